@@ -0,0 +1,9 @@
+# SPDX-License-Identifier: MIT
+
+"""Micro benchmarks for performance-critical parts of the app.
+
+The benchmarks are plain Python scripts and are not part of the test suite.
+Run them from the repository's root directory, e.g.::
+
+    python -m benchmarks.calendar_entry
+"""
@@ -0,0 +1,107 @@
+# SPDX-License-Identifier: MIT
+
+"""Benchmark memory footprint and sort time of :class:`~calingen.interfaces.data_exchange.CalendarEntry`.
+
+The current implementation is compared against a reference implementation,
+that mirrors the former ``CalendarEntry`` (instances with a ``__dict__`` and a
+comparison key, that is rebuilt on every comparison). Sorting is measured by
+the entries' comparison methods and by
+:func:`~calingen.interfaces.data_exchange.sort_key`, which is used by
+:class:`~calingen.interfaces.data_exchange.CalendarEntryList`.
+
+Usage::
+
+    python -m benchmarks.calendar_entry [--sizes 10000 100000 1000000]
+"""
+
+# Python imports
+import argparse
+import datetime
+import random
+from functools import partial, total_ordering
+
+# local imports
+from .util import measure_memory, measure_time, setup_django
+
+
+@total_ordering
+class LegacyCalendarEntry:
+    """Reference implementation of the former ``CalendarEntry``."""
+
+    def __init__(self, title, category, timestamp, source):  # noqa: D107
+        self.title = title
+        self.category = category
+        self.timestamp = timestamp
+        self.source = source
+
+    def __eq__(self, other):  # noqa: D105
+        return self.__key() == other.__key()
+
+    def __lt__(self, other):  # noqa: D105
+        return self.__key() < other.__key()
+
+    def __hash__(self):  # noqa: D105
+        return hash(self.__key())
+
+    def __key(self):
+        return (self.timestamp, self.category, self.title)
+
+
+def generate_records(size, seed=42):
+    """Generate ``size`` random records for the benchmark."""
+    rng = random.Random(seed)
+    base = datetime.datetime(2022, 1, 1)
+    categories = ["ANNUAL_ANNIVERSARY", "HOLIDAY"]
+    return [
+        (
+            "Entry {}".format(rng.randrange(size)),
+            categories[rng.randrange(2)],
+            base + datetime.timedelta(days=rng.randrange(365)),
+            ("EXTERNAL", "benchmark"),
+        )
+        for _ in range(size)
+    ]
+
+
+def build(cls, records):
+    """Create a list of ``cls`` instances from ``records``."""
+    return [cls(*record) for record in records]
+
+
+def run(sizes):
+    """Run the benchmark for all given ``sizes`` and print the results."""
+    setup_django()
+
+    # app imports
+    from calingen.interfaces.data_exchange import CalendarEntry, sort_key
+
+    row = "{:>9} | {:<19} | {:>10.1f} MiB | {:>8.3f} s | {:>10.3f} s"
+    print(
+        "{:>9} | {:<19} | {:>14} | {:>10} | {:>12}".format(
+            "entries", "class", "memory", "sort", "sort (key)"
+        )
+    )
+    for size in sizes:
+        records = generate_records(size)
+        for cls in (LegacyCalendarEntry, CalendarEntry):
+            entries, memory = measure_memory(partial(build, cls, records))
+            duration = measure_time(partial(sorted, entries))
+            key_duration = measure_time(partial(sorted, entries, key=sort_key))
+            print(
+                row.format(size, cls.__name__, memory / 2**20, duration, key_duration)
+            )
+            del entries
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--sizes",
+        nargs="+",
+        type=int,
+        default=[10000, 100000, 1000000],
+        help="Number of entries to benchmark with.",
+    )
+    options = parser.parse_args()
+
+    run(options.sizes)
@@ -0,0 +1,91 @@
+# SPDX-License-Identifier: MIT
+
+"""Benchmark the startup time of a project with the app's contributed plugins.
+
+Every run starts a fresh interpreter, that sets up Django with all
+contributed apps installed. The plugins are declared by the apps' manifests
+(``calingen_plugins``), so their modules are not imported during startup. For
+comparison, the ``eager`` runs additionally import all plugin modules, just
+like the apps did before the manifests were introduced.
+
+Usage::
+
+    python -m benchmarks.plugin_discovery [--repeat 10]
+"""
+
+# Python imports
+import argparse
+import subprocess
+import sys
+import time
+
+INSTALLED_APPS = [
+    "django.contrib.auth",
+    "django.contrib.contenttypes",
+    "django.contrib.sessions",
+    "calingen",
+    "calingen.contrib.layouts.lineatur",
+    "calingen.contrib.layouts.simple_event_list",
+    "calingen.contrib.layouts.year_by_week",
+    "calingen.contrib.providers.german_holidays",
+]
+
+PLUGIN_MODULES = [
+    "calingen.contrib.layouts.lineatur.lineatur",
+    "calingen.contrib.layouts.simple_event_list.simple_event_list",
+    "calingen.contrib.layouts.year_by_week.year_by_week",
+    "calingen.contrib.providers.german_holidays.provider",
+]
+
+SETUP = """
+import django
+from django.conf import settings
+settings.configure(INSTALLED_APPS={apps!r})
+django.setup()
+"""
+
+EAGER = """
+import importlib
+for module in {modules!r}:
+    importlib.import_module(module)
+"""
+
+
+def startup_time(source, repeat):
+    """Return the best wall clock time (in seconds) of running ``source`` in a new interpreter."""
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, "-c", source], check=True)
+        duration = time.perf_counter() - start
+        if best is None or duration < best:
+            best = duration
+    return best
+
+
+def run(repeat):
+    """Run the benchmark and print the results."""
+    setup = SETUP.format(apps=INSTALLED_APPS)
+    baseline = startup_time("import django", repeat)
+
+    row = "{:<8} | {:>8.1f} ms | {:>8.1f} ms"
+    print("{:<8} | {:>11} | {:>11}".format("startup", "total", "setup"))
+    for label, source in (
+        ("lazy", setup),
+        ("eager", setup + EAGER.format(modules=PLUGIN_MODULES)),
+    ):
+        duration = startup_time(source, repeat)
+        print(row.format(label, duration * 1000, (duration - baseline) * 1000))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--repeat",
+        type=int,
+        default=10,
+        help="Number of interpreters to start per variant.",
+    )
+    options = parser.parse_args()
+
+    run(options.repeat)
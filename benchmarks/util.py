@@ -0,0 +1,49 @@
+# SPDX-License-Identifier: MIT
+
+"""Shared helpers for the benchmark scripts."""
+
+# Python imports
+import gc
+import time
+import tracemalloc
+
+
+def setup_django():
+    """Provide a minimal Django configuration.
+
+    The benchmarks only need the parts of Django, that are imported by the
+    app's ``interfaces`` package, so no database or installed apps are
+    required.
+    """
+    # Django imports
+    import django
+    from django.conf import settings
+
+    if not settings.configured:
+        settings.configure(USE_I18N=False)
+        django.setup()
+
+
+def measure_memory(factory):
+    """Return the result of ``factory()`` and the memory it allocated (in bytes)."""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        result = factory()
+        current, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return result, current
+
+
+def measure_time(func, repeat=3):
+    """Return the best wall clock time (in seconds) of ``repeat`` runs of ``func()``."""
+    best = None
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        func()
+        duration = time.perf_counter() - start
+        if best is None or duration < best:
+            best = duration
+    return best
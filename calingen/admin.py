@@ -8,6 +8,7 @@ from django.contrib import admin
 # app imports
 from calingen.models.event import Event
 from calingen.models.profile import Profile
+from calingen.models.resolved_provider_year import ResolvedProviderYear
 
 
 @admin.register(Event)
@@ -18,3 +19,9 @@ class EventAdmin(admin.ModelAdmin):  # noqa: D101
 @admin.register(Profile)
 class ProfileAdmin(admin.ModelAdmin):  # noqa: D101
     pass
+
+
+@admin.register(ResolvedProviderYear)
+class ResolvedProviderYearAdmin(admin.ModelAdmin):  # noqa: D101
+    list_display = ("provider", "year", "language", "updated")
+    exclude = ("entries",)
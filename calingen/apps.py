@@ -40,15 +40,24 @@ class CalingenConfig(AppConfig):
         - inject app-specific settings into the project's ``settings`` module,
           if they are not already specified (see
           :mod:`calingen.settings` for details);
+        - register the plugin manifests (``calingen_plugins``) of all
+          installed apps (see
+          :func:`~calingen.interfaces.plugin_api.register_manifest`), so their
+          plugins are available without importing their modules.
         """
         # delay app imports until now, to make sure everything else is ready
         # app imports
         from calingen import settings as app_default_settings
         from calingen.checks import (
             check_config_value_compiler,
+            check_config_value_event_provider_cache_size,
+            check_config_value_event_provider_materialization,
             check_config_value_event_provider_notification,
+            check_config_value_event_provider_resolution,
+            check_config_value_instrumentation,
             check_session_enabled,
         )
+        from calingen.interfaces.plugin_api import register_manifest
 
         # inject app-specific settings
         # see https://stackoverflow.com/a/47154840
@@ -60,5 +69,15 @@ class CalingenConfig(AppConfig):
 
         # register app-specific check functions
         register_check(check_config_value_compiler)
+        register_check(check_config_value_event_provider_cache_size)
+        register_check(check_config_value_event_provider_materialization)
         register_check(check_config_value_event_provider_notification)
+        register_check(check_config_value_event_provider_resolution)
+        register_check(check_config_value_instrumentation)
         register_check(check_session_enabled)
+
+        # declare the plugins of all installed apps
+        for app_config in self.apps.get_app_configs():
+            manifest = getattr(app_config, "calingen_plugins", None)
+            if manifest:
+                register_manifest(manifest)
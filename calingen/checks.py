@@ -143,3 +143,139 @@ def check_config_value_compiler(*args, **kwargs):
         )
 
     return errors
+
+
+def check_config_value_event_provider_cache_size(*args, **kwargs):
+    """Verify that :attr:`~calingen.settings.CALINGEN_EVENT_PROVIDER_CACHE_SIZE` provides accepted value.
+
+    - **Check ID**: ``calingen.e005``
+
+    Returns
+    -------
+    list
+        A list of :djangodoc:`Messages <topics/checks/#messages>`.
+    """
+    errors = []
+    config_value = settings.CALINGEN_EVENT_PROVIDER_CACHE_SIZE
+
+    if (
+        not isinstance(config_value, int)
+        or isinstance(config_value, bool)
+        or config_value < 0
+    ):
+        errors.append(
+            Error(
+                "Unaccepted config value for CALINGEN_EVENT_PROVIDER_CACHE_SIZE",
+                hint=(
+                    "CALINGEN_EVENT_PROVIDER_CACHE_SIZE has to be an integer "
+                    "greater than or equal to 0."
+                ),
+                id="calingen.e005",
+            )
+        )
+
+    return errors
+
+
+def check_config_value_event_provider_resolution(*args, **kwargs):
+    """Verify the settings of the parallel resolution of event providers.
+
+    - **Check ID**: ``calingen.e006``: invalid
+      :attr:`~calingen.settings.CALINGEN_EVENT_PROVIDER_WORKERS`
+    - **Check ID**: ``calingen.e007``: invalid
+      :attr:`~calingen.settings.CALINGEN_EVENT_PROVIDER_TIMEOUT`
+    - **Check ID**: ``calingen.e008``: invalid
+      :attr:`~calingen.settings.CALINGEN_EVENT_PROVIDER_BUDGET`
+
+    Returns
+    -------
+    list
+        A list of :djangodoc:`Messages <topics/checks/#messages>`.
+    """
+    errors = []
+
+    workers = settings.CALINGEN_EVENT_PROVIDER_WORKERS
+    if not isinstance(workers, int) or isinstance(workers, bool) or workers < 0:
+        errors.append(
+            Error(
+                "Unaccepted config value for CALINGEN_EVENT_PROVIDER_WORKERS",
+                hint=(
+                    "CALINGEN_EVENT_PROVIDER_WORKERS has to be an integer "
+                    "greater than or equal to 0."
+                ),
+                id="calingen.e006",
+            )
+        )
+
+    for name, check_id in (
+        ("CALINGEN_EVENT_PROVIDER_TIMEOUT", "calingen.e007"),
+        ("CALINGEN_EVENT_PROVIDER_BUDGET", "calingen.e008"),
+    ):
+        config_value = getattr(settings, name)
+        if config_value is None:
+            continue
+        if (
+            not isinstance(config_value, (int, float))
+            or isinstance(config_value, bool)
+            or config_value <= 0
+        ):
+            errors.append(
+                Error(
+                    "Unaccepted config value for {}".format(name),
+                    hint=(
+                        "{} has to be a number (of seconds) greater than 0 or "
+                        "None.".format(name)
+                    ),
+                    id=check_id,
+                )
+            )
+
+    return errors
+
+
+def check_config_value_event_provider_materialization(*args, **kwargs):
+    """Verify that :attr:`~calingen.settings.CALINGEN_EVENT_PROVIDER_MATERIALIZATION` provides accepted value.
+
+    - **Check ID**: ``calingen.e009``
+
+    Returns
+    -------
+    list
+        A list of :djangodoc:`Messages <topics/checks/#messages>`.
+    """
+    errors = []
+
+    if not isinstance(settings.CALINGEN_EVENT_PROVIDER_MATERIALIZATION, bool):
+        errors.append(
+            Error(
+                "Unaccepted config value for CALINGEN_EVENT_PROVIDER_MATERIALIZATION",
+                hint="CALINGEN_EVENT_PROVIDER_MATERIALIZATION has to be a boolean.",
+                id="calingen.e009",
+            )
+        )
+
+    return errors
+
+
+def check_config_value_instrumentation(*args, **kwargs):
+    """Verify that :attr:`~calingen.settings.CALINGEN_INSTRUMENTATION` provides accepted value.
+
+    - **Check ID**: ``calingen.e010``
+
+    Returns
+    -------
+    list
+        A list of :djangodoc:`Messages <topics/checks/#messages>`.
+    """
+    errors = []
+
+    if not isinstance(settings.CALINGEN_INSTRUMENTATION, bool):
+        errors.append(
+            Error(
+                "Unaccepted config value for CALINGEN_INSTRUMENTATION",
+                hint="CALINGEN_INSTRUMENTATION has to be a boolean.",
+                id="calingen.e010",
+            )
+        )
+
+    return errors
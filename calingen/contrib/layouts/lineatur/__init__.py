@@ -10,9 +10,6 @@ Warnings
 This layout does not include events!
 """
 
-# local imports
-from .lineatur import Lineatur  # noqa: F401
-
 default_app_config = (
     "calingen.contrib.layouts.lineatur.apps.CalingenLayoutLineaturConfig"
 )
@@ -26,8 +23,9 @@ Notes
 -----
 While the layout is provided as a "standalone Django app", it is in fact nothing
 more than an implementation of
-:class:`~calingen.interfaces.plugin_api.LayoutProvider`. The actual magic of
-registering the layout with the main app is not done in this app's
-:class:`~django.apps.AppConfig`, but in this very file by importing the
-:class:`~calingen.contrib.layouts.lineatur.lineatur.Lineatur` class.
+:class:`~calingen.interfaces.plugin_api.LayoutProvider`. The layout is
+registered with the main app by the manifest in this app's
+:class:`~django.apps.AppConfig` (``calingen_plugins``), so the
+:class:`~calingen.contrib.layouts.lineatur.lineatur.Lineatur` class is only
+imported, when the layout is actually used.
 """
@@ -16,3 +16,16 @@ class CalingenLayoutLineaturConfig(AppConfig):
 
     name = "calingen.contrib.layouts.lineatur"
     verbose_name = "CalInGen Layout: Lineatur"
+
+    calingen_plugins = {
+        "LayoutProvider": {
+            "calingen.contrib.layouts.lineatur.lineatur.Lineatur": {
+                "title": "Lineatur (various, portrait)",
+                "name": "Lineatur",
+                "paper_size": "various",
+                "orientation": "portrait",
+                "layout_type": "html",
+            }
+        }
+    }
+    """The manifest of the app's plugins (see :func:`~calingen.interfaces.plugin_api.register_manifest`)."""
@@ -2,9 +2,6 @@
 
 """Implementation of :class:`~calingen.interfaces.plugin_api.LayoutProvider` that provides TeX-sources for a simple list of events."""
 
-# local imports
-from .simple_event_list import SimpleEventList  # noqa: F401
-
 default_app_config = "calingen.contrib.layouts.simple_event_list.apps.CalingenLayoutSimpleEventListConfig"
 """The path to the app's default configuration class.
 
@@ -16,9 +13,9 @@ Notes
 -----
 While the layout is provided as a "standalone Django app", it is in fact nothing
 more than an implementation of
-:class:`~calingen.interfaces.plugin_api.LayoutProvider`. The actual magic of
-registering the layout with the main app is not done in this app's
-:class:`~django.apps.AppConfig`, but in this very file by importing the
-:class:`~calingen.contrib.layouts.simple_event_list.simple_event_list.SimpleEventList`
-class.
+:class:`~calingen.interfaces.plugin_api.LayoutProvider`. The layout is
+registered with the main app by the manifest in this app's
+:class:`~django.apps.AppConfig` (``calingen_plugins``), so the
+:class:`~calingen.contrib.layouts.simple_event_list.simple_event_list.SimpleEventList` class is only
+imported, when the layout is actually used.
 """
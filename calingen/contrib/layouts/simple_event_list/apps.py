@@ -16,3 +16,16 @@ class CalingenLayoutSimpleEventListConfig(AppConfig):
 
     name = "calingen.contrib.layouts.simple_event_list"
     verbose_name = "CalInGen Layout: Simple Event List"
+
+    calingen_plugins = {
+        "LayoutProvider": {
+            "calingen.contrib.layouts.simple_event_list.simple_event_list.SimpleEventList": {
+                "title": "Simple Event List (a4, portrait)",
+                "name": "Simple Event List",
+                "paper_size": "a4",
+                "orientation": "portrait",
+                "layout_type": "tex",
+            }
+        }
+    }
+    """The manifest of the app's plugins (see :func:`~calingen.interfaces.plugin_api.register_manifest`)."""
@@ -12,6 +12,7 @@ This may be object to future changes.
 """
 
 # app imports
+from calingen.interfaces.data_exchange import CalendarEntryList
 from calingen.interfaces.plugin_api import LayoutProvider
 
 
@@ -51,24 +52,10 @@ class SimpleEventList(LayoutProvider):
     @classmethod
     def prepare_context(cls, context):
         """Pre-process the ``entries`` to group them by month."""
-        entries = context.pop("entries", [])
+        entries = context.pop("entries", CalendarEntryList())
 
         # put each month's entries in a dedicated list
-        processed_entries = []
-        try:
-            loop_month = entries[0].timestamp.month
-        except IndexError:
-            loop_month = "No Entries"
-
-        month_list = []
-        for entry in entries:
-            if entry.timestamp.month != loop_month:
-                processed_entries.append(month_list)
-                month_list = []
-                loop_month = entry.timestamp.month
-            month_list.append(entry)
-        if month_list:
-            processed_entries.append(month_list)
+        processed_entries = list(entries.by_month().values())
 
         context["entries"] = processed_entries
         return context
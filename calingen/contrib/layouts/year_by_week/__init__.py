@@ -9,9 +9,6 @@ This layout does only include events of the types
 :attr:`~calingen.constants.EventCategory.HOLIDAY`.
 """
 
-# local imports
-from .year_by_week import YearByWeek  # noqa: F401
-
 default_app_config = (
     "calingen.contrib.layouts.year_by_week.apps.CalingenLayoutYearByWeekConfig"
 )
@@ -25,9 +22,9 @@ Notes
 -----
 While the layout is provided as a "standalone Django app", it is in fact nothing
 more than an implementation of
-:class:`~calingen.interfaces.plugin_api.LayoutProvider`. The actual magic of
-registering the layout with the main app is not done in this app's
-:class:`~django.apps.AppConfig`, but in this very file by importing the
-:class:`~calingen.contrib.layouts.year_by_week.year_by_week.YearByWeek`
-class.
+:class:`~calingen.interfaces.plugin_api.LayoutProvider`. The layout is
+registered with the main app by the manifest in this app's
+:class:`~django.apps.AppConfig` (``calingen_plugins``), so the
+:class:`~calingen.contrib.layouts.year_by_week.year_by_week.YearByWeek` class is only
+imported, when the layout is actually used.
 """
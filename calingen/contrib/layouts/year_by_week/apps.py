@@ -16,3 +16,16 @@ class CalingenLayoutYearByWeekConfig(AppConfig):
 
     name = "calingen.contrib.layouts.year_by_week"
     verbose_name = "CalInGen Layout: Year by Week"
+
+    calingen_plugins = {
+        "LayoutProvider": {
+            "calingen.contrib.layouts.year_by_week.year_by_week.YearByWeek": {
+                "title": "Year by Week (a5, portrait)",
+                "name": "Year by Week",
+                "paper_size": "a5",
+                "orientation": "portrait",
+                "layout_type": "tex",
+            }
+        }
+    }
+    """The manifest of the app's plugins (see :func:`~calingen.interfaces.plugin_api.register_manifest`)."""
@@ -19,6 +19,7 @@ from django.template.defaultfilters import date as _date
 
 # app imports
 from calingen.constants import EventCategory
+from calingen.interfaces.data_exchange import CalendarEntryList
 from calingen.interfaces.plugin_api import LayoutProvider
 
 
@@ -223,12 +224,23 @@ class YearByWeek(LayoutProvider):
     layout_type = "tex"
     _template = "year_by_week/tex/year_by_week.tex"
 
+    @classmethod
+    def required_years(cls, target_year):
+        """Include the adjacent years, if the first or the last week extend into them."""
+        first_year = target_year
+        if date(target_year, 1, 1).weekday() != 0:
+            first_year -= 1
+        last_year = target_year
+        if date(target_year, 12, 31).weekday() != 6:
+            last_year += 1
+        return first_year, last_year
+
     @classmethod
     def prepare_context(cls, context):
         """Create a full year's representation and return it as ``weeklist``."""
         # values from the context for processing
         target_year = context.get("target_year")
-        entries = context.get("entries", [])
+        entries = context.get("entries", CalendarEntryList())
 
         # The first day of the calendar is the monday before [YEAR]-01-01
         # date().weekday() = 0 for Mondays, 6 for Sundays
@@ -254,18 +266,9 @@ class YearByWeek(LayoutProvider):
                     weeklist.append(this_week)
                     this_week = CalendarWeek()
 
-            # This may look rather complex but is nothing more than filtering
-            # the "entries" by day and feeding a list of entries into the
-            # constructor of the CalendarDay class.
-            this_day = CalendarDay(
-                day,
-                [
-                    x
-                    for x in entries
-                    if x.timestamp.date().day == day.day
-                    and x.timestamp.date().month == day.month
-                ],
-            )
+            # The "entries" include the days of the adjacent years in the
+            # first and the last week (see required_years())
+            this_day = CalendarDay(day, entries.on(day))
             this_week.add_day(this_day)
 
             # increment the invariant
@@ -4,10 +4,13 @@
 
 # Django imports
 from django.apps import AppConfig
+from django.utils.translation import gettext_lazy as _
 
 APP_CONFIG_NAME = "CALINGEN_PROVIDER_GERMAN_HOLIDAYS"
 """The name of the app-specific configuration option."""
 
+_PROVIDER_MODULE = "calingen.contrib.providers.german_holidays.provider"
+
 
 class CalingenProviderGermanHolidays(AppConfig):
     """Application-specific configuration class, as required by Django.
@@ -15,39 +18,45 @@ class CalingenProviderGermanHolidays(AppConfig):
     This sub-class of Django's `AppConfig` provides application-specific
     information to be used in Django's application registry (see
     :djangoapi:`applications/#configuring-applications`).
+
+    Notes
+    -----
+    The implementations of
+    :class:`~calingen.interfaces.plugin_api.EventProvider` are declared in
+    ``calingen_plugins`` (see
+    :func:`~calingen.interfaces.plugin_api.register_manifest`), so they are
+    available in **django-calingen** without importing
+    :mod:`~calingen.contrib.providers.german_holidays.provider` during
+    startup. The module (and the precomputed table of holidays, see
+    :mod:`calingen.contrib.providers.german_holidays.table`) is loaded, when a
+    provider is resolved for the first time.
     """
 
     name = "calingen.contrib.providers.german_holidays"
     verbose_name = "CalInGen Provider: German Holidays"
 
-    def ready(self):
-        """Apply app-specific stuff.
-
-        Notes
-        -----
-        This method is executed when the application is (completely) loaded.
-
-        It will import the actual implementations of
-        :class:`~calingen.interfaces.plugin_api.EventProvider`, making them
-        available in **django-calingen**.
-        """
-        # local imports
-        from .provider import (  # noqa: F401
-            BadenWuerttemberg,
-            Bayern,
-            Berlin,
-            Brandenburg,
-            Bremen,
-            GermanyFederal,
-            Hamburg,
-            Hessen,
-            MecklenburgVorpommern,
-            Niedersachsen,
-            NordrheinWestphalen,
-            RheinlandPfalz,
-            Saarland,
-            Sachsen,
-            SachsenAnhalt,
-            SchleswigHolstein,
-            Thueringen,
-        )
+    calingen_plugins = {
+        "EventProvider": {
+            "{}.{}".format(_PROVIDER_MODULE, name): {"title": title}
+            for name, title in (
+                ("GermanyFederal", _("German Federal Holidays")),
+                ("BadenWuerttemberg", _("Holidays of Baden-Württemberg")),
+                ("Bayern", _("Holidays of Bayern")),
+                ("Berlin", _("Holidays of Berlin")),
+                ("Brandenburg", _("Holidays of Brandenburg")),
+                ("Bremen", _("Holidays of Bremen")),
+                ("Hamburg", _("Holidays of Hamburg")),
+                ("MecklenburgVorpommern", _("Holidays of Mecklenburg-Vorpommern")),
+                ("Niedersachsen", _("Holidays of Niedersachsen")),
+                ("SchleswigHolstein", _("Holidays of Schleswig-Holstein")),
+                ("Hessen", _("Holidays of Hessen")),
+                ("NordrheinWestphalen", _("Holidays of Nordrhein-Westphalen")),
+                ("RheinlandPfalz", _("Holidays of Rheinland-Pfalz")),
+                ("Saarland", _("Holidays of Saarland")),
+                ("Sachsen", _("Holidays of Sachsen")),
+                ("SachsenAnhalt", _("Holidays of Sachsen-Anhalt")),
+                ("Thueringen", _("Holidays of Thüringen")),
+            )
+        }
+    }
+    """The manifest of the app's plugins (see :func:`~calingen.interfaces.plugin_api.register_manifest`)."""
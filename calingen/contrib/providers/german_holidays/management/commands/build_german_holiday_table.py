@@ -0,0 +1,52 @@
+# SPDX-License-Identifier: MIT
+
+"""Build the precomputed table of the German holidays.
+
+See :mod:`calingen.contrib.providers.german_holidays.table` for details.
+The table has to be rebuilt whenever the rules in
+:mod:`calingen.contrib.providers.german_holidays.provider` are changed::
+
+    django-admin build_german_holiday_table
+"""
+
+# Django imports
+from django.core.management.base import BaseCommand, CommandError
+
+# app imports
+from calingen.contrib.providers.german_holidays.table import (
+    FIRST_YEAR,
+    LAST_YEAR,
+    TABLE_PATH,
+    HolidayTableException,
+    build_table,
+)
+
+
+class Command(BaseCommand):
+    """Write the table of the German holidays to a file."""
+
+    help = "Precompute the dates of all German holidays."
+
+    def add_arguments(self, parser):  # noqa: D102
+        parser.add_argument("--first-year", type=int, default=FIRST_YEAR)
+        parser.add_argument("--last-year", type=int, default=LAST_YEAR)
+        parser.add_argument("--output", default=TABLE_PATH)
+
+    def handle(self, *args, **options):  # noqa: D102
+        first_year = options["first_year"]
+        last_year = options["last_year"]
+        if not 1 <= first_year <= last_year <= 9999:
+            raise CommandError("Invalid range of years")
+
+        try:
+            table = build_table(first_year, last_year)
+        except HolidayTableException as err:
+            raise CommandError(err) from err
+
+        with open(options["output"], "wb") as file_handle:
+            file_handle.write(table)
+        self.stdout.write(
+            "Wrote the holidays of {}-{} to {} ({} bytes)".format(
+                first_year, last_year, options["output"], len(table)
+            )
+        )
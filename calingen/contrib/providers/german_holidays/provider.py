@@ -11,6 +11,7 @@ recurrence. Most of Germany's holidays are based off the Easter date, so
 """
 
 # Python imports
+import logging
 from datetime import datetime
 
 # Django imports
@@ -23,6 +24,12 @@ from dateutil.rrule import WE, YEARLY, rrule
 from calingen.constants import EventCategory
 from calingen.interfaces.plugin_api import EventProvider
 
+# local imports
+from .table import HolidayTableException, register_table
+
+# get a module-level logger
+logger = logging.getLogger(__name__)
+
 # The following constants simply provide all the available German Holidays
 # These will be combined in the actual implementation classes, e.g. in
 # GermanyFederal
@@ -347,3 +354,11 @@ class Thueringen(GermanyFederal):
     title = _("Holidays of Thüringen")
 
     entries = FEDERAL_HOLIDAYS + [FRONLEICHNAM, WELTKINDERTAG, REFORMATIONSTAG]
+
+
+# Use the precomputed table of holidays, instead of evaluating the rules above.
+# If the table can not be loaded, the rules are evaluated directly.
+try:
+    register_table()
+except (OSError, HolidayTableException) as err:  # pragma: nocover
+    logger.warning("Could not load the table of holidays: {}".format(err))
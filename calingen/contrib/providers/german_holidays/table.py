@@ -0,0 +1,259 @@
+# SPDX-License-Identifier: MIT
+
+"""Provides a precomputed table of the German holidays.
+
+The table contains the day of the year of every holiday, that is defined in
+:mod:`calingen.contrib.providers.german_holidays.provider`, for a wide range of
+years. It is created by the management command
+``build_german_holiday_table`` (see
+:mod:`calingen.contrib.providers.german_holidays.management.commands.build_german_holiday_table`)
+and shipped with the app.
+
+When :mod:`~calingen.contrib.providers.german_holidays.provider` is imported,
+the table is memory-mapped and its columns are registered as the evaluators
+of the holidays' rules (see
+:func:`calingen.interfaces.recurrence.register_evaluator`), so resolving the
+holidays of a year does not evaluate any rule at all.
+
+The binary format consists of:
+
+- a header of 16 bytes: the magic bytes ``CLGH``, the format version
+  (``uint16``), the first year (``uint16``), the number of years (``uint16``),
+  the number of holidays (``uint16``) and the size of the names (``uint32``);
+- the table: for every holiday and every year the day of the year as
+  little-endian ``uint16``; ``0`` means, that the holiday does not occur in
+  that year (e.g. before the rule's ``dtstart``);
+- the names of the holidays (the names of the constants in
+  :mod:`~calingen.contrib.providers.german_holidays.provider`), UTF-8 encoded
+  and separated by newlines.
+"""
+
+# Python imports
+import datetime
+import mmap
+import os
+import struct
+import sys
+import zlib
+from array import array
+
+# external imports
+from dateutil.rrule import rrule
+
+# app imports
+from calingen.exceptions import CalingenException
+from calingen.interfaces.recurrence import (
+    RecurrenceEvaluator,
+    compile_rule,
+    register_evaluator,
+)
+
+TABLE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "holidays.bin")
+"""The location of the shipped table."""
+
+FIRST_YEAR = 1900
+"""The first year of the shipped table."""
+
+LAST_YEAR = 2300
+"""The last year of the shipped table."""
+
+_TABLE_MAGIC = b"CLGH"
+_TABLE_VERSION = 1
+_TABLE_HEADER = struct.Struct("<4sHHHHI")
+_NO_OCCURENCE = 0
+
+
+class HolidayTableException(CalingenException):
+    """Raised if a holiday table can not be built or loaded."""
+
+
+def holiday_rules():
+    """Return the holidays, that are defined in :mod:`~calingen.contrib.providers.german_holidays.provider`.
+
+    Returns
+    -------
+    dict
+        Maps the names of the constants to their rules
+        (:class:`dateutil.rrule.rrule`), sorted by name.
+    """
+    # ``provider`` registers the table while being imported, so it is
+    # imported here (and not on module level) to avoid circular imports
+    # local imports
+    from . import provider
+
+    return {
+        name: value[2]
+        for name, value in sorted(vars(provider).items())
+        if name.isupper()
+        and isinstance(value, tuple)
+        and len(value) == 3
+        and isinstance(value[2], rrule)
+    }
+
+
+def build_table(first_year=FIRST_YEAR, last_year=LAST_YEAR):
+    """Compute the table of all holidays.
+
+    The dates are computed by the rules themselves (using
+    ``rrule.between()``), so the table matches the rules exactly.
+
+    Parameters
+    ----------
+    first_year : int
+    last_year : int
+
+    Returns
+    -------
+    bytes
+        The binary representation of the table.
+
+    Raises
+    ------
+    HolidayTableException
+        Raised if a rule does not fit into the table, because it occurs more
+        than once a year or not at midnight.
+    """
+    rules = holiday_rules()
+    year_count = last_year - first_year + 1
+
+    table = array("H")
+    for name, rule in rules.items():
+        column = [_NO_OCCURENCE] * year_count
+        for occurence in rule.between(
+            datetime.datetime(first_year, 1, 1),
+            datetime.datetime(last_year, 12, 31, 23, 59, 59),
+            inc=True,
+        ):
+            index = occurence.year - first_year
+            if column[index] != _NO_OCCURENCE or occurence.time() != datetime.time():
+                raise HolidayTableException(
+                    "{} can not be represented in the table".format(name)
+                )
+            column[index] = occurence.timetuple().tm_yday
+        table.extend(column)
+    if sys.byteorder != "little":
+        table.byteswap()
+
+    names = "\n".join(rules).encode("utf-8")
+    header = _TABLE_HEADER.pack(
+        _TABLE_MAGIC, _TABLE_VERSION, first_year, year_count, len(rules), len(names)
+    )
+    return header + table.tobytes() + names
+
+
+class TableEvaluator(RecurrenceEvaluator):
+    """Provides the occurences of a rule from a column of the table.
+
+    Years outside of the table are evaluated by the rule's compiled evaluator
+    (see :func:`calingen.interfaces.recurrence.compile_rule`).
+    """
+
+    def __init__(self, rule, column, first_year, version=None):  # noqa: D107
+        super().__init__(rule)
+        self._column = column
+        self._first_year = first_year
+        self._fallback = compile_rule(rule)
+        self.version = version
+
+    def occurences(self, year):  # noqa: D102
+        index = year - self._first_year
+        if not 0 <= index < len(self._column):
+            return self._fallback.occurences(year)
+
+        day = self._column[index]
+        if day == _NO_OCCURENCE:
+            return []
+        return [datetime.datetime(year, 1, 1) + datetime.timedelta(days=day - 1)]
+
+
+def load_table(path=TABLE_PATH):
+    """Load a table, using a memory map.
+
+    Parameters
+    ----------
+    path : str, optional
+        The location of the table.
+
+    Returns
+    -------
+    dict
+        Maps the names of the holidays to their
+        :class:`~calingen.contrib.providers.german_holidays.table.TableEvaluator`.
+        Holidays, that are not (or no longer) defined in
+        :mod:`~calingen.contrib.providers.german_holidays.provider`, are
+        skipped.
+
+    Raises
+    ------
+    HolidayTableException
+        Raised if the file does not contain a holiday table.
+    """
+    with open(path, "rb") as file_handle:
+        try:
+            view = memoryview(
+                mmap.mmap(file_handle.fileno(), 0, access=mmap.ACCESS_READ)
+            )
+        except ValueError as err:
+            raise HolidayTableException("Could not map {}".format(path)) from err
+
+    if len(view) < _TABLE_HEADER.size:
+        raise HolidayTableException("{} is not a holiday table".format(path))
+    (
+        magic,
+        version,
+        first_year,
+        year_count,
+        count,
+        names_size,
+    ) = _TABLE_HEADER.unpack_from(view)
+    table_size = 2 * year_count * count
+    if (
+        magic != _TABLE_MAGIC
+        or version != _TABLE_VERSION
+        or len(view) != _TABLE_HEADER.size + table_size + names_size
+    ):
+        raise HolidayTableException("{} is not a holiday table".format(path))
+
+    table_offset = _TABLE_HEADER.size
+    names_offset = table_offset + table_size
+    table = view[table_offset:names_offset]
+    if sys.byteorder == "little":
+        table = table.cast("H")
+    else:
+        table = array("H", table.tobytes())
+        table.byteswap()
+    names = bytes(view[names_offset:]).decode("utf-8")
+    # identifies the content of the table in materialized results
+    table_version = "{}-{:08x}".format(_TABLE_VERSION, zlib.crc32(view))
+
+    rules = holiday_rules()
+    result = {}
+    for index, name in enumerate(names.split("\n")):
+        if name in rules:
+            start = index * year_count
+            stop = start + year_count
+            result[name] = TableEvaluator(
+                rules[name], table[start:stop], first_year, table_version
+            )
+    return result
+
+
+def register_table(path=TABLE_PATH):
+    """Register the evaluators of a table.
+
+    Parameters
+    ----------
+    path : str, optional
+        The location of the table.
+
+    Returns
+    -------
+    dict
+        The result of
+        :func:`~calingen.contrib.providers.german_holidays.table.load_table`.
+    """
+    rules = holiday_rules()
+    evaluators = load_table(path)
+    for name, evaluator in evaluators.items():
+        register_evaluator(rules[name], evaluator)
+    return evaluators
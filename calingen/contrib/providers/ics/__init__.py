@@ -0,0 +1,16 @@
+# SPDX-License-Identifier: MIT
+
+"""Provide the events of local iCalendar (``.ics``) files.
+
+:class:`~calingen.contrib.providers.ics.provider.ICSFileProvider` is an
+*abstract* provider: projects subclass it and specify the ``path`` of their
+file. The files are read by the streaming parser of
+:mod:`calingen.contrib.providers.ics.parser`; the results are cached on disk
+per year.
+
+This package does not provide any Django models, templates or static files, so
+it does not need to be included in ``INSTALLED_APPS``. Instead, the module,
+that provides the actual implementations, has to be imported (or declared in a
+plugin manifest, see
+:func:`~calingen.interfaces.plugin_api.register_manifest`).
+"""
@@ -0,0 +1,377 @@
+# SPDX-License-Identifier: MIT
+
+"""Provides a streaming parser for iCalendar files (:rfc:`5545`).
+
+The parser reads a file line by line and yields the file's ``VEVENT``
+components one by one (see :func:`~calingen.contrib.providers.ics.parser.iter_events`),
+so even big files are never loaded completely.
+
+Only the properties, that are required to determine the occurences of an
+event, are evaluated: ``UID``, ``SUMMARY``, ``DTSTART``, ``RRULE``,
+``RDATE``, ``EXDATE``, ``RECURRENCE-ID`` and ``STATUS``. Components, that are
+nested into events (e.g. ``VALARM``), and all other components are skipped.
+
+Timezones are resolved by their ``TZID`` with :func:`dateutil.tz.gettz`, i.e.
+``VTIMEZONE`` definitions of the file are not evaluated. Timestamps with an
+unknown ``TZID`` are considered `naive`.
+
+:func:`~calingen.contrib.providers.ics.parser.occurences` expands the
+recurrence of an event, restricted to a given period.
+"""
+
+# Python imports
+import datetime
+import logging
+import re
+
+# external imports
+from dateutil import tz
+from dateutil.rrule import DAILY, MONTHLY, WEEKLY, rrulestr
+
+# app imports
+from calingen.exceptions import CalingenException
+from calingen.interfaces.recurrence import compile_rule
+
+# get a module-level logger
+logger = logging.getLogger(__name__)
+
+_UNESCAPE = re.compile(r"\\(.)")
+_UNESCAPED = {"n": "\n", "N": "\n"}
+
+_QUOTED_HEAD = re.compile(r'((?:[^":]|"[^"]*")*):')
+
+_UNTIL = re.compile(r"UNTIL=(\d{8})(?:T(\d{6}))?(Z)?", re.IGNORECASE)
+
+
+class ICSParserException(CalingenException):
+    """Raised, if a file could not be parsed."""
+
+
+class VEvent:
+    """The relevant properties of one ``VEVENT`` component.
+
+    Attributes
+    ----------
+    uid : str
+    summary : str
+    dtstart : datetime.datetime
+        All-day events (``VALUE=DATE``) start at midnight.
+    rrule : str
+        The raw value of the ``RRULE`` property or ``None``.
+    rdates : list
+        Additional occurences (:py:obj:`datetime.datetime`).
+    exdates : list
+        Excluded occurences (:py:obj:`datetime.datetime`).
+    recurrence_id : datetime.datetime
+        If provided, the event replaces this occurence of the recurring event
+        with the same ``uid``.
+    status : str
+    """
+
+    __slots__ = (
+        "uid",
+        "summary",
+        "dtstart",
+        "rrule",
+        "rdates",
+        "exdates",
+        "recurrence_id",
+        "status",
+    )
+
+    def __init__(self):  # noqa: D107
+        self.uid = None
+        self.summary = ""
+        self.dtstart = None
+        self.rrule = None
+        self.rdates = []
+        self.exdates = []
+        self.recurrence_id = None
+        self.status = None
+
+    def set_property(self, name, params, value):
+        """Apply a content line to the event.
+
+        Parameters
+        ----------
+        name : str
+        params : dict
+        value : str
+            See :func:`~calingen.contrib.providers.ics.parser.parse_content_line`.
+        """
+        if name == "SUMMARY":
+            self.summary = unescape_text(value)
+        elif name == "DTSTART":
+            self.dtstart = parse_timestamp(value, params)
+        elif name == "UID":
+            self.uid = value
+        elif name == "RRULE":
+            self.rrule = value
+        elif name == "RDATE":
+            if params.get("VALUE") != "PERIOD":
+                self.rdates.extend(parse_timestamp(x, params) for x in value.split(","))
+        elif name == "EXDATE":
+            self.exdates.extend(parse_timestamp(x, params) for x in value.split(","))
+        elif name == "RECURRENCE-ID":
+            self.recurrence_id = parse_timestamp(value, params)
+        elif name == "STATUS":
+            self.status = value.upper()
+
+
+def unescape_text(value):
+    r"""Unescape a ``TEXT`` value (``\n``, ``\,``, ``\;`` and ``\\``)."""
+    if "\\" not in value:
+        return value
+    return _UNESCAPE.sub(
+        lambda match: _UNESCAPED.get(match.group(1), match.group(1)), value
+    )
+
+
+def parse_timestamp(value, params):
+    """Parse a ``DATE`` or ``DATE-TIME`` value.
+
+    Parameters
+    ----------
+    value : str
+        E.g. ``20221224``, ``20221224T180000`` or ``20221224T170000Z``.
+    params : dict
+        The parameters of the property, e.g. ``TZID``.
+
+    Returns
+    -------
+    datetime.datetime
+
+    Raises
+    ------
+    ValueError
+        Raised, if ``value`` is malformed.
+    """
+    value = value.strip()
+    year, month, day = int(value[:4]), int(value[4:6]), int(value[6:8])
+    if len(value) == 8:
+        return datetime.datetime(year, month, day)
+
+    if value[8] not in "Tt":
+        raise ValueError("Unaccepted timestamp: {}".format(value))
+    result = datetime.datetime(
+        year, month, day, int(value[9:11]), int(value[11:13]), int(value[13:15])
+    )
+    if value.endswith(("Z", "z")):
+        return result.replace(tzinfo=tz.UTC)
+
+    tzid = params.get("TZID")
+    if tzid:
+        tzinfo = tz.gettz(tzid)
+        if tzinfo is not None:
+            result = result.replace(tzinfo=tzinfo)
+    return result
+
+
+def parse_content_line(line):
+    """Split an (unfolded) content line into its name, parameters and value.
+
+    Parameters
+    ----------
+    line : str
+        E.g. ``DTSTART;TZID=Europe/Berlin:20221224T180000``.
+
+    Returns
+    -------
+    tuple
+        The name (upper case), the parameters (:py:obj:`dict`, with upper case
+        keys) and the value.
+
+    Raises
+    ------
+    ICSParserException
+        Raised, if the line does not provide a value.
+    """
+    head, separator, value = line.partition(":")
+    if '"' in head:
+        # parameter values may be quoted and include colons
+        match = _QUOTED_HEAD.match(line)
+        if match is None:
+            raise ICSParserException("Missing value: {}".format(line))
+        head, value = match.group(1), line[match.end() :]  # noqa: E203
+    elif not separator:
+        raise ICSParserException("Missing value: {}".format(line))
+
+    name, *raw_params = head.split(";")
+    params = {}
+    for param in raw_params:
+        key, _, param_value = param.partition("=")
+        params[key.upper()] = param_value.strip('"')
+    return name.upper(), params, value
+
+
+def _unfold(lines):
+    """Join folded lines, i.e. lines starting with whitespace continue the previous line."""
+    pending = None
+    for line in lines:
+        line = line.rstrip("\r\n")
+        if line[:1] in (" ", "\t"):
+            if pending is not None:
+                pending += line[1:]
+            continue
+        if pending:
+            yield pending
+        pending = line
+    if pending:
+        yield pending
+
+
+def iter_events(path):
+    """Read the events of an iCalendar file one by one.
+
+    Parameters
+    ----------
+    path : str, pathlib.Path
+
+    Yields
+    ------
+    VEvent
+        The file's events, that provide a ``DTSTART``, in order of the file.
+
+    Raises
+    ------
+    OSError
+        Raised, if the file can not be read.
+
+    Notes
+    -----
+    Events with malformed properties (e.g. an invalid timestamp) are skipped
+    and a log message (of level warning) is emitted.
+    """
+    event = None
+    nested = 0
+    with open(path, encoding="utf-8", errors="replace", newline="") as file_handle:
+        for line in _unfold(file_handle):
+            if event is None:
+                if line.upper() == "BEGIN:VEVENT":
+                    event = VEvent()
+                    nested = 0
+                continue
+            if ":" not in line:
+                continue
+
+            try:
+                name, params, value = parse_content_line(line)
+                if name == "BEGIN":
+                    nested += 1
+                elif name == "END":
+                    if nested:
+                        nested -= 1
+                        continue
+                    if event.dtstart is not None:
+                        yield event
+                    event = None
+                elif not nested:
+                    event.set_property(name, params, value)
+            except (ICSParserException, IndexError, ValueError) as err:
+                logger.warning(
+                    "Skipping malformed event {} of {}: {}".format(event.uid, path, err)
+                )
+                # the remaining lines of the event are ignored
+                event = None
+
+
+def fast_forward(rule, after):
+    """Move the start of ``rule`` as close to ``after`` as possible.
+
+    Parameters
+    ----------
+    rule : dateutil.rrule.rrule
+    after : datetime.datetime
+
+    Returns
+    -------
+    dateutil.rrule.rrule
+        A rule, that provides the same occurences as ``rule`` from ``after``
+        onwards.
+
+    Notes
+    -----
+    ``rrule`` generates its occurences by iterating from its ``dtstart``, so
+    the start of daily, weekly and monthly rules is moved forward by whole
+    intervals. Monthly rules are only moved, if they specify their days
+    explicitly (otherwise the day is derived from ``dtstart``). Rules with a
+    ``COUNT`` are not moved at all. Yearly rules are usually evaluated
+    directly (see :func:`calingen.interfaces.recurrence.compile_rule`).
+    """
+    dtstart = rule._dtstart
+    if rule._count is not None or dtstart >= after:
+        return rule
+
+    if rule._freq in (DAILY, WEEKLY):
+        period = datetime.timedelta(days=rule._interval)
+        if rule._freq == WEEKLY:
+            period *= 7
+        return rule.replace(dtstart=dtstart + (after - dtstart) // period * period)
+
+    explicit = rule._original_rule
+    if rule._freq == MONTHLY and (
+        explicit.get("bymonthday") or explicit.get("byweekday")
+    ):
+        months = (after.year - dtstart.year) * 12 + after.month - dtstart.month
+        months -= months % rule._interval
+        years, month = divmod(dtstart.month - 1 + months, 12)
+        return rule.replace(
+            dtstart=dtstart.replace(year=dtstart.year + years, month=month + 1, day=1)
+        )
+
+    return rule
+
+
+def _normalize_until(rule, dtstart):
+    """Adjust ``UNTIL`` of ``rule`` to the (naive or aware) ``dtstart``, as required by ``dateutil``."""
+
+    def _replace(match):
+        date, time, utc = match.groups()
+        if dtstart.tzinfo is None:
+            return "UNTIL={}T{}".format(date, time or "235959")
+        if utc:
+            return match.group(0)
+        until = datetime.datetime.strptime(date + (time or "235959"), "%Y%m%d%H%M%S")
+        until = until.replace(tzinfo=dtstart.tzinfo).astimezone(tz.UTC)
+        return until.strftime("UNTIL=%Y%m%dT%H%M%SZ")
+
+    return _UNTIL.sub(_replace, rule)
+
+
+def occurences(event, after, before):
+    """Return the occurences of ``event`` in a given period.
+
+    Parameters
+    ----------
+    event : VEvent
+    after : datetime.datetime
+    before : datetime.datetime
+        The (naive) bounds of the period (inclusive). For timezone-aware
+        events, they are interpreted in the timezone of the event's start.
+
+    Returns
+    -------
+    list
+        The sorted occurences (:py:obj:`datetime.datetime`).
+
+    Raises
+    ------
+    ValueError
+        Raised, if the recurrence rule of ``event`` is malformed.
+    """
+    dtstart = event.dtstart
+    if dtstart.tzinfo is not None:
+        after = after.replace(tzinfo=dtstart.tzinfo)
+        before = before.replace(tzinfo=dtstart.tzinfo)
+
+    result = set()
+    if after <= dtstart <= before:
+        # DTSTART is always the first occurence, even if the rule does not
+        # match it
+        result.add(dtstart)
+    if event.rrule is not None:
+        rule = rrulestr(_normalize_until(event.rrule, dtstart), dtstart=dtstart)
+        result.update(compile_rule(fast_forward(rule, after)).between(after, before))
+    result.update(x for x in event.rdates if after <= x <= before)
+    result.difference_update(event.exdates)
+    return sorted(result)
@@ -0,0 +1,243 @@
+# SPDX-License-Identifier: MIT
+
+"""Provides events of iCalendar files.
+
+:class:`~calingen.contrib.providers.ics.provider.ICSFileProvider` is not
+registered as a plugin itsself. Projects provide their files by subclassing
+it, e.g.
+
+.. code-block:: python
+
+    class CompanyHolidays(ICSFileProvider):
+        title = _("Company Holidays")
+        path = "/srv/calendars/company-holidays.ics"
+"""
+
+# Python imports
+import datetime
+import glob
+import hashlib
+import logging
+import os
+import tempfile
+
+# app imports
+from calingen.constants import EventCategory
+from calingen.exceptions import CalingenException
+from calingen.interfaces.data_exchange import (
+    SOURCE_EXTERNAL,
+    CalendarEntry,
+    CalendarEntryList,
+)
+from calingen.interfaces.plugin_api import EventProvider
+
+# local imports
+from .parser import iter_events, occurences
+
+# get a module-level logger
+logger = logging.getLogger(__name__)
+
+_CACHE_VERSION = 1
+"""Included in the cache keys, so incompatible cache files are not used."""
+
+
+def _instant(timestamp):
+    """Return a comparable representation of a (naive or aware) ``timestamp``."""
+    if timestamp.tzinfo is None:
+        return timestamp
+    return timestamp.astimezone(datetime.timezone.utc).replace(tzinfo=None)
+
+
+class ICSFileProvider(EventProvider):
+    """Provides the events of a local iCalendar file.
+
+    Attributes
+    ----------
+    path : str
+        The path of the file. Has to be provided by subclasses.
+    category : calingen.constants.EventCategory.value
+        The category of all events of the file.
+    cache_dir : str
+        The directory of the parsed results. Defaults to ``None``, disabling
+        the cache on disk. The directory should not be writable by other
+        users; it is created with restricted permissions, if missing.
+
+    Notes
+    -----
+    The file is parsed incrementally (see
+    :func:`~calingen.contrib.providers.ics.parser.iter_events`) and the
+    recurrences of its events are only expanded within the requested years
+    (see :func:`~calingen.contrib.providers.ics.parser.occurences`).
+    Cancelled events are omitted and modified occurences (``RECURRENCE-ID``)
+    replace the original occurences.
+
+    Events with malformed properties are skipped. A missing or unreadable
+    file does not provide any events. In both cases a log message (of level
+    warning) is emitted.
+
+    If ``cache_dir`` is provided, the results are cached on disk per year,
+    keyed by the file's path, its modification time and its size, so
+    unchanged files are not parsed again.
+    The cached results are stored in the binary format of
+    :mod:`calingen.interfaces.columnar`.
+    Several years are resolved with one single pass over the file (see
+    :meth:`~calingen.contrib.providers.ics.provider.ICSFileProvider.resolve_range`).
+
+    As the file may change at any time, the results are not memoized in
+    memory (``cacheable = False``).
+
+    Like all other calendar entries of the app, the entries use `naive`
+    timestamps: timezone-aware occurences are provided in the local time of
+    their timezone.
+    """
+
+    abstract = True
+
+    path = None
+
+    category = EventCategory.HOLIDAY
+
+    cache_dir = None
+
+    cacheable = False
+
+    @classmethod
+    def resolve(cls, year):  # noqa: D102
+        return cls.resolve_range(year, year)[year]
+
+    @classmethod
+    def resolve_range(cls, first_year, last_year):
+        """Resolve the events of several years, parsing the file at most once.
+
+        Parameters
+        ----------
+        first_year : int
+        last_year : int
+
+        Returns
+        -------
+        dict
+            Maps every year of the range (inclusive) to its
+            :class:`~calingen.interfaces.data_exchange.CalendarEntryList`.
+        """
+        years = range(first_year, last_year + 1)
+        try:
+            stat = os.stat(cls.path)
+        except OSError as err:
+            logger.warning("Could not read {}: {}".format(cls.path, err))
+            return {year: CalendarEntryList() for year in years}
+
+        result = {year: cls._load_cached(stat, year) for year in years}
+        missing = [year for year in years if result[year] is None]
+        if missing:
+            try:
+                parsed = cls._parse(missing)
+            except OSError as err:
+                logger.warning("Could not read {}: {}".format(cls.path, err))
+                parsed = {year: CalendarEntryList() for year in missing}
+            else:
+                for year in missing:
+                    cls._store_cached(stat, year, parsed[year])
+            result.update(parsed)
+        return result
+
+    @classmethod
+    def _parse(cls, years):
+        """Parse the file once, collecting the events of ``years``."""
+        result = {year: CalendarEntryList() for year in years}
+        after = datetime.datetime(min(years), 1, 1)
+        before = datetime.datetime(max(years), 12, 31, 23, 59, 59, 999999)
+        source = (SOURCE_EXTERNAL, cls.title)
+
+        instances = {}
+        replaced = []
+        for event in iter_events(cls.path):
+            if event.recurrence_id is not None:
+                replaced.append((event.uid, event.recurrence_id))
+            if event.status == "CANCELLED":
+                continue
+
+            try:
+                timestamps = occurences(event, after, before)
+            except (TypeError, ValueError) as err:
+                logger.warning(
+                    "Skipping event {} of {}: {}".format(event.uid, cls.path, err)
+                )
+                continue
+
+            for timestamp in timestamps:
+                if timestamp.year not in result:
+                    continue
+                entry = CalendarEntry(
+                    event.summary,
+                    cls.category,
+                    timestamp.replace(tzinfo=None),
+                    source,
+                )
+                result[timestamp.year].add(entry)
+                if event.rrule is not None and event.recurrence_id is None:
+                    instances[(event.uid, _instant(timestamp))] = entry
+
+        # modified occurences replace the original occurences of recurring
+        # events, which may be specified before or after the modification
+        for uid, recurrence_id in replaced:
+            entry = instances.get((uid, _instant(recurrence_id)))
+            if entry is not None:
+                result[entry.timestamp.year].discard(entry)
+
+        return result
+
+    @classmethod
+    def _cache_path(cls, stat, year):
+        """Return the cache file of ``year`` and the prefix of all cache files of ``year``."""
+        prefix = hashlib.sha1(
+            repr(
+                (_CACHE_VERSION, os.path.abspath(cls.path), str(cls.title), year)
+            ).encode("utf-8")
+        ).hexdigest()
+        return (
+            os.path.join(
+                cls.cache_dir,
+                "{}-{}-{}.bin".format(prefix, stat.st_mtime_ns, stat.st_size),
+            ),
+            os.path.join(cls.cache_dir, prefix),
+        )
+
+    @classmethod
+    def _load_cached(cls, stat, year):
+        """Return the cached result of ``year`` or ``None``."""
+        if cls.cache_dir is None:
+            return None
+
+        path, _ = cls._cache_path(stat, year)
+        try:
+            with open(path, "rb") as file_handle:
+                return CalendarEntryList.from_bytes(file_handle.read())
+        except FileNotFoundError:
+            return None
+        except (OSError, CalingenException) as err:
+            logger.warning("Ignoring cache file {}: {}".format(path, err))
+            return None
+
+    @classmethod
+    def _store_cached(cls, stat, year, entries):
+        """Store the result of ``year``, replacing the results of older versions of the file."""
+        if cls.cache_dir is None:
+            return
+
+        path, prefix = cls._cache_path(stat, year)
+        try:
+            os.makedirs(os.path.dirname(path), mode=0o700, exist_ok=True)
+            for outdated in glob.glob("{}-*.bin".format(glob.escape(prefix))):
+                if outdated != path:
+                    os.remove(outdated)
+
+            # write atomically, so concurrent readers never see partial files
+            file_descriptor, tmp_path = tempfile.mkstemp(
+                dir=os.path.dirname(path), suffix=".tmp"
+            )
+            with os.fdopen(file_descriptor, "wb") as file_handle:
+                file_handle.write(entries.to_bytes())
+            os.replace(tmp_path, path)
+        except OSError as err:
+            logger.warning("Could not cache {}: {}".format(path, err))
@@ -0,0 +1,228 @@
+# SPDX-License-Identifier: MIT
+
+"""Collects statistics about the calls of the app's plugins.
+
+If :attr:`~calingen.settings.CALINGEN_INSTRUMENTATION` is enabled, the
+following calls are measured:
+
+- resolving implementations of
+  :class:`~calingen.interfaces.plugin_api.EventProvider` (operation
+  ``"resolve"``, see
+  :meth:`~calingen.interfaces.plugin_api.EventProvider.resolve_cached` and
+  :func:`~calingen.interfaces.plugin_api.resolve_providers`), including the
+  hits and misses of the in-memory cache;
+- resolving :class:`~calingen.models.event.Event` instances (operation
+  ``"resolve"``) and all events of a user at once (operation
+  ``"resolve_bulk"``, see
+  :meth:`EventManager.get_calendar_entry_list() <calingen.models.event.EventManager.get_calendar_entry_list>`);
+- rendering implementations of
+  :class:`~calingen.interfaces.plugin_api.LayoutProvider` (operation
+  ``"render"``) and compiling their results with implementations of
+  :class:`~calingen.interfaces.plugin_api.CompilerProvider` (operation
+  ``"get_response"``), see :class:`calingen.views.generation.CompilerView`.
+
+Every call is aggregated in :data:`~calingen.instrumentation.stats_registry`
+and published by the signal
+:data:`~calingen.signals.plugin_call_finished`. The statistics are kept per
+process; they may be dumped by the management command ``calingen_stats``.
+"""
+
+# Python imports
+import time
+from threading import Lock
+
+# Django imports
+from django.conf import settings
+
+# app imports
+from calingen.signals import plugin_call_finished
+
+
+class PluginStats:
+    """The aggregated calls of one operation of one plugin.
+
+    Attributes
+    ----------
+    calls : int
+    total_time : float
+        The cumulative time of all calls in seconds.
+    max_time : float
+        The time of the slowest call in seconds.
+    entries : int
+        The cumulative number of resolved entries.
+    cache_hits : int
+    cache_misses : int
+    """
+
+    __slots__ = (
+        "calls",
+        "total_time",
+        "max_time",
+        "entries",
+        "cache_hits",
+        "cache_misses",
+    )
+
+    def __init__(self):  # noqa: D107
+        self.calls = 0
+        self.total_time = 0.0
+        self.max_time = 0.0
+        self.entries = 0
+        self.cache_hits = 0
+        self.cache_misses = 0
+
+    @property
+    def mean_time(self):
+        """The mean time of a call in seconds (:py:obj:`float`)."""
+        return self.total_time / self.calls if self.calls else 0.0
+
+    @property
+    def hit_rate(self):
+        """The share of cached results (:py:obj:`float`) or ``None``, if the calls are not cached."""
+        lookups = self.cache_hits + self.cache_misses
+        return self.cache_hits / lookups if lookups else None
+
+    def as_dict(self):
+        """Return the statistics (including ``mean_time`` and ``hit_rate``) as :py:obj:`dict`."""
+        result = {name: getattr(self, name) for name in self.__slots__}
+        result["mean_time"] = self.mean_time
+        result["hit_rate"] = self.hit_rate
+        return result
+
+    def copy(self):  # noqa: D102
+        result = PluginStats()
+        for name in self.__slots__:
+            setattr(result, name, getattr(self, name))
+        return result
+
+
+class StatsRegistry:
+    """Thread-safe registry of :class:`~calingen.instrumentation.PluginStats`."""
+
+    def __init__(self):  # noqa: D107
+        self._lock = Lock()
+        self._stats = {}
+
+    def record(self, plugin, operation, duration, entries=None, cache_hit=None):
+        """Add one call to the statistics of ``plugin`` and ``operation``.
+
+        Parameters
+        ----------
+        plugin : class
+        operation : str
+        duration : float
+        entries : int, optional
+        cache_hit : bool, optional
+        """
+        with self._lock:
+            try:
+                stats = self._stats[(plugin, operation)]
+            except KeyError:
+                stats = self._stats[(plugin, operation)] = PluginStats()
+            stats.calls += 1
+            stats.total_time += duration
+            if duration > stats.max_time:
+                stats.max_time = duration
+            if entries is not None:
+                stats.entries += entries
+            if cache_hit is True:
+                stats.cache_hits += 1
+            elif cache_hit is False:
+                stats.cache_misses += 1
+
+    def snapshot(self):
+        """Return a copy of the statistics.
+
+        Returns
+        -------
+        dict
+            Maps ``(qualified classname, operation)`` to
+            :class:`~calingen.instrumentation.PluginStats`, sorted by the
+            cumulative time (descending).
+        """
+        # delay the import, because the plugin api depends on this module
+        # app imports
+        from calingen.interfaces.plugin_api import fully_qualified_classname
+
+        with self._lock:
+            items = [(key, stats.copy()) for key, stats in self._stats.items()]
+        items.sort(key=lambda item: item[1].total_time, reverse=True)
+        return {
+            (fully_qualified_classname(plugin), operation): stats
+            for (plugin, operation), stats in items
+        }
+
+    def reset(self):
+        """Discard all statistics."""
+        with self._lock:
+            self._stats.clear()
+
+
+stats_registry = StatsRegistry()
+"""The process-wide :class:`~calingen.instrumentation.StatsRegistry`."""
+
+
+def instrumentation_enabled():
+    """Return ``True``, if :attr:`~calingen.settings.CALINGEN_INSTRUMENTATION` is enabled."""
+    return settings.CALINGEN_INSTRUMENTATION
+
+
+def record_call(plugin, operation, duration, entries=None, cache_hit=None):
+    """Record a call and send :data:`~calingen.signals.plugin_call_finished`.
+
+    Parameters
+    ----------
+    plugin : class
+        The called plugin.
+    operation : str
+        The called method.
+    duration : float
+        The time of the call in seconds.
+    entries : int, optional
+        The number of resolved entries.
+    cache_hit : bool, optional
+        ``True``, if the result was provided by a cache, ``False``, if it was
+        computed despite a cache.
+
+    Notes
+    -----
+    Callers should check :func:`~calingen.instrumentation.instrumentation_enabled` first,
+    so the duration is only measured, if the call is actually recorded.
+    """
+    stats_registry.record(plugin, operation, duration, entries, cache_hit)
+    plugin_call_finished.send(
+        sender=plugin,
+        operation=operation,
+        duration=duration,
+        entries=entries,
+        cache_hit=cache_hit,
+    )
+
+
+def instrumented_call(plugin, operation, func, *args, **kwargs):
+    """Call ``func(*args, **kwargs)`` and record the call, if instrumentation is enabled.
+
+    Parameters
+    ----------
+    plugin : class
+    operation : str
+    func : callable
+
+    Returns
+    -------
+    any
+        The result of ``func``. If the result provides ``len()`` and is not a
+        :py:obj:`str`, its length is recorded as the number of ``entries``.
+    """
+    if not instrumentation_enabled():
+        return func(*args, **kwargs)
+
+    start = time.perf_counter()
+    result = func(*args, **kwargs)
+    duration = time.perf_counter() - start
+
+    entries = None
+    if hasattr(result, "__len__") and not isinstance(result, (str, bytes)):
+        entries = len(result)
+    record_call(plugin, operation, duration, entries=entries)
+    return result
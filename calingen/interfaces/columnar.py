@@ -0,0 +1,441 @@
+# SPDX-License-Identifier: MIT
+
+"""Provides a compact, columnar binary serialization format for calendar entries.
+
+Instead of serializing one object per entry, the entries are stored column by
+column. ``title``, ``display_title``, ``category`` and ``source`` are
+*interned* in lookup tables, so every entry only stores small integer codes:
+
+- a header of 16 bytes: the magic bytes ``CLGN``, the format version
+  (``uint16``), a reserved ``uint16``, the number of entries (``uint32``) and
+  the size of the lookup tables (``uint32``);
+- the columns as fixed-width little-endian arrays, widest first: timestamps
+  (``int64``), title codes, display title codes and source codes
+  (``uint32``), category codes and timezone codes (``uint16``);
+- the lookup tables, encoded as UTF-8 JSON.
+
+Buffers of version 1 of the format, which has no display title codes, are
+still decoded.
+
+The format is lossy, as it stores values, not objects:
+
+- lazy translations are evaluated in the active language; they are restored
+  as lazy strings of that text, i.e. they are not translated again;
+- callables, e.g. the URL of an :class:`~calingen.models.event.Event` in
+  ``source``, are called once; they are restored as callables, that return
+  the result of that call;
+- timezones are restored as :py:class:`datetime.timezone` with the same UTC
+  offset;
+- tuples and lists are both restored as tuples.
+
+All other values (:py:obj:`str`, numbers, ``None`` and tuples of them) are
+restored unchanged.
+
+As all columns are properly aligned, a serialized list may be decoded without
+copying the columns, e.g. directly from a memory-mapped file (see
+:func:`~calingen.interfaces.columnar.load_file`).
+
+The format is used by
+:meth:`CalendarEntryList.to_bytes() <calingen.interfaces.data_exchange.CalendarEntryList.to_bytes>`
+and
+:meth:`CalendarEntryList.from_bytes() <calingen.interfaces.data_exchange.CalendarEntryList.from_bytes>`.
+"""
+
+# Python imports
+import datetime
+import json
+import mmap
+import struct
+import sys
+from array import array
+from itertools import repeat
+
+# Django imports
+from django.utils.functional import Promise, lazystr
+
+# app imports
+from calingen.exceptions import CallingenInterfaceException
+from calingen.interfaces.data_exchange import CalendarEntry
+
+_EPOCH = datetime.datetime(1970, 1, 1)
+_EPOCH_UTC = _EPOCH.replace(tzinfo=datetime.timezone.utc)
+_ONE_MICROSECOND = datetime.timedelta(microseconds=1)
+
+_FORMAT_MAGIC = b"CLGN"
+_FORMAT_VERSION = 2
+_FORMAT_HEADER = struct.Struct("<4sHHII")
+
+# The columns as (name, typecode), in the order of the binary format.
+_COLUMNS = (
+    ("timestamps", "q"),
+    ("titles", "I"),
+    ("display_titles", "I"),
+    ("sources", "I"),
+    ("categories", "H"),
+    ("tzinfos", "H"),
+)
+
+# The columns of the supported versions of the format.
+_VERSION_COLUMNS = {
+    1: tuple(column for column in _COLUMNS if column[0] != "display_titles"),
+    2: _COLUMNS,
+}
+
+
+class ColumnarFormatException(CallingenInterfaceException):
+    """Raised, if entries can not be serialized or a buffer can not be decoded."""
+
+
+def timestamp_to_int(timestamp):
+    """Convert a :py:obj:`datetime.datetime` to microseconds since the epoch.
+
+    Parameters
+    ----------
+    timestamp : datetime.datetime
+        The timestamp to convert.
+
+    Returns
+    -------
+    int
+        Microseconds since 1970-01-01. Naive timestamps are converted as they
+        are, timezone-aware timestamps are normalized to UTC.
+    """
+    if timestamp.tzinfo is None:
+        return (timestamp - _EPOCH) // _ONE_MICROSECOND
+    return (timestamp - _EPOCH_UTC) // _ONE_MICROSECOND
+
+
+def int_to_timestamp(value, tzinfo=None):
+    """Convert microseconds since the epoch back to :py:obj:`datetime.datetime`.
+
+    This is the inverse of
+    :func:`~calingen.interfaces.columnar.timestamp_to_int`.
+
+    Parameters
+    ----------
+    value : int
+        Microseconds since 1970-01-01.
+    tzinfo : datetime.tzinfo, optional
+        If provided, ``value`` is interpreted as UTC and the result is converted
+        to this timezone.
+
+    Returns
+    -------
+    datetime.datetime
+    """
+    if tzinfo is None:
+        return _EPOCH + datetime.timedelta(microseconds=value)
+    return (_EPOCH_UTC + datetime.timedelta(microseconds=value)).astimezone(tzinfo)
+
+
+class _StoredResult:
+    """Stand-in for a callable, that was serialized by its result."""
+
+    __slots__ = ("value",)
+
+    def __init__(self, value):
+        self.value = value
+
+    def __call__(self):
+        return self.value
+
+    def __eq__(self, other):
+        if isinstance(other, _StoredResult):
+            return self.value == other.value
+        return NotImplemented
+
+    def __hash__(self):
+        return hash(self.value)
+
+    def __repr__(self):
+        return "<_StoredResult({!r})>".format(self.value)
+
+
+def _encode_value(value):
+    """Convert a title, category or source to its JSON representation.
+
+    Lazy translations are evaluated (using the currently active language) and
+    callables are replaced by their return value; both are marked by wrapping
+    them in an object. Tuples are stored as lists.
+    """
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    if isinstance(value, Promise):
+        return {"lazy": str(value)}
+    if isinstance(value, (tuple, list)):
+        return [_encode_value(item) for item in value]
+    if callable(value):
+        return {"call": _encode_value(value())}
+    raise ColumnarFormatException(
+        "Can not serialize value of type {}".format(type(value).__name__)
+    )
+
+
+def _decode_value(value):
+    """Restore a value from its JSON representation (lists become tuples)."""
+    if isinstance(value, list):
+        return tuple(_decode_value(item) for item in value)
+    if isinstance(value, dict):
+        if "lazy" in value:
+            return lazystr(value["lazy"])
+        return _StoredResult(_decode_value(value["call"]))
+    return value
+
+
+def _intern_key(value):
+    """Return the key of ``value`` in an :class:`_InternTable`.
+
+    Lazy translations compare equal to their text, so the type is part of the
+    key.
+    """
+    if isinstance(value, tuple):
+        return tuple(_intern_key(item) for item in value)
+    return (type(value), value)
+
+
+def _encode_tzinfo(tzinfo):
+    """Convert a ``tzinfo`` to its UTC offset in microseconds."""
+    if tzinfo is None:
+        return None
+    offset = tzinfo.utcoffset(None)
+    if offset is None:
+        raise ColumnarFormatException(
+            "Can not serialize timezone {} without a fixed UTC offset".format(tzinfo)
+        )
+    return offset // _ONE_MICROSECOND
+
+
+def _decode_tzinfo(offset):
+    """Restore a ``tzinfo`` from its UTC offset in microseconds."""
+    if offset is None:
+        return None
+    if offset == 0:
+        return datetime.timezone.utc
+    return datetime.timezone(datetime.timedelta(microseconds=offset))
+
+
+class _InternTable:
+    """Map arbitrary (hashable) values to small integer codes."""
+
+    __slots__ = ("values", "_codes")
+
+    def __init__(self, values=()):
+        self.values = []
+        self._codes = {}
+        for value in values:
+            self.code(value)
+
+    def code(self, value):
+        """Return the code for ``value``, adding it to the table if required."""
+        try:
+            key = _intern_key(value)
+            return self._codes[key]
+        except KeyError:
+            code = len(self.values)
+            self._codes[key] = code
+            self.values.append(value)
+            return code
+        except TypeError:
+            # unhashable values can not be interned, just store them
+            self.values.append(value)
+            return len(self.values) - 1
+
+
+def dump_entries(entries):
+    """Return the binary representation of ``entries``.
+
+    See the module's documentation for a description of the format.
+
+    Parameters
+    ----------
+    entries : iterable
+        Instances of :class:`~calingen.interfaces.data_exchange.CalendarEntry`,
+        e.g. a :class:`~calingen.interfaces.data_exchange.CalendarEntryList`.
+        They are stored in the given order.
+
+    Returns
+    -------
+    bytes
+
+    Raises
+    ------
+    ColumnarFormatException
+        Raised if a ``source`` contains values that can not be represented
+        or if a timestamp has a timezone without a fixed UTC offset.
+
+    Notes
+    -----
+    ``title``, ``display_title``, ``category`` and the elements of
+    ``source`` are stored as JSON values. The format is lossy: lazy
+    translations are evaluated using the currently active language and
+    callables are called once, so only their current value is kept (see the
+    module's documentation).
+    """
+    columns = {name: array(typecode) for name, typecode in _COLUMNS}
+    tzinfo_table = _InternTable([None])
+    category_table = _InternTable()
+    title_table = _InternTable()
+    display_title_table = _InternTable([None])
+    source_table = _InternTable()
+
+    for entry in entries:
+        timestamp = entry.timestamp
+        columns["timestamps"].append(timestamp_to_int(timestamp))
+        columns["tzinfos"].append(tzinfo_table.code(timestamp.tzinfo))
+        columns["categories"].append(category_table.code(entry.category))
+        columns["titles"].append(title_table.code(entry.title))
+        columns["display_titles"].append(display_title_table.code(entry._display_title))
+        columns["sources"].append(source_table.code(entry.source))
+
+    tables = json.dumps(
+        {
+            "tzinfos": [_encode_tzinfo(x) for x in tzinfo_table.values],
+            "categories": [_encode_value(x) for x in category_table.values],
+            "titles": [_encode_value(x) for x in title_table.values],
+            "display_titles": [_encode_value(x) for x in display_title_table.values],
+            "sources": [_encode_value(x) for x in source_table.values],
+        },
+        separators=(",", ":"),
+    ).encode("utf-8")
+
+    chunks = [
+        _FORMAT_HEADER.pack(
+            _FORMAT_MAGIC,
+            _FORMAT_VERSION,
+            0,
+            len(columns["timestamps"]),
+            len(tables),
+        )
+    ]
+    for name, _typecode in _COLUMNS:
+        column = columns[name]
+        if sys.byteorder != "little":
+            column.byteswap()
+        chunks.append(column.tobytes())
+    chunks.append(tables)
+    return b"".join(chunks)
+
+
+def load_entries(buffer):
+    """Decode the entries of a binary representation.
+
+    The columns are not copied, but read as :py:class:`memoryview` on
+    ``buffer`` (on little-endian platforms). All views are released, before
+    this function returns or raises, so ``buffer`` may be closed afterwards,
+    e.g. a :py:class:`mmap.mmap`.
+
+    Parameters
+    ----------
+    buffer : bytes-like object
+        The output of :func:`~calingen.interfaces.columnar.dump_entries`,
+        e.g. as :py:obj:`bytes` or :py:class:`mmap.mmap`.
+
+    Returns
+    -------
+    list
+        The :class:`~calingen.interfaces.data_exchange.CalendarEntry`
+        instances, in the order they were stored.
+
+    Raises
+    ------
+    ColumnarFormatException
+        Raised if ``buffer`` does not contain serialized entries.
+    """
+    views = [memoryview(buffer)]
+    try:
+        return _load_views(views)
+    finally:
+        # release the views in reverse order, as casts and slices depend on
+        # the view they were created from
+        for view in reversed(views):
+            view.release()
+
+
+def _load_views(views):
+    """Decode the entries of ``views[0]``, see :func:`~calingen.interfaces.columnar.load_entries`.
+
+    Every view, that is created, is appended to ``views``.
+    """
+    view = views[0].cast("B")
+    views.append(view)
+    if len(view) < _FORMAT_HEADER.size:
+        raise ColumnarFormatException("Buffer is too short")
+    magic, version, _, count, tables_size = _FORMAT_HEADER.unpack_from(view)
+    if magic != _FORMAT_MAGIC or version not in _VERSION_COLUMNS:
+        raise ColumnarFormatException(
+            "Buffer does not contain serialized entries in a supported format"
+        )
+
+    layout = _VERSION_COLUMNS[version]
+    columns = {}
+    offset = _FORMAT_HEADER.size
+    for name, typecode in layout:
+        end = offset + count * array(typecode).itemsize
+        if end > len(view):
+            raise ColumnarFormatException("Buffer is too short")
+        chunk = view[offset:end]
+        views.append(chunk)
+        if sys.byteorder == "little":
+            columns[name] = chunk.cast(typecode)
+            views.append(columns[name])
+        else:
+            columns[name] = array(typecode, chunk.tobytes())
+            columns[name].byteswap()
+        offset = end
+    if offset + tables_size != len(view):
+        raise ColumnarFormatException("Buffer size does not match its header")
+    if "display_titles" not in columns:
+        columns["display_titles"] = repeat(0, count)
+
+    try:
+        tables = json.loads(view[offset:].tobytes().decode("utf-8"))
+        tzinfos = [_decode_tzinfo(value) for value in tables["tzinfos"]]
+        categories = tables["categories"]
+        titles = [_decode_value(value) for value in tables["titles"]]
+        display_titles = [
+            _decode_value(value) for value in tables.get("display_titles", [None])
+        ]
+        sources = [_decode_value(value) for value in tables["sources"]]
+
+        return [
+            CalendarEntry(
+                titles[title],
+                categories[category],
+                int_to_timestamp(timestamp, tzinfos[tzinfo]),
+                sources[source],
+                display_title=display_titles[display_title],
+            )
+            for timestamp, title, display_title, source, category, tzinfo in zip(
+                *(columns[name] for name, _typecode in _COLUMNS)
+            )
+        ]
+    except (ValueError, LookupError, TypeError) as err:
+        raise ColumnarFormatException("Could not decode lookup tables") from err
+
+
+def load_file(path):
+    """Decode the entries of a file, using a memory map.
+
+    Parameters
+    ----------
+    path : str, pathlib.Path
+        A file, written with the output of
+        :func:`~calingen.interfaces.columnar.dump_entries`.
+
+    Returns
+    -------
+    list
+        See :func:`~calingen.interfaces.columnar.load_entries`.
+
+    Raises
+    ------
+    ColumnarFormatException
+        Raised if the file does not contain serialized entries.
+    """
+    with open(path, "rb") as file_handle:
+        try:
+            mapped = mmap.mmap(file_handle.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError as err:
+            raise ColumnarFormatException("Could not map {}".format(path)) from err
+    with mapped:
+        return load_entries(mapped)
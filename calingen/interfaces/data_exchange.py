@@ -4,7 +4,12 @@
 
 # Python imports
 import datetime
+import heapq
+from bisect import bisect_left, bisect_right
+from collections.abc import Mapping
 from functools import total_ordering
+from itertools import chain, islice
+from operator import attrgetter
 
 # external imports
 from dateutil import parser
@@ -19,6 +24,119 @@ SOURCE_INTERNAL = "INTERNAL"
 SOURCE_EXTERNAL = "EXTERNAL"
 """Constant for entries provided by implementations of :class:`calingen.interfaces.plugin_api.EventProvider`"""
 
+_CATEGORY_LOOKUP = {category.value: category for category in EventCategory}
+"""Maps the values of :class:`~calingen.constants.EventCategory` to its members."""
+
+
+def parse_timestamp(value):
+    """Parse a timestamp, provided as :py:obj:`str`.
+
+    Parameters
+    ----------
+    value : str
+        The timestamp to parse.
+
+    Returns
+    -------
+    datetime.datetime
+
+    Raises
+    ------
+    dateutil.parser._parser.ParserError
+        Raised if ``value`` could not be parsed.
+
+    Notes
+    -----
+    ISO 8601 formatted strings are parsed by
+    :py:meth:`datetime.datetime.fromisoformat`, which is implemented in C and
+    very fast. All other strings are delegated to :meth:`dateutil.parser.parse`.
+    Django uses :py:meth:`datetime.datetime.strptime`, ``dateutil.parser``
+    should be "more forgiving". And while we rely on that package anyway...
+    """
+    try:
+        return datetime.datetime.fromisoformat(value)
+    except (TypeError, ValueError):
+        return parser.parse(value)
+
+
+def make_key(title, category, timestamp):
+    """Return the key, that identifies a calendar entry.
+
+    Parameters
+    ----------
+    title : str
+    category : calingen.constants.EventCategory.value
+    timestamp : datetime.datetime, datetime.date, str
+
+    Returns
+    -------
+    tuple
+        ``(timestamp, category, title)``, normalized just like the attributes
+        of :class:`~calingen.interfaces.data_exchange.CalendarEntry`. Entries
+        are compared by this key.
+
+    Raises
+    ------
+    dateutil.parser._parser.ParserError
+        Raised if ``timestamp`` is provided as :py:obj:`str` and could not be
+        parsed by :func:`~calingen.interfaces.data_exchange.parse_timestamp`
+    """
+    # Use the predefined category (if available)
+    category = _CATEGORY_LOOKUP.get(category, category)
+
+    # Ensure that "timestamp" is a datetime.datetime object
+    if isinstance(timestamp, datetime.datetime):
+        pass
+    elif isinstance(timestamp, datetime.date):
+        timestamp = datetime.datetime.combine(timestamp, datetime.time.min)
+    else:
+        timestamp = parse_timestamp(timestamp)
+
+    return (timestamp, category, title)
+
+
+sort_key = attrgetter("timestamp", "category", "title")
+"""Return the key of a :class:`~calingen.interfaces.data_exchange.CalendarEntry` for sorting.
+
+The key is equal to the result of
+:func:`~calingen.interfaces.data_exchange.make_key`, e.g.
+``entries.sort(key=sort_key)`` sorts a :py:obj:`list` of entries in their
+natural order, but compares the keys in C.
+"""
+
+
+def merge_sorted(*iterables):
+    """Lazily merge sorted iterables of calendar entries.
+
+    Parameters
+    ----------
+    iterables : iterable
+        Every iterable has to provide
+        :class:`~calingen.interfaces.data_exchange.CalendarEntry` instances in
+        sorted order, e.g. a
+        :class:`~calingen.interfaces.data_exchange.CalendarEntryList` or the
+        result of
+        :meth:`EventProvider.iter_entries() <calingen.interfaces.plugin_api.EventProvider.iter_entries>`.
+
+    Yields
+    ------
+    CalendarEntry
+        The entries of all ``iterables`` in sorted order. Duplicate entries are
+        skipped; like
+        :class:`~calingen.interfaces.data_exchange.CalendarEntryList`, the
+        entry of the first iterable is kept.
+
+    Notes
+    -----
+    This is a k-way merge using :py:func:`heapq.merge`, so only one entry per
+    iterable is held in memory at any given time.
+    """
+    last = None
+    for entry in heapq.merge(*iterables):
+        if last is None or entry != last:
+            yield entry
+            last = entry
+
 
 @total_ordering
 class CalendarEntry:
@@ -30,11 +148,19 @@ class CalendarEntry:
     category : calingen.constants.EventCategory.value
     timestamp : datetime.datetime, datetime.date, str
     source : tuple
+    display_title : str, optional
 
     Attributes
     ----------
     title : str
-        The actual title of the entry.
+        The actual title of the entry. This is used for comparisons, so it
+        should be a plain :py:obj:`str`, e.g. an already translated title.
+    display_title : str
+        An alternative representation of ``title`` for display purposes, e.g.
+        the `lazy` translation, that ``title`` was resolved from. This allows
+        consumers to render the entry in another language than the one that
+        was active, while ``title`` was resolved. Falls back to ``title``, if
+        not provided.
     category : str
         While this is actually a simple :py:obj:`str`, it is expected to be of
         the specified type. A lookup against
@@ -47,8 +173,9 @@ class CalendarEntry:
     timestamp : datetime.datetime
         The paremeter accepts the specified types and will convert them to
         :py:obj:`datetime.datetime` internally.
-        If a :py:obj:`str` is given, :meth:`dateutil.parser.parse` is used and
-        may raise an exception, if the provided string could not be parsed.
+        If a :py:obj:`str` is given, it is parsed by
+        :func:`~calingen.interfaces.data_exchange.parse_timestamp`, which may
+        raise an exception, if the provided string could not be parsed.
     source : tuple
         Expected is a tuple of the form ``("INTERNAL", [int])``, where ``[int]``
         is interpreted as an ``id`` of an :class:`~calingen.models.event.Event`
@@ -65,7 +192,7 @@ class CalendarEntry:
         Raised if ``source`` was not provided as :py:obj:`tuple`
     dateutil.parser._parser.ParserError
         Raised if ``timestamp`` is provided as :py:obj:`str` and could not be
-        parsed by :meth:`dateutil.parser.parse`
+        parsed by :func:`~calingen.interfaces.data_exchange.parse_timestamp`
 
     Warnings
     --------
@@ -78,9 +205,9 @@ class CalendarEntry:
     **equal**.
 
     The implementation of
-    :class:`calingen.interfaces.data_exchange.CalendarEntryList` relies
-    internally on a ``set``, which means the entries are unique. So, only
-    one of the events will be present in the resulting ``CalendarEntryList``.
+    :class:`calingen.interfaces.data_exchange.CalendarEntryList` keeps its
+    entries unique. So, only one of the events will be present in the resulting
+    ``CalendarEntryList``.
 
     Notes
     -----
@@ -96,6 +223,15 @@ class CalendarEntry:
     :class:`~calingen.interfaces.data_exchange.CalendarEntryList` with instances
     of this class as its payload.
 
+    Instances are **immutable** and use ``__slots__``, so they do not carry a
+    per-instance ``__dict__`` and only store references to their attributes.
+    Comparisons evaluate ``timestamp``, ``category`` and ``title`` one by one,
+    so comparing entries does not allocate any temporary objects. Sorting big
+    lists of entries is faster with :func:`~calingen.interfaces.data_exchange.sort_key`,
+    as the comparisons of its keys are performed in C. Attempting to modify an
+    attribute of an existing instance raises :py:exc:`AttributeError`; create a
+    new instance instead.
+
     As you can see, the documentation of the class's `magic methods` is kept at
     a minimum. See the source code for further details!
     """
@@ -103,47 +239,80 @@ class CalendarEntry:
     class CalendarEntryException(CallingenInterfaceException):
         """Class-specific exception, raised on failures in this class's methods."""
 
-    def __init__(self, title, category, timestamp, source):
+    __slots__ = ("timestamp", "category", "title", "source", "_display_title")
+
+    def __init__(self, title, category, timestamp, source, display_title=None):
         # documentation of the costructor is in the class's docstring!
-        self.title = title
-
-        # Use the predefined category (if available)
-        if category in EventCategory.values:
-            self.category = EventCategory[category]
-        else:
-            self.category = category
-
-        # Ensure that "timestamp" is a datetime.datetime object
-        if isinstance(timestamp, datetime.datetime):
-            self.timestamp = timestamp
-        elif isinstance(timestamp, datetime.date):
-            self.timestamp = datetime.datetime.combine(timestamp, datetime.time.min)
-        else:
-            # Delegate parsing to dateutil; probably breaks if unparsable
-            # Django uses datetime.datetime.strptime(), dateutil.parser should
-            # be "more forgiving". And while we rely on that package anyway...
-            self.timestamp = parser.parse(timestamp)
+
+        timestamp, category, title = make_key(title, category, timestamp)
 
         # "source" is expected to be a tuple of the the form
         # (SOURCE_INTERNAL, Event.id) or (SOURCE_EXTERNAL, EventProvider.title)
-        if isinstance(source, tuple):
-            self.source = source
-        else:
+        if not isinstance(source, tuple):
             raise self.CalendarEntryException("source must be provided as tuple")
 
+        # Instances are immutable, so the slots are populated by bypassing
+        # __setattr__().
+        object.__setattr__(self, "timestamp", timestamp)
+        object.__setattr__(self, "category", category)
+        object.__setattr__(self, "title", title)
+        object.__setattr__(self, "source", source)
+        object.__setattr__(self, "_display_title", display_title)
+
+    @property
+    def display_title(self):
+        """Read-only access to the entry's ``display_title``."""
+        if self._display_title is None:
+            return self.title
+        return self._display_title
+
+    @property
+    def _key(self):
+        """The entry's key, as provided by :func:`~calingen.interfaces.data_exchange.make_key`."""
+        return (self.timestamp, self.category, self.title)
+
+    def __setattr__(self, name, value):
+        """Prevent modification of the instance."""
+        raise AttributeError("CalendarEntry instances are immutable")
+
+    def __delattr__(self, name):
+        """Prevent modification of the instance."""
+        raise AttributeError("CalendarEntry instances are immutable")
+
+    def __reduce__(self):
+        """Support pickling of the immutable instance."""
+        return (
+            self.__class__,
+            (
+                self.title,
+                self.category,
+                self.timestamp,
+                self.source,
+                self._display_title,
+            ),
+        )
+
     def __eq__(self, other):
         """Check equality with ``other`` object."""
         # see https://stackoverflow.com/a/2909119
         # see https://stackoverflow.com/a/8796908
         if isinstance(other, CalendarEntry):
-            return self.__key() == other.__key()  # pragma: nocover
+            return (
+                self.timestamp == other.timestamp
+                and self.category == other.category
+                and self.title == other.title
+            )
         return NotImplemented
 
     def __lt__(self, other):
         """Provide `less than` comparison with ``other`` object."""
         # see https://stackoverflow.com/a/8796908
         if isinstance(other, CalendarEntry):
-            return self.__key() < other.__key()
+            if self.timestamp != other.timestamp:
+                return self.timestamp < other.timestamp
+            if self.category != other.category:
+                return self.category < other.category
+            return self.title < other.title
         return NotImplemented
 
     def __repr__(self):
@@ -154,24 +323,17 @@ class CalendarEntry:
             self.category.__repr__(),
             self.timestamp.__repr__(),
             self.source.__repr__(),
-        )  # pragma: nocover
+        )
 
     def __str__(self):
         """Provide a string representation of the instance."""
         # see https://stackoverflow.com/a/12448200
-        return "[{}] {} ({})".format(
-            self.timestamp, self.title, self.category
-        )  # pragma: nocover
+        return "[{}] {} ({})".format(self.timestamp, self.title, self.category)
 
     def __hash__(self):
         """Provide a unique representation of the instance."""
         # see https://stackoverflow.com/a/2909119
-        return hash(self.__key())  # pragma: nocover
-
-    def __key(self):
-        """Provide internal representation of the instance."""
-        # see https://stackoverflow.com/a/2909119
-        return (self.timestamp, self.category, self.title)  # pragma: nocover
+        return hash((self.timestamp, self.category, self.title))
 
 
 class CalendarEntryList:
@@ -179,10 +341,24 @@ class CalendarEntryList:
 
     Attributes
     ----------
-    _entries : set
-        This attribute stores the list of calendar entries. It is implemented
-        as a :py:obj:`set`, which makes it mutable and unordered. Primarily a
-        :py:obj:`set` is used to ensure that all included items are **unique**.
+    _entries : list
+        This attribute stores the list of calendar entries. The list is kept
+        **sorted** and all included items are **unique**.
+    _pending : list
+        Entries, that were added or merged but not yet sorted into
+        ``_entries``.
+    _date_index : dict
+        Maps :py:obj:`datetime.date` objects to the list of entries on that
+        day. The index is built on demand and discarded, if the list is
+        modified.
+    _index : dict
+        Maps the key of every entry (see
+        :func:`~calingen.interfaces.data_exchange.make_key`) to the entry.
+        The index is built on demand and then kept up to date by ``add()``,
+        ``replace()`` and ``discard()``; ``merge()`` discards it.
+    _stale : bool
+        ``True``, if ``_entries`` has to be rebuilt from ``_index``, because
+        entries were replaced or discarded.
 
     Warnings
     --------
@@ -198,16 +374,62 @@ class CalendarEntryList:
     Internally, the app expects the result of any ``resolve()`` operation to be
     an instance of this class with a set (or list) of
     :class:`~calingen.interfaces.data_exchange.CalendarEntry` instances.
+
+    Entries, that are added in order, are directly appended to ``_entries``.
+    All other entries are collected in ``_pending`` and are sorted into
+    ``_entries`` in one single step, as soon as the list is accessed (see
+    :meth:`~calingen.interfaces.data_exchange.CalendarEntryList._normalize`).
+    Merging two lists does not require sorting either list again.
+
+    The query methods
+    (:meth:`~calingen.interfaces.data_exchange.CalendarEntryList.on`,
+    :meth:`~calingen.interfaces.data_exchange.CalendarEntryList.between`,
+    :meth:`~calingen.interfaces.data_exchange.CalendarEntryList.by_month`,
+    :meth:`~calingen.interfaces.data_exchange.CalendarEntryList.by_iso_week`
+    and
+    :meth:`~calingen.interfaces.data_exchange.CalendarEntryList.by_category`)
+    rely on an index of the entries by date, which is built once and then
+    reused until the list is modified.
+
+    Just like a :py:obj:`list`, the entries may be accessed by their (sorted)
+    position, e.g. ``entries.0`` or ``entries|length`` in a template. Slicing
+    returns a :py:obj:`list` of entries.
+
+    Single entries may be looked up, replaced and removed by their key in
+    constant time
+    (:meth:`~calingen.interfaces.data_exchange.CalendarEntryList.get`,
+    :meth:`~calingen.interfaces.data_exchange.CalendarEntryList.replace`,
+    :meth:`~calingen.interfaces.data_exchange.CalendarEntryList.discard` and
+    ``in``), e.g. to patch an already resolved list after a single
+    :class:`~calingen.models.event.Event` was modified. The sorted
+    ``_entries`` are rebuilt once, as soon as the list is accessed again.
     """
 
     class CalendarEntryListException(CallingenInterfaceException):
         """Class-specific exception, raised on failures in this class's methods."""
 
     def __init__(self):  # noqa: D107
-        self._entries = set()
+        self._entries = []
+        self._pending = []
+        self._date_index = None
+        self._dates = None
+        self._index = None
+        self._stale = False
+
+    def __contains__(self, entry):  # noqa: D105
+        return getattr(entry, "_key", None) in self._get_index()
+
+    def __iter__(self):  # noqa: D105
+        self._normalize()
+        return iter(self._entries)
 
     def __len__(self):  # noqa: D105
-        return len(self._entries)  # pragma: nocover
+        self._normalize()
+        return len(self._entries)
+
+    def __getitem__(self, index):  # noqa: D105
+        self._normalize()
+        return self._entries[index]
 
     def add(self, entry):
         """Add a :class:`~calingen.interfaces.data_exchange.CalendarEntry` to the list.
@@ -229,7 +451,21 @@ class CalendarEntryList:
         if entry is None:
             raise self.CalendarEntryListException("An entry is required")
 
-        self._entries.add(entry)
+        self._date_index = None
+        if self._index is not None:
+            if entry._key in self._index:
+                return
+            self._index[entry._key] = entry
+
+        if not self._pending:
+            # fast path: entries that are added in order are simply appended
+            if not self._entries or self._entries[-1] < entry:
+                self._entries.append(entry)
+                return
+            if self._entries[-1] == entry:
+                return
+
+        self._pending.append(entry)
 
     def merge(self, entry_list_instance):
         """Merge two instances of ``CalendarEntryList``.
@@ -247,8 +483,312 @@ class CalendarEntryList:
         -----
         Providing a ``merge()`` method instead of enabling addition of objects
         of this type is a design choice and may be subject to change.
+
+        The (sorted) entries of ``entry_list_instance`` are appended to this
+        instance's ``_pending`` entries. As they form a sorted `run`, they are
+        merged into ``_entries`` in linear time (see
+        :meth:`~calingen.interfaces.data_exchange.CalendarEntryList._normalize`).
+        """
+        if self._stale:
+            self._normalize()
+        self._date_index = None
+        self._index = None
+        self._pending.extend(entry_list_instance)
+
+    @classmethod
+    def from_records(cls, records):
+        """Create an instance from raw records.
+
+        This is the preferred way to create big lists of entries, e.g. from
+        CSV files, JSON documents or database rows.
+
+        Parameters
+        ----------
+        records : iterable
+            Every record provides the arguments of
+            :class:`~calingen.interfaces.data_exchange.CalendarEntry`, either
+            as a sequence ``(title, category, timestamp, source)`` or as a
+            mapping with these keys. ``source`` may be provided as
+            :py:obj:`list` (as it is the case for JSON documents).
+
+        Returns
+        -------
+        CalendarEntryList
+
+        Raises
+        ------
+        dateutil.parser._parser.ParserError
+            Raised if a ``timestamp`` is provided as :py:obj:`str` and could not
+            be parsed.
+
+        Notes
+        -----
+        Timestamps provided as :py:obj:`str` are parsed only once per distinct
+        value. The entries are sorted in one single step, once the resulting
+        list is accessed.
+        """
+        parsed_timestamps = {}
+        entries = []
+        for record in records:
+            if isinstance(record, Mapping):
+                title = record["title"]
+                category = record["category"]
+                timestamp = record["timestamp"]
+                source = record["source"]
+            else:
+                title, category, timestamp, source = record
+
+            if isinstance(timestamp, str):
+                try:
+                    timestamp = parsed_timestamps[timestamp]
+                except KeyError:
+                    timestamp = parsed_timestamps[timestamp] = parse_timestamp(
+                        timestamp
+                    )
+            if isinstance(source, list):
+                source = tuple(source)
+
+            entries.append(CalendarEntry(title, category, timestamp, source))
+
+        result = cls()
+        result.merge(entries)
+        return result
+
+    @classmethod
+    def from_bytes(cls, buffer):
+        """Create an instance from its binary representation.
+
+        Parameters
+        ----------
+        buffer : bytes-like object
+            The output of
+            :meth:`~calingen.interfaces.data_exchange.CalendarEntryList.to_bytes`,
+            e.g. as :py:obj:`bytes` or :py:class:`mmap.mmap`.
+
+        Returns
+        -------
+        CalendarEntryList
+
+        Raises
+        ------
+        calingen.interfaces.columnar.ColumnarFormatException
+            Raised if ``buffer`` does not contain serialized entries.
+
+        Notes
+        -----
+        The entries are decoded by
+        :func:`~calingen.interfaces.columnar.load_entries`. They were stored in
+        sorted order, so they are merged as one single sorted run.
+        """
+        # delay the import, because the columnar module depends on this module
+        # app imports
+        from calingen.interfaces.columnar import load_entries
+
+        result = cls()
+        result.merge(load_entries(buffer))
+        return result
+
+    def to_bytes(self):
+        """Return a compact binary representation of this instance.
+
+        Returns
+        -------
+        bytes
+            See :mod:`calingen.interfaces.columnar` for details of the format.
+
+        Raises
+        ------
+        calingen.interfaces.columnar.ColumnarFormatException
+            Raised if the entries can not be serialized, see
+            :func:`~calingen.interfaces.columnar.dump_entries`.
+        """
+        # delay the import, because the columnar module depends on this module
+        # app imports
+        from calingen.interfaces.columnar import dump_entries
+
+        return dump_entries(self)
+
+    def copy(self):
+        """Return a (shallow) copy of this instance.
+
+        Returns
+        -------
+        CalendarEntryList
+            A new instance with the same entries. As entries are immutable,
+            both instances may be modified independently.
+        """
+        self._normalize()
+        result = self.__class__()
+        result._entries = list(self._entries)
+        return result
+
+    def get(self, title, category, timestamp, default=None):
+        """Return the entry with the given key.
+
+        Parameters
+        ----------
+        title : str
+        category : calingen.constants.EventCategory.value
+        timestamp : datetime.datetime, datetime.date, str
+            The arguments are normalized by
+            :func:`~calingen.interfaces.data_exchange.make_key`, just like
+            the arguments of
+            :class:`~calingen.interfaces.data_exchange.CalendarEntry`.
+        default : optional
+            Returned, if there is no matching entry.
+
+        Returns
+        -------
+        CalendarEntry
+        """
+        return self._get_index().get(make_key(title, category, timestamp), default)
+
+    def replace(self, entry, new_entry):
+        """Replace an entry of the list.
+
+        Parameters
+        ----------
+        entry : CalendarEntry
+            The entry to be replaced (or an equal entry).
+        new_entry : CalendarEntry
+            The replacement. If the list already contains another entry, that
+            is equal to ``new_entry``, ``entry`` is just removed.
+
+        Raises
+        ------
+        CalendarEntryList.CalendarEntryListException
+            Raised if ``entry`` is not part of the list.
+        """
+        index = self._get_index()
+        if entry._key not in index:
+            raise self.CalendarEntryListException(
+                "{} is not part of the list".format(entry)
+            )
+
+        self._date_index = None
+        if entry._key == new_entry._key:
+            index[entry._key] = new_entry
+            if not self._stale:
+                # the position does not change, but ``entry`` may still be
+                # pending
+                self._normalize()
+                self._entries[bisect_left(self._entries, entry)] = new_entry
+            return
+
+        del index[entry._key]
+        index.setdefault(new_entry._key, new_entry)
+        self._stale = True
+
+    def discard(self, entry):
+        """Remove an entry from the list, if it is present.
+
+        Parameters
+        ----------
+        entry : CalendarEntry
+            The entry to be removed (or an equal entry).
+        """
+        if self._get_index().pop(entry._key, None) is not None:
+            self._date_index = None
+            self._stale = True
+
+    def on(self, date):
+        """Return the entries of a given day.
+
+        Parameters
+        ----------
+        date : datetime.date, datetime.datetime
+            The day to look up. If a :py:obj:`datetime.datetime` is provided,
+            only its ``date()`` is considered.
+
+        Returns
+        -------
+        list
+            The sorted list of
+            :class:`~calingen.interfaces.data_exchange.CalendarEntry` of that
+            day.
         """
-        self._entries.update(entry_list_instance._entries)
+        if isinstance(date, datetime.datetime):
+            date = date.date()
+        return list(self._get_date_index().get(date, ()))
+
+    def between(self, start, end):
+        """Return the entries between ``start`` and ``end`` (inclusive).
+
+        Parameters
+        ----------
+        start : datetime.date, datetime.datetime
+            The lower bound. If a :py:obj:`datetime.date` is provided, the whole
+            day is included.
+        end : datetime.date, datetime.datetime
+            The upper bound. If a :py:obj:`datetime.date` is provided, the whole
+            day is included.
+
+        Returns
+        -------
+        CalendarEntryList
+            A new instance with the matching entries.
+        """
+        index = self._get_date_index()
+
+        start_date = start.date() if isinstance(start, datetime.datetime) else start
+        end_date = end.date() if isinstance(end, datetime.datetime) else end
+
+        result = self.__class__()
+        for date in islice(
+            self._dates,
+            bisect_left(self._dates, start_date),
+            bisect_right(self._dates, end_date),
+        ):
+            for entry in index[date]:
+                # datetime bounds need a check of the actual timestamp on the
+                # first and the last day
+                if isinstance(start, datetime.datetime) and entry.timestamp < start:
+                    continue
+                if isinstance(end, datetime.datetime) and entry.timestamp > end:
+                    continue
+                result.add(entry)
+        return result
+
+    def by_month(self):
+        """Group the entries by month.
+
+        Returns
+        -------
+        dict
+            Maps ``(year, month)`` to the sorted list of that month's
+            :class:`~calingen.interfaces.data_exchange.CalendarEntry`. Only
+            months with entries are included, in chronological order.
+        """
+        return self._group_dates(lambda date: (date.year, date.month))
+
+    def by_iso_week(self):
+        """Group the entries by their ISO calendar week.
+
+        Returns
+        -------
+        dict
+            Maps ``(iso_year, iso_week)`` (see
+            :py:meth:`datetime.date.isocalendar`) to the sorted list of that
+            week's :class:`~calingen.interfaces.data_exchange.CalendarEntry`.
+            Only weeks with entries are included, in chronological order.
+        """
+        return self._group_dates(lambda date: tuple(date.isocalendar()[:2]))
+
+    def by_category(self):
+        """Group the entries by their ``category``.
+
+        Returns
+        -------
+        dict
+            Maps the categories to the sorted list of
+            :class:`~calingen.interfaces.data_exchange.CalendarEntry` of that
+            category.
+        """
+        self._normalize()
+        result = {}
+        for entry in self._entries:
+            result.setdefault(entry.category, []).append(entry)
+        return result
 
     def sorted(self):
         """Return the object's ``_entries`` sorted by ``start``.
@@ -259,12 +799,145 @@ class CalendarEntryList:
             The sorted list of
             :class:`~calingen.interfaces.data_exchange.CalendarEntry`.
 
-        Warnings
-        --------
-        While this class uses internally a ``set`` to manage the entries, this
-        method returns a list.
+        Notes
+        -----
+        The entries are kept in order, so this method just returns a (shallow)
+        copy of ``_entries``.
+        """
+        self._normalize()
+        return list(self._entries)
+
+    def _get_date_index(self):
+        """Return the index of entries by date, building it if required."""
+        self._normalize()
+        if self._date_index is None:
+            index = {}
+            for entry in self._entries:
+                date = entry.timestamp.date()
+                try:
+                    index[date].append(entry)
+                except KeyError:
+                    index[date] = [entry]
+            self._date_index = index
+            # the entries are sorted, so are the keys of the index
+            self._dates = list(index)
+        return self._date_index
+
+    def _get_index(self):
+        """Return the index of entries by key, building it if required."""
+        if self._index is None:
+            self._normalize()
+            self._index = {entry._key: entry for entry in self._entries}
+        return self._index
+
+    def _group_dates(self, group_key):
+        """Group the entries of the date index by ``group_key(date)``."""
+        result = {}
+        for date, entries in self._get_date_index().items():
+            result.setdefault(group_key(date), []).extend(entries)
+        return result
+
+    def _normalize(self):
+        """Sort the ``_pending`` entries into ``_entries``.
 
-        If consuming code requires uniqueness of items, use this method as late
-        as possible.
+        Notes
+        -----
+        The pending entries are appended to the (already sorted) ``_entries``
+        and the combined list is sorted. Python's sort algorithm (`Timsort`)
+        detects already sorted runs and merges them in linear time, so the
+        cost of this operation mostly depends on the number (and order) of the
+        pending entries.
+
+        The sort is stable, so of several equal entries the one that was added
+        first is kept.
+
+        If entries were replaced or discarded, ``_entries`` is rebuilt from
+        ``_index`` instead, which already contains all (unique) entries.
         """
-        return sorted(self._entries)  # pragma: nocover
+        if self._stale:
+            self._entries = sorted(self._index.values(), key=sort_key)
+            self._pending = []
+            self._stale = False
+            return
+
+        if not self._pending:
+            return
+
+        combined = self._entries + self._pending
+        combined.sort(key=sort_key)
+        self._pending = []
+
+        # equal entries are adjacent now, keep only the first one
+        entries = [combined[0]]
+        for entry in islice(combined, 1, None):
+            if entry != entries[-1]:
+                entries.append(entry)
+        self._entries = entries
+
+
+class CalendarEntryStream:
+    """A lazy, sorted and unique sequence of calendar entries.
+
+    This is a lightweight alternative to
+    :class:`~calingen.interfaces.data_exchange.CalendarEntryList`, if the
+    entries only have to be iterated once, e.g. in a template. The entries of
+    all sources are merged by
+    :func:`~calingen.interfaces.data_exchange.merge_sorted` while iterating
+    the stream.
+
+    Parameters
+    ----------
+    sources : callable
+        Every source is a callable without arguments, returning an iterable of
+        :class:`~calingen.interfaces.data_exchange.CalendarEntry` instances in
+        sorted order. The sources are called once, when the stream is
+        iterated (or evaluated as :py:obj:`bool`) for the first time.
+
+    Warnings
+    --------
+    A stream is single-pass, just like an iterator: it may only be iterated
+    once, a second iteration raises :py:exc:`RuntimeError`. Entries, that are
+    required several times, have to be collected, e.g. in a
+    :class:`~calingen.interfaces.data_exchange.CalendarEntryList`.
+
+    Evaluating an instance as :py:obj:`bool` retrieves the first entry, which
+    is kept for the following iteration, so ``{% if entries %}`` and
+    ``{% for entry in entries %}`` retrieve the entries only once. Please
+    note, that Django's ``{% for %}`` tag collects all entries in a
+    :py:obj:`list` before rendering the loop.
+
+    Unlike :class:`~calingen.interfaces.data_exchange.CalendarEntryList`, a
+    stream does not support ``len()`` or access by position. Layouts are
+    always provided with a
+    :class:`~calingen.interfaces.data_exchange.CalendarEntryList`.
+    """
+
+    def __init__(self, *sources):  # noqa: D107
+        self._sources = sources
+        self._iterator = None
+        self._head = None
+        self._iterated = False
+
+    def __iter__(self):  # noqa: D105
+        if self._iterated:
+            raise RuntimeError("A CalendarEntryStream may only be iterated once")
+        self._iterated = True
+        iterator = self._get_iterator()
+        if self._head:
+            return chain(self._head, iterator)
+        return iterator
+
+    def __bool__(self):  # noqa: D105
+        if self._head is None:
+            if self._iterated:
+                raise RuntimeError(
+                    "A CalendarEntryStream can not be evaluated while iterating"
+                )
+            self._head = list(islice(self._get_iterator(), 1))
+        return bool(self._head)
+
+    def _get_iterator(self):
+        """Return the merged iterator of all sources, calling them on first use."""
+        if self._iterator is None:
+            self._iterator = merge_sorted(*(source() for source in self._sources))
+        return self._iterator
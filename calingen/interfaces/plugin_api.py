@@ -3,18 +3,37 @@
 """Provides the API for plugins."""
 
 # Python imports
-from datetime import datetime
+import asyncio
+import logging
+import time as clock
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from datetime import datetime, time
+from threading import Lock
+from types import MappingProxyType
 
 # Django imports
+from django.conf import settings
 from django.template.loader import render_to_string
 from django.utils.functional import classproperty
+from django.utils.module_loading import import_string
+from django.utils.translation import get_language, override
+
+# external imports
+from asgiref.sync import sync_to_async
 
 # app imports
+from calingen.exceptions import CallingenInterfaceException
+from calingen.instrumentation import instrumentation_enabled, record_call
 from calingen.interfaces.data_exchange import (
     SOURCE_EXTERNAL,
     CalendarEntry,
     CalendarEntryList,
 )
+from calingen.interfaces.recurrence import get_evaluator, get_occurences
+
+# get a module-level logger
+logger = logging.getLogger(__name__)
 
 
 def fully_qualified_classname(class_or_instance):
@@ -43,6 +62,10 @@ def fully_qualified_classname(class_or_instance):
     )
 
 
+_REGISTRY_LOCK = Lock()
+"""Serializes the replacement of :class:`~calingen.interfaces.plugin_api.PluginRegistry` instances."""
+
+
 class PluginMount(type):
     """Core of the plugin api.
 
@@ -62,6 +85,13 @@ class PluginMount(type):
     Obviously, [1]_ was ported to Python3 syntax (getting rid of ``__metaclass__``
     and apply it in the class definition of the actual mount point).
 
+    Classes, that set ``abstract = True`` in their own body, are not
+    registered. They may provide common functionality for actual
+    implementations, e.g.
+    :class:`~calingen.contrib.providers.ics.provider.ICSFileProvider`. The
+    attribute is not inherited in this regard, so their subclasses are
+    registered as usual.
+
     References
     ----------
     .. [1] http://martyalchin.com/2008/jan/10/simple-plugin-framework/
@@ -69,18 +99,203 @@ class PluginMount(type):
     """
 
     def __init__(cls, name, bases, attrs):
-        """Initialize the plugin list."""
-        if not hasattr(cls, "plugins"):
+        """Initialize the plugin registry."""
+        if not hasattr(cls, "registry"):
             # This branch only executes when processing the mount point itself.
             # So, since this is a new plugin type, not an implementation, this
             # class shouldn't be registered as a plugin. Instead, it sets up a
-            # list where plugins can be registered later.
-            cls.plugins = []
+            # registry where plugins can be registered later.
+            cls._mount_point = cls
+            cls.registry = PluginRegistry()
+        elif attrs.get("abstract", False):
+            # Abstract implementations are only used as base classes of
+            # actual implementations, so they are not registered.
+            pass
         else:
             # This must be a plugin implementation, which should be registered.
-            # Simply appending it to the list is all that's needed to keep
-            # track of it later.
-            cls.plugins.append(cls)
+            # The registry is immutable, so it is replaced on the mount point
+            # by a new registry, that includes the plugin.
+            mount_point = cls._mount_point
+            with _REGISTRY_LOCK:
+                mount_point.registry = mount_point.registry.register(cls)
+
+    @property
+    def plugins(cls):
+        """The registered plugins (:py:obj:`tuple`), in order of registration."""
+        return cls.registry.plugins
+
+    def get_plugin(cls, name, default=None):
+        """Return the plugin with the `qualified classname` ``name``.
+
+        Parameters
+        ----------
+        name : str
+            The `qualified classname`, as determined by
+            :func:`~calingen.interfaces.plugin_api.fully_qualified_classname`.
+        default : any, optional
+            Returned, if there is no such plugin.
+
+        Notes
+        -----
+        Plugins, that are only declared in a manifest (see
+        :func:`~calingen.interfaces.plugin_api.register_manifest`), are
+        imported on first access.
+        """
+        registry = cls.registry
+        try:
+            return registry.by_name[name]
+        except KeyError:
+            if name not in registry.declared:
+                return default
+        return import_string(name)
+
+    def is_available(cls, name):
+        """Return ``True``, if a plugin with the `qualified classname` ``name`` is registered or declared."""
+        registry = cls.registry
+        return name in registry.by_name or name in registry.declared
+
+
+class PluginRegistry:
+    """Immutable registry of the plugins of one mount point.
+
+    Parameters
+    ----------
+    plugins : tuple, optional
+        The registered plugins.
+    version : int, optional
+        The version stamp of the registry.
+
+    Notes
+    -----
+    The registry is looked up for every rendering of
+    :class:`~calingen.models.profile.ProfileForm` or
+    :class:`~calingen.forms.generation.LayoutSelectionForm` and on every
+    access of :attr:`Profile.event_provider <calingen.models.profile.Profile.event_provider>`.
+    Thus, the plugins are indexed by their `qualified classname` and the
+    choices of
+    :meth:`~calingen.interfaces.plugin_api.EventProvider.list_available_plugins`
+    are computed only once per language.
+
+    Plugins are registered while their modules are imported. Additionally,
+    plugins may be *declared* by a manifest (see
+    :func:`~calingen.interfaces.plugin_api.register_manifest`), providing
+    their ``title`` without importing their module. Instead of modifying the
+    registry, :meth:`~calingen.interfaces.plugin_api.PluginRegistry.register`
+    and :meth:`~calingen.interfaces.plugin_api.PluginRegistry.declare` return
+    a new registry with an incremented ``version``, so readers always work on
+    a consistent snapshot.
+    """
+
+    __slots__ = ("plugins", "by_name", "declared", "version", "_choices")
+
+    def __init__(self, plugins=(), version=0, declared=None):  # noqa: D107
+        self.plugins = tuple(plugins)
+        self.by_name = MappingProxyType(
+            {fully_qualified_classname(plugin): plugin for plugin in self.plugins}
+        )
+        self.declared = MappingProxyType(dict(declared or {}))
+        self.version = version
+        self._choices = {}
+
+    def register(self, plugin):
+        """Return a new registry, that includes ``plugin``."""
+        return PluginRegistry(self.plugins + (plugin,), self.version + 1, self.declared)
+
+    def declare(self, name, attributes):
+        """Return a new registry, that includes the declaration of a plugin.
+
+        Parameters
+        ----------
+        name : str
+            The `qualified classname` of the plugin.
+        attributes : dict
+            The plugin's attributes, at least its ``title``.
+        """
+        declared = dict(self.declared)
+        declared[name] = MappingProxyType(dict(attributes))
+        return PluginRegistry(self.plugins, self.version + 1, declared)
+
+    def choices(self):
+        """Return the plugins as choices, sorted by their ``title``.
+
+        Returns
+        -------
+        tuple
+            A 2-tuple ``(qualified classname, title)`` for every plugin.
+
+        Notes
+        -----
+        The choices include declared plugins, that are not yet imported. The
+        ``title`` may be a `lazy` translation, so the choices are sorted and
+        memoized per active language.
+        """
+        language = get_language()
+        try:
+            return self._choices[language]
+        except KeyError:
+            pass
+
+        titles = {
+            name: attributes["title"] for name, attributes in self.declared.items()
+        }
+        titles.update((name, plugin.title) for name, plugin in self.by_name.items())
+        choices = tuple(
+            sorted(set(titles.items()), key=lambda plugin_tuple: plugin_tuple[1])
+        )
+        self._choices[language] = choices
+        return choices
+
+
+_RESOLVED_TITLES = {}
+"""Cache of the translated titles of the ``entries`` of an :class:`~calingen.interfaces.plugin_api.EventProvider`.
+
+Maps ``(provider, language)`` to a tuple ``(entries, titles)``, see
+:meth:`~calingen.interfaces.plugin_api.EventProvider.resolved_titles`.
+"""
+
+
+_RESOLVE_CACHE = OrderedDict()
+"""Memoized results of :meth:`~calingen.interfaces.plugin_api.EventProvider.resolve`.
+
+Maps ``(provider, year, language)`` to a tuple ``(entries, result)``, see
+:meth:`~calingen.interfaces.plugin_api.EventProvider.resolve_cached`, and
+``(providers, year, language)`` to the combined results of
+:func:`~calingen.interfaces.plugin_api.resolve_providers`. The least recently
+used items are kept at the beginning.
+"""
+
+_RESOLVE_CACHE_LOCK = Lock()
+
+
+def clear_resolve_cache():
+    """Remove all memoized results of :meth:`~calingen.interfaces.plugin_api.EventProvider.resolve`."""
+    with _RESOLVE_CACHE_LOCK:
+        _RESOLVE_CACHE.clear()
+
+
+def _memo_lookup(key, entries):
+    """Return a copy of the memoized result for ``key`` or ``None``.
+
+    Results, that were computed from different ``entries``, are ignored.
+    """
+    with _RESOLVE_CACHE_LOCK:
+        try:
+            cached_entries, result = _RESOLVE_CACHE[key]
+        except KeyError:
+            return None
+        if cached_entries != entries:
+            return None
+        _RESOLVE_CACHE.move_to_end(key)
+        return result.copy()
+
+
+def _memo_store(key, entries, result, max_size):
+    """Memoize ``result`` for ``key``, evicting the least recently used results."""
+    with _RESOLVE_CACHE_LOCK:
+        _RESOLVE_CACHE[key] = (entries, result)
+        _RESOLVE_CACHE.move_to_end(key)
+        while len(_RESOLVE_CACHE) > max_size:
+            _RESOLVE_CACHE.popitem(last=False)
 
 
 class EventProvider(metaclass=PluginMount):
@@ -108,16 +323,50 @@ class EventProvider(metaclass=PluginMount):
       the `Events` of the requested year with their corresponding meta
       information as specified by
       :class:`calingen.interfaces.data_exchange.CalendarEntry`.
+    - **resolve_window(start, end)** : A classmethod that accepts two
+      :py:obj:`datetime.date` and returns an instance of
+      :class:`calingen.interfaces.data_exchange.CalendarEntryList` containing
+      the `Events` between these days (inclusive). The default implementation
+      works on ``entries`` or falls back to ``resolve(year)``.
+    - **resolve_range(first_year, last_year)** : A classmethod that accepts two
+      years (:py:obj:`int`) and returns a :py:obj:`dict`, mapping every year
+      of the range (inclusive) to its result of ``resolve(year)``. The default
+      implementation evaluates ``entries`` once for the whole range.
+    - **iter_entries(year)** : A classmethod that accepts a **year**
+      (:py:obj:`int`) as parameter and returns an iterable of
+      :class:`calingen.interfaces.data_exchange.CalendarEntry` in sorted order.
+      The default implementation relies on ``resolve(year)``; plugins, that
+      provide lots of entries, may re-implement it to generate their entries
+      lazily.
+    - **resolve_async(year)** : An ``async`` classmethod with the same
+      semantics as ``resolve(year)``. Plugins, that perform I/O to determine
+      their events, may implement it natively; the default implementation
+      runs ``resolve(year)`` in a thread.
+    - **cacheable** (:py:obj:`bool`): The results of ``resolve(year)`` are
+      memoized (see
+      :meth:`~calingen.interfaces.plugin_api.EventProvider.resolve_cached`).
+      Plugins, whose events are not determined by the year (and the active
+      language) alone, must set this to ``False``.
+    - **resolve_version** : Identifies the implementation of
+      ``resolve(year)`` in the fingerprint of materialized results (see
+      :func:`~calingen.models.resolved_provider_year.provider_fingerprint`).
+      Plugins, that re-implement ``resolve(year)``, should change it, if
+      their results change without a change of ``resolve()`` itsself, e.g.
+      because of a changed data file.
     """
 
+    cacheable = True
+
+    resolve_version = None
+
     @classmethod
     def list_available_plugins(cls):
         """Return the available plugins.
 
         Returns
         -------
-        set
-            The resulting :py:obj:`set` contains a 2-tuple for every plugin,
+        list
+            The resulting :py:obj:`list` contains a 2-tuple for every plugin,
             including its `qualified classname` and its ``title`` attribute.
             The `qualified classname` is determined by
             :func:`~calingen.interfaces.plugin_api.fully_qualified_classname`.
@@ -128,14 +377,43 @@ class EventProvider(metaclass=PluginMount):
         specifically :class:`~calingen.models.profile.ProfileForm` uses this
         method to provide the choices of its field. That ``Form`` is then used
         in the app's views, e.g. :class:`calingen.views.profile.ProfileUpdateView`.
+
+        The choices are precomputed by
+        :meth:`PluginRegistry.choices() <calingen.interfaces.plugin_api.PluginRegistry.choices>`.
         """
-        result = set()
-        for plugin in cls.plugins:
-            result.add((fully_qualified_classname(plugin), plugin.title))
+        return list(cls.registry.choices())
+
+    @classmethod
+    def resolved_titles(cls):
+        """Return the titles of ``entries``, translated to the active language.
 
-        # the ``set`` is sorted on return (converting it to a list, but that's
-        # fine with the current (only) consumer)
-        return sorted(result, key=lambda plugin_tuple: plugin_tuple[1])
+        Returns
+        -------
+        list
+            The titles of the provider's ``entries`` as plain :py:obj:`str`,
+            in the same order as ``entries``.
+
+        Notes
+        -----
+        Titles are commonly provided as `lazy` translations (see
+        :func:`django.utils.translation.gettext_lazy`). Every comparison of
+        lazy objects triggers the translation again, e.g. while sorting the
+        entries. Thus, the titles are translated once per provider and
+        language and then cached. The cache is invalidated, if the provider's
+        ``entries`` attribute is replaced or modified.
+        """
+        key = (cls, get_language())
+        entries = tuple(cls.entries)
+        try:
+            cached_entries, titles = _RESOLVED_TITLES[key]
+            if cached_entries == entries:
+                return titles
+        except KeyError:
+            pass
+
+        titles = [str(entry[0]) for entry in entries]
+        _RESOLVED_TITLES[key] = (entries, titles)
+        return titles
 
     @classmethod
     def resolve(cls, year):
@@ -173,21 +451,924 @@ class EventProvider(metaclass=PluginMount):
           implementation itsself and is used to populate the ``source``
           attribute of the returned
           :class:`~calingen.interfaces.data_exchange.CalenderEntry` instances.
+
+        The entries' titles are provided by
+        :meth:`~calingen.interfaces.plugin_api.EventProvider.resolved_titles`,
+        the original (`lazy`) titles are kept as ``display_title``.
+
+        The recurrences are evaluated by
+        :func:`~calingen.interfaces.recurrence.get_occurences`, which computes
+        the occurences of common yearly rules directly and shares its results
+        with every provider using the same rule. Entries without an occurence
+        in ``year`` are skipped.
         """
         result = CalendarEntryList()
-        for entry in cls.entries:
+        for title, entry in zip(cls.resolved_titles(), cls.entries):
+            occurence = _first_occurence(entry[2], year)
+            if occurence is None:
+                # e.g. years before the rule's dtstart
+                continue
             result.add(
                 CalendarEntry(
-                    entry[0],
+                    title,
                     entry[1],
-                    entry[2].between(
-                        datetime(year, 1, 1), datetime(year, 12, 31), inc=True
-                    )[0],
+                    occurence,
                     (SOURCE_EXTERNAL, cls.title),
+                    display_title=entry[0],
                 )
             )
         return result
 
+    @classmethod
+    def resolve_cached(cls, year):
+        """Return a list of events, using memoized results.
+
+        Parameters
+        ----------
+        year : int
+            The year to retrieve the list of events for.
+
+        Returns
+        -------
+        :class:`calingen.interfaces.data_exchange.CalendarEntryList`
+            The result of
+            :meth:`~calingen.interfaces.plugin_api.EventProvider.resolve`. The
+            caller gets its own copy, so it may be modified freely.
+
+        Notes
+        -----
+        Results are memoized per provider, ``year`` and active language. The
+        number of memoized results is limited by
+        :attr:`~calingen.settings.CALINGEN_EVENT_PROVIDER_CACHE_SIZE`; the
+        least recently used result is evicted first.
+
+        A memoized result is discarded, if the provider's ``entries``
+        attribute was replaced or modified since the result was computed.
+        Providers, that set ``cacheable`` to ``False``, are always resolved.
+        """
+        instrumented = instrumentation_enabled()
+        if instrumented:
+            start = clock.perf_counter()
+
+        max_size = settings.CALINGEN_EVENT_PROVIDER_CACHE_SIZE
+        if not cls.cacheable or not max_size:
+            cache_hit = None
+            result = cls.resolve(year)
+        else:
+            key = (cls, year, get_language())
+            entries = tuple(getattr(cls, "entries", ()))
+            result = _memo_lookup(key, entries)
+            cache_hit = result is not None
+            if not cache_hit:
+                result = cls.resolve(year)
+                _memo_store(key, entries, result, max_size)
+                result = result.copy()
+
+        if instrumented:
+            record_call(
+                cls,
+                "resolve",
+                clock.perf_counter() - start,
+                entries=len(result),
+                cache_hit=cache_hit,
+            )
+        return result
+
+    @classmethod
+    async def resolve_async(cls, year):
+        """Return a list of events, without blocking the event loop.
+
+        Parameters
+        ----------
+        year : int
+            The year to retrieve the list of events for.
+
+        Returns
+        -------
+        :class:`calingen.interfaces.data_exchange.CalendarEntryList`
+            The same result as
+            :meth:`~calingen.interfaces.plugin_api.EventProvider.resolve`.
+
+        Notes
+        -----
+        This is the default implementation. It adapts synchronous providers,
+        running :meth:`~calingen.interfaces.plugin_api.EventProvider.resolve_cached`
+        in a worker thread (see :func:`asgiref.sync.sync_to_async`).
+        Providers, that perform I/O, e.g. reading files or querying a web
+        service, may re-implement this method natively.
+        """
+        return await sync_to_async(cls.resolve_cached, thread_sensitive=False)(year)
+
+    @classmethod
+    def resolve_window(cls, start, end):
+        """Return a list of events inside a window of days.
+
+        Parameters
+        ----------
+        start : datetime.date
+            The first day of the window.
+        end : datetime.date
+            The last day of the window (inclusive).
+
+        Returns
+        -------
+        :class:`calingen.interfaces.data_exchange.CalendarEntryList`
+            Wraps all occurences of the provider's events inside the window.
+
+        Notes
+        -----
+        This is the default implementation. It works on the ``entries`` class
+        variable, just like
+        :meth:`~calingen.interfaces.plugin_api.EventProvider.resolve`, and only
+        computes the occurences inside the window, so the window may span
+        several years, e.g. for an academic year.
+
+        If an implementation re-implements
+        :meth:`~calingen.interfaces.plugin_api.EventProvider.resolve`, all
+        affected years are resolved and filtered afterwards.
+        """
+        if cls.resolve.__func__ is not EventProvider.resolve.__func__:
+            result = CalendarEntryList()
+            for entries in cls.resolve_range(start.year, end.year).values():
+                result.merge(entries)
+            return result.between(start, end)
+
+        return _resolve_window_shared(cls, set(), start, end)
+
+    @classmethod
+    def resolve_range(cls, first_year, last_year):
+        """Return the lists of events of several years.
+
+        Parameters
+        ----------
+        first_year : int
+            The first year to retrieve the list of events for.
+        last_year : int
+            The last year to retrieve the list of events for (inclusive).
+
+        Returns
+        -------
+        dict
+            Maps every year of the range to its
+            :class:`calingen.interfaces.data_exchange.CalendarEntryList`, just
+            like the result of
+            :meth:`~calingen.interfaces.plugin_api.EventProvider.resolve`.
+
+        Notes
+        -----
+        This is the default implementation. It works on the ``entries`` class
+        variable, just like
+        :meth:`~calingen.interfaces.plugin_api.EventProvider.resolve`, but
+        translates the titles, looks up the evaluators and evaluates each
+        recurrence only once for the whole range.
+
+        If an implementation re-implements
+        :meth:`~calingen.interfaces.plugin_api.EventProvider.resolve`, every
+        year is resolved by
+        :meth:`~calingen.interfaces.plugin_api.EventProvider.resolve_cached`.
+        """
+        if cls.resolve.__func__ is not EventProvider.resolve.__func__:
+            return {
+                year: cls.resolve_cached(year)
+                for year in range(first_year, last_year + 1)
+            }
+
+        return _resolve_range_shared(cls, set(), first_year, last_year)
+
+    @classmethod
+    def iter_entries(cls, year):
+        """Iterate the events of a given year in sorted order.
+
+        Parameters
+        ----------
+        year : int
+            The year to retrieve the events for.
+
+        Yields
+        ------
+        :class:`calingen.interfaces.data_exchange.CalendarEntry`
+            The provider's events, sorted as in
+            :class:`~calingen.interfaces.data_exchange.CalendarEntryList`.
+
+        Notes
+        -----
+        This is the default implementation, which simply iterates the result
+        of :meth:`~calingen.interfaces.plugin_api.EventProvider.resolve_cached`.
+        :func:`~calingen.interfaces.plugin_api.iter_providers` uses it as one
+        source of a streaming merge of several providers (see
+        :func:`~calingen.interfaces.data_exchange.merge_sorted`), so
+        implementations must keep the order of the entries.
+        """
+        yield from cls.resolve_cached(year)
+
+
+class ResolutionReport:
+    """Collects information about a run of :func:`~calingen.interfaces.plugin_api.resolve_providers`.
+
+    Attributes
+    ----------
+    timings : dict
+        Maps the resolved providers to the time (in seconds), that was
+        required to resolve them.
+    timed_out : list
+        The providers, that did not finish in time. Their events are missing
+        in the result.
+    failed : list
+        The providers, that raised an exception. Their events are missing in
+        the result.
+    memoized : bool
+        ``True``, if the result was memoized, i.e. no provider was actually
+        resolved.
+    """
+
+    def __init__(self):  # noqa: D107
+        self.timings = {}
+        self.timed_out = []
+        self.failed = []
+        self.memoized = False
+
+
+def resolve_providers(providers, year, report=None):
+    """Combine the events of several providers for a given year.
+
+    Parameters
+    ----------
+    providers : iterable
+        Implementations of
+        :class:`~calingen.interfaces.plugin_api.EventProvider`.
+    year : int
+        The year to retrieve the events for.
+    report : ResolutionReport, optional
+        Receives the timings of the providers and the providers, that timed
+        out.
+
+    Returns
+    -------
+    :class:`calingen.interfaces.data_exchange.CalendarEntryList`
+        A single instance including the events of all ``providers``.
+
+    Notes
+    -----
+    Providers commonly share entries, e.g. every state provider of
+    :mod:`calingen.contrib.providers.german_holidays` includes the federal
+    holidays. Instead of resolving every provider on its own and dropping the
+    duplicates while merging, the entries of providers, that rely on the
+    default implementation of
+    :meth:`~calingen.interfaces.plugin_api.EventProvider.resolve`, are resolved
+    by rule: every combination of rule, category and title is evaluated once
+    and attributed to the first provider, that includes it. This is the same
+    result as merging the providers' results in order. These providers are
+    resolved inline, as this is just a computation.
+
+    Providers with a custom ``resolve()`` may perform I/O or expensive
+    computations, so they are resolved by
+    :meth:`~calingen.interfaces.plugin_api.EventProvider.resolve_cached` in a
+    bounded thread pool (see
+    :attr:`~calingen.settings.CALINGEN_EVENT_PROVIDER_WORKERS`). Every
+    provider has to finish within
+    :attr:`~calingen.settings.CALINGEN_EVENT_PROVIDER_TIMEOUT` and all of them
+    within :attr:`~calingen.settings.CALINGEN_EVENT_PROVIDER_BUDGET` (both
+    measured from the start of this function). Their entries are merged
+    after the inline providers, so duplicates are attributed to the latter.
+
+    Providers, that do not finish in time or raise an exception, are logged
+    and recorded in ``report``, but their events are omitted instead of
+    failing the whole operation.
+
+    The combined result is memoized just like the results of
+    :meth:`~calingen.interfaces.plugin_api.EventProvider.resolve_cached`, if
+    all ``providers`` are ``cacheable`` and all of them were resolved.
+    """
+    providers = tuple(providers)
+    if report is None:
+        report = ResolutionReport()
+
+    max_size = settings.CALINGEN_EVENT_PROVIDER_CACHE_SIZE
+    if not max_size or not all(provider.cacheable for provider in providers):
+        return _resolve_providers(providers, year, report)
+
+    start = clock.perf_counter()
+    key = (providers, year, get_language())
+    entries = tuple(tuple(getattr(provider, "entries", ())) for provider in providers)
+    result = _memo_lookup(key, entries)
+    if result is not None:
+        report.memoized = True
+        if instrumentation_enabled():
+            # the lookup is attributed to all providers evenly
+            duration = (clock.perf_counter() - start) / max(len(providers), 1)
+            for provider in providers:
+                record_call(provider, "resolve", duration, cache_hit=True)
+        return result
+
+    result = _resolve_providers(providers, year, report, memoized=True)
+    if not report.timed_out and not report.failed:
+        _memo_store(key, entries, result, max_size)
+        result = result.copy()
+    return result
+
+
+def resolve_providers_window(providers, start, end, report=None):
+    """Combine the events of several providers inside a window of days.
+
+    Parameters
+    ----------
+    providers : iterable
+        Implementations of
+        :class:`~calingen.interfaces.plugin_api.EventProvider`.
+    start : datetime.date
+        The first day of the window.
+    end : datetime.date
+        The last day of the window (inclusive).
+    report : ResolutionReport, optional
+        Receives the timings of the providers and the providers, that timed
+        out or failed.
+
+    Returns
+    -------
+    :class:`calingen.interfaces.data_exchange.CalendarEntryList`
+        A single instance including the events of all ``providers``, as
+        provided by
+        :meth:`~calingen.interfaces.plugin_api.EventProvider.resolve_window`.
+
+    Notes
+    -----
+    Providers are resolved just like in
+    :func:`~calingen.interfaces.plugin_api.resolve_providers`, i.e. entries,
+    that are shared by several providers, are only evaluated once and
+    providers with a custom ``resolve()`` are resolved in the thread pool and
+    skipped, if they do not finish in time or fail. The result is not
+    memoized.
+    """
+    if report is None:
+        report = ResolutionReport()
+
+    start_time = clock.perf_counter()
+    period = "{} - {}".format(start, end)
+    inline, futures = _submit(providers, "resolve_window", start, end)
+
+    result = CalendarEntryList()
+    resolved = set()
+    for provider in inline:
+        if provider.resolve.__func__ is EventProvider.resolve.__func__:
+            entries = _call_inline(
+                provider,
+                report,
+                period,
+                _resolve_window_shared,
+                provider,
+                resolved,
+                start,
+                end,
+            )
+        else:
+            entries = _call_inline(
+                provider, report, period, provider.resolve_window, start, end
+            )
+        if entries is not None:
+            result.merge(entries)
+
+    for _provider, entries in _collect(futures, start_time, report, period):
+        result.merge(entries)
+
+    return result
+
+
+def resolve_providers_range(providers, first_year, last_year, report=None):
+    """Combine the events of several providers for several years.
+
+    Parameters
+    ----------
+    providers : iterable
+        Implementations of
+        :class:`~calingen.interfaces.plugin_api.EventProvider`.
+    first_year : int
+        The first year to retrieve the events for.
+    last_year : int
+        The last year to retrieve the events for (inclusive).
+    report : ResolutionReport, optional
+        Receives the timings of the providers and the providers, that timed
+        out or failed.
+
+    Returns
+    -------
+    dict
+        Maps every year of the range to a single
+        :class:`calingen.interfaces.data_exchange.CalendarEntryList`,
+        including the events of all ``providers``, as provided by
+        :meth:`~calingen.interfaces.plugin_api.EventProvider.resolve_range`.
+
+    Notes
+    -----
+    Providers are resolved just like in
+    :func:`~calingen.interfaces.plugin_api.resolve_providers`, i.e. entries,
+    that are shared by several providers, are only evaluated once and
+    providers with a custom ``resolve()`` are resolved in the thread pool and
+    skipped, if they do not finish in time or fail. The result is not
+    memoized.
+    """
+    if report is None:
+        report = ResolutionReport()
+
+    start = clock.perf_counter()
+    period = "{} - {}".format(first_year, last_year)
+    inline, futures = _submit(providers, "resolve_range", first_year, last_year)
+
+    result = {year: CalendarEntryList() for year in range(first_year, last_year + 1)}
+    combined = []
+    resolved = set()
+    for provider in inline:
+        if provider.resolve.__func__ is EventProvider.resolve.__func__:
+            years = _call_inline(
+                provider,
+                report,
+                period,
+                _resolve_range_shared,
+                provider,
+                resolved,
+                first_year,
+                last_year,
+            )
+        else:
+            years = _call_inline(
+                provider, report, period, provider.resolve_range, first_year, last_year
+            )
+        if years is not None:
+            combined.append(years)
+    combined.extend(
+        years for _provider, years in _collect(futures, start, report, period)
+    )
+
+    for years in combined:
+        for year, entries in years.items():
+            result[year].merge(entries)
+    return result
+
+
+def iter_providers(providers, year, report=None):
+    """Provide the events of several providers for a given year as separate sources.
+
+    Parameters
+    ----------
+    providers : iterable
+        Implementations of
+        :class:`~calingen.interfaces.plugin_api.EventProvider`.
+    year : int
+        The year to retrieve the events for.
+    report : ResolutionReport, optional
+        Receives the timings of the providers and the providers, that timed
+        out or failed.
+
+    Returns
+    -------
+    list
+        One iterator per provider, yielding its
+        :class:`~calingen.interfaces.data_exchange.CalendarEntry` instances in
+        sorted order, as provided by
+        :meth:`~calingen.interfaces.plugin_api.EventProvider.iter_entries`.
+        The iterators are meant to be merged by
+        :func:`~calingen.interfaces.data_exchange.merge_sorted`, which also
+        drops the entries, that are shared by several providers.
+
+    Notes
+    -----
+    In contrast to :func:`~calingen.interfaces.plugin_api.resolve_providers`,
+    the results of the providers are not combined in one single
+    :class:`~calingen.interfaces.data_exchange.CalendarEntryList`, so only the
+    entries of the provider, that is currently iterated, have to be held in
+    memory. Shared entries are evaluated by every provider, that includes
+    them.
+
+    Providers with a custom ``resolve()`` and the default ``iter_entries()``
+    are started in the thread pool right away and are subject to the same
+    time limits as in
+    :func:`~calingen.interfaces.plugin_api.resolve_providers`, measured from
+    the call of this function. Their iterator waits for the result, when the
+    first entry is retrieved.
+
+    All other providers are iterated lazily, i.e. they are not time-limited,
+    as they run in the consumer's thread. If a provider raises an exception,
+    its iterator stops. The entries, that were already retrieved, are kept.
+
+    ``report`` is complete, once all iterators are exhausted.
+    """
+    if report is None:
+        report = ResolutionReport()
+
+    start = clock.perf_counter()
+    providers = list(providers)
+    _inline, futures = _submit(
+        [
+            provider
+            for provider in providers
+            if provider.iter_entries.__func__ is EventProvider.iter_entries.__func__
+        ],
+        "resolve_cached",
+        year,
+    )
+    futures = dict(futures)
+
+    sources = []
+    for provider in providers:
+        if provider in futures:
+            sources.append(
+                _iter_future(provider, futures[provider], start, report, year)
+            )
+        else:
+            sources.append(_iter_inline(provider, report, year))
+    return sources
+
+
+async def resolve_providers_async(providers, year, report=None):
+    """Combine the events of several providers concurrently.
+
+    Parameters
+    ----------
+    providers : iterable
+        Implementations of
+        :class:`~calingen.interfaces.plugin_api.EventProvider`.
+    year : int
+        The year to retrieve the events for.
+    report : ResolutionReport, optional
+        Receives the timings of the providers and the providers, that timed
+        out or failed.
+
+    Returns
+    -------
+    :class:`calingen.interfaces.data_exchange.CalendarEntryList`
+        A single instance including the events of all ``providers``.
+
+    Notes
+    -----
+    Providers, that implement
+    :meth:`~calingen.interfaces.plugin_api.EventProvider.resolve_async`
+    natively, are awaited concurrently. All other providers are combined by
+    :func:`~calingen.interfaces.plugin_api.resolve_providers` in a worker
+    thread at the same time, so shared entries are still resolved only once.
+    Duplicates are attributed to the synchronous providers first and then to
+    the asynchronous providers, in the given order.
+
+    The native implementations are subject to the same time limits as the
+    providers in the thread pool; as coroutines can be cancelled, they are
+    actually stopped, if they do not finish in time.
+    """
+    if report is None:
+        report = ResolutionReport()
+
+    native = []
+    synchronous = []
+    for provider in providers:
+        if provider.resolve_async.__func__ is EventProvider.resolve_async.__func__:
+            synchronous.append(provider)
+        else:
+            native.append(provider)
+
+    results = await asyncio.gather(
+        sync_to_async(resolve_providers, thread_sensitive=False)(
+            synchronous, year, report
+        ),
+        *(_resolve_native(provider, year, report) for provider in native),
+    )
+
+    result = CalendarEntryList()
+    for entries in results:
+        if entries is not None:
+            result.merge(entries)
+    return result
+
+
+async def _resolve_native(provider, year, report):
+    """Await the native ``resolve_async()`` of ``provider`` within the time limits."""
+    limits = [
+        limit
+        for limit in (
+            settings.CALINGEN_EVENT_PROVIDER_TIMEOUT,
+            settings.CALINGEN_EVENT_PROVIDER_BUDGET,
+        )
+        if limit is not None
+    ]
+    start = clock.perf_counter()
+    try:
+        result = await asyncio.wait_for(
+            provider.resolve_async(year), timeout=min(limits) if limits else None
+        )
+    except asyncio.TimeoutError:
+        logger.warning(
+            "{} did not resolve {} in time".format(
+                fully_qualified_classname(provider), year
+            )
+        )
+        report.timed_out.append(provider)
+        return None
+    except asyncio.CancelledError:
+        raise
+    except Exception:
+        _report_failure(provider, report, year)
+        return None
+    report.timings[provider] = clock.perf_counter() - start
+    return result
+
+
+def _resolve_providers(providers, year, report, memoized=False):
+    """Combine the events of ``providers``, see :func:`~calingen.interfaces.plugin_api.resolve_providers`.
+
+    ``memoized`` determines, if providers with the default ``resolve()`` are
+    instrumented as cache misses (see :mod:`calingen.instrumentation`).
+    """
+    start = clock.perf_counter()
+    instrumented = instrumentation_enabled()
+
+    # providers with a custom resolve() are started first, so they run while
+    # the other providers are resolved inline
+    inline, futures = _submit(providers, "resolve_cached", year)
+
+    result = CalendarEntryList()
+    resolved = set()
+    for provider in inline:
+        provider_start = clock.perf_counter()
+        if provider.resolve.__func__ is not EventProvider.resolve.__func__:
+            entries = _call_inline(
+                provider, report, year, provider.resolve_cached, year
+            )
+            if entries is not None:
+                result.merge(entries)
+            continue
+
+        source = (SOURCE_EXTERNAL, provider.title)
+        added = []
+        try:
+            entries, keys = _shared_entries(provider, resolved)
+            for title, entry in entries:
+                occurence = _first_occurence(entry[2], year)
+                if occurence is None:
+                    continue
+                added.append(
+                    CalendarEntry(
+                        title, entry[1], occurence, source, display_title=entry[0]
+                    )
+                )
+        except Exception:
+            _report_failure(provider, report, year)
+            continue
+        resolved.update(keys)
+        for entry in added:
+            result.add(entry)
+        report.timings[provider] = clock.perf_counter() - provider_start
+        if instrumented:
+            record_call(
+                provider,
+                "resolve",
+                report.timings[provider],
+                entries=len(added),
+                cache_hit=False if memoized else None,
+            )
+
+    for _provider, entries in _collect(futures, start, report, year):
+        result.merge(entries)
+
+    return result
+
+
+def _submit(providers, method, *args):
+    """Start ``method`` of the providers with a custom ``resolve()`` in the thread pool.
+
+    Returns the providers, that have to be resolved inline, and the pairs of
+    provider and future of the started providers.
+    """
+    workers = settings.CALINGEN_EVENT_PROVIDER_WORKERS
+    inline = []
+    futures = []
+    for provider in providers:
+        if workers and provider.resolve.__func__ is not EventProvider.resolve.__func__:
+            future = _get_executor(workers).submit(
+                _timed_call, getattr(provider, method), get_language(), *args
+            )
+            futures.append((provider, future))
+        else:
+            inline.append(provider)
+    return inline, futures
+
+
+def _collect(futures, start, report, period):
+    """Yield the providers of ``futures`` with their results, that finish in time.
+
+    Providers, that do not finish in time or raise an exception, are logged
+    and recorded in ``report``. ``start`` is the start of the resolution, the
+    time limits are measured from.
+    """
+    timeout = settings.CALINGEN_EVENT_PROVIDER_TIMEOUT
+    budget = settings.CALINGEN_EVENT_PROVIDER_BUDGET
+    for provider, future in futures:
+        remaining = [
+            limit - (clock.perf_counter() - start)
+            for limit in (timeout, budget)
+            if limit is not None
+        ]
+        try:
+            result, duration = future.result(
+                timeout=max(min(remaining), 0) if remaining else None
+            )
+        except FutureTimeoutError:
+            if not future.cancel():
+                _abandon(future)
+            logger.warning(
+                "{} did not resolve {} in time".format(
+                    fully_qualified_classname(provider), period
+                )
+            )
+            report.timed_out.append(provider)
+            continue
+        except Exception:
+            _report_failure(provider, report, period)
+            continue
+        report.timings[provider] = duration
+        yield provider, result
+
+
+def _iter_future(provider, future, start, report, year):
+    """Yield the result of ``future`` of ``provider``, if it finishes in time."""
+    for _provider, entries in _collect([(provider, future)], start, report, year):
+        yield from entries
+
+
+def _iter_inline(provider, report, year):
+    """Yield the entries of ``provider``, recording the time spent in the provider."""
+    duration = 0.0
+    start = clock.perf_counter()
+    try:
+        for entry in provider.iter_entries(year):
+            duration += clock.perf_counter() - start
+            yield entry
+            start = clock.perf_counter()
+    except Exception:
+        _report_failure(provider, report, year)
+        return
+    report.timings[provider] = duration + clock.perf_counter() - start
+
+
+def _call_inline(provider, report, period, func, *args):
+    """Call ``func`` of ``provider``, returning its result or ``None`` on failure."""
+    start = clock.perf_counter()
+    try:
+        result = func(*args)
+    except Exception:
+        _report_failure(provider, report, period)
+        return None
+    report.timings[provider] = clock.perf_counter() - start
+    return result
+
+
+def _report_failure(provider, report, period):
+    """Log the current exception of ``provider`` and record it in ``report``."""
+    logger.exception(
+        "{} failed to resolve {}".format(fully_qualified_classname(provider), period)
+    )
+    report.failed.append(provider)
+
+
+def _timed_call(func, language, *args):
+    """Call ``func`` in a worker thread, returning the result and its duration."""
+    start = clock.perf_counter()
+    with override(language):
+        result = func(*args)
+    return result, clock.perf_counter() - start
+
+
+_EXECUTOR = None
+"""The thread pool of :func:`~calingen.interfaces.plugin_api.resolve_providers`."""
+
+_EXECUTOR_WORKERS = 0
+"""The number of threads of the current thread pool."""
+
+_EXECUTOR_LOCK = Lock()
+
+_ABANDONED = set()
+"""The futures, that did not finish in time, but still occupy a worker."""
+
+
+def _get_executor(workers):
+    """Return the (shared) thread pool with ``workers`` threads.
+
+    Running threads can not be stopped, so providers, that did not finish in
+    time, keep occupying their worker until they return (see
+    :func:`~calingen.interfaces.plugin_api._abandon`). Once all workers are
+    occupied like this, the pool is replaced, so other providers are not
+    queued behind them. The occupied threads are left to finish on their own,
+    i.e. every provider, that never returns, leaks one thread. This is logged.
+    """
+    global _EXECUTOR, _EXECUTOR_WORKERS
+
+    with _EXECUTOR_LOCK:
+        saturated = _EXECUTOR is not None and len(_ABANDONED) >= _EXECUTOR_WORKERS
+        if saturated:
+            logger.warning(
+                "All {} workers are occupied by providers, that did not finish "
+                "in time, starting a new thread pool".format(_EXECUTOR_WORKERS)
+            )
+        if _EXECUTOR is None or _EXECUTOR_WORKERS != workers or saturated:
+            if _EXECUTOR is not None:
+                _EXECUTOR.shutdown(wait=False)
+            _EXECUTOR = ThreadPoolExecutor(
+                max_workers=workers, thread_name_prefix="calingen-provider"
+            )
+            _EXECUTOR_WORKERS = workers
+            _ABANDONED.clear()
+        return _EXECUTOR
+
+
+def _abandon(future):
+    """Track the running ``future``, that did not finish in time, until it finishes."""
+    with _EXECUTOR_LOCK:
+        _ABANDONED.add(future)
+    # called immediately, if the future finished in the meantime
+    future.add_done_callback(_release)
+
+
+def _release(future):
+    """Stop tracking ``future``, as its worker is available again."""
+    with _EXECUTOR_LOCK:
+        _ABANDONED.discard(future)
+
+
+def _shared_entries(provider, resolved):
+    """Return the entries of ``provider``, that are not ``resolved`` yet, and their keys.
+
+    The entries are returned as pairs of translated title and entry. Every
+    combination of rule, category and title is included once; callers add
+    the keys to ``resolved``, once the entries are actually resolved.
+    """
+    keys = set()
+    entries = []
+    for title, entry in zip(provider.resolved_titles(), provider.entries):
+        key = (entry[2], entry[1], title)
+        if key not in resolved and key not in keys:
+            keys.add(key)
+            entries.append((title, entry))
+    return entries, keys
+
+
+def _resolve_window_shared(provider, resolved, start, end):
+    """Resolve the entries of ``provider`` inside a window, skipping ``resolved`` entries.
+
+    See :meth:`~calingen.interfaces.plugin_api.EventProvider.resolve_window`.
+    """
+    entries, keys = _shared_entries(provider, resolved)
+    lower = datetime.combine(start, time.min)
+    upper = datetime.combine(end, time.max)
+    source = (SOURCE_EXTERNAL, provider.title)
+
+    result = CalendarEntryList()
+    for title, entry in entries:
+        for timestamp in get_evaluator(entry[2]).between(lower, upper):
+            result.add(
+                CalendarEntry(
+                    title, entry[1], timestamp, source, display_title=entry[0]
+                )
+            )
+    resolved.update(keys)
+    return result
+
+
+def _resolve_range_shared(provider, resolved, first_year, last_year):
+    """Resolve the entries of ``provider`` for several years, skipping ``resolved`` entries.
+
+    See :meth:`~calingen.interfaces.plugin_api.EventProvider.resolve_range`.
+    """
+    entries, keys = _shared_entries(provider, resolved)
+    source = (SOURCE_EXTERNAL, provider.title)
+
+    result = {year: CalendarEntryList() for year in range(first_year, last_year + 1)}
+    for title, entry in entries:
+        resolved_years = set()
+        for occurence in get_evaluator(entry[2]).between(
+            datetime(first_year, 1, 1), datetime(last_year, 12, 31)
+        ):
+            year = occurence.year
+            # just like resolve(): the first occurence of every year, up to
+            # the start of December 31st
+            if year in resolved_years or occurence > datetime(year, 12, 31):
+                continue
+            resolved_years.add(year)
+            result[year].add(
+                CalendarEntry(
+                    title, entry[1], occurence, source, display_title=entry[0]
+                )
+            )
+    resolved.update(keys)
+    return result
+
+
+def _first_occurence(rule, year):
+    """Return the occurence of ``rule``, that is resolved for ``year``.
+
+    This is the first occurence up to the start of December 31st (matching
+    :meth:`~calingen.interfaces.plugin_api.EventProvider.resolve_range`) or
+    ``None``.
+    """
+    occurences = get_occurences(rule, year)
+    if occurences and occurences[0] <= datetime(year, 12, 31):
+        return occurences[0]
+    return None
+
 
 class LayoutProvider(metaclass=PluginMount):
     """Mount point for plugins that provide layouts.
@@ -233,6 +1414,9 @@ class LayoutProvider(metaclass=PluginMount):
       re-implemented by the actual layout. See
       :meth:`~calingen.interfaces.plugin_api.LayoutProvider.prepare_context` for
       additional details.
+    - **required_years(target_year)** (:py:obj:`tuple`): The years, whose
+      entries are required to render the ``target_year``. See
+      :meth:`~calingen.interfaces.plugin_api.LayoutProvider.required_years`.
     - **render(year, entries)** (:py:obj:`str`): Actually renders the layout's
       templates with the given context. This method may be re-implemented by
       actual layouts, though it is pretty generic as it is and should work for
@@ -280,8 +1464,8 @@ class LayoutProvider(metaclass=PluginMount):
 
         Returns
         -------
-        set
-            The resulting :py:obj:`set` contains a 2-tuple for every plugin,
+        list
+            The resulting :py:obj:`list` contains a 2-tuple for every plugin,
             including its `qualified classname` and its **title** attribute.
             The `qualified classname` is determined by
             :func:`~calingen.interfaces.plugin_api.fully_qualified_classname`.
@@ -293,13 +1477,32 @@ class LayoutProvider(metaclass=PluginMount):
         method to provide the choices of its field. That ``Form`` is then used
         in the app's views, e.g. :class:`~calingen.views.profile.ProfileUpdateView`.
         """
-        result = set()
-        for plugin in cls.plugins:
-            result.add((fully_qualified_classname(plugin), plugin.title))
+        return list(cls.registry.choices())
+
+    @classmethod
+    def required_years(cls, target_year):
+        """Return the years, whose entries are required to render ``target_year``.
 
-        # the ``set`` is sorted on return (converting it to a list, but that's
-        # fine with the current (only) consumer)
-        return sorted(result, key=lambda plugin_tuple: plugin_tuple[1])
+        Parameters
+        ----------
+        target_year : int
+            The year to create the layout for.
+
+        Returns
+        -------
+        tuple
+            The first and the last year (inclusive).
+
+        Notes
+        -----
+        This default implementation only requires ``target_year``. Layouts,
+        that include days of adjacent years, e.g. the first and the last week
+        of the year, may extend the range.
+        :class:`~calingen.views.generation.CompilerView` provides the entries
+        of all these years then, resolving them at once (see
+        :meth:`Profile.resolve_range() <calingen.models.profile.Profile.resolve_range>`).
+        """
+        return target_year, target_year
 
     @classmethod
     def prepare_context(cls, context):
@@ -364,19 +1567,13 @@ class CompilerProvider(metaclass=PluginMount):
 
         Returns
         -------
-        set
-            The resulting :py:obj:`set` contains a 2-tuple for every plugin,
+        list
+            The resulting :py:obj:`list` contains a 2-tuple for every plugin,
             including its `qualified classname` and its **title** attribute.
             The `qualified classname` is determined by
             :func:`~calingen.interfaces.plugin_api.fully_qualified_classname`.
         """
-        result = set()
-        for plugin in cls.plugins:
-            result.add((fully_qualified_classname(plugin), plugin.title))
-
-        # the ``set`` is sorted on return (converting it to a list, but that's
-        # fine with the current (only) consumer)
-        return sorted(result, key=lambda plugin_tuple: plugin_tuple[1])
+        return list(cls.registry.choices())
 
     @classmethod
     def get_response(cls, source, *args, **kwargs):
@@ -409,3 +1606,56 @@ class CompilerProvider(metaclass=PluginMount):
         raise NotImplementedError(
             "Has to be implemented by the actual provider"
         )  # pragma: nocover
+
+
+def register_manifest(manifest):
+    """Declare the plugins of a manifest.
+
+    Parameters
+    ----------
+    manifest : dict
+        Maps the names of the mount points (``"EventProvider"``,
+        ``"LayoutProvider"`` and ``"CompilerProvider"``) to :py:obj:`dict`
+        instances, that map the `qualified classnames` of plugins to their
+        attributes. The attributes must include the plugin's ``title``;
+        layouts should provide their ``name``, ``paper_size``,
+        ``orientation`` and ``layout_type`` aswell.
+
+    Raises
+    ------
+    CallingenInterfaceException
+        Raised if the manifest refers to an unknown mount point or a plugin
+        without ``title``.
+
+    Notes
+    -----
+    Applications provide their manifest as ``calingen_plugins`` attribute of
+    their ``AppConfig``; :meth:`calingen.apps.CalingenConfig.ready` registers
+    the manifests of all installed apps. Declared plugins are listed by
+    ``list_available_plugins()``, but their modules are only imported on first
+    access, e.g. by :func:`~django.utils.module_loading.import_string` while
+    resolving a profile or rendering a layout.
+    """
+    for mount_point_name, plugins in manifest.items():
+        try:
+            mount_point = _MOUNT_POINTS[mount_point_name]
+        except KeyError:
+            raise CallingenInterfaceException(
+                "Unknown mount point {}".format(mount_point_name)
+            )
+
+        for name, attributes in plugins.items():
+            if "title" not in attributes:
+                raise CallingenInterfaceException(
+                    "The declaration of {} is missing a title".format(name)
+                )
+            with _REGISTRY_LOCK:
+                mount_point.registry = mount_point.registry.declare(name, attributes)
+
+
+_MOUNT_POINTS = {
+    "CompilerProvider": CompilerProvider,
+    "EventProvider": EventProvider,
+    "LayoutProvider": LayoutProvider,
+}
+"""The mount points, that may be referenced by a manifest."""
@@ -0,0 +1,323 @@
+# SPDX-License-Identifier: MIT
+
+"""Provides direct evaluation of yearly recurrence rules.
+
+Implementations of :class:`~calingen.interfaces.plugin_api.EventProvider`
+define the recurrence of their events with :class:`dateutil.rrule.rrule`.
+``rrule`` generates its occurences by iterating from the rule's ``dtstart``,
+so the cost of looking up the occurences of a given year grows with the
+distance between ``dtstart`` and that year.
+
+This module *compiles* the most common yearly rules into evaluators, that
+compute the occurences of any given year directly:
+
+- fixed days, e.g. ``rrule(freq=YEARLY, dtstart=datetime(1990, 12, 25))``
+  (:class:`~calingen.interfaces.recurrence.MonthDayEvaluator`);
+- weekdays in a (bounded) range of days, e.g. ``bymonth=11, byweekday=WE,
+  bymonthday=(16, ..., 22)``, and the `n-th` weekday of a month, e.g.
+  ``bymonth=5, byweekday=SU(+2)``
+  (:class:`~calingen.interfaces.recurrence.MonthDayEvaluator`);
+- days with a fixed offset to Easter Sunday, e.g. ``byeaster=-2``
+  (:class:`~calingen.interfaces.recurrence.EasterEvaluator`).
+
+All other rules are evaluated by ``rrule`` itsself
+(:class:`~calingen.interfaces.recurrence.RRuleEvaluator`).
+
+Use :func:`~calingen.interfaces.recurrence.get_evaluator` to retrieve the
+evaluator of a rule. :func:`~calingen.interfaces.recurrence.get_occurences`
+memoizes the occurences of a rule per year; as the memo is keyed on the rule
+itsself, rules that are used by several providers are evaluated only once.
+Applications may provide specialized evaluators for
+their rules with :func:`~calingen.interfaces.recurrence.register_evaluator`.
+"""
+
+# Python imports
+import calendar
+import datetime
+from functools import lru_cache
+from weakref import WeakKeyDictionary
+
+# external imports
+from dateutil.easter import easter
+from dateutil.rrule import YEARLY
+
+ENGINE_VERSION = 1
+"""The version of the evaluators of this module.
+
+Has to be incremented, whenever a change of the evaluators changes their
+results. It is part of the fingerprint of materialized results (see
+:func:`~calingen.models.resolved_provider_year.provider_fingerprint`).
+"""
+
+_EVALUATORS = WeakKeyDictionary()
+"""Cache of compiled evaluators, see :func:`~calingen.interfaces.recurrence.get_evaluator`."""
+
+_OCCURENCE_CACHE_SIZE = 4096
+"""The number of memoized results of :func:`~calingen.interfaces.recurrence.get_occurences`."""
+
+
+class RecurrenceEvaluator:
+    """Base class of all evaluators.
+
+    Evaluators provide the occurences of one single
+    :class:`dateutil.rrule.rrule`. Implementations have to provide
+    :meth:`~calingen.interfaces.recurrence.RecurrenceEvaluator.occurences`.
+
+    Parameters
+    ----------
+    rule : dateutil.rrule.rrule
+        The evaluated rule.
+
+    Attributes
+    ----------
+    version : str
+        Identifies the data, the evaluator relies on, e.g. a precomputed
+        table. ``None``, if the results are determined by the rule (and
+        :data:`~calingen.interfaces.recurrence.ENGINE_VERSION`) alone.
+    """
+
+    version = None
+
+    def __init__(self, rule):  # noqa: D107
+        self.rule = rule
+        self._dtstart = rule._dtstart
+        self._until = rule._until
+        self._timeset = rule._timeset
+
+    def occurences(self, year):
+        """Return the occurences of the rule in ``year``.
+
+        Parameters
+        ----------
+        year : int
+
+        Returns
+        -------
+        list
+            The sorted list of :py:obj:`datetime.datetime` instances.
+        """
+        raise NotImplementedError  # pragma: nocover
+
+    def between(self, after, before):
+        """Return the occurences between ``after`` and ``before`` (inclusive).
+
+        This matches ``rrule.between(after, before, inc=True)``.
+
+        Parameters
+        ----------
+        after : datetime.datetime
+        before : datetime.datetime
+
+        Returns
+        -------
+        list
+            The sorted list of :py:obj:`datetime.datetime` instances.
+        """
+        result = []
+        for year in range(max(after.year, self._dtstart.year), before.year + 1):
+            result.extend(
+                occurence
+                for occurence in self.occurences(year)
+                if after <= occurence <= before
+            )
+        return result
+
+    def _timestamps(self, dates):
+        """Combine ``dates`` with the rule's times, honoring ``dtstart`` and ``until``."""
+        result = []
+        for date in dates:
+            for time in self._timeset:
+                timestamp = datetime.datetime.combine(date, time)
+                if timestamp < self._dtstart:
+                    continue
+                if self._until is not None and timestamp > self._until:
+                    continue
+                result.append(timestamp)
+        return result
+
+
+class RRuleEvaluator(RecurrenceEvaluator):
+    """Fallback, that evaluates the rule by ``rrule`` itsself."""
+
+    def __init__(self, rule):  # noqa: D107
+        self.rule = rule
+        self._dtstart = rule._dtstart
+
+    def occurences(self, year):  # noqa: D102
+        return self.rule.between(
+            datetime.datetime(year, 1, 1),
+            datetime.datetime(year, 12, 31, 23, 59, 59, 999999),
+            inc=True,
+        )
+
+    def between(self, after, before):  # noqa: D102
+        return self.rule.between(after, before, inc=True)
+
+
+class EasterEvaluator(RecurrenceEvaluator):
+    """Evaluates rules, that are only defined by ``byeaster``."""
+
+    def __init__(self, rule):  # noqa: D107
+        super().__init__(rule)
+        self._offsets = [datetime.timedelta(days=x) for x in sorted(rule._byeaster)]
+
+    def occurences(self, year):  # noqa: D102
+        sunday = easter(year)
+        return self._timestamps(
+            date
+            for date in (sunday + offset for offset in self._offsets)
+            if date.year == year
+        )
+
+
+class MonthDayEvaluator(RecurrenceEvaluator):
+    """Evaluates rules, that select days of given months.
+
+    The days may be filtered by day of the month (``bymonthday``) and by
+    weekday (``byweekday``, including the `n-th` weekday of the month).
+    """
+
+    def __init__(self, rule):  # noqa: D107
+        super().__init__(rule)
+        self._months = sorted(rule._bymonth)
+        self._monthdays = set(rule._bymonthday or ())
+        self._nmonthdays = set(rule._bynmonthday or ())
+        self._weekdays = set(rule._byweekday or ())
+        self._nweekdays = rule._bynweekday or ()
+
+    def occurences(self, year):  # noqa: D102
+        dates = []
+        for month in self._months:
+            first_weekday, length = calendar.monthrange(year, month)
+            if self._monthdays or self._nmonthdays:
+                days = sorted(
+                    {day for day in self._monthdays if day <= length}
+                    | {length + 1 + day for day in self._nmonthdays if -day <= length}
+                )
+            else:
+                days = range(1, length + 1)
+
+            if self._weekdays:
+                days = [
+                    day
+                    for day in days
+                    if (first_weekday + day - 1) % 7 in self._weekdays
+                ]
+            elif self._nweekdays:
+                matching = set()
+                for weekday, n in self._nweekdays:
+                    first = 1 + (weekday - first_weekday) % 7
+                    if n > 0:
+                        matching.add(first + 7 * (n - 1))
+                    else:
+                        last = first + 7 * ((length - first) // 7)
+                        matching.add(last + 7 * (n + 1))
+                days = [day for day in days if day in matching]
+
+            dates.extend(datetime.date(year, month, day) for day in days)
+        return self._timestamps(dates)
+
+
+def compile_rule(rule):
+    """Compile a rule into an evaluator.
+
+    Parameters
+    ----------
+    rule : dateutil.rrule.rrule
+
+    Returns
+    -------
+    RecurrenceEvaluator
+        The most specific evaluator for ``rule``. Rules, that are not yearly
+        with an interval of ``1`` or that use ``count``, ``bysetpos``,
+        ``byyearday``, ``byweekno`` or timezones, are evaluated by
+        :class:`~calingen.interfaces.recurrence.RRuleEvaluator`.
+    """
+    if (
+        rule._freq != YEARLY
+        or rule._interval != 1
+        or rule._count is not None
+        or rule._bysetpos
+        or rule._byyearday
+        or rule._byweekno
+        or rule._tzinfo is not None
+        or not rule._timeset
+    ):
+        return RRuleEvaluator(rule)
+
+    if rule._byeaster:
+        if (
+            rule._bymonth
+            or rule._bymonthday
+            or rule._bynmonthday
+            or rule._byweekday
+            or rule._bynweekday
+        ):
+            return RRuleEvaluator(rule)
+        return EasterEvaluator(rule)
+
+    # weekdays and n-th weekdays are only combined with months, and not with
+    # each other (the combination's semantics are rather special)
+    if rule._bymonth and not (rule._byweekday and rule._bynweekday):
+        return MonthDayEvaluator(rule)
+
+    return RRuleEvaluator(rule)
+
+
+def get_evaluator(rule):
+    """Return the (cached) evaluator of ``rule``.
+
+    Parameters
+    ----------
+    rule : dateutil.rrule.rrule
+
+    Returns
+    -------
+    RecurrenceEvaluator
+        See :func:`~calingen.interfaces.recurrence.compile_rule`.
+    """
+    try:
+        return _EVALUATORS[rule]
+    except KeyError:
+        evaluator = _EVALUATORS[rule] = compile_rule(rule)
+        return evaluator
+
+
+@lru_cache(maxsize=_OCCURENCE_CACHE_SIZE)
+def get_occurences(rule, year):
+    """Return the (memoized) occurences of ``rule`` in ``year``.
+
+    Parameters
+    ----------
+    rule : dateutil.rrule.rrule
+    year : int
+
+    Returns
+    -------
+    tuple
+        The sorted occurences, as provided by
+        :meth:`RecurrenceEvaluator.occurences() <calingen.interfaces.recurrence.RecurrenceEvaluator.occurences>`.
+
+    Notes
+    -----
+    Results are memoized per rule (by identity) and year, so they are shared
+    by every caller, that uses the same rule object, e.g. several
+    :class:`~calingen.interfaces.plugin_api.EventProvider` implementations,
+    that include the same holidays.
+    """
+    return tuple(get_evaluator(rule).occurences(year))
+
+
+def register_evaluator(rule, evaluator):
+    """Provide a custom evaluator for ``rule``.
+
+    Parameters
+    ----------
+    rule : dateutil.rrule.rrule
+    evaluator : RecurrenceEvaluator
+        Will be returned by
+        :func:`~calingen.interfaces.recurrence.get_evaluator` for ``rule``, e.g.
+        an evaluator that looks up precomputed occurences.
+    """
+    _EVALUATORS[rule] = evaluator
+    get_occurences.cache_clear()
@@ -0,0 +1,3 @@
+# SPDX-License-Identifier: MIT
+
+"""Management commands of **django-calingen**."""
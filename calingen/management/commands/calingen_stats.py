@@ -0,0 +1,105 @@
+# SPDX-License-Identifier: MIT
+
+"""Dump the statistics of the app's plugins.
+
+See :mod:`calingen.instrumentation` for details. The statistics are kept per
+process, so the command shows the calls of the command's own process. With
+``--resolve``, all profiles are resolved before the statistics are dumped::
+
+    django-admin calingen_stats --resolve 2022
+"""
+
+# Python imports
+import json
+
+# Django imports
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+# app imports
+from calingen.instrumentation import stats_registry
+from calingen.models.event import Event
+from calingen.models.profile import Profile
+
+
+class Command(BaseCommand):
+    """Dump the statistics of :data:`~calingen.instrumentation.stats_registry`."""
+
+    help = "Show call counts, timings and cache hit rates of the app's plugins."
+
+    def add_arguments(self, parser):  # noqa: D102
+        parser.add_argument(
+            "--resolve",
+            type=int,
+            metavar="YEAR",
+            help="Resolve all profiles and their events for YEAR first",
+        )
+        parser.add_argument(
+            "--json", action="store_true", help="Dump the statistics as JSON"
+        )
+        parser.add_argument(
+            "--reset", action="store_true", help="Discard the statistics afterwards"
+        )
+
+    def handle(self, *args, **options):  # noqa: D102
+        if options["resolve"] is not None:
+            self._resolve(options["resolve"])
+
+        stats = stats_registry.snapshot()
+        if options["json"]:
+            self.stdout.write(
+                json.dumps(
+                    [
+                        dict(plugin=plugin, operation=operation, **item.as_dict())
+                        for (plugin, operation), item in stats.items()
+                    ],
+                    indent=2,
+                )
+            )
+        elif not stats:
+            self.stdout.write("No statistics available (CALINGEN_INSTRUMENTATION)")
+        else:
+            self._write_table(stats)
+
+        if options["reset"]:
+            stats_registry.reset()
+
+    def _resolve(self, year):
+        """Resolve all profiles and events, recording their calls."""
+        if not settings.CALINGEN_INSTRUMENTATION:
+            raise CommandError("--resolve requires CALINGEN_INSTRUMENTATION")
+
+        for profile in Profile.objects.all():
+            profile.resolve(year)
+        for event in Event.objects.all():
+            event.resolve(year)
+
+    def _write_table(self, stats):
+        """Write one line per plugin and operation."""
+        row = "{:<60} {:<12} {:>7} {:>10} {:>10} {:>10} {:>8} {:>6}"
+        self.stdout.write(
+            row.format(
+                "Plugin",
+                "Operation",
+                "Calls",
+                "Total ms",
+                "Mean ms",
+                "Max ms",
+                "Entries",
+                "Hits",
+            )
+        )
+        for (plugin, operation), item in stats.items():
+            hit_rate = item.hit_rate
+            self.stdout.write(
+                row.format(
+                    plugin,
+                    operation,
+                    item.calls,
+                    "{:.2f}".format(item.total_time * 1000),
+                    "{:.2f}".format(item.mean_time * 1000),
+                    "{:.2f}".format(item.max_time * 1000),
+                    item.entries,
+                    "-" if hit_rate is None else "{:.0%}".format(hit_rate),
+                )
+            )
@@ -0,0 +1,77 @@
+# SPDX-License-Identifier: MIT
+
+"""Materialize the results of the event providers in the database.
+
+See :class:`calingen.models.resolved_provider_year.ResolvedProviderYear` for
+details. The command should be run after every deployment (and at the turn of
+the year)::
+
+    django-admin materialize_event_providers --prune
+"""
+
+# Python imports
+import datetime
+
+# Django imports
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+# app imports
+from calingen.interfaces.plugin_api import EventProvider
+from calingen.models.resolved_provider_year import ResolvedProviderYear
+
+
+class Command(BaseCommand):
+    """Resolve event providers and store their results."""
+
+    help = "Store the resolved events of the event providers in the database."
+
+    def add_arguments(self, parser):  # noqa: D102
+        current_year = datetime.datetime.now().year
+        parser.add_argument("--first-year", type=int, default=current_year)
+        parser.add_argument("--last-year", type=int, default=current_year + 1)
+        parser.add_argument(
+            "--provider",
+            action="append",
+            dest="providers",
+            help="The qualified classname of a provider (default: all available)",
+        )
+        parser.add_argument(
+            "--language",
+            action="append",
+            dest="languages",
+            help="The language to resolve the providers in (default: LANGUAGE_CODE)",
+        )
+        parser.add_argument(
+            "--prune",
+            action="store_true",
+            help="Delete outdated results and results of unavailable providers",
+        )
+
+    def handle(self, *args, **options):  # noqa: D102
+        first_year = options["first_year"]
+        last_year = options["last_year"]
+        if not 1 <= first_year <= last_year <= 9999:
+            raise CommandError("Invalid range of years")
+
+        available = [name for name, _title in EventProvider.list_available_plugins()]
+        names = options["providers"] or available
+        unknown = set(names) - set(available)
+        if unknown:
+            raise CommandError(
+                "Unavailable providers: {}".format(", ".join(sorted(unknown)))
+            )
+        providers = [EventProvider.get_plugin(name) for name in names]
+
+        manager = ResolvedProviderYear.calingen_manager
+        for language in options["languages"] or [settings.LANGUAGE_CODE]:
+            count = manager.materialize(providers, first_year, last_year, language)
+            self.stdout.write(
+                "Stored {} results of {}-{} ({})".format(
+                    count, first_year, last_year, language
+                )
+            )
+
+        if options["prune"]:
+            count = manager.prune(EventProvider.get_plugin(name) for name in available)
+            self.stdout.write("Deleted {} outdated results".format(count))
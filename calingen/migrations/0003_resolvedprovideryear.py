@@ -0,0 +1,47 @@
+# Generated by Django 4.1.13 on 2026-10-16 19:45
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("calingen", "0002_alter_event_unique_together"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ResolvedProviderYear",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "provider",
+                    models.CharField(max_length=255, verbose_name="Event Provider"),
+                ),
+                ("year", models.PositiveSmallIntegerField(verbose_name="Year")),
+                ("language", models.CharField(max_length=15, verbose_name="Language")),
+                (
+                    "fingerprint",
+                    models.CharField(max_length=40, verbose_name="Fingerprint"),
+                ),
+                ("entries", models.BinaryField(verbose_name="Entries")),
+                (
+                    "updated",
+                    models.DateTimeField(auto_now=True, verbose_name="Updated"),
+                ),
+            ],
+            options={
+                "verbose_name": "Resolved Event Provider",
+                "verbose_name_plural": "Resolved Event Providers",
+                "unique_together": {("provider", "year", "language")},
+            },
+        ),
+    ]
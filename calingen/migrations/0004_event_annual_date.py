@@ -0,0 +1,50 @@
+# Generated by Django 4.1.13 on 2026-10-16 19:53
+
+import datetime
+
+from django.db import migrations, models
+from django.db.models.functions import ExtractDay, ExtractMonth
+
+
+def backfill_annual_date(apps, schema_editor):
+    """Derive start_month and start_day of existing events (see Event.sync_annual_date())."""
+    Event = apps.get_model("calingen", "Event")
+    utc = datetime.timezone.utc
+    Event.objects.using(schema_editor.connection.alias).update(
+        start_month=ExtractMonth("start", tzinfo=utc),
+        start_day=ExtractDay("start", tzinfo=utc),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("calingen", "0003_resolvedprovideryear"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="event",
+            name="start_day",
+            field=models.PositiveSmallIntegerField(
+                default=0, editable=False, verbose_name="Start Day"
+            ),
+            preserve_default=False,
+        ),
+        migrations.AddField(
+            model_name="event",
+            name="start_month",
+            field=models.PositiveSmallIntegerField(
+                default=0, editable=False, verbose_name="Start Month"
+            ),
+            preserve_default=False,
+        ),
+        migrations.RunPython(backfill_annual_date, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name="event",
+            index=models.Index(
+                fields=["profile", "start_month", "start_day"],
+                name="calingen_event_annual_idx",
+            ),
+        ),
+    ]
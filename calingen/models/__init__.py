@@ -24,3 +24,4 @@ with that data.
 # app imports
 from calingen.models.event import Event  # noqa: F401
 from calingen.models.profile import Profile  # noqa: F401
+from calingen.models.resolved_provider_year import ResolvedProviderYear  # noqa: F401
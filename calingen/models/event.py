@@ -9,17 +9,24 @@ contains the related implementations of :class:`django.db.models.QuerySet`,
 
 # Python imports
 import datetime
+import time
+from itertools import groupby
+from operator import itemgetter
 
 # Django imports
 from django import forms
 from django.db import models
-from django.urls import reverse
+from django.db.models.functions import ExtractDay, ExtractMonth
+from django.db.models.signals import pre_save
+from django.dispatch import receiver
+from django.urls import reverse, reverse_lazy
 from django.utils.translation import gettext_lazy as _
 
 # app imports
 from calingen.constants import EventCategory
 from calingen.exceptions import CalingenException
 from calingen.forms.fields import SplitDateTimeOptionalField
+from calingen.instrumentation import instrumentation_enabled, record_call
 from calingen.interfaces.data_exchange import (
     SOURCE_INTERNAL,
     CalendarEntry,
@@ -29,6 +36,30 @@ from calingen.models.profile import Profile
 from calingen.models.queryset import CalingenQuerySet
 
 
+def _event_source(pk):
+    """Return the ``source`` of the calendar entries of the event ``pk``."""
+    return (SOURCE_INTERNAL, reverse_lazy("calingen:event-detail", args=[pk]))
+
+
+def _utc_month_and_day(start):
+    """Return the month and day of ``start``, evaluated in UTC for timezone-aware values."""
+    if start.tzinfo is not None:
+        start = start.astimezone(datetime.timezone.utc)
+    return start.month, start.day
+
+
+def _annual_date(year, month, day):
+    """Return the occurence of an annual event on ``month`` and ``day`` in ``year``.
+
+    Events on February 29th do not occur in years, that are no leap years, so
+    ``None`` is returned.
+    """
+    try:
+        return datetime.date(year, month, day)
+    except ValueError:
+        return None
+
+
 class EventModelException(CalingenException):
     """Base class for all exceptions related to the :class:`~calingen.models.event.Event` model."""
 
@@ -56,6 +87,62 @@ class EventQuerySet(CalingenQuerySet):
         """
         return self  # pragma: nocover
 
+    def bulk_create(self, objs, *args, **kwargs):
+        """Create the objects, deriving their annual date from ``start``.
+
+        Notes
+        -----
+        :meth:`QuerySet.bulk_create() <django.db.models.query.QuerySet.bulk_create>`
+        does not send ``pre_save``, so
+        :meth:`~calingen.models.event.Event.sync_annual_date` is applied to
+        the objects before they are created.
+        """
+        objs = list(objs)
+        for obj in objs:
+            obj.sync_annual_date()
+        return super().bulk_create(objs, *args, **kwargs)
+
+    def bulk_update(self, objs, fields, *args, **kwargs):
+        """Update the objects, deriving their annual date from ``start``.
+
+        Notes
+        -----
+        If ``fields`` includes ``"start"``,
+        :meth:`~calingen.models.event.Event.sync_annual_date` is applied to
+        the objects and ``start_month`` and ``start_day`` are updated aswell.
+        """
+        if "start" in fields:
+            objs = list(objs)
+            for obj in objs:
+                obj.sync_annual_date()
+            fields = [*fields, "start_month", "start_day"]
+        return super().bulk_update(objs, fields, *args, **kwargs)
+
+    def update(self, **kwargs):
+        """Update the result set, deriving the annual date from ``start``.
+
+        Notes
+        -----
+        If ``start`` is updated, ``start_month`` and ``start_day`` are updated
+        aswell, unless they are provided explicitly. They are derived from the
+        new value just like
+        :meth:`~calingen.models.event.Event.sync_annual_date` does, or by the
+        database, if the new value is an expression.
+        """
+        start = kwargs.get("start", None)
+        if isinstance(start, datetime.datetime):
+            month, day = _utc_month_and_day(start)
+            kwargs.setdefault("start_month", month)
+            kwargs.setdefault("start_day", day)
+        elif start is not None:
+            kwargs.setdefault(
+                "start_month", ExtractMonth(start, tzinfo=datetime.timezone.utc)
+            )
+            kwargs.setdefault(
+                "start_day", ExtractDay(start, tzinfo=datetime.timezone.utc)
+            )
+        return super().update(**kwargs)
+
     def filter_by_user(self, user):
         """Filter the result set by the objects' :attr:`owners <calingen.models.profile.Profile.owner>`.
 
@@ -79,6 +166,93 @@ class EventQuerySet(CalingenQuerySet):
         """
         return self.filter(profile__owner=user)
 
+    def annotate_annual_date(self):
+        """Annotate the month and day of the objects' ``start``.
+
+        Returns
+        -------
+        :class:`django.db.models.QuerySet`
+            The annotated queryset. The objects provide the month and day of
+            their ``start`` (in UTC, just like
+            :meth:`~calingen.models.event.Event.resolve` uses them) as
+            ``resolve_month`` and ``resolve_day``.
+
+        Notes
+        -----
+        The values are provided by the indexed columns
+        :attr:`~calingen.models.event.Event.start_month` and
+        :attr:`~calingen.models.event.Event.start_day`.
+        """
+        if "resolve_month" in self.query.annotations:
+            return self
+
+        return self.annotate(
+            resolve_month=models.F("start_month"), resolve_day=models.F("start_day")
+        )
+
+    def order_by_annual_date(self):
+        """Order the result set by the annual date of the objects.
+
+        Returns
+        -------
+        :class:`django.db.models.QuerySet`
+            The queryset, annotated by
+            :meth:`~calingen.models.event.EventQuerySet.annotate_annual_date`
+            and ordered by month, day, ``category`` and ``title``.
+
+        Notes
+        -----
+        Resolved for any year, the objects are provided in calendar order.
+        Within one day, the database's collation determines the order of the
+        titles, so it may differ from the order of
+        :class:`~calingen.interfaces.data_exchange.CalendarEntryList`.
+        """
+        return self.annotate_annual_date().order_by(
+            "resolve_month", "resolve_day", "category", "title"
+        )
+
+    def filter_by_annual_window(self, start, end):
+        """Filter the result set by the annual date of the objects.
+
+        Parameters
+        ----------
+        start : datetime.date
+            The first day of the window. Only its month and day are evaluated.
+        end : datetime.date
+            The last day of the window (inclusive). Only its month and day are
+            evaluated.
+
+        Returns
+        -------
+        :class:`django.db.models.QuerySet`
+            The queryset, annotated by
+            :meth:`~calingen.models.event.EventQuerySet.annotate_annual_date`
+            and filtered to the objects, that occur inside the window.
+
+        Notes
+        -----
+        Windows may wrap around the turn of the year, e.g. from December 15th
+        to January 15th. All events of March are retrieved by
+        ``filter_by_annual_window(date(2022, 3, 1), date(2022, 3, 31))``.
+
+        Combined with
+        :meth:`~calingen.models.event.EventQuerySet.filter_by_user`, the
+        lookup is answered by the index on ``profile``, ``start_month`` and
+        ``start_day``, so its costs depend on the size of the result instead
+        of the number of the user's events.
+        """
+        after_start = models.Q(resolve_month__gt=start.month) | models.Q(
+            resolve_month=start.month, resolve_day__gte=start.day
+        )
+        before_end = models.Q(resolve_month__lt=end.month) | models.Q(
+            resolve_month=end.month, resolve_day__lte=end.day
+        )
+        if (start.month, start.day) <= (end.month, end.day):
+            window = after_start & before_end
+        else:
+            window = after_start | before_end
+        return self.annotate_annual_date().filter(window)
+
 
 class EventManager(models.Manager):
     """App-/model-specific implementation of :class:`django.db.models.Manager`.
@@ -112,13 +286,124 @@ class EventManager(models.Manager):
         :class:`~calingen.interfaces.data_exchange.CalendarEntryList`
             All :class:`~calingen.models.event.Event` instances of ``user``,
             converted into a ``CalendarEntryList``.
+
+        Notes
+        -----
+        The events are not instantiated. Instead, only the required columns
+        are fetched with one single query and converted into entries in one
+        pass (see
+        :meth:`CalendarEntryList.from_records() <calingen.interfaces.data_exchange.CalendarEntryList.from_records>`).
+        The result is identical to merging the results of
+        :meth:`~calingen.models.event.Event.resolve`, including the
+        ``source`` of the entries, which provides the URL of the event as lazy
+        string.
         """
+        instrumented = instrumentation_enabled()
+        if instrumented:
+            start_time = time.perf_counter()
+
+        if year is None:
+            year = datetime.datetime.now().year
+
+        rows = self.get_user_events_qs(user).values_list(
+            "id", "title", "category", "start"
+        )
+        result = CalendarEntryList.from_records(
+            (title, category, date, _event_source(pk))
+            for pk, title, category, date in (
+                # see Event.resolve()
+                (pk, title, category, _annual_date(year, start.month, start.day))
+                for pk, title, category, start in rows.iterator()
+            )
+            if date is not None
+        )
+
+        if instrumented:
+            record_call(
+                self.model,
+                "resolve_bulk",
+                time.perf_counter() - start_time,
+                entries=len(result),
+            )
+        return result
+
+    def get_calendar_entry_list_window(self, user=None, start=None, end=None):
+        """Return all instances inside a window as :class:`~calingen.interfaces.data_exchange.CalendarEntryList`.
+
+        Parameters
+        ----------
+        user :
+            The entries are provided for an actual user, filtered by
+            :attr:`calingen.models.event.Event.owner`.
+        start : datetime.date
+            The first day of the window.
+        end : datetime.date
+            The last day of the window (inclusive).
+
+        Returns
+        -------
+        :class:`~calingen.interfaces.data_exchange.CalendarEntryList`
+            All :class:`~calingen.models.event.Event` instances of ``user``,
+            resolved by :meth:`~calingen.models.event.Event.resolve_window`.
+        """
+        queryset = self.get_user_events_qs(user)
+        if (end.year, end.month, end.day) < (start.year + 1, start.month, start.day):
+            # the window is shorter than a year, so every annual date occurs
+            # at most once and the database may skip the events outside of it
+            queryset = queryset.filter_by_annual_window(start, end)
+
         result = CalendarEntryList()
-        for event in self.get_user_events_qs(user).iterator():
-            result.merge(event.resolve(year))
+        for event in queryset.iterator():
+            result.merge(event.resolve_window(start, end))
 
         return result
 
+    def iter_calendar_entries(self, user=None, year=None):
+        """Iterate all instances of a ``user`` as sorted calendar entries.
+
+        Parameters
+        ----------
+        user :
+            The entries are provided for an actual user, filtered by
+            :attr:`calingen.models.event.Event.owner`.
+        year : int, optional
+            The year to resolve the events for.
+
+        Yields
+        ------
+        :class:`~calingen.interfaces.data_exchange.CalendarEntry`
+            The resolved events, sorted as in
+            :class:`~calingen.interfaces.data_exchange.CalendarEntryList`.
+
+        Notes
+        -----
+        The database provides the events ordered by month and day of their
+        ``start`` (see
+        :meth:`~calingen.models.event.EventQuerySet.order_by_annual_date`), so
+        only the entries of one single day have to be sorted in memory. Just
+        like :meth:`~calingen.models.event.EventManager.get_calendar_entry_list`,
+        the events are not instantiated.
+        """
+        if year is None:
+            year = datetime.datetime.now().year
+
+        rows = (
+            self.get_user_events_qs(user)
+            .order_by_annual_date()
+            .values_list("resolve_month", "resolve_day", "id", "title", "category")
+        )
+        for (month, day), day_rows in groupby(rows.iterator(), key=itemgetter(0, 1)):
+            # see Event.resolve()
+            timestamp = _annual_date(year, month, day)
+            if timestamp is None:
+                continue
+            # different events may resolve to the same entry and the database
+            # may order the titles differently
+            yield from CalendarEntryList.from_records(
+                (title, category, timestamp, _event_source(pk))
+                for _month, _day, pk, title, category in day_rows
+            )
+
     def get_queryset(self):
         """Use the app-/model-specific :class:`~calingen.models.event.EventQuerySet` by default.
 
@@ -185,27 +470,6 @@ class Event(models.Model):
     :class:`~django.db.models.Model`) are not documented here.
     """
 
-    objects = models.Manager()
-    """The model's default manager.
-
-    The default manager is set to :class:`django.db.models.Manager`, which is
-    the default value. In order to add the custom :attr:`calingen_manager` as
-    an *additional* manager, the default manager has to be provided explicitly
-    (see :djangodoc:`topics/db/managers/#default-managers`).
-    """
-
-    calingen_manager = EventManager()
-    """App-/model-specific manager, that provides additional functionality.
-
-    This manager is set to
-    :class:`calingen.models.event.EventManager`. Its implementation provides
-    augmentations of `Event` objects, by annotating them on database level.
-    This will reduce the number of required database queries, if attributes of
-    the object are accessed.
-
-    The manager has to be used explicitly.
-    """
-
     profile = models.ForeignKey(
         Profile,
         on_delete=models.CASCADE,
@@ -279,8 +543,70 @@ class Event(models.Model):
     its possible values limited by :class:`calingen.constants.EventCategory`.
     """
 
+    start_month = models.PositiveSmallIntegerField(
+        editable=False, verbose_name=_("Start Month")
+    )
+    """The month of :attr:`start` (in UTC, :py:obj:`int`).
+
+    Notes
+    -----
+    This attribute and :attr:`start_day` are derived from :attr:`start`, so
+    the annual date of events may be looked up by the index on ``profile``,
+    ``start_month`` and ``start_day`` (see
+    :meth:`~calingen.models.event.EventQuerySet.filter_by_annual_window`).
+
+    They are derived by a receiver of ``pre_save`` (see
+    :func:`~calingen.models.event.sync_event_annual_date`), i.e. on
+    :meth:`~calingen.models.event.Event.save` and while loading fixtures, and
+    by the bulk operations of :class:`~calingen.models.event.EventQuerySet`.
+
+    Warnings
+    --------
+    Raw SQL and querysets, that are not based on
+    :class:`~calingen.models.event.EventQuerySet`, bypass these mechanisms
+    and have to provide both attributes explicitly (see
+    :meth:`~calingen.models.event.Event.sync_annual_date`).
+    """
+
+    start_day = models.PositiveSmallIntegerField(
+        editable=False, verbose_name=_("Start Day")
+    )
+    """The day of :attr:`start` (in UTC, :py:obj:`int`).
+
+    See :attr:`start_month` for details.
+    """
+
+    objects = models.Manager.from_queryset(EventQuerySet)()
+    """The model's default manager.
+
+    The default manager is a :class:`django.db.models.Manager`, that uses
+    :class:`~calingen.models.event.EventQuerySet`, so bulk operations keep
+    :attr:`start_month` and :attr:`start_day` in sync with :attr:`start`. In
+    order to add the custom :attr:`calingen_manager` as an *additional*
+    manager, the default manager has to be provided explicitly (see
+    :djangodoc:`topics/db/managers/#default-managers`).
+    """
+
+    calingen_manager = EventManager()
+    """App-/model-specific manager, that provides additional functionality.
+
+    This manager is set to
+    :class:`calingen.models.event.EventManager`. Its implementation provides
+    augmentations of `Event` objects, by annotating them on database level.
+    This will reduce the number of required database queries, if attributes of
+    the object are accessed.
+
+    The manager has to be used explicitly.
+    """
+
     class Meta:  # noqa: D106
         app_label = "calingen"
+        indexes = [
+            models.Index(
+                fields=["profile", "start_month", "start_day"],
+                name="calingen_event_annual_idx",
+            )
+        ]
         unique_together = ["profile", "title", "start"]
         verbose_name = _("Event")
         verbose_name_plural = _("Events")
@@ -290,6 +616,22 @@ class Event(models.Model):
             self.category, self.profile, self.title, self.start
         )  # pragma: nocover
 
+    def save(self, *args, **kwargs):
+        """Keep :attr:`start_month` and :attr:`start_day` in sync with :attr:`start`.
+
+        Notes
+        -----
+        The attributes are derived by
+        :func:`~calingen.models.event.sync_event_annual_date`. If
+        ``update_fields`` includes ``"start"``, the derived attributes are
+        included aswell.
+        """
+        update_fields = kwargs.get("update_fields")
+        if update_fields is not None and "start" in update_fields:
+            kwargs["update_fields"] = {*update_fields, "start_month", "start_day"}
+
+        super().save(*args, **kwargs)
+
     def get_absolute_url(self):
         """Return the absolute URL for instances of this model.
 
@@ -300,6 +642,16 @@ class Event(models.Model):
         """
         return reverse("calingen:event-detail", args=[self.id])  # pragma: nocover
 
+    def sync_annual_date(self):
+        """Derive :attr:`start_month` and :attr:`start_day` from :attr:`start`.
+
+        Notes
+        -----
+        Timezone-aware values of ``start`` are evaluated in UTC, just like the
+        database provides them.
+        """
+        self.start_month, self.start_day = _utc_month_and_day(self.start)
+
     def resolve(self, year=None):
         """Resolve this object's ``start`` for a given ``year``.
 
@@ -312,8 +664,19 @@ class Event(models.Model):
         -------
         :class:`~calingen.interfaces.data_exchange.CalendarEntryList`
             The method returns a ``CalendarEntryList`` with entries for the
-            given ``year``.
+            given ``year``. Their ``source`` provides the URL of this object
+            as lazy string, just like the entries of
+            :meth:`~calingen.models.event.EventManager.get_calendar_entry_list`.
+
+        Notes
+        -----
+        Events on February 29th are skipped in years, that are no leap years.
+        This applies to all methods, that resolve events.
         """
+        instrumented = instrumentation_enabled()
+        if instrumented:
+            start = time.perf_counter()
+
         if year is None:
             year = datetime.datetime.now().year
 
@@ -324,17 +687,70 @@ class Event(models.Model):
         # to have a yearly recurrence.
         # The following statement works on that assumption and simply uses the
         # specified year parameter with the (stored) values of month and day.
-        result.add(
-            CalendarEntry(
-                self.title,
-                self.category,
-                datetime.date(year, self.start.month, self.start.day),
-                (SOURCE_INTERNAL, self.get_absolute_url),
+        date = _annual_date(year, self.start.month, self.start.day)
+        if date is not None:
+            result.add(
+                CalendarEntry(self.title, self.category, date, _event_source(self.pk))
             )
-        )
 
+        if instrumented:
+            record_call(
+                type(self), "resolve", time.perf_counter() - start, entries=len(result)
+            )
         return result
 
+    def resolve_window(self, start, end):
+        """Resolve this object's ``start`` for all days from ``start`` to ``end``.
+
+        Parameters
+        ----------
+        start : datetime.date
+            The first day of the window.
+        end : datetime.date
+            The last day of the window (inclusive).
+
+        Returns
+        -------
+        :class:`~calingen.interfaces.data_exchange.CalendarEntryList`
+            The method returns a ``CalendarEntryList`` with an entry for every
+            occurence of the event inside the window.
+
+        Notes
+        -----
+        Just like :meth:`~calingen.models.event.Event.resolve`, this method
+        assumes a yearly recurrence. Events on February 29th are skipped in
+        years, that are no leap years.
+        """
+        result = CalendarEntryList()
+
+        for year in range(start.year, end.year + 1):
+            date = _annual_date(year, self.start.month, self.start.day)
+            if date is not None and start <= date <= end:
+                result.add(
+                    CalendarEntry(
+                        self.title,
+                        self.category,
+                        date,
+                        _event_source(self.pk),
+                    )
+                )
+
+        return result
+
+
+@receiver(pre_save, sender=Event)
+def sync_event_annual_date(sender, instance, **kwargs):
+    """Derive the annual date of an :class:`~calingen.models.event.Event` before saving it.
+
+    Notes
+    -----
+    This receiver of ``pre_save`` applies
+    :meth:`~calingen.models.event.Event.sync_annual_date`. It is also called
+    for ``raw`` saves, so fixtures do not have to provide the derived
+    attributes.
+    """
+    instance.sync_annual_date()
+
 
 class EventForm(forms.ModelForm):
     """Used to validate input for creating and updating `Event` instances."""
@@ -18,11 +18,22 @@ from django.urls import reverse
 from django.utils.module_loading import import_string
 from django.utils.translation import gettext_lazy as _
 
+# external imports
+from asgiref.sync import sync_to_async
+
 # app imports
 from calingen.forms.fields import PluginField
-from calingen.interfaces.data_exchange import CalendarEntryList
-from calingen.interfaces.plugin_api import EventProvider
+from calingen.interfaces.data_exchange import CalendarEntryList, merge_sorted
+from calingen.interfaces.plugin_api import (
+    EventProvider,
+    iter_providers,
+    resolve_providers,
+    resolve_providers_async,
+    resolve_providers_range,
+    resolve_providers_window,
+)
 from calingen.models.queryset import CalingenQuerySet
+from calingen.models.resolved_provider_year import ResolvedProviderYear
 
 
 class ProfileQuerySet(CalingenQuerySet):
@@ -246,7 +257,7 @@ class Profile(models.Model):
         """
         return reverse("calingen:profile", args=[self.id])  # pragma: nocover
 
-    def resolve(self, year=None):
+    def resolve(self, year=None, report=None):
         """Combine all event providers results for a given year into one :class:`~calingen.interfaces.data_exchange.CalendarEntryList`.
 
         Parameters
@@ -254,22 +265,247 @@ class Profile(models.Model):
         year : int, optional
             The year to use for resolving the
             :class:`~calingen.interfaces.plugin_api.EventProvider`.
+        report : :class:`~calingen.interfaces.plugin_api.ResolutionReport`, optional
+            Receives the timings of the providers and the providers, that did
+            not finish in time.
+
+        Returns
+        -------
+        :class:`~calingen.interfaces.data_exchange.CalendarEntryList`
+            A single instance including all events from all active providers.
+
+        Notes
+        -----
+        The providers are combined by
+        :func:`~calingen.interfaces.plugin_api.resolve_providers`, so entries,
+        that are shared by several providers, are only resolved once.
+        Providers with a custom ``resolve()`` are resolved in parallel and
+        skipped, if they do not finish in time.
+
+        If :attr:`~calingen.settings.CALINGEN_EVENT_PROVIDER_MATERIALIZATION` is
+        enabled, the materialized results of the providers are retrieved from
+        :class:`~calingen.models.resolved_provider_year.ResolvedProviderYear`
+        first; only the remaining providers are resolved.
+        """
+        if year is None:
+            year = datetime.datetime.now().year
+
+        providers = [
+            import_string(provider) for provider in self.event_provider["active"]
+        ]
+        if not settings.CALINGEN_EVENT_PROVIDER_MATERIALIZATION:
+            return resolve_providers(providers, year, report=report)
+
+        result, providers = ResolvedProviderYear.calingen_manager.load(providers, year)
+        if providers:
+            result.merge(resolve_providers(providers, year, report=report))
+        return result
+
+    async def resolve_async(self, year=None, report=None):
+        """Combine all event providers results for a given year concurrently.
+
+        Parameters
+        ----------
+        year : int, optional
+            The year to use for resolving the
+            :class:`~calingen.interfaces.plugin_api.EventProvider`.
+        report : :class:`~calingen.interfaces.plugin_api.ResolutionReport`, optional
+            Receives the timings of the providers and the providers, that did
+            not finish in time or failed.
 
         Returns
         -------
         :class:`~calingen.interfaces.data_exchange.CalendarEntryList`
             A single instance including all events from all active providers.
+
+        Notes
+        -----
+        The active providers are resolved concurrently by
+        :func:`~calingen.interfaces.plugin_api.resolve_providers_async`, so
+        providers, that perform I/O in
+        :meth:`EventProvider.resolve_async() <calingen.interfaces.plugin_api.EventProvider.resolve_async>`,
+        do not block each other.
+
+        Materialized results are used just like in
+        :meth:`~calingen.models.profile.Profile.resolve`.
         """
         if year is None:
             year = datetime.datetime.now().year
 
+        providers = [
+            import_string(provider) for provider in self.event_provider["active"]
+        ]
+        if not settings.CALINGEN_EVENT_PROVIDER_MATERIALIZATION:
+            return await resolve_providers_async(providers, year, report=report)
+
+        result, providers = await sync_to_async(
+            ResolvedProviderYear.calingen_manager.load
+        )(providers, year)
+        if providers:
+            result.merge(await resolve_providers_async(providers, year, report=report))
+        return result
+
+    def resolve_window(self, start, end, report=None):
+        """Combine all event providers results for a window into one :class:`~calingen.interfaces.data_exchange.CalendarEntryList`.
+
+        Parameters
+        ----------
+        start : datetime.date
+            The first day of the window.
+        end : datetime.date
+            The last day of the window (inclusive).
+        report : :class:`~calingen.interfaces.plugin_api.ResolutionReport`, optional
+            Receives the timings of the providers and the providers, that did
+            not finish in time or failed.
+
+        Returns
+        -------
+        :class:`~calingen.interfaces.data_exchange.CalendarEntryList`
+            A single instance including all events from all active providers,
+            as provided by
+            :meth:`EventProvider.resolve_window() <calingen.interfaces.plugin_api.EventProvider.resolve_window>`.
+
+        Notes
+        -----
+        The providers are combined by
+        :func:`~calingen.interfaces.plugin_api.resolve_providers_window`, i.e.
+        with the same time limits as in
+        :meth:`~calingen.models.profile.Profile.resolve`.
+
+        If :attr:`~calingen.settings.CALINGEN_EVENT_PROVIDER_MATERIALIZATION` is
+        enabled, the materialized results of all affected years are used for
+        providers with a custom ``resolve()``, as their windows are cut from
+        their yearly results anyway. Providers with the default
+        ``resolve()`` provide all occurences inside the window (not just the
+        first occurence per year), so they are always resolved.
+        """
+        providers = [
+            import_string(provider) for provider in self.event_provider["active"]
+        ]
+        if not settings.CALINGEN_EVENT_PROVIDER_MATERIALIZATION:
+            return resolve_providers_window(providers, start, end, report=report)
+
+        custom = [
+            provider
+            for provider in providers
+            if provider.resolve.__func__ is not EventProvider.resolve.__func__
+        ]
+        years, remaining = ResolvedProviderYear.calingen_manager.load_range(
+            custom, start.year, end.year
+        )
         result = CalendarEntryList()
-        for provider in self.event_provider["active"]:
-            provider_instance = import_string(provider)
-            result.merge(provider_instance.resolve(year))
+        for entries in years.values():
+            result.merge(entries)
+        result = result.between(start, end)
+
+        materialized = set(custom).difference(remaining)
+        result.merge(
+            resolve_providers_window(
+                [provider for provider in providers if provider not in materialized],
+                start,
+                end,
+                report=report,
+            )
+        )
+        return result
 
+    def resolve_range(self, first_year, last_year, report=None):
+        """Combine all event providers results for several years.
+
+        Parameters
+        ----------
+        first_year : int
+            The first year to use for resolving the
+            :class:`~calingen.interfaces.plugin_api.EventProvider`.
+        last_year : int
+            The last year to use for resolving the
+            :class:`~calingen.interfaces.plugin_api.EventProvider` (inclusive).
+        report : :class:`~calingen.interfaces.plugin_api.ResolutionReport`, optional
+            Receives the timings of the providers and the providers, that did
+            not finish in time or failed.
+
+        Returns
+        -------
+        dict
+            Maps every year of the range to a single
+            :class:`~calingen.interfaces.data_exchange.CalendarEntryList`,
+            including all events from all active providers, as provided by
+            :meth:`EventProvider.resolve_range() <calingen.interfaces.plugin_api.EventProvider.resolve_range>`.
+
+        Notes
+        -----
+        The providers are combined by
+        :func:`~calingen.interfaces.plugin_api.resolve_providers_range`, i.e.
+        with the same time limits as in
+        :meth:`~calingen.models.profile.Profile.resolve`.
+
+        Materialized results are used just like in
+        :meth:`~calingen.models.profile.Profile.resolve`, retrieving all years
+        with one single query.
+        """
+        providers = [
+            import_string(provider) for provider in self.event_provider["active"]
+        ]
+        if not settings.CALINGEN_EVENT_PROVIDER_MATERIALIZATION:
+            return resolve_providers_range(
+                providers, first_year, last_year, report=report
+            )
+
+        result, providers = ResolvedProviderYear.calingen_manager.load_range(
+            providers, first_year, last_year
+        )
+        if providers:
+            for year, entries in resolve_providers_range(
+                providers, first_year, last_year, report=report
+            ).items():
+                result[year].merge(entries)
         return result
 
+    def iter_entries(self, year=None, report=None):
+        """Iterate all event providers' entries for a given year.
+
+        Parameters
+        ----------
+        year : int, optional
+            The year to use for resolving the
+            :class:`~calingen.interfaces.plugin_api.EventProvider`.
+        report : :class:`~calingen.interfaces.plugin_api.ResolutionReport`, optional
+            Receives the timings of the providers and the providers, that did
+            not finish in time or failed.
+
+        Returns
+        -------
+        iterator
+            The unique :class:`~calingen.interfaces.data_exchange.CalendarEntry`
+            instances of all active providers in sorted order.
+
+        Notes
+        -----
+        Every provider is a separate source (see
+        :func:`~calingen.interfaces.plugin_api.iter_providers`), that is merged
+        by :func:`~calingen.interfaces.data_exchange.merge_sorted`, so the
+        results of the providers are not combined in memory. ``report`` is
+        complete, once the iterator is exhausted.
+
+        Materialized results are used just like in
+        :meth:`~calingen.models.profile.Profile.resolve`; they are loaded as
+        one single source.
+        """
+        if year is None:
+            year = datetime.datetime.now().year
+
+        providers = [
+            import_string(provider) for provider in self.event_provider["active"]
+        ]
+        sources = []
+        if settings.CALINGEN_EVENT_PROVIDER_MATERIALIZATION:
+            materialized, providers = ResolvedProviderYear.calingen_manager.load(
+                providers, year
+            )
+            sources.append(materialized)
+        sources.extend(iter_providers(providers, year, report=report))
+        return merge_sorted(*sources)
+
     @property
     def event_provider(self):
         """Get and set the list of :class:`~calingen.interfaces.plugin_api.EventProvider`.
@@ -296,21 +532,19 @@ class Profile(models.Model):
         """
         raw = self._event_provider
 
-        provider = [p[0] for p in EventProvider.list_available_plugins()]
-
         active = []
         unavailable = []
         newly_unavailable = []
 
         for item in raw.get("active", []):
-            if item in provider:
+            if EventProvider.is_available(item):
                 active.append(item)
             else:
                 newly_unavailable.append(item)
                 unavailable.append(item)
 
         for item in raw.get("unavailable", []):
-            if item in provider:
+            if EventProvider.is_available(item):
                 active.append(item)
             else:
                 unavailable.append(item)
@@ -0,0 +1,346 @@
+# SPDX-License-Identifier: MIT
+
+"""Materialized results of :class:`~calingen.interfaces.plugin_api.EventProvider` implementations.
+
+Beside the actual :class:`calingen.models.resolved_provider_year.ResolvedProviderYear`
+model, this module contains the related implementation of
+:class:`django.db.models.Manager`.
+"""
+
+# Python imports
+import hashlib
+import inspect
+from collections import defaultdict
+from weakref import WeakKeyDictionary
+
+# Django imports
+from django.db import models, transaction
+from django.utils.translation import get_language, gettext_lazy as _, override
+
+# app imports
+from calingen.interfaces.data_exchange import CalendarEntryList
+from calingen.interfaces.plugin_api import fully_qualified_classname
+from calingen.interfaces.recurrence import ENGINE_VERSION, get_evaluator
+
+_FINGERPRINTS = WeakKeyDictionary()
+"""Cache of :func:`~calingen.models.resolved_provider_year.provider_fingerprint`."""
+
+
+def provider_fingerprint(provider):
+    """Return a fingerprint of the definition of ``provider``.
+
+    Parameters
+    ----------
+    provider : :class:`~calingen.interfaces.plugin_api.EventProvider`
+
+    Returns
+    -------
+    str
+        A hex digest, that changes, if the provider's ``title``, its
+        ``entries`` (including their recurrence), its ``resolve_version``, the
+        source code of its ``resolve()`` or the evaluation of the recurrences
+        change.
+
+    Notes
+    -----
+    Titles are included untranslated, so the fingerprint does not depend on
+    the active language. The fingerprint is computed once per provider (and
+    again, if its ``entries``, their evaluators or its ``resolve_version`` are
+    modified).
+
+    The evaluation of the recurrences is represented by
+    :data:`~calingen.interfaces.recurrence.ENGINE_VERSION` and the class and
+    ``version`` of the evaluator of every rule (see
+    :func:`~calingen.interfaces.recurrence.get_evaluator`), e.g. of the
+    precomputed table of
+    :mod:`calingen.contrib.providers.german_holidays.table`.
+
+    The fingerprint has to be the same in every process, e.g. in the
+    management command ``materialize_event_providers`` and the web workers,
+    regardless of the interpreter's version and hash seed. That is why
+    ``resolve()`` is represented by its source code instead of its bytecode.
+    If the source is not available, only the explicit ``resolve_version`` of
+    the provider reflects changes of ``resolve()``.
+    """
+    entries = tuple(getattr(provider, "entries", ()))
+    evaluators = tuple(
+        (fully_qualified_classname(evaluator), evaluator.version)
+        for evaluator in (get_evaluator(entry[2]) for entry in entries)
+    )
+    version = provider.resolve_version
+    try:
+        cached, fingerprint = _FINGERPRINTS[provider]
+        if cached == (entries, evaluators, version):
+            return fingerprint
+    except KeyError:
+        pass
+
+    resolve = provider.resolve.__func__
+    try:
+        source = inspect.getsource(resolve)
+    except (OSError, TypeError):
+        source = resolve.__qualname__
+    with override(None):
+        definition = [
+            ENGINE_VERSION,
+            evaluators,
+            fully_qualified_classname(provider),
+            str(provider.title),
+            str(version),
+            hashlib.sha1(source.encode("utf-8")).hexdigest(),
+        ]
+        definition.extend(
+            (str(title), str(category), str(rule)) for title, category, rule in entries
+        )
+    fingerprint = hashlib.sha1(repr(definition).encode("utf-8")).hexdigest()
+    _FINGERPRINTS[provider] = ((entries, evaluators, version), fingerprint)
+    return fingerprint
+
+
+class ResolvedProviderYearManager(models.Manager):
+    """App-/model-specific implementation of :class:`django.db.models.Manager`.
+
+    Notes
+    -----
+    This :class:`~django.db.models.Manager` implementation is used as an
+    **additional** manager of
+    :class:`~calingen.models.resolved_provider_year.ResolvedProviderYear`
+    (see :attr:`calingen.models.resolved_provider_year.ResolvedProviderYear.calingen_manager`).
+    """
+
+    def load(self, providers, year, language=None):
+        """Retrieve the materialized results of ``providers`` with one single query.
+
+        Parameters
+        ----------
+        providers : iterable
+            Implementations of
+            :class:`~calingen.interfaces.plugin_api.EventProvider`.
+        year : int
+        language : str, optional
+            Defaults to the active language.
+
+        Returns
+        -------
+        tuple
+            The combined :class:`~calingen.interfaces.data_exchange.CalendarEntryList`
+            of all materialized providers and the :py:obj:`list` of providers,
+            that have to be resolved by other means.
+
+        Notes
+        -----
+        Only providers, that are ``cacheable``, are materialized. Results,
+        that do not match the provider's current
+        :func:`~calingen.models.resolved_provider_year.provider_fingerprint`,
+        are ignored.
+        """
+        result, remaining = self.load_range(providers, year, year, language=language)
+        return result[year], remaining
+
+    def load_range(self, providers, first_year, last_year, language=None):
+        """Retrieve the materialized results of ``providers`` for several years.
+
+        Parameters
+        ----------
+        providers : iterable
+            Implementations of
+            :class:`~calingen.interfaces.plugin_api.EventProvider`.
+        first_year : int
+        last_year : int
+        language : str, optional
+            Defaults to the active language.
+
+        Returns
+        -------
+        tuple
+            A :py:obj:`dict`, mapping every year of the range (inclusive) to
+            the combined
+            :class:`~calingen.interfaces.data_exchange.CalendarEntryList` of
+            all materialized providers, and the :py:obj:`list` of providers,
+            that have to be resolved by other means.
+
+        Notes
+        -----
+        The rows are retrieved with one single query. A provider is only
+        considered materialized, if the rows of all years of the range match
+        its current
+        :func:`~calingen.models.resolved_provider_year.provider_fingerprint`.
+        """
+        providers = list(providers)
+        candidates = {
+            fully_qualified_classname(provider): provider
+            for provider in providers
+            if provider.cacheable
+        }
+        years = range(first_year, last_year + 1)
+
+        result = {year: CalendarEntryList() for year in years}
+        loaded = set()
+        if candidates:
+            rows = self.filter(
+                provider__in=candidates,
+                year__gte=first_year,
+                year__lte=last_year,
+                language=language or get_language(),
+            ).values_list("provider", "year", "fingerprint", "entries")
+            fingerprints = {
+                name: provider_fingerprint(provider)
+                for name, provider in candidates.items()
+            }
+            found = defaultdict(dict)
+            for name, year, fingerprint, entries in rows:
+                if fingerprint == fingerprints[name]:
+                    found[name][year] = entries
+            for name, entries_by_year in found.items():
+                if len(entries_by_year) < len(years):
+                    continue
+                for year, entries in entries_by_year.items():
+                    result[year].merge(CalendarEntryList.from_bytes(entries))
+                loaded.add(candidates[name])
+
+        return result, [provider for provider in providers if provider not in loaded]
+
+    def materialize(self, providers, first_year, last_year, language):
+        """Resolve ``providers`` and store their results, replacing existing rows.
+
+        Parameters
+        ----------
+        providers : iterable
+            Implementations of
+            :class:`~calingen.interfaces.plugin_api.EventProvider`. Providers,
+            that are not ``cacheable``, are skipped.
+        first_year : int
+        last_year : int
+        language : str
+
+        Returns
+        -------
+        int
+            The number of stored rows.
+        """
+        objs = []
+        with override(language):
+            for provider in providers:
+                if not provider.cacheable:
+                    continue
+                name = fully_qualified_classname(provider)
+                fingerprint = provider_fingerprint(provider)
+                for year, entries in provider.resolve_range(
+                    first_year, last_year
+                ).items():
+                    objs.append(
+                        self.model(
+                            provider=name,
+                            year=year,
+                            language=language,
+                            fingerprint=fingerprint,
+                            entries=entries.to_bytes(),
+                        )
+                    )
+
+        with transaction.atomic(using=self.db):
+            self.filter(
+                provider__in={obj.provider for obj in objs},
+                year__gte=first_year,
+                year__lte=last_year,
+                language=language,
+            ).delete()
+            self.bulk_create(objs)
+        return len(objs)
+
+    def prune(self, providers):
+        """Delete all rows, that are outdated or belong to unavailable providers.
+
+        Parameters
+        ----------
+        providers : iterable
+            The available implementations of
+            :class:`~calingen.interfaces.plugin_api.EventProvider`.
+
+        Returns
+        -------
+        int
+            The number of deleted rows.
+        """
+        current = {
+            fully_qualified_classname(provider): provider_fingerprint(provider)
+            for provider in providers
+            if provider.cacheable
+        }
+        stale = models.Q()
+        for name, fingerprint in self.values_list("provider", "fingerprint").distinct():
+            if current.get(name) != fingerprint:
+                stale |= models.Q(provider=name, fingerprint=fingerprint)
+        if not stale:
+            return 0
+        return self.filter(stale).delete()[0]
+
+
+class ResolvedProviderYear(models.Model):
+    """The resolved entries of one event provider in one year.
+
+    Notes
+    -----
+    Every worker of a deployment keeps its own in-memory cache of the results
+    of :class:`~calingen.interfaces.plugin_api.EventProvider` implementations
+    (see :meth:`~calingen.interfaces.plugin_api.EventProvider.resolve_cached`).
+    If :attr:`~calingen.settings.CALINGEN_EVENT_PROVIDER_MATERIALIZATION` is
+    enabled, :meth:`Profile.resolve() <calingen.models.profile.Profile.resolve>`
+    (and the other ``resolve*()`` methods of
+    :class:`~calingen.models.profile.Profile`) retrieves the results from this
+    model instead, so they are shared by all workers.
+
+    The rows are created by the management command
+    ``materialize_event_providers``. They are invalidated automatically, when
+    the definition of the provider changes (see
+    :func:`~calingen.models.resolved_provider_year.provider_fingerprint`).
+
+    The entries are stored in the compact binary format of
+    :mod:`calingen.interfaces.columnar`, so lazy ``display_title`` values are
+    kept in the language of the row only.
+    """
+
+    provider = models.CharField(max_length=255, verbose_name=_("Event Provider"))
+    """The `qualified classname` of the provider (:py:obj:`str`)."""
+
+    year = models.PositiveSmallIntegerField(verbose_name=_("Year"))
+    """The resolved year (:py:obj:`int`)."""
+
+    language = models.CharField(max_length=15, verbose_name=_("Language"))
+    """The language, that was active while resolving (:py:obj:`str`)."""
+
+    fingerprint = models.CharField(max_length=40, verbose_name=_("Fingerprint"))
+    """The :func:`~calingen.models.resolved_provider_year.provider_fingerprint` of the provider (:py:obj:`str`)."""
+
+    entries = models.BinaryField(verbose_name=_("Entries"))
+    """The serialized :class:`~calingen.interfaces.data_exchange.CalendarEntryList`."""
+
+    updated = models.DateTimeField(auto_now=True, verbose_name=_("Updated"))
+    """The time of the last update (:py:obj:`datetime.datetime`)."""
+
+    objects = models.Manager()
+    """The model's default manager.
+
+    The default manager is set to :class:`django.db.models.Manager`, which is
+    the default value. In order to add the custom :attr:`calingen_manager` as
+    an *additional* manager, the default manager has to be provided explicitly
+    (see :djangodoc:`topics/db/managers/#default-managers`).
+    """
+
+    calingen_manager = ResolvedProviderYearManager()
+    """App-/model-specific manager, that provides additional functionality.
+
+    This manager is set to
+    :class:`calingen.models.resolved_provider_year.ResolvedProviderYearManager`.
+
+    The manager has to be used explicitly.
+    """
+
+    class Meta:  # noqa: D106
+        app_label = "calingen"
+        unique_together = ["provider", "year", "language"]
+        verbose_name = _("Resolved Event Provider")
+        verbose_name_plural = _("Resolved Event Providers")
+
+    def __str__(self):  # noqa: D105
+        return "[{}] {} ({})".format(self.year, self.provider, self.language)
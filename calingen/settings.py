@@ -94,3 +94,140 @@ implementation details.
 See :func:`calingen.checks.check_config_value_event_provider_notification` for
 the corresponding contribution to Django's check framework.
 """
+
+CALINGEN_EVENT_PROVIDER_CACHE_SIZE = 128
+"""The number of resolved years, that are kept in memory.
+
+**Default value:** ``128``
+
+**Accepted values**: :py:obj:`int` (``>= 0``)
+
+Notes
+-----
+The results of
+:meth:`EventProvider.resolve() <calingen.interfaces.plugin_api.EventProvider.resolve>`
+are memoized per provider, year and language (see
+:meth:`~calingen.interfaces.plugin_api.EventProvider.resolve_cached`). Once
+the cache is full, the least recently used result is evicted. A value of ``0``
+disables the cache.
+
+See :func:`calingen.checks.check_config_value_event_provider_cache_size` for
+the corresponding contribution to Django's check framework.
+"""
+
+CALINGEN_EVENT_PROVIDER_WORKERS = 4
+"""The number of threads, that resolve event providers in parallel.
+
+**Default value:** ``4``
+
+**Accepted values**: :py:obj:`int` (``>= 0``)
+
+Notes
+-----
+Implementations of :class:`~calingen.interfaces.plugin_api.EventProvider`,
+that provide a custom
+:meth:`~calingen.interfaces.plugin_api.EventProvider.resolve`, may perform
+I/O or expensive computations. They are resolved in a shared thread pool of
+this size, see :func:`calingen.interfaces.plugin_api.resolve_providers`.
+
+A value of ``0`` resolves all providers sequentially in the requesting
+thread; :attr:`~calingen.settings.CALINGEN_EVENT_PROVIDER_TIMEOUT` and
+:attr:`~calingen.settings.CALINGEN_EVENT_PROVIDER_BUDGET` are not applied
+then.
+
+See :func:`calingen.checks.check_config_value_event_provider_resolution` for
+the corresponding contribution to Django's check framework.
+"""
+
+CALINGEN_EVENT_PROVIDER_TIMEOUT = 5
+"""The time (in seconds), that a single event provider may take.
+
+**Default value:** ``5``
+
+**Accepted values**: :py:obj:`int` or :py:obj:`float` (``> 0``), ``None``
+
+Notes
+-----
+Event providers, that are resolved in the thread pool (see
+:attr:`~calingen.settings.CALINGEN_EVENT_PROVIDER_WORKERS`) and do not finish
+in time, are skipped: their events are omitted, a warning is logged and - if
+:attr:`~calingen.settings.CALINGEN_MISSING_EVENT_PROVIDER_NOTIFICATION` is
+``"messages"`` - the user is notified. ``None`` disables the timeout.
+
+The thread of a skipped provider can not be stopped and remains occupied until
+the provider returns. If all threads of the pool are occupied like this, the
+pool is replaced by a new one (see
+:attr:`~calingen.settings.CALINGEN_EVENT_PROVIDER_WORKERS`), so a provider,
+that never returns, leaks one thread.
+
+See :func:`calingen.checks.check_config_value_event_provider_resolution` for
+the corresponding contribution to Django's check framework.
+"""
+
+CALINGEN_EVENT_PROVIDER_BUDGET = 10
+"""The time (in seconds), that resolving all event providers may take.
+
+**Default value:** ``10``
+
+**Accepted values**: :py:obj:`int` or :py:obj:`float` (``> 0``), ``None``
+
+Notes
+-----
+This limits the overall latency of
+:func:`calingen.interfaces.plugin_api.resolve_providers`, while
+:attr:`~calingen.settings.CALINGEN_EVENT_PROVIDER_TIMEOUT` limits every
+single provider. Providers, that are still running when the budget is
+exhausted, are skipped just like providers, that exceed their timeout.
+``None`` disables the budget.
+
+See :func:`calingen.checks.check_config_value_event_provider_resolution` for
+the corresponding contribution to Django's check framework.
+"""
+
+CALINGEN_EVENT_PROVIDER_MATERIALIZATION = False
+"""Determines, if the materialized results of event providers are used.
+
+**Default value:** ``False``
+
+**Accepted values**: :py:obj:`bool`
+
+Notes
+-----
+If enabled, :meth:`Profile.resolve() <calingen.models.profile.Profile.resolve>`
+(and the other ``resolve*()`` methods of
+:class:`~calingen.models.profile.Profile`) retrieves the results of its event
+providers from
+:class:`~calingen.models.resolved_provider_year.ResolvedProviderYear` with one
+single query. The results are shared by all workers of a deployment, while the
+in-memory cache (see
+:attr:`~calingen.settings.CALINGEN_EVENT_PROVIDER_CACHE_SIZE`) is kept per
+worker. Providers without (current) materialized results are resolved as
+usual.
+
+The results are materialized by the management command
+``materialize_event_providers``.
+
+See :func:`calingen.checks.check_config_value_event_provider_materialization`
+for the corresponding contribution to Django's check framework.
+"""
+
+CALINGEN_INSTRUMENTATION = False
+"""Determines, if the calls of plugins are measured.
+
+**Default value:** ``False``
+
+**Accepted values**: :py:obj:`bool`
+
+Notes
+-----
+If enabled, the app collects call counts, timings, numbers of resolved entries
+and cache hit rates of event providers, events, layouts and compilers (see
+:mod:`calingen.instrumentation`). Every measured call is published by the
+signal :data:`~calingen.signals.plugin_call_finished`.
+
+The statistics are kept per process and may be dumped by the management
+command ``calingen_stats``.
+
+See :func:`calingen.checks.check_config_value_instrumentation` for the
+corresponding contribution to Django's check framework.
+"""
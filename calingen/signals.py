@@ -0,0 +1,24 @@
+# SPDX-License-Identifier: MIT
+
+"""App-specific :djangodoc:`signals <topics/signals/>`."""
+
+# Django imports
+from django.dispatch import Signal
+
+plugin_call_finished = Signal()
+"""Sent after an instrumented call of a plugin finished.
+
+The signal is only sent, if :attr:`~calingen.settings.CALINGEN_INSTRUMENTATION`
+is enabled (see :func:`calingen.instrumentation.record_call`).
+
+Arguments sent with this signal:
+
+- ``sender``: The plugin (class), e.g. an implementation of
+  :class:`~calingen.interfaces.plugin_api.EventProvider`, or
+  :class:`~calingen.models.event.Event`.
+- ``operation`` (:py:obj:`str`): The called method, e.g. ``"resolve"``.
+- ``duration`` (:py:obj:`float`): The time of the call in seconds.
+- ``entries`` (:py:obj:`int`): The number of resolved entries or ``None``.
+- ``cache_hit`` (:py:obj:`bool`): If the result was provided by a cache
+  (``True``) or computed (``False``); ``None`` for uncached calls.
+"""
@@ -17,6 +17,7 @@ from django.views.generic.base import ContextMixin, View
 # app imports
 from calingen.exceptions import CalingenException
 from calingen.forms.generation import LayoutSelectionForm
+from calingen.instrumentation import instrumented_call
 from calingen.views.generic import RequestEnabledFormView
 from calingen.views.mixins import AllCalendarEntriesMixin, RestrictToUserMixin
 
@@ -52,14 +53,20 @@ class CompilerView(
         :class:`~calingen.interfaces.plugin_api.LayoutProvider`) is set or if
         the specified compiler can not be imported. In that case a log message
         (of level warn) is emitted.
+
+        Rendering and compiling are measured, if
+        :attr:`~calingen.settings.CALINGEN_INSTRUMENTATION` is enabled (see
+        :mod:`calingen.instrumentation`).
         """
         try:
             layout = self._get_layout()
         except self.NoLayoutSelectedException:
             return redirect("calingen:layout-selection")
 
-        render_context = self._prepare_context(*args, **kwargs)
-        rendered_source = layout.render(render_context)
+        render_context = self._prepare_context(layout, *args, **kwargs)
+        rendered_source = instrumented_call(
+            layout, "render", layout.render, render_context
+        )
 
         try:
             compiler = import_string(settings.CALINGEN_COMPILER[layout.layout_type])
@@ -73,7 +80,13 @@ class CompilerView(
             )
             compiler = import_string(settings.CALINGEN_COMPILER["default"])
 
-        return compiler.get_response(rendered_source, layout_type=layout.layout_type)
+        return instrumented_call(
+            compiler,
+            "get_response",
+            compiler.get_response,
+            rendered_source,
+            layout_type=layout.layout_type,
+        )
 
     def _get_layout(self):
         """Return the :class:`~calingen.interfaces.plugin_api.LayoutProvider` implementation.
@@ -93,7 +106,7 @@ class CompilerView(
 
         return import_string(selected_layout)
 
-    def _prepare_context(self, *args, **kwargs):
+    def _prepare_context(self, layout, *args, **kwargs):
         """Prepare the context passed to the layout's rendering method.
 
         Notes
@@ -108,10 +121,18 @@ class CompilerView(
         - ``entries``: All calendar entries of the user's profile, resolved to
           the ``target_year``, provided as a
           :class:`calingen.interfaces.data_exchange.CalendarEntryList` object.
+          If the layout requires the entries of several years (see
+          :meth:`LayoutProvider.required_years() <calingen.interfaces.plugin_api.LayoutProvider.required_years>`),
+          they are provided as ``target_years`` and ``entries`` includes all
+          of them.
         """
         target_year = self.request.session.pop("target_year", date.today().year)
         layout_configuration = self.request.session.pop("layout_configuration", None)
 
+        target_years = layout.required_years(target_year)
+        if target_years != (target_year, target_year):
+            kwargs["target_years"] = target_years
+
         return self.get_context_data(
             target_year=target_year, layout_configuration=layout_configuration, **kwargs
         )
@@ -2,11 +2,18 @@
 
 """App-specific mixins to be used with class-based views."""
 
+# Python imports
+from datetime import date
+from functools import partial
+
 # Django imports
+from django.conf import settings
+from django.contrib import messages
 from django.core.exceptions import ImproperlyConfigured
 
 # app imports
-from calingen.interfaces.data_exchange import CalendarEntryList
+from calingen.interfaces.data_exchange import CalendarEntryList, CalendarEntryStream
+from calingen.interfaces.plugin_api import ResolutionReport, fully_qualified_classname
 from calingen.models.event import Event
 from calingen.models.profile import Profile
 
@@ -77,29 +84,146 @@ class AllCalendarEntriesMixin:
 
     This mixin uses ``get_context_data()`` to provide all of the user's
     :class:`~calingen.interfaces.data_exchange.CalendarEntry` instances for
-    the context.
+    the context. They are provided as
+    :class:`~calingen.interfaces.data_exchange.CalendarEntryList` in
+    ``context["entries"]``.
+
+    If the view sets ``stream_entries`` to ``True``, the entries are provided
+    as :class:`~calingen.interfaces.data_exchange.CalendarEntryStream`
+    instead. The user's events and the entries of every active event provider
+    are then retrieved as separate sources and merged lazily while the stream
+    is iterated (see
+    :meth:`Profile.iter_entries() <calingen.models.profile.Profile.iter_entries>`).
+    This is sufficient, if the entries are just iterated once, e.g. by a
+    template.
+
+    By default, the entries of ``context["target_year"]`` are provided. If the
+    context provides ``target_window`` as a tuple of two
+    :py:obj:`datetime.date`, only the entries between these days (inclusive)
+    are resolved instead, which may span several years (see
+    :meth:`Profile.resolve_window() <calingen.models.profile.Profile.resolve_window>`).
+    If the context provides ``target_years`` as a tuple of the first and the
+    last year, the entries of all these years are resolved at once (see
+    :meth:`Profile.resolve_range() <calingen.models.profile.Profile.resolve_range>`).
+
+    Event providers, that do not finish in time (see
+    :attr:`~calingen.settings.CALINGEN_EVENT_PROVIDER_TIMEOUT`) or fail, are
+    omitted.
+    This is dependent on the setting
+    :attr:`~calingen.settings.CALINGEN_MISSING_EVENT_PROVIDER_NOTIFICATION`,
+    the user is informed about them using Django's ``messages`` framework.
+    If the entries of ``context["target_year"]`` are streamed, the providers
+    are only known after the stream was iterated, i.e. while rendering the
+    response, so the messages are shown with the next response.
     """
 
+    stream_entries = False
+
     def get_context_data(self, **kwargs):  # noqa: D102
         context = super().get_context_data(**kwargs)
 
         # get the user's profile (required to process plugins)
         profile = Profile.calingen_manager.get_profile(self.request.user)
 
-        all_entries = CalendarEntryList()
-        internal_events = Event.calingen_manager.get_calendar_entry_list(
-            user=self.request.user, year=context["target_year"]
-        )
-        plugin_events = profile.resolve(year=context["target_year"])
-        all_entries.merge(internal_events)
-        all_entries.merge(plugin_events)
-        entries = all_entries.sorted()
-
-        context["entries"] = entries
-
         # Usually, CalingenUserProfileIDMixin provides the (required)
         # profile_id, but as this view fetches the Profile anyway, it will be
         # added manually
         context["profile_id"] = profile.id
 
+        user = self.request.user
+        report = ResolutionReport()
+        target_window = context.get("target_window", None)
+        if target_window is not None:
+            start, end = target_window
+            events = partial(
+                Event.calingen_manager.get_calendar_entry_list_window,
+                user=user,
+                start=start,
+                end=end,
+            )
+            provider_entries = profile.resolve_window(start, end, report=report)
+        elif context.get("target_years", None) is not None:
+            first_year, last_year = context["target_years"]
+            events = partial(
+                Event.calingen_manager.get_calendar_entry_list_window,
+                user=user,
+                start=date(first_year, 1, 1),
+                end=date(last_year, 12, 31),
+            )
+            provider_entries = CalendarEntryList()
+            for entries in profile.resolve_range(
+                first_year, last_year, report=report
+            ).values():
+                provider_entries.merge(entries)
+        elif self.stream_entries:
+            events = partial(
+                Event.calingen_manager.iter_calendar_entries,
+                user=user,
+                year=context["target_year"],
+            )
+            provider_entries = None
+        else:
+            events = partial(
+                Event.calingen_manager.get_calendar_entry_list,
+                user=user,
+                year=context["target_year"],
+            )
+            provider_entries = profile.resolve(context["target_year"], report=report)
+
+        if provider_entries is None:
+            # every provider is a separate source of the stream, they are
+            # resolved while the stream is iterated
+            all_entries = CalendarEntryStream(
+                events,
+                partial(
+                    self._stream_provider_entries,
+                    profile,
+                    context["target_year"],
+                    report,
+                ),
+            )
+        elif self.stream_entries:
+            # only the user's events are retrieved lazily, the providers are
+            # already resolved
+            self._notify_missing_providers(report)
+            all_entries = CalendarEntryStream(events, partial(iter, provider_entries))
+        else:
+            self._notify_missing_providers(report)
+            all_entries = CalendarEntryList()
+            all_entries.merge(events())
+            all_entries.merge(provider_entries)
+
+        # The CalendarEntryList (or CalendarEntryStream) is passed on as it is:
+        # it is iterable in sorted order and layouts may use the query methods
+        # of CalendarEntryList, just like indexing and len() of a list. Only
+        # views with ``stream_entries`` set receive a CalendarEntryStream.
+        context["entries"] = all_entries
+
         return context
+
+    def _stream_provider_entries(self, profile, year, report):
+        """Yield the entries of the profile's providers and notify the user afterwards."""
+        yield from profile.iter_entries(year, report=report)
+        self._notify_missing_providers(report)
+
+    def _notify_missing_providers(self, report):
+        """Inform the user about the providers, that were omitted from ``report``."""
+        if settings.CALINGEN_MISSING_EVENT_PROVIDER_NOTIFICATION != "messages":
+            return
+
+        for provider in report.timed_out:
+            messages.warning(
+                self.request,
+                "The following plugin did not respond in time: {}".format(
+                    fully_qualified_classname(provider)
+                ),
+                fail_silently=True,
+            )
+        for provider in report.failed:
+            messages.warning(
+                self.request,
+                "The following plugin failed: {}".format(
+                    fully_qualified_classname(provider)
+                ),
+                fail_silently=True,
+            )
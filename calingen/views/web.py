@@ -36,3 +36,4 @@ class CalendarEntryListView(
     """
 
     template_name = "calingen/calendar_entry_list_year.html"
+    stream_entries = True
@@ -0,0 +1,57 @@
+# SPDX-License-Identifier: MIT
+
+"""Provide tests for calingen.contrib.layouts.year_by_week.year_by_week."""
+
+# Python imports
+from datetime import date
+from unittest import mock, skip  # noqa: F401
+
+# Django imports
+from django.test import override_settings, tag  # noqa: F401
+
+# app imports
+from calingen.constants import EventCategory
+from calingen.contrib.layouts.year_by_week.year_by_week import YearByWeek
+from calingen.interfaces.data_exchange import CalendarEntry, CalendarEntryList
+
+# local imports
+from ...util.testcases import CalingenTestCase
+
+
+@tag("contrib", "layout", "year_by_week")
+class YearByWeekTest(CalingenTestCase):
+    def test_required_years(self):
+        # Arrange (set up test environment)
+
+        # Act (actually perform what has to be done)
+
+        # Assert (verify the results)
+        # 2022-01-01 is a Saturday, 2022-12-31 is a Saturday
+        self.assertEqual(YearByWeek.required_years(2022), (2021, 2023))
+        # 2024-01-01 is a Monday, 2024-12-31 is a Tuesday
+        self.assertEqual(YearByWeek.required_years(2024), (2024, 2025))
+        # 2017-01-01 is a Sunday, 2017-12-31 is a Sunday
+        self.assertEqual(YearByWeek.required_years(2017), (2016, 2017))
+
+    def test_prepare_context_uses_entries_of_adjacent_years(self):
+        # Arrange (set up test environment)
+        entries = CalendarEntryList()
+        for day in (date(2021, 12, 31), date(2022, 12, 31)):
+            entries.add(
+                CalendarEntry(
+                    "New Year's Eve {}".format(day.year),
+                    EventCategory.HOLIDAY,
+                    day,
+                    ("foo",),
+                )
+            )
+
+        # Act (actually perform what has to be done)
+        context = YearByWeek.prepare_context({"target_year": 2022, "entries": entries})
+
+        # Assert (verify the results)
+        first_week = context["weeklist"][0]
+        self.assertEqual(first_week.days[0].date, date(2021, 12, 27))
+        self.assertEqual(first_week.days[4].holidays, ["New Year's Eve 2021"])
+        last_week = context["weeklist"][-1]
+        self.assertEqual(last_week.days[5].holidays, ["New Year's Eve 2022"])
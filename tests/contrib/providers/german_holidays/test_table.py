@@ -0,0 +1,142 @@
+# SPDX-License-Identifier: MIT
+
+"""Provide tests for calingen.contrib.providers.german_holidays.table."""
+
+# Python imports
+import datetime
+import os
+import tempfile
+from unittest import mock, skip  # noqa: F401
+
+# Django imports
+from django.core.management import call_command
+from django.test import override_settings, tag  # noqa: F401
+
+# app imports
+from calingen.contrib.providers.german_holidays.management.commands.build_german_holiday_table import (
+    Command,
+)
+from calingen.contrib.providers.german_holidays.table import (
+    FIRST_YEAR,
+    LAST_YEAR,
+    TABLE_PATH,
+    HolidayTableException,
+    TableEvaluator,
+    build_table,
+    holiday_rules,
+    load_table,
+    register_table,
+)
+from calingen.interfaces.recurrence import get_evaluator
+
+# local imports
+from ....util.testcases import CalingenTestCase
+
+
+@tag("contrib", "german_holidays", "recurrence")
+class HolidayTableTest(CalingenTestCase):
+    def test_shipped_table_matches_rules(self):
+        # Arrange (set up test environment)
+        rules = holiday_rules()
+        after = datetime.datetime(FIRST_YEAR, 1, 1)
+        before = datetime.datetime(LAST_YEAR, 12, 31, 23, 59, 59)
+
+        # Act (actually perform what has to be done)
+        evaluators = load_table(TABLE_PATH)
+
+        # Assert (verify the results)
+        self.assertEqual(set(evaluators), set(rules))
+        for name, rule in rules.items():
+            with self.subTest(holiday=name):
+                self.assertEqual(
+                    [
+                        x
+                        for year in range(FIRST_YEAR, LAST_YEAR + 1)
+                        for x in evaluators[name].occurences(year)
+                    ],
+                    rule.between(after, before, inc=True),
+                )
+
+    def test_shipped_table_is_up_to_date(self):
+        # Arrange (set up test environment)
+        with open(TABLE_PATH, "rb") as file_handle:
+            shipped = file_handle.read()
+
+        # Act (actually perform what has to be done)
+        result = build_table()
+
+        # Assert (verify the results)
+        self.assertEqual(result, shipped)
+
+    def test_years_outside_of_table(self):
+        # Arrange (set up test environment)
+        rule = holiday_rules()["OSTER_MONTAG"]
+        evaluator = load_table(TABLE_PATH)["OSTER_MONTAG"]
+
+        # Act (actually perform what has to be done)
+        result = evaluator.between(
+            datetime.datetime(LAST_YEAR, 1, 1), datetime.datetime(LAST_YEAR + 5, 12, 31)
+        )
+
+        # Assert (verify the results)
+        self.assertEqual(
+            result,
+            rule.between(
+                datetime.datetime(LAST_YEAR, 1, 1),
+                datetime.datetime(LAST_YEAR + 5, 12, 31),
+                inc=True,
+            ),
+        )
+        self.assertEqual(len(result), 6)
+
+    def test_register_table(self):
+        # Arrange (set up test environment)
+        rules = holiday_rules()
+
+        # Act (actually perform what has to be done)
+        register_table()
+
+        # Assert (verify the results)
+        for rule in rules.values():
+            self.assertIsInstance(get_evaluator(rule), TableEvaluator)
+
+    def test_invalid_file(self):
+        # Arrange (set up test environment)
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "holidays.bin")
+            for content in (b"", b"XXXX" + build_table(2000, 2001)[4:]):
+                with open(path, "wb") as file_handle:
+                    file_handle.write(content)
+
+                # Act (actually perform what has to be done)
+                # Assert (verify the results)
+                with self.assertRaises(HolidayTableException):
+                    load_table(path)
+
+    def test_command_writes_table(self):
+        # Arrange (set up test environment)
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "holidays.bin")
+
+            # Act (actually perform what has to be done)
+            call_command(
+                Command(),
+                first_year=2000,
+                last_year=2010,
+                output=path,
+                stdout=mock.MagicMock(),
+            )
+
+            # Assert (verify the results)
+            evaluators = load_table(path)
+        self.assertEqual(
+            evaluators["ERSTER_WEIHNACHTSTAG"].occurences(2005),
+            [datetime.datetime(2005, 12, 25)],
+        )
+        # the evaluators identify the content of their table
+        shipped_version = load_table(TABLE_PATH)["ERSTER_WEIHNACHTSTAG"].version
+        self.assertEqual(
+            {x.version for x in evaluators.values()},
+            {evaluators["ERSTER_WEIHNACHTSTAG"].version},
+        )
+        self.assertNotEqual(evaluators["ERSTER_WEIHNACHTSTAG"].version, shipped_version)
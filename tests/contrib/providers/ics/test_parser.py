@@ -0,0 +1,217 @@
+# SPDX-License-Identifier: MIT
+
+"""Provide tests for calingen.contrib.providers.ics.parser."""
+
+# Python imports
+import datetime
+import os
+import tempfile
+from unittest import mock, skip  # noqa: F401
+
+# Django imports
+from django.test import override_settings, tag  # noqa: F401
+
+# external imports
+from dateutil import tz
+from dateutil.rrule import DAILY, MONTHLY, WEEKLY, rrule
+
+# app imports
+from calingen.contrib.providers.ics.parser import (
+    ICSParserException,
+    VEvent,
+    fast_forward,
+    iter_events,
+    occurences,
+    parse_content_line,
+    parse_timestamp,
+)
+
+# local imports
+from ....util.testcases import CalingenTestCase
+
+ICS_DOCUMENT = """BEGIN:VCALENDAR\r
+VERSION:2.0\r
+BEGIN:VEVENT\r
+UID:1\r
+SUMMARY:Company\\, Day with a title, that is folded into several \r
+ lines\r
+DTSTART;VALUE=DATE:20100301\r
+RRULE:FREQ=YEARLY\r
+BEGIN:VALARM\r
+SUMMARY:Reminder\r
+END:VALARM\r
+END:VEVENT\r
+BEGIN:VTODO\r
+SUMMARY:Not an event\r
+DTSTART:20220101\r
+END:VTODO\r
+BEGIN:VEVENT\r
+UID:2\r
+SUMMARY:Without start\r
+END:VEVENT\r
+END:VCALENDAR\r
+"""
+
+
+@tag("contrib", "ics")
+class ParserTest(CalingenTestCase):
+    def test_iter_events(self):
+        # Arrange (set up test environment)
+        with tempfile.NamedTemporaryFile("w", suffix=".ics", delete=False) as f:
+            f.write(ICS_DOCUMENT)
+        self.addCleanup(os.remove, f.name)
+
+        # Act (actually perform what has to be done)
+        events = list(iter_events(f.name))
+
+        # Assert (verify the results)
+        self.assertEqual(len(events), 1)
+        self.assertEqual(events[0].uid, "1")
+        self.assertEqual(
+            events[0].summary,
+            "Company, Day with a title, that is folded into several lines",
+        )
+        self.assertEqual(events[0].dtstart, datetime.datetime(2010, 3, 1))
+        self.assertEqual(events[0].rrule, "FREQ=YEARLY")
+
+    @mock.patch("calingen.contrib.providers.ics.parser.logger")
+    def test_iter_events_skips_malformed_events(self, mock_logger):
+        # Arrange (set up test environment)
+        document = ICS_DOCUMENT.replace(
+            "BEGIN:VTODO",
+            "BEGIN:VEVENT\r\nUID:3\r\nDTSTART:2022-01-05\r\n"
+            "SUMMARY:Malformed\r\nEND:VEVENT\r\nBEGIN:VTODO",
+        )
+        with tempfile.NamedTemporaryFile("w", suffix=".ics", delete=False) as f:
+            f.write(document)
+        self.addCleanup(os.remove, f.name)
+
+        # Act (actually perform what has to be done)
+        events = list(iter_events(f.name))
+
+        # Assert (verify the results)
+        self.assertEqual([x.uid for x in events], ["1"])
+        mock_logger.warning.assert_called_once()
+
+    def test_parse_content_line(self):
+        # Arrange (set up test environment)
+        lines = (
+            ("SUMMARY:foo:bar", ("SUMMARY", {}, "foo:bar")),
+            (
+                "dtstart;tzid=Europe/Berlin:20221224T180000",
+                ("DTSTART", {"TZID": "Europe/Berlin"}, "20221224T180000"),
+            ),
+            (
+                'ATTENDEE;CN="Doe: John":mailto:john@example.com',
+                ("ATTENDEE", {"CN": "Doe: John"}, "mailto:john@example.com"),
+            ),
+        )
+
+        for line, expected in lines:
+            with self.subTest(line=line):
+                # Act (actually perform what has to be done)
+                return_value = parse_content_line(line)
+
+                # Assert (verify the results)
+                self.assertEqual(return_value, expected)
+
+        with self.assertRaises(ICSParserException):
+            parse_content_line('X-FOO;BAR="baz:')
+
+    def test_parse_timestamp(self):
+        # Arrange (set up test environment)
+        berlin = tz.gettz("Europe/Berlin")
+        values = (
+            ("20221224", {}, datetime.datetime(2022, 12, 24)),
+            ("20221224T180000", {}, datetime.datetime(2022, 12, 24, 18)),
+            (
+                "20221224T170000Z",
+                {},
+                datetime.datetime(2022, 12, 24, 17, tzinfo=tz.UTC),
+            ),
+            (
+                "20221224T180000",
+                {"TZID": "Europe/Berlin"},
+                datetime.datetime(2022, 12, 24, 18, tzinfo=berlin),
+            ),
+            (
+                "20221224T180000",
+                {"TZID": "Unknown"},
+                datetime.datetime(2022, 12, 24, 18),
+            ),
+        )
+
+        for value, params, expected in values:
+            with self.subTest(value=value, params=params):
+                # Act (actually perform what has to be done)
+                return_value = parse_timestamp(value, params)
+
+                # Assert (verify the results)
+                self.assertEqual(return_value, expected)
+                self.assertEqual(return_value.tzinfo, expected.tzinfo)
+
+        with self.assertRaises(ValueError):
+            parse_timestamp("2022-12-24", {})
+
+    def test_fast_forward_keeps_occurences(self):
+        # Arrange (set up test environment)
+        dtstart = datetime.datetime(2001, 1, 31, 10)
+        after = datetime.datetime(2022, 1, 1)
+        before = datetime.datetime(2022, 12, 31, 23, 59, 59)
+        rules = (
+            rrule(freq=DAILY, dtstart=dtstart, interval=3),
+            rrule(freq=WEEKLY, dtstart=dtstart, interval=2, byweekday=(0, 3)),
+            rrule(freq=MONTHLY, dtstart=dtstart, interval=5, bymonthday=(1, 31)),
+            rrule(freq=MONTHLY, dtstart=dtstart, byweekday=(0, 1)),
+            rrule(freq=MONTHLY, dtstart=dtstart),
+            rrule(freq=DAILY, dtstart=dtstart, count=10000),
+        )
+
+        for rule in rules:
+            with self.subTest(rule=str(rule)):
+                # Act (actually perform what has to be done)
+                return_value = fast_forward(rule, after)
+
+                # Assert (verify the results)
+                self.assertEqual(
+                    return_value.between(after, before, inc=True),
+                    rule.between(after, before, inc=True),
+                )
+
+    def test_fast_forward_moves_start(self):
+        # Arrange (set up test environment)
+        rule = rrule(freq=WEEKLY, dtstart=datetime.datetime(1990, 1, 1), interval=2)
+
+        # Act (actually perform what has to be done)
+        return_value = fast_forward(rule, datetime.datetime(2022, 1, 1))
+
+        # Assert (verify the results)
+        self.assertEqual(return_value._dtstart, datetime.datetime(2021, 12, 20))
+
+    def test_occurences(self):
+        # Arrange (set up test environment)
+        berlin = tz.gettz("Europe/Berlin")
+        event = VEvent()
+        event.dtstart = datetime.datetime(2020, 1, 6, 10, tzinfo=berlin)
+        event.rrule = "FREQ=WEEKLY;INTERVAL=26;UNTIL=20221231"
+        event.exdates = [datetime.datetime(2022, 1, 3, 10, tzinfo=berlin)]
+        event.rdates = [
+            datetime.datetime(2022, 5, 1, 10, tzinfo=berlin),
+            datetime.datetime(2023, 5, 1, 10, tzinfo=berlin),
+        ]
+
+        # Act (actually perform what has to be done)
+        return_value = occurences(
+            event,
+            datetime.datetime(2022, 1, 1),
+            datetime.datetime(2022, 12, 31, 23, 59, 59),
+        )
+
+        # Assert (verify the results)
+        self.assertEqual(
+            return_value,
+            [
+                datetime.datetime(2022, 5, 1, 10, tzinfo=berlin),
+                datetime.datetime(2022, 7, 4, 10, tzinfo=berlin),
+            ],
+        )
@@ -0,0 +1,212 @@
+# SPDX-License-Identifier: MIT
+
+"""Provide tests for calingen.contrib.providers.ics.provider."""
+
+# Python imports
+import datetime
+import os
+import tempfile
+from unittest import mock, skip  # noqa: F401
+
+# Django imports
+from django.test import override_settings, tag  # noqa: F401
+
+# app imports
+from calingen.contrib.providers.ics.parser import iter_events
+from calingen.contrib.providers.ics.provider import ICSFileProvider
+from calingen.interfaces.plugin_api import EventProvider, fully_qualified_classname
+
+# local imports
+from ....util.testcases import CalingenTestCase
+
+ICS_DOCUMENT = """BEGIN:VCALENDAR
+VERSION:2.0
+BEGIN:VEVENT
+UID:1
+SUMMARY:Company Day
+DTSTART;VALUE=DATE:20100301
+RRULE:FREQ=YEARLY
+END:VEVENT
+BEGIN:VEVENT
+UID:2
+RECURRENCE-ID;TZID=Europe/Berlin:20220117T100000
+SUMMARY:Moved meeting
+DTSTART;TZID=Europe/Berlin:20220118T100000
+END:VEVENT
+BEGIN:VEVENT
+UID:2
+SUMMARY:Meeting
+DTSTART;TZID=Europe/Berlin:20220103T100000
+RRULE:FREQ=WEEKLY;INTERVAL=2;UNTIL=20220131T235959Z
+END:VEVENT
+BEGIN:VEVENT
+UID:3
+SUMMARY:Cancelled
+DTSTART:20220501T080000Z
+STATUS:CANCELLED
+END:VEVENT
+BEGIN:VEVENT
+UID:4
+SUMMARY:Malformed
+DTSTART:20220501
+RRULE:FREQ=SOMETIMES
+END:VEVENT
+END:VCALENDAR
+"""
+
+
+@tag("contrib", "ics")
+class ICSFileProviderTest(CalingenTestCase):
+    def setUp(self):
+        tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp_dir.cleanup)
+        self.path = os.path.join(tmp_dir.name, "calendar.ics")
+        with open(self.path, "w") as f:
+            f.write(ICS_DOCUMENT)
+
+        class ICSFileProviderTestImplementation(ICSFileProvider):
+            title = "company"
+            path = self.path
+            cache_dir = os.path.join(tmp_dir.name, "cache")
+
+        self.provider = ICSFileProviderTestImplementation
+
+    def test_abstract_provider_is_not_registered(self):
+        # Arrange (set up test environment)
+
+        # Act (actually perform what has to be done)
+
+        # Assert (verify the results)
+        self.assertFalse(
+            EventProvider.is_available(fully_qualified_classname(ICSFileProvider))
+        )
+        self.assertTrue(
+            EventProvider.is_available(fully_qualified_classname(self.provider))
+        )
+
+    @mock.patch("calingen.contrib.providers.ics.provider.logger")
+    def test_resolve(self, mock_logger):
+        # Arrange (set up test environment)
+
+        # Act (actually perform what has to be done)
+        result = self.provider.resolve(2022)
+
+        # Assert (verify the results)
+        self.assertEqual(
+            [(x.title, x.timestamp) for x in result],
+            [
+                ("Meeting", datetime.datetime(2022, 1, 3, 10)),
+                ("Moved meeting", datetime.datetime(2022, 1, 18, 10)),
+                ("Meeting", datetime.datetime(2022, 1, 31, 10)),
+                ("Company Day", datetime.datetime(2022, 3, 1)),
+            ],
+        )
+        self.assertEqual(result.sorted()[0].source, ("EXTERNAL", "company"))
+        mock_logger.warning.assert_called_once()
+
+    def test_resolve_range_parses_once(self):
+        # Arrange (set up test environment)
+
+        # Act (actually perform what has to be done)
+        with mock.patch(
+            "calingen.contrib.providers.ics.provider.iter_events",
+            wraps=iter_events,
+        ) as mock_iter_events:
+            result = self.provider.resolve_range(2021, 2022)
+
+        # Assert (verify the results)
+        mock_iter_events.assert_called_once_with(self.path)
+        self.assertEqual(list(result), [2021, 2022])
+        self.assertEqual(
+            [x.timestamp for x in result[2021]], [datetime.datetime(2021, 3, 1)]
+        )
+        self.assertEqual(len(result[2022]), 4)
+
+    def test_results_are_cached_on_disk(self):
+        # Arrange (set up test environment)
+        expected = [(x.title, x.timestamp) for x in self.provider.resolve(2022)]
+
+        # Act (actually perform what has to be done)
+        with mock.patch(
+            "calingen.contrib.providers.ics.provider.iter_events"
+        ) as mock_iter_events:
+            result = self.provider.resolve(2022)
+
+        # Assert (verify the results)
+        mock_iter_events.assert_not_called()
+        self.assertEqual([(x.title, x.timestamp) for x in result], expected)
+        self.assertEqual(len(os.listdir(self.provider.cache_dir)), 1)
+
+    def test_modified_file_is_parsed_again(self):
+        # Arrange (set up test environment)
+        self.provider.resolve(2022)
+        with open(self.path, "w") as f:
+            f.write(ICS_DOCUMENT.replace("Company Day", "Other Day"))
+
+        # Act (actually perform what has to be done)
+        result = self.provider.resolve(2022)
+
+        # Assert (verify the results)
+        self.assertIn("Other Day", [x.title for x in result])
+        # outdated results are removed
+        self.assertEqual(len(os.listdir(self.provider.cache_dir)), 1)
+
+    @mock.patch("calingen.contrib.providers.ics.provider.logger")
+    def test_corrupt_cache_is_ignored(self, mock_logger):
+        # Arrange (set up test environment)
+        self.provider.resolve(2022)
+        for name in os.listdir(self.provider.cache_dir):
+            with open(os.path.join(self.provider.cache_dir, name), "wb") as f:
+                f.write(b"foo")
+        mock_logger.reset_mock()
+
+        # Act (actually perform what has to be done)
+        result = self.provider.resolve(2022)
+
+        # Assert (verify the results)
+        self.assertEqual(len(result), 4)
+        self.assertTrue(mock_logger.warning.called)
+
+    @mock.patch("calingen.contrib.providers.ics.provider.logger")
+    def test_missing_file_provides_no_entries(self, mock_logger):
+        # Arrange (set up test environment)
+        os.remove(self.path)
+
+        # Act (actually perform what has to be done)
+        result = self.provider.resolve_range(2021, 2022)
+
+        # Assert (verify the results)
+        self.assertEqual(list(result), [2021, 2022])
+        self.assertEqual(len(result[2021]), 0)
+        self.assertEqual(len(result[2022]), 0)
+        mock_logger.warning.assert_called_once()
+
+    @mock.patch("calingen.contrib.providers.ics.provider.logger")
+    def test_unreadable_file_provides_no_entries(self, mock_logger):
+        # Arrange (set up test environment)
+
+        # Act (actually perform what has to be done)
+        with mock.patch(
+            "calingen.contrib.providers.ics.provider.iter_events",
+            side_effect=PermissionError("denied"),
+        ):
+            result = self.provider.resolve(2022)
+
+        # Assert (verify the results)
+        self.assertEqual(len(result), 0)
+        mock_logger.warning.assert_called_once()
+        # the empty result is not cached
+        self.assertFalse(os.path.exists(self.provider.cache_dir))
+
+    def test_no_cache_without_cache_dir(self):
+        # Arrange (set up test environment)
+        class UncachedProvider(self.provider):
+            cache_dir = None
+
+        # Act (actually perform what has to be done)
+        with mock.patch("tempfile.mkstemp") as mock_mkstemp:
+            result = UncachedProvider.resolve(2022)
+
+        # Assert (verify the results)
+        self.assertEqual(len(result), 4)
+        mock_mkstemp.assert_not_called()
@@ -0,0 +1,73 @@
+# SPDX-License-Identifier: MIT
+
+"""Verify the plugin manifests of the contributed apps."""
+
+# Python imports
+from unittest import mock, skip  # noqa: F401
+
+# Django imports
+from django.test import override_settings, tag  # noqa: F401
+from django.utils.module_loading import import_string
+
+# app imports
+from calingen.contrib.layouts.lineatur.apps import CalingenLayoutLineaturConfig
+from calingen.contrib.layouts.simple_event_list.apps import (
+    CalingenLayoutSimpleEventListConfig,
+)
+from calingen.contrib.layouts.year_by_week.apps import CalingenLayoutYearByWeekConfig
+from calingen.contrib.providers.german_holidays.apps import (
+    CalingenProviderGermanHolidays,
+)
+from calingen.interfaces.plugin_api import (
+    EventProvider,
+    LayoutProvider,
+    fully_qualified_classname,
+)
+
+# local imports
+from ..util.testcases import CalingenTestCase
+
+APP_CONFIGS = (
+    CalingenLayoutLineaturConfig,
+    CalingenLayoutSimpleEventListConfig,
+    CalingenLayoutYearByWeekConfig,
+    CalingenProviderGermanHolidays,
+)
+
+MOUNT_POINTS = {"EventProvider": EventProvider, "LayoutProvider": LayoutProvider}
+
+
+@tag("contrib", "plugin", "manifest")
+class ManifestTest(CalingenTestCase):
+    def test_manifests_match_plugins(self):
+        for app_config in APP_CONFIGS:
+            for mount_point_name, plugins in app_config.calingen_plugins.items():
+                for name, attributes in plugins.items():
+                    with self.subTest(plugin=name):
+                        # Arrange (set up test environment)
+                        mount_point = MOUNT_POINTS[mount_point_name]
+
+                        # Act (actually perform what has to be done)
+                        plugin = import_string(name)
+
+                        # Assert (verify the results)
+                        self.assertTrue(issubclass(plugin, mount_point))
+                        self.assertEqual(fully_qualified_classname(plugin), name)
+                        for attribute, value in attributes.items():
+                            self.assertEqual(getattr(plugin, attribute), value)
+
+    def test_manifests_are_complete(self):
+        # Arrange (set up test environment)
+        provider_module = "calingen.contrib.providers.german_holidays.provider"
+        import_string(provider_module + ".GermanyFederal")
+        declared = set(CalingenProviderGermanHolidays.calingen_plugins["EventProvider"])
+
+        # Act (actually perform what has to be done)
+        plugins = {
+            fully_qualified_classname(plugin)
+            for plugin in EventProvider.plugins
+            if plugin.__module__ == provider_module
+        }
+
+        # Assert (verify the results)
+        self.assertEqual(plugins, declared)
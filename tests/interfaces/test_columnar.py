@@ -0,0 +1,263 @@
+# SPDX-License-Identifier: MIT
+
+"""Provide tests for calingen.interfaces.columnar."""
+
+# Python imports
+import datetime
+import json
+import os
+import struct
+import tempfile
+from unittest import mock, skip  # noqa: F401
+
+# Django imports
+from django.test import override_settings, tag  # noqa: F401
+from django.utils.functional import Promise, lazy
+from django.utils.translation import gettext_lazy
+
+# app imports
+from calingen.constants import EventCategory
+from calingen.interfaces.columnar import (
+    ColumnarFormatException,
+    dump_entries,
+    int_to_timestamp,
+    load_entries,
+    load_file,
+    timestamp_to_int,
+)
+from calingen.interfaces.data_exchange import CalendarEntry, CalendarEntryList
+
+# local imports
+from ..util.testcases import CalingenTestCase
+
+
+def _entry(title, timestamp, category=EventCategory.HOLIDAY, source=("foo", "bar")):
+    return CalendarEntry(title, category, timestamp, source)
+
+
+@tag("interfaces", "data", "columnar")
+class TimestampConversionTest(CalingenTestCase):
+    def test_naive_roundtrip(self):
+        # Arrange (set up test environment)
+        timestamp = datetime.datetime(2021, 12, 2, 14, 48, 3, 17)
+
+        # Act (actually perform what has to be done)
+        result = int_to_timestamp(timestamp_to_int(timestamp))
+
+        # Assert (verify the results)
+        self.assertEqual(result, timestamp)
+        self.assertIsNone(result.tzinfo)
+
+    def test_aware_roundtrip(self):
+        # Arrange (set up test environment)
+        tzinfo = datetime.timezone(datetime.timedelta(hours=2))
+        timestamp = datetime.datetime(2021, 12, 2, 14, 48, tzinfo=tzinfo)
+
+        # Act (actually perform what has to be done)
+        result = int_to_timestamp(timestamp_to_int(timestamp), tzinfo)
+
+        # Assert (verify the results)
+        self.assertEqual(result, timestamp)
+        self.assertEqual(result.utcoffset(), timestamp.utcoffset())
+
+
+@tag("interfaces", "data", "columnar", "serialization")
+class ColumnarSerializationTest(CalingenTestCase):
+    def test_roundtrip(self):
+        # Arrange (set up test environment)
+        tzinfo = datetime.timezone(datetime.timedelta(hours=2))
+        entries = [
+            _entry("a", datetime.datetime(2022, 1, 1, 12, tzinfo=tzinfo)),
+            _entry(
+                "b",
+                datetime.datetime(2022, 1, 1, tzinfo=datetime.timezone.utc),
+                "foo",
+                ("INTERNAL", 42, None, ("nested", 1.5)),
+            ),
+            _entry("c", datetime.datetime(2022, 2, 1, tzinfo=datetime.timezone.utc)),
+        ]
+
+        # Act (actually perform what has to be done)
+        result = load_entries(dump_entries(entries))
+
+        # Assert (verify the results)
+        self.assertEqual(result, entries)
+        for loaded, original in zip(result, entries):
+            self.assertEqual(loaded.source, original.source)
+            self.assertEqual(
+                loaded.timestamp.utcoffset(), original.timestamp.utcoffset()
+            )
+        self.assertIs(result[0].category, EventCategory.HOLIDAY)
+
+    def test_calendar_entry_list_roundtrip(self):
+        # Arrange (set up test environment)
+        entry_list = CalendarEntryList.from_records(
+            [
+                ("b", EventCategory.HOLIDAY, "2022-01-02", ("foo",)),
+                ("a", EventCategory.HOLIDAY, "2022-01-01", ("foo",)),
+                ("b", EventCategory.HOLIDAY, "2022-01-02", ("bar",)),
+            ]
+        )
+
+        # Act (actually perform what has to be done)
+        result = CalendarEntryList.from_bytes(entry_list.to_bytes())
+
+        # Assert (verify the results)
+        self.assertEqual(result.sorted(), entry_list.sorted())
+        self.assertEqual([x.title for x in result], ["a", "b"])
+
+    def test_lossy_roundtrip(self):
+        """Lazy values and callables are restored by their value at serialization."""
+        # Arrange (set up test environment)
+        # a lazy value, that depends on the active language
+        language = {"current": "de"}
+        translated = lazy(lambda: {"de": "Feiertag"}.get(language["current"]), str)
+        entries = [
+            CalendarEntry(
+                "Holiday",
+                EventCategory.HOLIDAY,
+                datetime.date(2022, 1, 1),
+                ("INTERNAL", lambda: "/event/1/", translated()),
+                display_title=translated(),
+            ),
+            _entry("plain", datetime.date(2022, 1, 2)),
+        ]
+
+        # Act (actually perform what has to be done)
+        buffer = dump_entries(entries)
+        language["current"] = "en"
+        result = load_entries(buffer)
+
+        # Assert (verify the results)
+        self.assertEqual(result, entries)
+        source = result[0].source
+        self.assertEqual(source[0], "INTERNAL")
+        # callables are restored as callables, returning their original result
+        self.assertTrue(callable(source[1]))
+        self.assertEqual(source[1](), "/event/1/")
+        # lazy translations are restored as lazy strings of their text in the
+        # language, that was active while serializing
+        for value in (source[2], result[0].display_title):
+            self.assertIsInstance(value, Promise)
+            self.assertEqual(str(value), "Feiertag")
+        # entries without display_title fall back to the title
+        self.assertEqual(result[1].display_title, "plain")
+        self.assertIsNone(result[1]._display_title)
+
+    def test_display_titles_are_kept_apart_from_titles(self):
+        # Arrange (set up test environment)
+        entries = [
+            CalendarEntry(
+                "a", "foo", datetime.date(2022, 1, 1), ("foo",), display_title="b"
+            ),
+            CalendarEntry("b", "foo", datetime.date(2022, 1, 2), ("foo",)),
+            CalendarEntry(
+                "c",
+                "foo",
+                datetime.date(2022, 1, 3),
+                ("foo",),
+                display_title=gettext_lazy("a"),
+            ),
+        ]
+
+        # Act (actually perform what has to be done)
+        result = load_entries(dump_entries(entries))
+
+        # Assert (verify the results)
+        self.assertEqual([x.display_title for x in result], ["b", "b", "a"])
+        self.assertNotIsInstance(result[0].display_title, Promise)
+        self.assertIsInstance(result[2].display_title, Promise)
+
+    def test_version_1(self):
+        """Buffers without display titles are still decoded."""
+        # Arrange (set up test environment)
+        tables = json.dumps(
+            {
+                "tzinfos": [None],
+                "categories": ["foo"],
+                "titles": ["a"],
+                "sources": [["foo"]],
+            }
+        ).encode("utf-8")
+        buffer = b"".join(
+            [
+                struct.pack("<4sHHII", b"CLGN", 1, 0, 1, len(tables)),
+                struct.pack(
+                    "<qIIHH",
+                    timestamp_to_int(datetime.datetime(2022, 1, 1)),
+                    0,
+                    0,
+                    0,
+                    0,
+                ),
+                tables,
+            ]
+        )
+
+        # Act (actually perform what has to be done)
+        result = load_entries(buffer)
+
+        # Assert (verify the results)
+        self.assertEqual(
+            result, [CalendarEntry("a", "foo", datetime.date(2022, 1, 1), ("foo",))]
+        )
+        self.assertEqual(result[0].display_title, "a")
+
+    def test_from_file(self):
+        # Arrange (set up test environment)
+        entries = [_entry("a", datetime.date(2022, 1, 1))]
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "entries.bin")
+            with open(path, "wb") as file_handle:
+                file_handle.write(dump_entries(entries))
+
+            # Act (actually perform what has to be done)
+            result = load_file(path)
+
+        # Assert (verify the results)
+        self.assertEqual(result, entries)
+
+    def test_invalid_buffer(self):
+        # Arrange (set up test environment)
+        buffer = dump_entries([])
+
+        # Act (actually perform what has to be done)
+        # Assert (verify the results)
+        for invalid in (b"", b"XXXX" + buffer[4:], buffer + b" "):
+            with self.assertRaises(ColumnarFormatException):
+                load_entries(invalid)
+
+    def test_corrupt_file(self):
+        """Corrupt files raise ColumnarFormatException, releasing the memory map."""
+        # Arrange (set up test environment)
+        buffer = dump_entries([_entry("a", datetime.date(2022, 1, 1))])
+        corrupt_tables = buffer[:-2] + b"{}"
+
+        with tempfile.TemporaryDirectory() as directory:
+            for name, content in (
+                ("truncated.bin", buffer[:-1]),
+                ("tables.bin", corrupt_tables),
+            ):
+                path = os.path.join(directory, name)
+                with open(path, "wb") as file_handle:
+                    file_handle.write(content)
+
+                # Act (actually perform what has to be done)
+                # Assert (verify the results)
+                with self.assertRaises(ColumnarFormatException):
+                    load_file(path)
+
+    def test_timezone_without_fixed_offset(self):
+        # Arrange (set up test environment)
+        class _VariableTimezone(datetime.tzinfo):
+            def utcoffset(self, dt):
+                return None if dt is None else datetime.timedelta(0)
+
+        entries = [
+            _entry("a", datetime.datetime(2022, 1, 1, tzinfo=_VariableTimezone()))
+        ]
+
+        # Act (actually perform what has to be done)
+        # Assert (verify the results)
+        with self.assertRaises(ColumnarFormatException):
+            dump_entries(entries)
@@ -4,16 +4,25 @@
 
 # Python imports
 import datetime
+import pickle
 from unittest import mock, skip  # noqa: F401
 
 # Django imports
+from django.template import Context, Template
 from django.test import override_settings, tag  # noqa: F401
 
 # external imports
 from dateutil import parser
 
 # app imports
-from calingen.interfaces.data_exchange import CalendarEntry, CalendarEntryList
+from calingen.constants import EventCategory
+from calingen.interfaces.data_exchange import (
+    CalendarEntry,
+    CalendarEntryList,
+    CalendarEntryStream,
+    merge_sorted,
+    sort_key,
+)
 
 # local imports
 from ..util.testcases import CalingenTestCase
@@ -55,6 +64,26 @@ class CalendarEntryTest(CalingenTestCase):
         # Assert (verify the results)
         self.assertEqual(entry.timestamp, test_datetime)
 
+    def test_constructor_uses_predefined_category(self):
+        # Arrange (set up test environment)
+        test_datetime = datetime.datetime(2021, 12, 12, 8, 15)
+
+        # Act (actually perform what has to be done)
+        entry = CalendarEntry("foo", "HOLIDAY", test_datetime, ("foo", "bar"))
+
+        # Assert (verify the results)
+        self.assertIs(entry.category, EventCategory.HOLIDAY)
+
+    def test_constructor_accepts_non_iso_datestring(self):
+        # Arrange (set up test environment)
+        test_datetime = datetime.datetime(2021, 12, 2, 14, 48)
+
+        # Act (actually perform what has to be done)
+        entry = CalendarEntry("foo", "bar", "Dec 2 2021 14:48", ("foo", "bar"))
+
+        # Assert (verify the results)
+        self.assertEqual(entry.timestamp, test_datetime)
+
     def test_constructor_rejects_non_valid_timestamp(self):
         # Arrange (set up test environment)
         test_datetime_str = "foobar"
@@ -75,17 +104,18 @@ class CalendarEntryTest(CalingenTestCase):
         with self.assertRaises(CalendarEntry.CalendarEntryException):
             entry = CalendarEntry("foo", "bar", test_date, "BREAK")  # noqa: F841
 
-    @mock.patch("calingen.interfaces.data_exchange.EventCategory")
-    def test_constructor_accepts_event_category(self, mock_event_category):
+    def test_constructor_accepts_event_category(self):
         # Arrange (set up test environment)
         test_datetime = datetime.datetime(2021, 12, 12, 8, 15)
         test_category = "TEST_CAT"
         test_event_cat = mock.MagicMock()
-        mock_event_category.__getitem__.return_value = test_event_cat
-        mock_event_category.values = [test_category]
 
         # Act (actually perform what has to be done)
-        entry = CalendarEntry("foo", test_category, test_datetime, ("foo", "bar"))
+        with mock.patch.dict(
+            "calingen.interfaces.data_exchange._CATEGORY_LOOKUP",
+            {test_category: test_event_cat},
+        ):
+            entry = CalendarEntry("foo", test_category, test_datetime, ("foo", "bar"))
 
         # Assert (verify the results)
         self.assertEqual(entry.timestamp, test_datetime)
@@ -173,12 +203,107 @@ class CalendarEntryTest(CalingenTestCase):
         self.assertLess(entry_2, entry_1)
         self.assertLessEqual(entry_2, entry_1)
 
+    def test_instances_are_immutable(self):
+        # Arrange (set up test environment)
+        entry = CalendarEntry(
+            "foo", "bar", datetime.datetime(2021, 12, 2, 15, 4), ("foo", "bar")
+        )
+
+        # Act (actually perform what has to be done)
+        # Assert (verify the results)
+        with self.assertRaises(AttributeError):
+            entry.title = "baz"
+        with self.assertRaises(AttributeError):
+            del entry.title
+        with self.assertRaises(AttributeError):
+            entry.foo = "bar"
+
+    def test_equal_instances_share_hash(self):
+        # Arrange (set up test environment)
+        entry_1 = CalendarEntry(
+            "foo", "bar", datetime.datetime(2021, 12, 2, 15, 4), ("foo", "bar")
+        )
+        entry_2 = CalendarEntry(
+            "foo", "bar", datetime.datetime(2021, 12, 2, 15, 4), ("bar", "baz")
+        )
+
+        # Act (actually perform what has to be done)
+        # Assert (verify the results)
+        self.assertEqual(entry_1, entry_2)
+        self.assertEqual(hash(entry_1), hash(entry_2))
+        self.assertEqual(len({entry_1, entry_2}), 1)
+
+    def test_repr_and_str(self):
+        """repr() and str() describe the entry."""
+        # Arrange (set up test environment)
+        timestamp = datetime.datetime(2021, 12, 2, 15, 4)
+        entry = CalendarEntry("foo", "bar", timestamp, ("foo", "bar"))
+
+        # Act (actually perform what has to be done)
+        representation = repr(entry)
+        string = str(entry)
+
+        # Assert (verify the results)
+        self.assertEqual(
+            representation,
+            "<CalendarEntry(title='foo', category='bar', start={}, "
+            "source=('foo', 'bar'))>".format(repr(timestamp)),
+        )
+        self.assertEqual(string, "[{}] foo (bar)".format(timestamp))
+
+    def test_sort_key_matches_comparison(self):
+        # Arrange (set up test environment)
+        timestamp = datetime.datetime(2021, 12, 2, 15, 4)
+        entries = [
+            CalendarEntry("b", "foo", timestamp, ("foo",)),
+            CalendarEntry("a", "foo", timestamp, ("foo",)),
+            CalendarEntry("c", "bar", timestamp, ("foo",)),
+            CalendarEntry("a", "bar", datetime.date(2021, 12, 1), ("foo",)),
+        ]
+
+        # Act (actually perform what has to be done)
+        result = sorted(entries, key=sort_key)
+
+        # Assert (verify the results)
+        self.assertEqual(result, sorted(entries))
+        self.assertEqual([x.title for x in result], ["a", "c", "a", "b"])
+
+    def test_pickle_roundtrip(self):
+        # Arrange (set up test environment)
+        entry = CalendarEntry(
+            "foo", "bar", datetime.datetime(2021, 12, 2, 15, 4), ("foo", "bar")
+        )
+
+        # Act (actually perform what has to be done)
+        restored = pickle.loads(pickle.dumps(entry))
+
+        # Assert (verify the results)
+        self.assertEqual(restored, entry)
+        self.assertEqual(restored.source, entry.source)
+
+    def test_display_title(self):
+        """display_title falls back to title."""
+        # Arrange (set up test environment)
+        timestamp = datetime.datetime(2021, 12, 2, 15, 4)
+
+        # Act (actually perform what has to be done)
+        plain = CalendarEntry("foo", "bar", timestamp, ("foo", "bar"))
+        with_display = CalendarEntry(
+            "foo", "bar", timestamp, ("foo", "bar"), display_title="Foo"
+        )
+
+        # Assert (verify the results)
+        self.assertEqual(plain.display_title, "foo")
+        self.assertEqual(with_display.display_title, "Foo")
+        self.assertEqual(plain, with_display)
+        self.assertEqual(pickle.loads(pickle.dumps(with_display)).display_title, "Foo")
+
 
 @tag("interfaces", "data", "calendarentrylist")
 class CalendarEntryListTest(CalingenTestCase):
     """Provide tests for the CalendarEntryList class."""
 
-    def test_constructor_initializes_set(self):
+    def test_constructor_initializes_list(self):
         """Constructor initializes _entries."""
         # Arrange (set up test environment)
         cal_entry_list = CalendarEntryList()
@@ -186,7 +311,8 @@ class CalendarEntryListTest(CalingenTestCase):
         # Act (actually perform what has to be done)
 
         # Assert (verify the results)
-        self.assertIsInstance(cal_entry_list._entries, set)
+        self.assertIsInstance(cal_entry_list._entries, list)
+        self.assertEqual(len(cal_entry_list), 0)
 
     def test_add_adds_provided_entry(self):
         """add() appends provided entry to _entries."""
@@ -236,8 +362,8 @@ class CalendarEntryListTest(CalingenTestCase):
         cal_entry_list_target.merge(cal_entry_list_second)
 
         # Assert (verify the results)
-        self.assertIn(cal_entry_one, cal_entry_list_target._entries)
-        self.assertIn(cal_entry_two, cal_entry_list_target._entries)
+        self.assertIn(cal_entry_one, cal_entry_list_target)
+        self.assertIn(cal_entry_two, cal_entry_list_target)
 
     def test_merge_merges_non_distinct_sets(self):
         """merge() correctly merges two non distinct CalendarEntryList instances."""
@@ -266,6 +392,449 @@ class CalendarEntryListTest(CalingenTestCase):
         cal_entry_list_target.merge(cal_entry_list_second)
 
         # Assert (verify the results)
-        self.assertIn(cal_entry_one, cal_entry_list_target._entries)
-        self.assertIn(cal_entry_two, cal_entry_list_target._entries)
-        self.assertEqual(len(cal_entry_list_target._entries), 2)
+        self.assertIn(cal_entry_one, cal_entry_list_target)
+        self.assertIn(cal_entry_two, cal_entry_list_target)
+        self.assertEqual(len(cal_entry_list_target), 2)
+
+    def test_entries_are_kept_sorted(self):
+        """Entries are sorted, regardless of the order they are added in."""
+        # Arrange (set up test environment)
+        entries = [
+            CalendarEntry("b", "foo", datetime.date(2022, 1, 2), ("foo", "bar")),
+            CalendarEntry("a", "foo", datetime.date(2022, 1, 3), ("foo", "bar")),
+            CalendarEntry("c", "foo", datetime.date(2022, 1, 1), ("foo", "bar")),
+            CalendarEntry("a", "foo", datetime.date(2022, 1, 3), ("foo", "bar")),
+        ]
+        cal_entry_list = CalendarEntryList()
+
+        # Act (actually perform what has to be done)
+        for entry in entries:
+            cal_entry_list.add(entry)
+
+        # Assert (verify the results)
+        self.assertEqual(cal_entry_list.sorted(), sorted(set(entries)))
+        self.assertEqual(list(cal_entry_list), sorted(set(entries)))
+
+    def test_merge_keeps_order_and_first_entry(self):
+        """merge() keeps the list sorted and prefers already included entries."""
+        # Arrange (set up test environment)
+        cal_entry_one = CalendarEntry(
+            "a", "foo", datetime.date(2022, 1, 1), ("first", "list")
+        )
+        cal_entry_two = CalendarEntry(
+            "b", "foo", datetime.date(2022, 1, 2), ("second", "list")
+        )
+        cal_entry_three = CalendarEntry(
+            "a", "foo", datetime.date(2022, 1, 1), ("second", "list")
+        )
+
+        cal_entry_list_target = CalendarEntryList()
+        cal_entry_list_target.add(cal_entry_one)
+
+        cal_entry_list_second = CalendarEntryList()
+        cal_entry_list_second.add(cal_entry_two)
+        cal_entry_list_second.add(cal_entry_three)
+
+        # Act (actually perform what has to be done)
+        cal_entry_list_target.merge(cal_entry_list_second)
+        result = cal_entry_list_target.sorted()
+
+        # Assert (verify the results)
+        self.assertEqual(result, [cal_entry_one, cal_entry_two])
+        self.assertEqual(result[0].source, ("first", "list"))
+
+    def test_from_records(self):
+        """from_records() accepts sequences and mappings."""
+        # Arrange (set up test environment)
+        records = [
+            ("b", "HOLIDAY", "2022-01-02", ("foo", "bar")),
+            {
+                "title": "a",
+                "category": "foo",
+                "timestamp": "2022-01-02",
+                "source": ["foo", "bar"],
+            },
+            ("c", "foo", datetime.date(2022, 1, 1), ("foo", "bar")),
+            ("c", "foo", "2022-01-01T00:00:00", ("foo", "bar")),
+        ]
+
+        # Act (actually perform what has to be done)
+        cal_entry_list = CalendarEntryList.from_records(records)
+        result = cal_entry_list.sorted()
+
+        # Assert (verify the results)
+        self.assertEqual([x.title for x in result], ["c", "b", "a"])
+        self.assertIs(result[1].category, EventCategory.HOLIDAY)
+        self.assertEqual(result[2].source, ("foo", "bar"))
+        self.assertEqual(result[1].timestamp, datetime.datetime(2022, 1, 2))
+
+    def test_bytes_roundtrip(self):
+        """to_bytes() and from_bytes() preserve all entries."""
+        # Arrange (set up test environment)
+        cal_entry_list = CalendarEntryList.from_records(
+            [
+                ("b", "HOLIDAY", "2022-01-02", ("foo", "bar")),
+                ("a", "foo", "2022-01-02", ("foo", 1)),
+            ]
+        )
+
+        # Act (actually perform what has to be done)
+        result = CalendarEntryList.from_bytes(cal_entry_list.to_bytes()).sorted()
+
+        # Assert (verify the results)
+        self.assertEqual(result, cal_entry_list.sorted())
+        self.assertEqual([x.source for x in result], [("foo", "bar"), ("foo", 1)])
+
+    def test_get(self):
+        """get() looks up entries by their (normalized) key."""
+        # Arrange (set up test environment)
+        entry = CalendarEntry("foo", "HOLIDAY", datetime.date(2022, 1, 1), ("foo",))
+        cal_entry_list = CalendarEntryList()
+        cal_entry_list.add(entry)
+
+        # Act (actually perform what has to be done)
+        # Assert (verify the results)
+        self.assertIs(
+            cal_entry_list.get("foo", EventCategory.HOLIDAY, "2022-01-01"), entry
+        )
+        self.assertIsNone(cal_entry_list.get("bar", "HOLIDAY", "2022-01-01"))
+        self.assertEqual(cal_entry_list.get("bar", "HOLIDAY", "2022-01-01", 42), 42)
+
+    def test_replace_keeps_order(self):
+        """Replaced entries are sorted into the list."""
+        # Arrange (set up test environment)
+        cal_entry_list = CalendarEntryList.from_records(
+            [
+                ("a", "foo", "2022-01-01", ("foo",)),
+                ("b", "foo", "2022-01-02", ("foo",)),
+                ("c", "foo", "2022-01-03", ("foo",)),
+            ]
+        )
+        old = cal_entry_list.get("a", "foo", "2022-01-01")
+        new = CalendarEntry("a", "foo", datetime.date(2022, 1, 4), ("bar",))
+
+        # Act (actually perform what has to be done)
+        cal_entry_list.replace(old, new)
+
+        # Assert (verify the results)
+        self.assertEqual([x.title for x in cal_entry_list], ["b", "c", "a"])
+        self.assertNotIn(old, cal_entry_list)
+        self.assertIn(new, cal_entry_list)
+        self.assertEqual(len(cal_entry_list.on(datetime.date(2022, 1, 4))), 1)
+
+    def test_replace_same_key(self):
+        """Replacing an equal entry updates the stored instance in place."""
+        # Arrange (set up test environment)
+        old = CalendarEntry("a", "foo", datetime.date(2022, 1, 1), ("foo",))
+        new = CalendarEntry("a", "foo", datetime.date(2022, 1, 1), ("bar",))
+        cal_entry_list = CalendarEntryList()
+        cal_entry_list.add(old)
+
+        # Act (actually perform what has to be done)
+        cal_entry_list.replace(old, new)
+
+        # Assert (verify the results)
+        self.assertEqual([x.source for x in cal_entry_list], [("bar",)])
+
+    def test_replace_pending_entry(self):
+        """Entries, that were added after building the index, are replaced."""
+        # Arrange (set up test environment)
+        cal_entry_list = CalendarEntryList()
+        cal_entry_list.add(
+            CalendarEntry("c", "foo", datetime.date(2022, 1, 3), ("foo",))
+        )
+        cal_entry_list.get("c", "foo", "2022-01-03")
+        cal_entry_list.add(
+            CalendarEntry("a", "foo", datetime.date(2022, 1, 1), ("foo",))
+        )
+        old = CalendarEntry("d", "foo", datetime.date(2022, 1, 4), ("foo",))
+        cal_entry_list.add(old)
+        new = CalendarEntry("d", "foo", datetime.date(2022, 1, 4), ("bar",))
+
+        # Act (actually perform what has to be done)
+        cal_entry_list.replace(old, new)
+
+        # Assert (verify the results)
+        self.assertEqual(
+            [(x.title, x.source) for x in cal_entry_list],
+            [("a", ("foo",)), ("c", ("foo",)), ("d", ("bar",))],
+        )
+
+    def test_replace_missing_entry(self):
+        # Arrange (set up test environment)
+        entry = CalendarEntry("a", "foo", datetime.date(2022, 1, 1), ("foo",))
+        cal_entry_list = CalendarEntryList()
+
+        # Act (actually perform what has to be done)
+        # Assert (verify the results)
+        with self.assertRaises(CalendarEntryList.CalendarEntryListException):
+            cal_entry_list.replace(entry, entry)
+
+    def test_discard(self):
+        """discard() removes entries and ignores missing ones."""
+        # Arrange (set up test environment)
+        first = CalendarEntry("a", "foo", datetime.date(2022, 1, 1), ("foo",))
+        second = CalendarEntry("b", "foo", datetime.date(2022, 1, 2), ("foo",))
+        cal_entry_list = CalendarEntryList()
+        cal_entry_list.add(first)
+        cal_entry_list.add(second)
+
+        # Act (actually perform what has to be done)
+        cal_entry_list.discard(first)
+        cal_entry_list.discard(first)
+        cal_entry_list.add(first)
+        cal_entry_list.discard(second)
+
+        # Assert (verify the results)
+        self.assertEqual(cal_entry_list.sorted(), [first])
+
+    def test_merge_after_discard(self):
+        # Arrange (set up test environment)
+        first = CalendarEntry("a", "foo", datetime.date(2022, 1, 1), ("foo",))
+        second = CalendarEntry("b", "foo", datetime.date(2022, 1, 2), ("foo",))
+        cal_entry_list = CalendarEntryList()
+        cal_entry_list.add(first)
+        cal_entry_list.add(second)
+        other = CalendarEntryList()
+        other.add(second)
+
+        # Act (actually perform what has to be done)
+        cal_entry_list.discard(first)
+        cal_entry_list.merge(other)
+
+        # Assert (verify the results)
+        self.assertEqual(cal_entry_list.sorted(), [second])
+
+    def test_sorted_returns_copy(self):
+        """sorted() returns a new list, that may be modified by the caller."""
+        # Arrange (set up test environment)
+        cal_entry_list = CalendarEntryList()
+        cal_entry_list.add(
+            CalendarEntry("a", "foo", datetime.date(2022, 1, 1), ("foo", "bar"))
+        )
+
+        # Act (actually perform what has to be done)
+        cal_entry_list.sorted().clear()
+
+        # Assert (verify the results)
+        self.assertEqual(len(cal_entry_list), 1)
+
+    def test_getitem_provides_sorted_entries(self):
+        """Entries are accessible by their position in sorted order."""
+        # Arrange (set up test environment)
+        cal_entry_list = CalendarEntryList()
+        entry_one = CalendarEntry("a", "foo", datetime.date(2022, 1, 1), ("x", "y"))
+        entry_two = CalendarEntry("b", "foo", datetime.date(2022, 1, 2), ("x", "y"))
+        cal_entry_list.add(entry_two)
+        cal_entry_list.add(entry_one)
+
+        # Act (actually perform what has to be done)
+        first = cal_entry_list[0]
+        last = cal_entry_list[-1]
+        sliced = cal_entry_list[:1]
+
+        # Assert (verify the results)
+        self.assertIs(first, entry_one)
+        self.assertIs(last, entry_two)
+        self.assertEqual(sliced, [entry_one])
+        with self.assertRaises(IndexError):
+            cal_entry_list[2]
+
+    def test_template_uses_index_and_length(self):
+        """Templates may use ``entries.0`` and ``entries|length``."""
+        # Arrange (set up test environment)
+        cal_entry_list = CalendarEntryList()
+        cal_entry_list.add(
+            CalendarEntry("b", "foo", datetime.date(2022, 1, 2), ("x", "y"))
+        )
+        cal_entry_list.add(
+            CalendarEntry("a", "foo", datetime.date(2022, 1, 1), ("x", "y"))
+        )
+        template = Template("{{ entries.0.title }}/{{ entries|length }}")
+
+        # Act (actually perform what has to be done)
+        result = template.render(Context({"entries": cal_entry_list}))
+
+        # Assert (verify the results)
+        self.assertEqual(result, "a/2")
+
+
+@tag("interfaces", "data", "calendarentrylist", "queries")
+class CalendarEntryListQueryTest(CalingenTestCase):
+    """Provide tests for the query methods of CalendarEntryList."""
+
+    def setUp(self):
+        self.entries = [
+            CalendarEntry(
+                "a", "foo", datetime.datetime(2021, 12, 31, 20, 0), ("foo", "bar")
+            ),
+            CalendarEntry("b", "bar", datetime.date(2022, 1, 1), ("foo", "bar")),
+            CalendarEntry(
+                "c", "foo", datetime.datetime(2022, 1, 1, 12, 0), ("foo", "bar")
+            ),
+            CalendarEntry("d", "foo", datetime.date(2022, 1, 3), ("foo", "bar")),
+            CalendarEntry("e", "bar", datetime.date(2022, 2, 1), ("foo", "bar")),
+        ]
+        self.entry_list = CalendarEntryList()
+        for entry in reversed(self.entries):
+            self.entry_list.add(entry)
+
+    def test_on(self):
+        # Arrange (set up test environment)
+
+        # Act (actually perform what has to be done)
+        result = self.entry_list.on(datetime.date(2022, 1, 1))
+
+        # Assert (verify the results)
+        self.assertEqual(result, self.entries[1:3])
+        self.assertEqual(self.entry_list.on(datetime.date(2022, 1, 2)), [])
+        self.assertEqual(
+            self.entry_list.on(datetime.datetime(2022, 1, 3, 18, 0)),
+            self.entries[3:4],
+        )
+
+    def test_on_reflects_modifications(self):
+        # Arrange (set up test environment)
+        self.entry_list.on(datetime.date(2022, 1, 2))
+        entry = CalendarEntry("f", "foo", datetime.date(2022, 1, 2), ("foo", "bar"))
+
+        # Act (actually perform what has to be done)
+        self.entry_list.add(entry)
+
+        # Assert (verify the results)
+        self.assertEqual(self.entry_list.on(datetime.date(2022, 1, 2)), [entry])
+
+    def test_between_dates(self):
+        # Arrange (set up test environment)
+
+        # Act (actually perform what has to be done)
+        result = self.entry_list.between(
+            datetime.date(2022, 1, 1), datetime.date(2022, 1, 3)
+        )
+
+        # Assert (verify the results)
+        self.assertIsInstance(result, CalendarEntryList)
+        self.assertEqual(result.sorted(), self.entries[1:4])
+
+    def test_between_datetimes(self):
+        # Arrange (set up test environment)
+
+        # Act (actually perform what has to be done)
+        result = self.entry_list.between(
+            datetime.datetime(2021, 12, 31, 21, 0),
+            datetime.datetime(2022, 1, 1, 6, 0),
+        )
+
+        # Assert (verify the results)
+        self.assertEqual(result.sorted(), self.entries[1:2])
+
+    def test_by_month(self):
+        # Arrange (set up test environment)
+
+        # Act (actually perform what has to be done)
+        result = self.entry_list.by_month()
+
+        # Assert (verify the results)
+        self.assertEqual(list(result), [(2021, 12), (2022, 1), (2022, 2)])
+        self.assertEqual(result[(2022, 1)], self.entries[1:4])
+
+    def test_by_iso_week(self):
+        # Arrange (set up test environment)
+
+        # Act (actually perform what has to be done)
+        result = self.entry_list.by_iso_week()
+
+        # Assert (verify the results)
+        self.assertEqual(list(result), [(2021, 52), (2022, 1), (2022, 5)])
+        self.assertEqual(result[(2021, 52)], self.entries[0:3])
+
+    def test_by_category(self):
+        # Arrange (set up test environment)
+
+        # Act (actually perform what has to be done)
+        result = self.entry_list.by_category()
+
+        # Assert (verify the results)
+        self.assertEqual(result["bar"], [self.entries[1], self.entries[4]])
+        self.assertEqual(len(result["foo"]), 3)
+
+
+@tag("interfaces", "data", "calendarentrystream")
+class CalendarEntryStreamTest(CalingenTestCase):
+    def _entries(self, *titles):
+        return [
+            CalendarEntry(title, "foo", datetime.date(2022, 1, day), ("foo", source))
+            for day, title, source in titles
+        ]
+
+    def test_merge_sorted(self):
+        """merge_sorted() keeps the order and skips duplicates."""
+        # Arrange (set up test environment)
+        first = self._entries((1, "a", 1), (3, "c", 1))
+        second = self._entries((2, "b", 2), (3, "c", 2), (4, "d", 2))
+
+        # Act (actually perform what has to be done)
+        result = list(merge_sorted(first, second))
+
+        # Assert (verify the results)
+        self.assertEqual([x.title for x in result], ["a", "b", "c", "d"])
+        self.assertEqual(result[2].source, ("foo", 1))
+
+    def test_stream_matches_calendar_entry_list(self):
+        """Iterating a stream yields the same entries as merging lists."""
+        # Arrange (set up test environment)
+        first = self._entries((2, "b", 1), (2, "a", 1))
+        second = self._entries((1, "z", 2), (2, "a", 2))
+        reference = CalendarEntryList()
+        reference.merge(first)
+        reference.merge(second)
+
+        # Act (actually perform what has to be done)
+        stream = CalendarEntryStream(
+            lambda: sorted(first), lambda: iter(sorted(second))
+        )
+
+        # Assert (verify the results)
+        self.assertEqual(list(stream), reference.sorted())
+        # streams are single-pass
+        with self.assertRaises(RuntimeError):
+            iter(stream)
+
+    def test_bool(self):
+        # Arrange (set up test environment)
+        empty = CalendarEntryStream(list)
+        filled = CalendarEntryStream(list, lambda: self._entries((1, "a", 1)))
+
+        # Act (actually perform what has to be done)
+        # Assert (verify the results)
+        self.assertFalse(empty)
+        self.assertTrue(filled)
+
+    def test_bool_keeps_the_first_entry(self):
+        """Evaluating a stream as bool does not call the sources again."""
+        # Arrange (set up test environment)
+        entries = self._entries((1, "a", 1), (2, "b", 1))
+        source = mock.MagicMock(return_value=iter(entries))
+        stream = CalendarEntryStream(source)
+
+        # Act (actually perform what has to be done)
+        filled = bool(stream)
+        result = list(stream)
+
+        # Assert (verify the results)
+        self.assertTrue(filled)
+        self.assertEqual(result, entries)
+        source.assert_called_once_with()
+        # the state is known, even after the iteration
+        self.assertTrue(stream)
+
+    def test_bool_while_iterating(self):
+        # Arrange (set up test environment)
+        stream = CalendarEntryStream(lambda: self._entries((1, "a", 1)))
+
+        # Act (actually perform what has to be done)
+        list(stream)
+
+        # Assert (verify the results)
+        with self.assertRaises(RuntimeError):
+            bool(stream)
@@ -3,19 +3,42 @@
 """Provide tests for calingen.interfaces.plugin_api."""
 
 # Python imports
+import asyncio
+import threading
+from datetime import date, datetime
 from unittest import mock, skip  # noqa: F401
 
 # Django imports
 from django.test import override_settings, tag  # noqa: F401
 from django.utils.functional import classproperty
 
+# external imports
+from dateutil.rrule import YEARLY, rrule
+
 # app imports
+from calingen.exceptions import CallingenInterfaceException
+from calingen.interfaces import plugin_api
+from calingen.interfaces.data_exchange import (
+    CalendarEntry,
+    CalendarEntryList,
+    merge_sorted,
+)
 from calingen.interfaces.plugin_api import (
     CompilerProvider,
     EventProvider,
     LayoutProvider,
+    PluginRegistry,
+    ResolutionReport,
+    clear_resolve_cache,
     fully_qualified_classname,
+    iter_providers,
+    register_manifest,
+    resolve_providers,
+    resolve_providers_async,
+    resolve_providers_range,
+    resolve_providers_window,
 )
+from calingen.interfaces.recurrence import get_evaluator, get_occurences
 
 # local imports
 from ..util.testcases import CalingenTestCase
@@ -51,6 +74,674 @@ class EventProviderTest(CalingenTestCase):
         # Assert (verify the results)
         self.assertIn((mock.ANY, test_implementation_name), event_provider_list)
 
+    def test_resolve_uses_resolved_titles(self):
+        """Titles are translated once per provider and language."""
+
+        # Arrange (set up test environment)
+        class LazyTitle:
+            calls = 0
+
+            def __str__(self):
+                LazyTitle.calls += 1
+                return "foo"
+
+        lazy_title = LazyTitle()
+
+        class EventProviderTestImplementation_resolved_titles_test(EventProvider):
+            title = "do-not-care"
+            entries = [
+                (
+                    lazy_title,
+                    "bar",
+                    rrule(freq=YEARLY, dtstart=datetime(1990, 1, 1)),
+                )
+            ]
+
+        provider = EventProviderTestImplementation_resolved_titles_test
+
+        # Act (actually perform what has to be done)
+        with mock.patch(
+            "calingen.interfaces.plugin_api.get_language", return_value="en"
+        ):
+            result = provider.resolve(2021).sorted() + provider.resolve(2022).sorted()
+        with mock.patch(
+            "calingen.interfaces.plugin_api.get_language", return_value="de"
+        ):
+            provider.resolve(2022)
+
+        # Assert (verify the results)
+        self.assertEqual(LazyTitle.calls, 2)
+        self.assertEqual([x.title for x in result], ["foo", "foo"])
+        self.assertIs(result[0].display_title, lazy_title)
+
+    def test_resolve_window(self):
+        """Only occurences inside the window are resolved, across years."""
+
+        # Arrange (set up test environment)
+        class EventProviderTestImplementation_resolve_window_test(EventProvider):
+            title = "do-not-care"
+            entries = [
+                ("foo", "bar", rrule(freq=YEARLY, dtstart=datetime(1990, 1, 1))),
+                ("baz", "bar", rrule(freq=YEARLY, dtstart=datetime(1990, 10, 3))),
+            ]
+
+        # Act (actually perform what has to be done)
+        result = EventProviderTestImplementation_resolve_window_test.resolve_window(
+            date(2021, 8, 1), date(2022, 7, 31)
+        )
+
+        # Assert (verify the results)
+        self.assertEqual(
+            [(x.title, x.timestamp) for x in result],
+            [("baz", datetime(2021, 10, 3)), ("foo", datetime(2022, 1, 1))],
+        )
+
+    def test_resolve_window_uses_custom_resolve(self):
+        """Providers with a custom resolve() are resolved by year and filtered."""
+
+        # Arrange (set up test environment)
+        class EventProviderTestImplementation_resolve_window_custom_test(EventProvider):
+            title = "do-not-care"
+
+            @classmethod
+            def resolve(cls, year):
+                result = CalendarEntryList()
+                result.add(CalendarEntry("foo", "bar", date(year, 3, 1), ("foo",)))
+                return result
+
+        provider = EventProviderTestImplementation_resolve_window_custom_test
+
+        # Act (actually perform what has to be done)
+        result = provider.resolve_window(date(2021, 4, 1), date(2022, 3, 1))
+
+        # Assert (verify the results)
+        self.assertEqual([x.timestamp for x in result], [datetime(2022, 3, 1)])
+
+    def test_resolve_range(self):
+        """The range matches resolve() for every year."""
+
+        # Arrange (set up test environment)
+        class EventProviderTestImplementation_resolve_range_test(EventProvider):
+            title = "do-not-care"
+            entries = [
+                ("foo", "bar", rrule(freq=YEARLY, dtstart=datetime(2021, 1, 1))),
+                (
+                    "baz",
+                    "bar",
+                    rrule(freq=YEARLY, dtstart=datetime(1990, 1, 1), bymonth=(3, 10)),
+                ),
+                ("late", "bar", rrule(freq=YEARLY, dtstart=datetime(1990, 12, 31, 6))),
+            ]
+
+        provider = EventProviderTestImplementation_resolve_range_test
+
+        # Act (actually perform what has to be done)
+        result = provider.resolve_range(2020, 2023)
+
+        # Assert (verify the results)
+        self.assertEqual(list(result), [2020, 2021, 2022, 2023])
+        for year, entries in result.items():
+            expected = provider.resolve(year)
+            self.assertEqual(entries.sorted(), expected.sorted())
+            self.assertEqual(
+                [x.display_title for x in entries], [x.display_title for x in expected]
+            )
+        self.assertEqual([x.title for x in result[2020]], ["baz"])
+
+    def test_resolve_range_uses_custom_resolve(self):
+        """Providers with a custom resolve() are resolved by year."""
+
+        # Arrange (set up test environment)
+        class EventProviderTestImplementation_resolve_range_custom_test(EventProvider):
+            title = "do-not-care"
+
+            @classmethod
+            def resolve(cls, year):
+                result = CalendarEntryList()
+                result.add(CalendarEntry("foo", "bar", date(year, 3, 1), ("foo",)))
+                return result
+
+        provider = EventProviderTestImplementation_resolve_range_custom_test
+
+        # Act (actually perform what has to be done)
+        result = provider.resolve_range(2021, 2022)
+
+        # Assert (verify the results)
+        self.assertEqual(
+            {year: [x.timestamp for x in entries] for year, entries in result.items()},
+            {2021: [datetime(2021, 3, 1)], 2022: [datetime(2022, 3, 1)]},
+        )
+
+    def _cached_provider(self, cacheable=True):
+        class EventProviderTestImplementation_cache_test(EventProvider):
+            title = "do-not-care"
+            entries = [("foo", "bar", rrule(freq=YEARLY, dtstart=datetime(1990, 1, 1)))]
+
+        provider = EventProviderTestImplementation_cache_test
+        provider.cacheable = cacheable
+        provider.resolve = mock.MagicMock(wraps=provider.resolve)
+        return provider
+
+    def test_resolve_cached(self):
+        """Results are memoized per year and returned as copies."""
+        # Arrange (set up test environment)
+        provider = self._cached_provider()
+
+        # Act (actually perform what has to be done)
+        first = provider.resolve_cached(2022)
+        first.discard(first.sorted()[0])
+        second = provider.resolve_cached(2022)
+        provider.resolve_cached(2021)
+
+        # Assert (verify the results)
+        self.assertEqual(provider.resolve.call_count, 2)
+        self.assertEqual(len(second), 1)
+
+    def test_resolve_cached_respects_language(self):
+        # Arrange (set up test environment)
+        provider = self._cached_provider()
+
+        # Act (actually perform what has to be done)
+        for language in ("en", "de", "en"):
+            with mock.patch(
+                "calingen.interfaces.plugin_api.get_language", return_value=language
+            ):
+                provider.resolve_cached(2022)
+
+        # Assert (verify the results)
+        self.assertEqual(provider.resolve.call_count, 2)
+
+    def test_resolve_cached_detects_modified_entries(self):
+        # Arrange (set up test environment)
+        provider = self._cached_provider()
+        provider.resolve_cached(2022)
+
+        # Act (actually perform what has to be done)
+        provider.entries.append(
+            ("baz", "bar", rrule(freq=YEARLY, dtstart=datetime(1990, 2, 1)))
+        )
+        result = provider.resolve_cached(2022)
+
+        # Assert (verify the results)
+        self.assertEqual(provider.resolve.call_count, 2)
+        self.assertEqual(len(result), 2)
+
+    def test_resolve_cached_opt_out(self):
+        # Arrange (set up test environment)
+        provider = self._cached_provider(cacheable=False)
+
+        # Act (actually perform what has to be done)
+        provider.resolve_cached(2022)
+        provider.resolve_cached(2022)
+
+        # Assert (verify the results)
+        self.assertEqual(provider.resolve.call_count, 2)
+
+    @override_settings(CALINGEN_EVENT_PROVIDER_CACHE_SIZE=1)
+    def test_resolve_cached_evicts_least_recently_used(self):
+        # Arrange (set up test environment)
+        clear_resolve_cache()
+        provider = self._cached_provider()
+
+        # Act (actually perform what has to be done)
+        for year in (2021, 2021, 2022, 2021):
+            provider.resolve_cached(year)
+
+        # Assert (verify the results)
+        self.assertEqual(provider.resolve.call_count, 3)
+
+    def test_iter_entries_uses_resolve(self):
+        """The default implementation iterates the result of resolve()."""
+
+        # Arrange (set up test environment)
+        class EventProviderTestImplementation_iter_entries_test(EventProvider):
+            title = "do-not-care"
+            resolve = mock.MagicMock(return_value=["foo", "bar"])
+
+        # Act (actually perform what has to be done)
+        result = list(
+            EventProviderTestImplementation_iter_entries_test.iter_entries(2022)
+        )
+
+        # Assert (verify the results)
+        EventProviderTestImplementation_iter_entries_test.resolve.assert_called_once_with(
+            2022
+        )
+        self.assertEqual(result, ["foo", "bar"])
+
+
+@tag("interfaces", "plugin", "EventProvider")
+class ResolveProvidersTest(CalingenTestCase):
+    def test_shared_rules_are_resolved_once(self):
+        # Arrange (set up test environment)
+        shared = ("foo", "bar", rrule(freq=YEARLY, dtstart=datetime(1990, 1, 1)))
+
+        class EventProviderTestImplementation_shared_first(EventProvider):
+            title = "first"
+            entries = [shared]
+
+        class EventProviderTestImplementation_shared_second(EventProvider):
+            title = "second"
+            entries = [
+                shared,
+                ("baz", "bar", rrule(freq=YEARLY, dtstart=datetime(1990, 3, 1))),
+            ]
+
+        providers = [
+            EventProviderTestImplementation_shared_first,
+            EventProviderTestImplementation_shared_second,
+        ]
+        expected = CalendarEntryList()
+        for provider in providers:
+            expected.merge(provider.resolve(2022))
+
+        # Act (actually perform what has to be done)
+        with mock.patch(
+            "calingen.interfaces.plugin_api.get_occurences",
+            wraps=get_occurences,
+        ) as mock_get_occurences:
+            result = resolve_providers(providers, 2022)
+
+        # Assert (verify the results)
+        self.assertEqual(result.sorted(), expected.sorted())
+        self.assertEqual(
+            [x.source for x in result], [("EXTERNAL", "first"), ("EXTERNAL", "second")]
+        )
+        self.assertEqual(mock_get_occurences.call_count, 2)
+
+    def _shared_providers(self):
+        shared = ("foo", "bar", rrule(freq=YEARLY, dtstart=datetime(1990, 1, 1)))
+
+        class EventProviderTestImplementation_shared_window_first(EventProvider):
+            title = "first"
+            entries = [shared]
+
+        class EventProviderTestImplementation_shared_window_second(EventProvider):
+            title = "second"
+            entries = [
+                shared,
+                ("baz", "bar", rrule(freq=YEARLY, dtstart=datetime(1990, 3, 1))),
+            ]
+
+        return [
+            EventProviderTestImplementation_shared_window_first,
+            EventProviderTestImplementation_shared_window_second,
+        ]
+
+    def test_shared_rules_are_resolved_once_in_windows(self):
+        # Arrange (set up test environment)
+        providers = self._shared_providers()
+        start, end = date(2021, 9, 1), date(2022, 8, 31)
+        expected = CalendarEntryList()
+        for provider in providers:
+            expected.merge(provider.resolve_window(start, end))
+
+        # Act (actually perform what has to be done)
+        with mock.patch(
+            "calingen.interfaces.plugin_api.get_evaluator", wraps=get_evaluator
+        ) as mock_get_evaluator:
+            result = resolve_providers_window(providers, start, end)
+
+        # Assert (verify the results)
+        self.assertEqual(result.sorted(), expected.sorted())
+        self.assertEqual(
+            [x.source for x in result], [("EXTERNAL", "first"), ("EXTERNAL", "second")]
+        )
+        self.assertEqual(mock_get_evaluator.call_count, 2)
+
+    def test_shared_rules_are_resolved_once_in_ranges(self):
+        # Arrange (set up test environment)
+        providers = self._shared_providers()
+
+        # Act (actually perform what has to be done)
+        with mock.patch(
+            "calingen.interfaces.plugin_api.get_evaluator", wraps=get_evaluator
+        ) as mock_get_evaluator:
+            result = resolve_providers_range(providers, 2021, 2022)
+
+        # Assert (verify the results)
+        for year in (2021, 2022):
+            expected = CalendarEntryList()
+            for provider in providers:
+                expected.merge(provider.resolve(year))
+            self.assertEqual(result[year].sorted(), expected.sorted())
+            self.assertEqual(
+                [x.source for x in result[year]],
+                [("EXTERNAL", "first"), ("EXTERNAL", "second")],
+            )
+        self.assertEqual(mock_get_evaluator.call_count, 2)
+
+    def test_result_is_memoized(self):
+        # Arrange (set up test environment)
+        class EventProviderTestImplementation_shared_memoized(EventProvider):
+            title = "do-not-care"
+            entries = [("foo", "bar", rrule(freq=YEARLY, dtstart=datetime(1990, 1, 1)))]
+
+        providers = [EventProviderTestImplementation_shared_memoized]
+        first = resolve_providers(providers, 2022)
+        first.discard(first.sorted()[0])
+
+        # Act (actually perform what has to be done)
+        with mock.patch(
+            "calingen.interfaces.plugin_api.get_occurences",
+            wraps=get_occurences,
+        ) as mock_get_occurences:
+            result = resolve_providers(providers, 2022)
+
+        # Assert (verify the results)
+        mock_get_occurences.assert_not_called()
+        self.assertEqual(len(result), 1)
+
+    def test_custom_resolve(self):
+        # Arrange (set up test environment)
+        class EventProviderTestImplementation_shared_custom(EventProvider):
+            title = "do-not-care"
+
+            @classmethod
+            def resolve(cls, year):
+                result = CalendarEntryList()
+                result.add(CalendarEntry("foo", "bar", date(year, 3, 1), ("foo",)))
+                return result
+
+        # Act (actually perform what has to be done)
+        result = resolve_providers(
+            [EventProviderTestImplementation_shared_custom], 2022
+        )
+
+        # Assert (verify the results)
+        self.assertEqual([x.timestamp for x in result], [datetime(2022, 3, 1)])
+
+    def _slow_provider(self, release):
+        class EventProviderTestImplementation_shared_slow(EventProvider):
+            title = "do-not-care"
+
+            @classmethod
+            def resolve(cls, year):
+                release.wait(5)
+                result = CalendarEntryList()
+                result.add(CalendarEntry("slow", "bar", date(year, 3, 1), ("foo",)))
+                return result
+
+        return EventProviderTestImplementation_shared_slow
+
+    @override_settings(CALINGEN_EVENT_PROVIDER_TIMEOUT=0.05)
+    def test_timed_out_provider_is_reported(self):
+        # Arrange (set up test environment)
+        release = threading.Event()
+        self.addCleanup(release.set)
+        slow = self._slow_provider(release)
+
+        class EventProviderTestImplementation_shared_fast(EventProvider):
+            title = "do-not-care"
+            entries = [
+                ("fast", "bar", rrule(freq=YEARLY, dtstart=datetime(1990, 1, 1)))
+            ]
+
+        providers = [slow, EventProviderTestImplementation_shared_fast]
+        report = ResolutionReport()
+
+        # Act (actually perform what has to be done)
+        with mock.patch("calingen.interfaces.plugin_api.logger") as mock_logger:
+            result = resolve_providers(providers, 2022, report)
+
+        # Assert (verify the results)
+        self.assertEqual([x.title for x in result], ["fast"])
+        self.assertEqual(report.timed_out, [slow])
+        mock_logger.warning.assert_called_once()
+        self.assertEqual(
+            list(report.timings), [EventProviderTestImplementation_shared_fast]
+        )
+
+        # a result with missing providers is not memoized
+        release.set()
+        second = ResolutionReport()
+        result = resolve_providers(providers, 2022, second)
+        self.assertFalse(second.memoized)
+        self.assertEqual([x.title for x in result], ["fast", "slow"])
+        self.assertEqual(second.timed_out, [])
+
+    @override_settings(
+        CALINGEN_EVENT_PROVIDER_TIMEOUT=None, CALINGEN_EVENT_PROVIDER_BUDGET=0.05
+    )
+    def test_budget_limits_all_providers(self):
+        # Arrange (set up test environment)
+        release = threading.Event()
+        self.addCleanup(release.set)
+        slow = self._slow_provider(release)
+        report = ResolutionReport()
+
+        # Act (actually perform what has to be done)
+        with mock.patch("calingen.interfaces.plugin_api.logger") as mock_logger:
+            result = resolve_providers([slow], 2022, report)
+
+        # Assert (verify the results)
+        self.assertEqual(len(result), 0)
+        self.assertEqual(report.timed_out, [slow])
+        mock_logger.warning.assert_called_once()
+
+    @override_settings(CALINGEN_EVENT_PROVIDER_WORKERS=0)
+    def test_without_workers_providers_are_resolved_inline(self):
+        # Arrange (set up test environment)
+        release = threading.Event()
+        release.set()
+        slow = self._slow_provider(release)
+        report = ResolutionReport()
+
+        # Act (actually perform what has to be done)
+        with mock.patch("calingen.interfaces.plugin_api._get_executor") as mock_pool:
+            result = resolve_providers([slow], 2022, report)
+
+        # Assert (verify the results)
+        mock_pool.assert_not_called()
+        self.assertEqual([x.title for x in result], ["slow"])
+        self.assertEqual(list(report.timings), [slow])
+
+    def _broken_provider(self):
+        class EventProviderTestImplementation_shared_broken(EventProvider):
+            title = "do-not-care"
+
+            @classmethod
+            def resolve(cls, year):
+                raise RuntimeError("broken")
+
+        return EventProviderTestImplementation_shared_broken
+
+    def _assert_failure_is_reported(self):
+        # Arrange (set up test environment)
+        broken = self._broken_provider()
+
+        class EventProviderTestImplementation_shared_working(EventProvider):
+            title = "do-not-care"
+            entries = [
+                ("working", "bar", rrule(freq=YEARLY, dtstart=datetime(1990, 1, 1)))
+            ]
+
+        report = ResolutionReport()
+
+        # Act (actually perform what has to be done)
+        with mock.patch("calingen.interfaces.plugin_api.logger") as mock_logger:
+            result = resolve_providers(
+                [broken, EventProviderTestImplementation_shared_working], 2022, report
+            )
+
+        # Assert (verify the results)
+        self.assertEqual([x.title for x in result], ["working"])
+        self.assertEqual(report.failed, [broken])
+        mock_logger.exception.assert_called_once()
+
+    def test_failed_provider_is_reported(self):
+        self._assert_failure_is_reported()
+
+    @override_settings(CALINGEN_EVENT_PROVIDER_WORKERS=0)
+    def test_failed_inline_provider_is_reported(self):
+        self._assert_failure_is_reported()
+
+    @override_settings(
+        CALINGEN_EVENT_PROVIDER_WORKERS=1, CALINGEN_EVENT_PROVIDER_TIMEOUT=0.05
+    )
+    def test_saturated_pool_is_replaced(self):
+        # Arrange (set up test environment)
+        release = threading.Event()
+        self.addCleanup(release.set)
+        slow = self._slow_provider(release)
+        pool = plugin_api._get_executor(1)
+
+        # Act (actually perform what has to be done)
+        with mock.patch("calingen.interfaces.plugin_api.logger") as mock_logger:
+            resolve_providers([slow], 2022, ResolutionReport())
+            replaced = plugin_api._get_executor(1)
+
+        # Assert (verify the results)
+        self.assertIsNot(replaced, pool)
+        self.assertEqual(mock_logger.warning.call_count, 2)
+
+        # the pool is kept, once the worker is available again
+        release.set()
+        pool.shutdown(wait=True)
+        self.assertIs(plugin_api._get_executor(1), replaced)
+
+    @override_settings(CALINGEN_EVENT_PROVIDER_TIMEOUT=0.05)
+    def test_window_applies_time_limits(self):
+        # Arrange (set up test environment)
+        release = threading.Event()
+        self.addCleanup(release.set)
+        slow = self._slow_provider(release)
+        broken = self._broken_provider()
+
+        class EventProviderTestImplementation_shared_window(EventProvider):
+            title = "do-not-care"
+            entries = [
+                ("fast", "bar", rrule(freq=YEARLY, dtstart=datetime(1990, 1, 1)))
+            ]
+
+        report = ResolutionReport()
+
+        # Act (actually perform what has to be done)
+        with mock.patch("calingen.interfaces.plugin_api.logger"):
+            result = resolve_providers_window(
+                [slow, broken, EventProviderTestImplementation_shared_window],
+                date(2021, 9, 1),
+                date(2022, 8, 31),
+                report,
+            )
+
+        # Assert (verify the results)
+        self.assertEqual([x.timestamp for x in result], [datetime(2022, 1, 1)])
+        self.assertEqual(report.timed_out, [slow])
+        self.assertEqual(report.failed, [broken])
+
+    @override_settings(CALINGEN_EVENT_PROVIDER_TIMEOUT=0.05)
+    def test_range_applies_time_limits(self):
+        # Arrange (set up test environment)
+        release = threading.Event()
+        self.addCleanup(release.set)
+        slow = self._slow_provider(release)
+        broken = self._broken_provider()
+
+        class EventProviderTestImplementation_shared_range(EventProvider):
+            title = "do-not-care"
+            entries = [
+                ("fast", "bar", rrule(freq=YEARLY, dtstart=datetime(1990, 1, 1)))
+            ]
+
+        report = ResolutionReport()
+
+        # Act (actually perform what has to be done)
+        with mock.patch("calingen.interfaces.plugin_api.logger"):
+            result = resolve_providers_range(
+                [slow, broken, EventProviderTestImplementation_shared_range],
+                2021,
+                2022,
+                report,
+            )
+
+        # Assert (verify the results)
+        self.assertEqual(list(result), [2021, 2022])
+        self.assertEqual([x.title for x in result[2021]], ["fast"])
+        self.assertEqual([x.title for x in result[2022]], ["fast"])
+        self.assertEqual(report.timed_out, [slow])
+        self.assertEqual(report.failed, [broken])
+
+    def test_iter_providers_yields_separate_sources(self):
+        # Arrange (set up test environment)
+        rule = rrule(freq=YEARLY, dtstart=datetime(1990, 1, 1))
+
+        class EventProviderTestImplementation_iter_first(EventProvider):
+            title = "first"
+            entries = [("shared", "bar", rule)]
+
+        class EventProviderTestImplementation_iter_second(EventProvider):
+            title = "second"
+            entries = [
+                ("shared", "bar", rule),
+                ("own", "bar", rrule(freq=YEARLY, dtstart=datetime(1990, 3, 1))),
+            ]
+
+        report = ResolutionReport()
+
+        # Act (actually perform what has to be done)
+        sources = iter_providers(
+            [
+                EventProviderTestImplementation_iter_first,
+                EventProviderTestImplementation_iter_second,
+            ],
+            2022,
+            report,
+        )
+        result = list(merge_sorted(*sources))
+
+        # Assert (verify the results)
+        self.assertEqual(len(sources), 2)
+        self.assertEqual([x.title for x in result], ["shared", "own"])
+        # shared entries are attributed to the first provider
+        self.assertEqual(result[0].source[1], "first")
+        self.assertEqual(
+            set(report.timings),
+            {
+                EventProviderTestImplementation_iter_first,
+                EventProviderTestImplementation_iter_second,
+            },
+        )
+
+    @override_settings(CALINGEN_EVENT_PROVIDER_TIMEOUT=0.05)
+    def test_iter_providers_applies_time_limits(self):
+        # Arrange (set up test environment)
+        release = threading.Event()
+        self.addCleanup(release.set)
+        slow = self._slow_provider(release)
+        broken = self._broken_provider()
+
+        class EventProviderTestImplementation_iter_lazy(EventProvider):
+            title = "do-not-care"
+
+            @classmethod
+            def iter_entries(cls, year):
+                yield CalendarEntry("lazy", "bar", date(year, 1, 1), ("foo",))
+                raise RuntimeError("broken")
+
+        report = ResolutionReport()
+
+        # Act (actually perform what has to be done)
+        with mock.patch("calingen.interfaces.plugin_api.logger"):
+            result = list(
+                merge_sorted(
+                    *iter_providers(
+                        [slow, broken, EventProviderTestImplementation_iter_lazy],
+                        2022,
+                        report,
+                    )
+                )
+            )
+
+        # Assert (verify the results)
+        # the entries of a failing iterator, that were already retrieved, are
+        # kept
+        self.assertEqual([x.title for x in result], ["lazy"])
+        self.assertEqual(report.timed_out, [slow])
+        self.assertEqual(
+            report.failed, [broken, EventProviderTestImplementation_iter_lazy]
+        )
+
 
 @tag("interfaces", "plugin", "LayoutProvider")
 class LayoutProviderTest(CalingenTestCase):
@@ -159,6 +850,232 @@ class CompilerProviderTest(CalingenTestCase):
         self.assertIn((mock.ANY, test_implementation_title), layout_provider_list)
 
 
+@tag("interfaces", "plugin")
+class PluginRegistryTest(CalingenTestCase):
+    def test_registration_replaces_registry(self):
+        # Arrange (set up test environment)
+        registry = CompilerProvider.registry
+
+        # Act (actually perform what has to be done)
+        class CompilerProviderTestImplementation_registry_test(CompilerProvider):
+            title = "do-not-care"
+
+        # Assert (verify the results)
+        self.assertIsNot(CompilerProvider.registry, registry)
+        self.assertEqual(CompilerProvider.registry.version, registry.version + 1)
+        self.assertNotIn(
+            CompilerProviderTestImplementation_registry_test, registry.plugins
+        )
+        self.assertIs(
+            CompilerProviderTestImplementation_registry_test.registry,
+            CompilerProvider.registry,
+        )
+
+    def test_lookup_by_name(self):
+        # Arrange (set up test environment)
+        class CompilerProviderTestImplementation_lookup_test(CompilerProvider):
+            title = "do-not-care"
+
+        name = fully_qualified_classname(CompilerProviderTestImplementation_lookup_test)
+
+        # Act (actually perform what has to be done)
+        plugin = CompilerProvider.get_plugin(name)
+
+        # Assert (verify the results)
+        self.assertIs(plugin, CompilerProviderTestImplementation_lookup_test)
+        self.assertTrue(CompilerProvider.is_available(name))
+        self.assertFalse(CompilerProvider.is_available("foo.bar"))
+        self.assertIsNone(CompilerProvider.get_plugin("foo.bar"))
+        self.assertFalse(EventProvider.is_available(name))
+
+    def test_choices_are_memoized_per_language(self):
+        # Arrange (set up test environment)
+        plugin = type("PluginRegistryTestPlugin", (), {"title": "bar"})
+        registry = PluginRegistry().register(plugin)
+
+        # Act (actually perform what has to be done)
+        with mock.patch(
+            "calingen.interfaces.plugin_api.get_language", return_value="de"
+        ):
+            first = registry.choices()
+            second = registry.choices()
+        with mock.patch(
+            "calingen.interfaces.plugin_api.get_language", return_value="en"
+        ):
+            third = registry.choices()
+
+        # Assert (verify the results)
+        self.assertEqual(first, ((fully_qualified_classname(plugin), "bar"),))
+        self.assertIs(first, second)
+        self.assertIsNot(first, third)
+        self.assertEqual(first, third)
+
+
+@tag("interfaces", "plugin", "EventProvider", "async")
+class ResolveAsyncTest(CalingenTestCase):
+    async def test_default_implementation(self):
+        # Arrange (set up test environment)
+        class EventProviderTestImplementation_async_default(EventProvider):
+            title = "do-not-care"
+            entries = [("foo", "bar", rrule(freq=YEARLY, dtstart=datetime(1990, 1, 1)))]
+
+        provider = EventProviderTestImplementation_async_default
+
+        # Act (actually perform what has to be done)
+        result = await provider.resolve_async(2022)
+
+        # Assert (verify the results)
+        self.assertEqual(result.sorted(), provider.resolve(2022).sorted())
+
+    async def test_native_providers_are_gathered(self):
+        """Native implementations run concurrently, i.e. may wait for each other."""
+        # Arrange (set up test environment)
+        first_started = asyncio.Event()
+        second_started = asyncio.Event()
+
+        def _provider(title, started, other):
+            class EventProviderTestImplementation_async_native(EventProvider):
+                @classmethod
+                async def resolve_async(cls, year):
+                    started.set()
+                    await other.wait()
+                    result = CalendarEntryList()
+                    result.add(CalendarEntry(title, "bar", date(year, 1, 1), (title,)))
+                    return result
+
+            EventProviderTestImplementation_async_native.title = title
+            return EventProviderTestImplementation_async_native
+
+        class EventProviderTestImplementation_async_sync(EventProvider):
+            title = "sync"
+            entries = [("baz", "bar", rrule(freq=YEARLY, dtstart=datetime(1990, 1, 1)))]
+
+        providers = [
+            _provider("first", first_started, second_started),
+            EventProviderTestImplementation_async_sync,
+            _provider("second", second_started, first_started),
+        ]
+
+        # Act (actually perform what has to be done)
+        result = await asyncio.wait_for(
+            resolve_providers_async(providers, 2022), timeout=5
+        )
+
+        # Assert (verify the results)
+        self.assertEqual([x.title for x in result], ["baz", "first", "second"])
+
+    async def test_native_providers_apply_time_limits(self):
+        # Arrange (set up test environment)
+        class EventProviderTestImplementation_async_slow(EventProvider):
+            title = "do-not-care"
+
+            @classmethod
+            async def resolve_async(cls, year):
+                await asyncio.sleep(5)
+
+        class EventProviderTestImplementation_async_broken(EventProvider):
+            title = "do-not-care"
+
+            @classmethod
+            async def resolve_async(cls, year):
+                raise RuntimeError("broken")
+
+        class EventProviderTestImplementation_async_working(EventProvider):
+            title = "do-not-care"
+            entries = [("baz", "bar", rrule(freq=YEARLY, dtstart=datetime(1990, 1, 1)))]
+
+        report = ResolutionReport()
+
+        # Act (actually perform what has to be done)
+        with mock.patch("calingen.interfaces.plugin_api.logger"), override_settings(
+            CALINGEN_EVENT_PROVIDER_TIMEOUT=0.05
+        ):
+            result = await asyncio.wait_for(
+                resolve_providers_async(
+                    [
+                        EventProviderTestImplementation_async_slow,
+                        EventProviderTestImplementation_async_broken,
+                        EventProviderTestImplementation_async_working,
+                    ],
+                    2022,
+                    report,
+                ),
+                timeout=5,
+            )
+
+        # Assert (verify the results)
+        self.assertEqual([x.title for x in result], ["baz"])
+        self.assertEqual(report.timed_out, [EventProviderTestImplementation_async_slow])
+        self.assertEqual(report.failed, [EventProviderTestImplementation_async_broken])
+
+
+@tag("interfaces", "plugin", "manifest")
+class RegisterManifestTest(CalingenTestCase):
+    def setUp(self):
+        # restore the original registry after each test
+        self.addCleanup(
+            setattr, CompilerProvider, "registry", CompilerProvider.registry
+        )
+
+    def test_declared_plugins_are_available(self):
+        # Arrange (set up test environment)
+        name = "foo.bar.DeclaredCompiler"
+
+        # Act (actually perform what has to be done)
+        register_manifest({"CompilerProvider": {name: {"title": "declared"}}})
+
+        # Assert (verify the results)
+        self.assertTrue(CompilerProvider.is_available(name))
+        self.assertIn((name, "declared"), CompilerProvider.list_available_plugins())
+        self.assertEqual(CompilerProvider.registry.declared[name]["title"], "declared")
+        self.assertNotIn(name, CompilerProvider.registry.by_name)
+
+    @mock.patch("calingen.interfaces.plugin_api.import_string")
+    def test_declared_plugins_are_imported_on_access(self, mock_import_string):
+        # Arrange (set up test environment)
+        name = "foo.bar.DeclaredCompiler"
+        register_manifest({"CompilerProvider": {name: {"title": "declared"}}})
+
+        # Act (actually perform what has to be done)
+        plugin = CompilerProvider.get_plugin(name)
+
+        # Assert (verify the results)
+        mock_import_string.assert_called_once_with(name)
+        self.assertEqual(plugin, mock_import_string.return_value)
+
+    def test_registered_plugins_replace_declarations(self):
+        # Arrange (set up test environment)
+        class CompilerProviderTestImplementation_manifest_test(CompilerProvider):
+            title = "registered"
+
+        name = fully_qualified_classname(
+            CompilerProviderTestImplementation_manifest_test
+        )
+
+        # Act (actually perform what has to be done)
+        register_manifest({"CompilerProvider": {name: {"title": "declared"}}})
+
+        # Assert (verify the results)
+        self.assertIs(
+            CompilerProvider.get_plugin(name),
+            CompilerProviderTestImplementation_manifest_test,
+        )
+        self.assertIn((name, "registered"), CompilerProvider.list_available_plugins())
+        self.assertNotIn((name, "declared"), CompilerProvider.list_available_plugins())
+
+    def test_invalid_manifests(self):
+        for manifest in (
+            {"FooProvider": {"foo.bar.Baz": {"title": "foo"}}},
+            {"CompilerProvider": {"foo.bar.Baz": {"name": "foo"}}},
+        ):
+            with self.subTest(manifest=manifest):
+                # Arrange (set up test environment)
+                # Act (actually perform what has to be done)
+                # Assert (verify the results)
+                with self.assertRaises(CallingenInterfaceException):
+                    register_manifest(manifest)
+
+
 @tag("interfaces", "utility")
 class UtilityFunctionTest(CalingenTestCase):
     def test_fully_qualified_classname_class(self):
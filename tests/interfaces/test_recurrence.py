@@ -0,0 +1,207 @@
+# SPDX-License-Identifier: MIT
+
+"""Provide tests for calingen.interfaces.recurrence."""
+
+# Python imports
+import datetime
+from unittest import mock, skip  # noqa: F401
+
+# Django imports
+from django.test import override_settings, tag  # noqa: F401
+
+# external imports
+from dateutil.rrule import FR, MO, MONTHLY, SA, SU, TH, WE, YEARLY, rrule
+
+# app imports
+from calingen.contrib.providers.german_holidays import provider as german_holidays
+from calingen.interfaces.recurrence import (
+    EasterEvaluator,
+    MonthDayEvaluator,
+    RRuleEvaluator,
+    compile_rule,
+    get_evaluator,
+    get_occurences,
+    register_evaluator,
+)
+
+# local imports
+from ..util.testcases import CalingenTestCase
+
+DTSTART = datetime.datetime(1990, 1, 1)
+
+RULES = {
+    "fixed day": (
+        MonthDayEvaluator,
+        rrule(freq=YEARLY, dtstart=datetime.datetime(1990, 12, 25)),
+    ),
+    "fixed day with time": (
+        MonthDayEvaluator,
+        rrule(freq=YEARLY, dtstart=datetime.datetime(1990, 12, 31, 6, 30)),
+    ),
+    "leap day": (
+        MonthDayEvaluator,
+        rrule(freq=YEARLY, dtstart=datetime.datetime(1992, 2, 29)),
+    ),
+    "until": (
+        MonthDayEvaluator,
+        rrule(
+            freq=YEARLY,
+            dtstart=datetime.datetime(1990, 5, 1),
+            until=datetime.datetime(2100, 5, 1),
+        ),
+    ),
+    "weekday in range": (
+        MonthDayEvaluator,
+        rrule(
+            freq=YEARLY,
+            dtstart=DTSTART,
+            bymonth=11,
+            byweekday=WE,
+            bymonthday=(16, 17, 18, 19, 20, 21, 22),
+        ),
+    ),
+    "nth weekday": (
+        MonthDayEvaluator,
+        rrule(freq=YEARLY, dtstart=DTSTART, bymonth=(5, 10), byweekday=SU(+2)),
+    ),
+    "last weekday": (
+        MonthDayEvaluator,
+        rrule(freq=YEARLY, dtstart=DTSTART, bymonth=11, byweekday=(TH(-1), FR(-2))),
+    ),
+    "negative monthday": (
+        MonthDayEvaluator,
+        rrule(freq=YEARLY, dtstart=DTSTART, bymonth=2, bymonthday=(-1, 1)),
+    ),
+    "all weekdays of a month": (
+        MonthDayEvaluator,
+        rrule(freq=YEARLY, dtstart=DTSTART, bymonth=2, byweekday=(SA, SU)),
+    ),
+    "easter": (
+        EasterEvaluator,
+        rrule(freq=YEARLY, dtstart=DTSTART, byeaster=(-2, 0, 1, 60)),
+    ),
+    "easter with dtstart after easter": (
+        EasterEvaluator,
+        rrule(freq=YEARLY, dtstart=datetime.datetime(1990, 4, 15), byeaster=0),
+    ),
+    "monthly": (
+        RRuleEvaluator,
+        rrule(freq=MONTHLY, dtstart=DTSTART, bymonthday=13, byweekday=FR),
+    ),
+    "interval": (
+        RRuleEvaluator,
+        rrule(freq=YEARLY, interval=4, dtstart=datetime.datetime(1992, 2, 29)),
+    ),
+    "count": (RRuleEvaluator, rrule(freq=YEARLY, count=10, dtstart=DTSTART)),
+    "mixed weekdays": (
+        RRuleEvaluator,
+        rrule(freq=YEARLY, dtstart=DTSTART, bymonth=1, byweekday=(MO, MO(+1))),
+    ),
+}
+
+
+@tag("interfaces", "recurrence")
+class RecurrenceEvaluatorTest(CalingenTestCase):
+    def assertMatchesRRule(self, rule, years):  # noqa: N802
+        evaluator = get_evaluator(rule)
+        after = datetime.datetime(years.start, 1, 1)
+        before = datetime.datetime(years.stop - 1, 12, 31, 23, 59, 59)
+        expected = rule.between(after, before, inc=True)
+
+        self.assertEqual(evaluator.between(after, before), expected)
+        if not isinstance(evaluator, RRuleEvaluator):
+            self.assertEqual(
+                [x for year in years for x in evaluator.occurences(year)], expected
+            )
+
+    def test_compile_rule(self):
+        for name, (evaluator_class, rule) in RULES.items():
+            with self.subTest(rule=name):
+                # Arrange (set up test environment)
+
+                # Act (actually perform what has to be done)
+                evaluator = compile_rule(rule)
+
+                # Assert (verify the results)
+                self.assertIsInstance(evaluator, evaluator_class)
+
+    def test_rules_match_rrule(self):
+        for name, (_, rule) in RULES.items():
+            with self.subTest(rule=name):
+                # Arrange (set up test environment)
+                # Act (actually perform what has to be done)
+                # Assert (verify the results)
+                self.assertMatchesRRule(rule, range(1985, 2200))
+
+    def test_german_holidays_match_rrule(self):
+        # Arrange (set up test environment)
+        rules = [
+            value[2]
+            for value in vars(german_holidays).values()
+            if isinstance(value, tuple) and len(value) == 3
+        ]
+
+        # Act (actually perform what has to be done)
+        # Assert (verify the results)
+        self.assertTrue(rules)
+        for rule in rules:
+            self.assertNotIsInstance(get_evaluator(rule), RRuleEvaluator)
+            self.assertMatchesRRule(rule, range(1900, 2400))
+
+    def test_between_spans_years(self):
+        # Arrange (set up test environment)
+        rule = RULES["easter"][1]
+        after = datetime.datetime(2020, 4, 13)
+        before = datetime.datetime(2022, 4, 15)
+
+        # Act (actually perform what has to be done)
+        result = get_evaluator(rule).between(after, before)
+
+        # Assert (verify the results)
+        self.assertEqual(result, rule.between(after, before, inc=True))
+
+    def test_get_evaluator_is_cached(self):
+        # Arrange (set up test environment)
+        rule = rrule(freq=YEARLY, dtstart=DTSTART)
+
+        # Act (actually perform what has to be done)
+        # Assert (verify the results)
+        self.assertIs(get_evaluator(rule), get_evaluator(rule))
+
+    def test_register_evaluator(self):
+        # Arrange (set up test environment)
+        rule = rrule(freq=YEARLY, dtstart=DTSTART)
+        evaluator = RRuleEvaluator(rule)
+
+        # Act (actually perform what has to be done)
+        register_evaluator(rule, evaluator)
+
+        # Assert (verify the results)
+        self.assertIs(get_evaluator(rule), evaluator)
+
+    def test_get_occurences_is_memoized(self):
+        # Arrange (set up test environment)
+        rule = rrule(freq=YEARLY, dtstart=DTSTART)
+        get_occurences.cache_clear()
+
+        # Act (actually perform what has to be done)
+        first = get_occurences(rule, 2022)
+        second = get_occurences(rule, 2022)
+
+        # Assert (verify the results)
+        self.assertEqual(first, (datetime.datetime(2022, 1, 1),))
+        self.assertIs(first, second)
+        self.assertEqual(get_occurences.cache_info().misses, 1)
+
+    def test_register_evaluator_clears_occurences(self):
+        # Arrange (set up test environment)
+        rule = rrule(freq=YEARLY, dtstart=DTSTART)
+        get_occurences(rule, 2022)
+        evaluator = mock.MagicMock()
+        evaluator.occurences.return_value = [datetime.datetime(2022, 2, 2)]
+
+        # Act (actually perform what has to be done)
+        register_evaluator(rule, evaluator)
+
+        # Assert (verify the results)
+        self.assertEqual(get_occurences(rule, 2022), (datetime.datetime(2022, 2, 2),))
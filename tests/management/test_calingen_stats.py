@@ -0,0 +1,76 @@
+# SPDX-License-Identifier: MIT
+
+"""Provide tests for calingen.management.commands.calingen_stats."""
+
+# Python imports
+import json
+from io import StringIO
+from unittest import mock, skip  # noqa: F401
+
+# Django imports
+from django.core.management import CommandError, call_command
+from django.test import override_settings, tag  # noqa: F401
+
+# app imports
+from calingen.instrumentation import stats_registry
+from calingen.interfaces.plugin_api import clear_resolve_cache
+
+# local imports
+from ..util.testcases import CalingenORMTestCase
+
+
+@tag("management", "instrumentation")
+class CalingenStatsTest(CalingenORMTestCase):
+    def setUp(self):
+        stats_registry.reset()
+        clear_resolve_cache()
+
+    def tearDown(self):
+        stats_registry.reset()
+
+    def test_no_statistics(self):
+        # Arrange (set up test environment)
+        out = StringIO()
+
+        # Act (actually perform what has to be done)
+        call_command("calingen_stats", stdout=out)
+
+        # Assert (verify the results)
+        self.assertIn("No statistics available", out.getvalue())
+
+    @override_settings(CALINGEN_INSTRUMENTATION=True)
+    def test_resolve_and_reset(self):
+        # Arrange (set up test environment)
+        out = StringIO()
+
+        # Act (actually perform what has to be done)
+        call_command(
+            "calingen_stats", "--resolve=2022", "--json", "--reset", stdout=out
+        )
+
+        # Assert (verify the results)
+        result = json.loads(out.getvalue())
+        self.assertIn(
+            ("calingen.models.event.Event", "resolve"),
+            [(x["plugin"], x["operation"]) for x in result],
+        )
+        self.assertEqual(stats_registry.snapshot(), {})
+
+    @override_settings(CALINGEN_INSTRUMENTATION=True)
+    def test_table(self):
+        # Arrange (set up test environment)
+        out = StringIO()
+        call_command("calingen_stats", "--resolve=2022", stdout=StringIO())
+
+        # Act (actually perform what has to be done)
+        call_command("calingen_stats", stdout=out)
+
+        # Assert (verify the results)
+        self.assertIn("calingen.models.event.Event", out.getvalue())
+
+    def test_resolve_requires_instrumentation(self):
+        # Arrange (set up test environment)
+
+        # Act (actually perform what has to be done)
+        with self.assertRaises(CommandError):
+            call_command("calingen_stats", "--resolve=2022")
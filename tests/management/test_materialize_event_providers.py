@@ -0,0 +1,67 @@
+# SPDX-License-Identifier: MIT
+
+"""Provide tests for calingen.management.commands.materialize_event_providers."""
+
+# Python imports
+from io import StringIO
+from unittest import mock, skip  # noqa: F401
+
+# Django imports
+from django.core.management import CommandError, call_command
+from django.test import override_settings, tag  # noqa: F401
+
+# app imports
+from calingen.interfaces.plugin_api import fully_qualified_classname
+from calingen.models.resolved_provider_year import ResolvedProviderYear
+
+# local imports
+from ..models.test_resolved_provider_year import (
+    EventProviderTestImplementation_materialized,
+)
+from ..util.testcases import CalingenORMTestCase
+
+
+@tag("management", "ResolvedProviderYear")
+class MaterializeEventProvidersTest(CalingenORMTestCase):
+    def test_command(self):
+        # Arrange (set up test environment)
+        name = fully_qualified_classname(EventProviderTestImplementation_materialized)
+        out = StringIO()
+
+        # Act (actually perform what has to be done)
+        call_command(
+            "materialize_event_providers",
+            "--provider={}".format(name),
+            "--first-year=2021",
+            "--last-year=2022",
+            "--language=en",
+            "--language=de",
+            "--prune",
+            stdout=out,
+        )
+
+        # Assert (verify the results)
+        self.assertEqual(
+            sorted(
+                ResolvedProviderYear.objects.values_list("provider", "year", "language")
+            ),
+            [
+                (name, 2021, "de"),
+                (name, 2021, "en"),
+                (name, 2022, "de"),
+                (name, 2022, "en"),
+            ],
+        )
+        self.assertIn("Deleted 0 outdated results", out.getvalue())
+
+    def test_unavailable_provider(self):
+        # Arrange (set up test environment)
+
+        # Act (actually perform what has to be done)
+        with self.assertRaises(CommandError):
+            call_command(
+                "materialize_event_providers", "--provider=foo.bar", stdout=StringIO()
+            )
+
+        # Assert (verify the results)
+        self.assertFalse(ResolvedProviderYear.objects.exists())
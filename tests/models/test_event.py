@@ -4,13 +4,17 @@
 
 # Python imports
 import datetime
+from importlib import import_module
 from unittest import mock, skip  # noqa: F401
 
 # Django imports
+from django.apps import apps
 from django.contrib.auth.models import User
+from django.db import models
 from django.test import override_settings, tag  # noqa: F401
 
 # app imports
+from calingen.interfaces.data_exchange import CalendarEntryList
 from calingen.models.event import Event, EventModelException, EventQuerySet
 
 # local imports
@@ -40,6 +44,42 @@ class EventQuerySetTest(CalingenORMTestCase):
             bob_events, map(repr, test_bob_events), ordered=False, transform=repr
         )
 
+    def test_order_by_annual_date(self):
+        # Arrange (set up test environment)
+        alice = User.objects.get(pk=2)  # Alice!
+
+        # Act (actually perform what has to be done)
+        result = EventQuerySet(Event).filter_by_user(alice).order_by_annual_date()
+
+        # Assert (verify the results)
+        self.assertEqual(
+            [(x.resolve_month, x.resolve_day) for x in result],
+            [(1, 1), (2, 14), (11, 30), (12, 6)],
+        )
+
+    def test_filter_by_annual_window(self):
+        # Arrange (set up test environment)
+        alice = User.objects.get(pk=2)  # Alice!
+        queryset = EventQuerySet(Event).filter_by_user(alice)
+        windows = (
+            ((2022, 2, 1), (2022, 2, 28), [2]),
+            ((2022, 2, 14), (2022, 12, 1), [2, 11]),
+            ((2021, 12, 1), (2022, 1, 1), [12, 1]),
+            ((2021, 12, 7), (2022, 2, 13), [1]),
+        )
+
+        for start, end, expected in windows:
+            with self.subTest(start=start, end=end):
+                # Act (actually perform what has to be done)
+                result = queryset.filter_by_annual_window(
+                    datetime.date(*start), datetime.date(*end)
+                ).order_by_annual_date()
+
+                # Assert (verify the results)
+                self.assertEqual(
+                    sorted(x.resolve_month for x in result), sorted(expected)
+                )
+
 
 @tag("models", "event", "EventManager")
 class EventManagerTest(CalingenORMTestCase):
@@ -83,21 +123,246 @@ class EventManagerTest(CalingenORMTestCase):
         # Assert (verify the results)
         self.assertEqual(alice_events, test_alice_events)
 
-    @mock.patch("calingen.models.event.CalendarEntryList")
-    def test_get_calendar_entry_list(self, mock_calendarentrylist):
+    def test_get_calendar_entry_list(self):
+        """The bulk conversion matches the results of Event.resolve()."""
         # Arrange (set up test environment)
-        mock_merge = mock.MagicMock()
-        mock_calendarentrylist.return_value.merge = mock_merge
         alice = User.objects.get(pk=2)  # Alice!
-        alice_events = Event.objects.filter(profile__owner=alice).count()
+        expected = CalendarEntryList()
+        for event in Event.objects.filter(profile__owner=alice):
+            expected.merge(event.resolve(2022))
+
+        # Act (actually perform what has to be done)
+        with self.assertNumQueries(1):
+            result = Event.calingen_manager.get_calendar_entry_list(
+                user=alice, year=2022
+            )
+
+        # Assert (verify the results)
+        self.assertEqual(result.sorted(), expected.sorted())
+        self.assertEqual(
+            [x.source for x in result.sorted()],
+            [x.source for x in expected.sorted()],
+        )
+
+    def test_get_calendar_entry_list_window(self):
+        """A window matches the filtered results of the affected years."""
+        # Arrange (set up test environment)
+        alice = User.objects.get(pk=2)  # Alice!
+        start = datetime.date(2021, 9, 1)
+        end = datetime.date(2022, 8, 31)
+        expected = CalendarEntryList()
+        for year in (2021, 2022):
+            expected.merge(
+                Event.calingen_manager.get_calendar_entry_list(user=alice, year=year)
+            )
+
+        # Act (actually perform what has to be done)
+        result = Event.calingen_manager.get_calendar_entry_list_window(
+            user=alice, start=start, end=end
+        )
+
+        # Assert (verify the results)
+        self.assertEqual(result.sorted(), expected.between(start, end).sorted())
+        self.assertEqual(
+            [x.source for x in result.sorted()],
+            [x.source for x in expected.between(start, end).sorted()],
+        )
+
+    def test_get_calendar_entry_list_window_filters_in_database(self):
+        """Windows shorter than a year are filtered by the database."""
+        # Arrange (set up test environment)
+        alice = User.objects.get(pk=2)  # Alice!
+        windows = (
+            (datetime.date(2021, 11, 30), datetime.date(2022, 1, 1)),
+            (datetime.date(2022, 2, 1), datetime.date(2022, 2, 28)),
+            (datetime.date(2021, 2, 14), datetime.date(2022, 2, 14)),
+        )
+
+        for start, end in windows:
+            with self.subTest(start=start, end=end):
+                expected = CalendarEntryList()
+                for event in Event.objects.filter(profile__owner=alice):
+                    expected.merge(event.resolve_window(start, end))
+
+                # Act (actually perform what has to be done)
+                result = Event.calingen_manager.get_calendar_entry_list_window(
+                    user=alice, start=start, end=end
+                )
+
+                # Assert (verify the results)
+                self.assertEqual(result.sorted(), expected.sorted())
+
+    def test_iter_calendar_entries(self):
+        """Streamed entries match the sorted CalendarEntryList."""
+        # Arrange (set up test environment)
+        alice = User.objects.get(pk=2)  # Alice!
+        expected = Event.calingen_manager.get_calendar_entry_list(
+            user=alice, year=2022
+        ).sorted()
+
+        # Act (actually perform what has to be done)
+        result = list(
+            Event.calingen_manager.iter_calendar_entries(user=alice, year=2022)
+        )
+
+        # Assert (verify the results)
+        self.assertEqual(result, expected)
+        self.assertEqual(len(result), len(expected))
+
+    def test_leap_day_events_are_skipped_in_other_years(self):
+        """All paths skip events on February 29th in years, that are no leap years."""
+        # Arrange (set up test environment)
+        alice = User.objects.get(pk=2)  # Alice!
+        event = Event.objects.create(
+            profile=alice.profile,
+            title="Leap Day",
+            start=datetime.datetime(2020, 2, 29, 12, 0),
+        )
+
+        for year, expected in ((2021, []), (2024, [datetime.datetime(2024, 2, 29)])):
+            with self.subTest(year=year):
+                # Act (actually perform what has to be done)
+                results = {
+                    "resolve": list(event.resolve(year)),
+                    "bulk": list(
+                        Event.calingen_manager.get_calendar_entry_list(
+                            user=alice, year=year
+                        )
+                    ),
+                    "stream": list(
+                        Event.calingen_manager.iter_calendar_entries(
+                            user=alice, year=year
+                        )
+                    ),
+                    "window": list(
+                        Event.calingen_manager.get_calendar_entry_list_window(
+                            user=alice,
+                            start=datetime.date(year, 1, 1),
+                            end=datetime.date(year, 12, 31),
+                        )
+                    ),
+                }
+
+                # Assert (verify the results)
+                for path, entries in results.items():
+                    self.assertEqual(
+                        [x.timestamp for x in entries if x.title == "Leap Day"],
+                        expected,
+                        path,
+                    )
+
+
+@tag("models", "event", "Event")
+class EventAnnualDateTest(CalingenORMTestCase):
+    def test_save_syncs_annual_date(self):
+        # Arrange (set up test environment)
+        event = Event.objects.get(pk=1)
+        event.start = datetime.datetime(2020, 3, 4, 6, 0)
+
+        # Act (actually perform what has to be done)
+        event.save(update_fields=["start"])
+
+        # Assert (verify the results)
+        self.assertEqual(
+            Event.objects.values_list("start_month", "start_day").get(pk=1), (3, 4)
+        )
+
+    def test_bulk_create_syncs_annual_date(self):
+        # Arrange (set up test environment)
+        profile = User.objects.get(pk=2).profile
+        events = [
+            Event(profile=profile, title="foo", start=datetime.datetime(2020, 3, 4)),
+            Event(profile=profile, title="bar", start=datetime.datetime(2020, 5, 6)),
+        ]
+
+        # Act (actually perform what has to be done)
+        Event.objects.bulk_create(events)
+
+        # Assert (verify the results)
+        self.assertEqual(
+            list(
+                Event.objects.filter(title__in=["foo", "bar"])
+                .order_by("start")
+                .values_list("start_month", "start_day")
+            ),
+            [(3, 4), (5, 6)],
+        )
+
+    def test_update_syncs_annual_date(self):
+        # Arrange (set up test environment)
+        queryset = Event.objects.filter(pk=1)
+
+        for start, expected in (
+            (datetime.datetime(2020, 3, 4, 6, 0), (3, 4)),
+            (models.F("start") + datetime.timedelta(days=1), (3, 5)),
+        ):
+            with self.subTest(start=start):
+                # Act (actually perform what has to be done)
+                queryset.update(start=start)
+
+                # Assert (verify the results)
+                self.assertEqual(
+                    queryset.values_list("start_month", "start_day").get(), expected
+                )
+
+    def test_bulk_update_syncs_annual_date(self):
+        # Arrange (set up test environment)
+        event = Event.objects.get(pk=1)
+        event.start = datetime.datetime(2020, 3, 4, 6, 0)
 
         # Act (actually perform what has to be done)
-        test_alice_events = (  # noqa: F841
-            Event.calingen_manager.get_calendar_entry_list(user=alice)
+        Event.objects.bulk_update([event], ["start"])
+
+        # Assert (verify the results)
+        self.assertEqual(
+            Event.objects.values_list("start_month", "start_day").get(pk=1), (3, 4)
         )
 
+    def test_raw_save_syncs_annual_date(self):
+        """Fixtures do not have to provide the annual date."""
+        # Arrange (set up test environment)
+        event = Event.objects.get(pk=1)
+        event.start = datetime.datetime(2020, 3, 4, 6, 0)
+        event.start_month = event.start_day = 0
+
+        # Act (actually perform what has to be done)
+        event.save_base(raw=True)
+
         # Assert (verify the results)
-        self.assertEqual(mock_merge.call_count, alice_events)
+        self.assertEqual(
+            Event.objects.values_list("start_month", "start_day").get(pk=1), (3, 4)
+        )
+
+    def test_sync_annual_date_uses_utc(self):
+        # Arrange (set up test environment)
+        event = Event()
+        event.start = datetime.datetime(
+            2020, 3, 1, 0, 30, tzinfo=datetime.timezone(datetime.timedelta(hours=1))
+        )
+
+        # Act (actually perform what has to be done)
+        event.sync_annual_date()
+
+        # Assert (verify the results)
+        self.assertEqual((event.start_month, event.start_day), (2, 29))
+
+    def test_migration_backfills_annual_date(self):
+        # Arrange (set up test environment)
+        migration = import_module("calingen.migrations.0004_event_annual_date")
+        Event.objects.update(start_month=0, start_day=0)
+        schema_editor = mock.MagicMock()
+        schema_editor.connection.alias = "default"
+
+        # Act (actually perform what has to be done)
+        migration.backfill_annual_date(apps, schema_editor)
+
+        # Assert (verify the results)
+        for event in Event.objects.all():
+            with self.subTest(event=event):
+                self.assertEqual(
+                    (event.start_month, event.start_day),
+                    (event.start.month, event.start.day),
+                )
 
 
 @tag("models", "event", "Event")
@@ -139,3 +404,38 @@ class EventTest(CalingenTestCase):
         # Assert (verify the results)
         mock_ce.assert_called_with("foo", "bar", mock_datetime.date(), mock.ANY)
         self.assertIsInstance(return_value, mock.MagicMock)
+
+    def test_resolve_window_spans_years(self):
+        """All occurences inside the window are resolved."""
+        # Arrange (set up test environment)
+        event = Event()
+        event.title = "foo"
+        event.category = "bar"
+        event.start = datetime.datetime(1990, 1, 15, 0, 0)
+
+        # Act (actually perform what has to be done)
+        result = event.resolve_window(
+            datetime.date(2020, 9, 1), datetime.date(2022, 1, 14)
+        )
+
+        # Assert (verify the results)
+        self.assertEqual(
+            [x.timestamp for x in result], [datetime.datetime(2021, 1, 15)]
+        )
+
+    def test_resolve_window_skips_missing_leap_days(self):
+        # Arrange (set up test environment)
+        event = Event()
+        event.title = "foo"
+        event.category = "bar"
+        event.start = datetime.datetime(1992, 2, 29, 0, 0)
+
+        # Act (actually perform what has to be done)
+        result = event.resolve_window(
+            datetime.date(2019, 1, 1), datetime.date(2021, 12, 31)
+        )
+
+        # Assert (verify the results)
+        self.assertEqual(
+            [x.timestamp for x in result], [datetime.datetime(2020, 2, 29)]
+        )
@@ -10,6 +10,7 @@ from unittest import mock, skip  # noqa: F401
 from django.test import override_settings, tag  # noqa: F401
 
 # app imports
+from calingen.interfaces.data_exchange import CalendarEntry, CalendarEntryList
 from calingen.models.profile import Profile
 
 # local imports
@@ -23,10 +24,10 @@ class ProfileTest(CalingenTestCase):
     def test_event_provider_getter_empty_raw(self, mock_event_provider):
         """If _event_provider is empty, return empty values."""
         # Arrange (set up test environment)
-        mock_event_provider.list_available_plugins.return_value = [
-            ("bar", "foo.bar"),
-            ("baz", "foo.baz"),
-        ]
+        mock_event_provider.is_available.side_effect = [
+            "foo.bar",
+            "foo.baz",
+        ].__contains__
         raw_json = {"active": [], "unavailable": []}
         profile = Profile()
         profile._event_provider = raw_json
@@ -44,10 +45,10 @@ class ProfileTest(CalingenTestCase):
     def test_event_provider_getter_active_to_active(self, mock_event_provider):
         """Active and available stays active."""
         # Arrange (set up test environment)
-        mock_event_provider.list_available_plugins.return_value = [
-            ("foo.bar", "bar"),
-            ("foo.baz", "baz"),
-        ]
+        mock_event_provider.is_available.side_effect = [
+            "foo.bar",
+            "foo.baz",
+        ].__contains__
         raw_json = {"active": ["foo.bar"], "unavailable": []}
         profile = Profile()
         profile._event_provider = raw_json
@@ -67,10 +68,10 @@ class ProfileTest(CalingenTestCase):
     ):
         """Inactive and unavailable stays unavailable."""
         # Arrange (set up test environment)
-        mock_event_provider.list_available_plugins.return_value = [
-            ("foo.bar", "bar"),
-            ("foo.baz", "baz"),
-        ]
+        mock_event_provider.is_available.side_effect = [
+            "foo.bar",
+            "foo.baz",
+        ].__contains__
         raw_json = {"active": [], "unavailable": ["foo.bar.buhu"]}
         profile = Profile()
         profile._event_provider = raw_json
@@ -88,10 +89,10 @@ class ProfileTest(CalingenTestCase):
     def test_event_provider_getter_unavailable_to_active(self, mock_event_provider):
         """Inactive but available is moved to active."""
         # Arrange (set up test environment)
-        mock_event_provider.list_available_plugins.return_value = [
-            ("foo.bar", "bar"),
-            ("foo.baz", "baz"),
-        ]
+        mock_event_provider.is_available.side_effect = [
+            "foo.bar",
+            "foo.baz",
+        ].__contains__
         raw_json = {"active": ["foo.bar"], "unavailable": ["foo.baz"]}
         profile = Profile()
         profile._event_provider = raw_json
@@ -109,10 +110,10 @@ class ProfileTest(CalingenTestCase):
     def test_event_provider_getter_active_to_unavailable(self, mock_event_provider):
         """Active but unavailable is moved to unavailable and included in newly_unavailable."""
         # Arrange (set up test environment)
-        mock_event_provider.list_available_plugins.return_value = [
-            ("foo.bar", "bar"),
-            ("foo.baz", "baz"),
-        ]
+        mock_event_provider.is_available.side_effect = [
+            "foo.bar",
+            "foo.baz",
+        ].__contains__
         raw_json = {"active": ["foo.bar.buhu"], "unavailable": []}
         profile = Profile()
         profile._event_provider = raw_json
@@ -126,12 +127,12 @@ class ProfileTest(CalingenTestCase):
         self.assertEqual(return_value["newly_unavailable"], ["foo.bar.buhu"])
 
     @mock.patch("calingen.models.profile.import_string")
-    @mock.patch("calingen.models.profile.CalendarEntryList")
+    @mock.patch("calingen.models.profile.resolve_providers")
     @mock.patch(
         "calingen.models.profile.Profile.event_provider", new_callable=mock.PropertyMock
     )
     def test_resolve_applies_given_year_in_CalendarEntry(
-        self, mock_event_provider, mock_cel, mock_import_string
+        self, mock_event_provider, mock_resolve_providers, mock_import_string
     ):
         """Resolving CalendarEntryList with given year."""
         # Arrange (set up test environment)
@@ -143,19 +144,146 @@ class ProfileTest(CalingenTestCase):
         return_value = profile.resolve(year=2020)
 
         # Assert (verify the results)
-        mock_cel.assert_called_once()
         mock_import_string.assert_called_once_with(test_active_provider)
-        mock_cel.return_value.merge.assert_called_once()
-        self.assertIsInstance(return_value, mock.MagicMock)
+        mock_resolve_providers.assert_called_once_with(
+            [mock_import_string.return_value], 2020, report=None
+        )
+        self.assertEqual(return_value, mock_resolve_providers.return_value)
+
+    @mock.patch("calingen.models.profile.import_string")
+    @mock.patch("calingen.models.profile.resolve_providers_window")
+    @mock.patch(
+        "calingen.models.profile.Profile.event_provider", new_callable=mock.PropertyMock
+    )
+    def test_resolve_window(
+        self, mock_event_provider, mock_resolve_providers_window, mock_import_string
+    ):
+        """Resolving CalendarEntryList for a window."""
+        # Arrange (set up test environment)
+        test_active_provider = "foo.bar.buhu"
+        profile = Profile()
+        mock_event_provider.return_value = {"active": [test_active_provider]}
+        start = datetime.date(2020, 9, 1)
+        end = datetime.date(2021, 8, 31)
+
+        # Act (actually perform what has to be done)
+        return_value = profile.resolve_window(start, end)
+
+        # Assert (verify the results)
+        mock_import_string.assert_called_once_with(test_active_provider)
+        mock_resolve_providers_window.assert_called_once_with(
+            [mock_import_string.return_value], start, end, report=None
+        )
+        self.assertEqual(return_value, mock_resolve_providers_window.return_value)
+
+    @mock.patch("calingen.models.profile.import_string")
+    @mock.patch("calingen.models.profile.resolve_providers_range")
+    @mock.patch(
+        "calingen.models.profile.Profile.event_provider", new_callable=mock.PropertyMock
+    )
+    def test_resolve_range(
+        self, mock_event_provider, mock_resolve_providers_range, mock_import_string
+    ):
+        """Resolving CalendarEntryList instances for several years."""
+        # Arrange (set up test environment)
+        profile = Profile()
+        mock_event_provider.return_value = {"active": ["foo.bar.buhu", "foo.bar.baz"]}
+
+        # Act (actually perform what has to be done)
+        return_value = profile.resolve_range(2020, 2021)
+
+        # Assert (verify the results)
+        self.assertEqual(mock_import_string.call_count, 2)
+        mock_resolve_providers_range.assert_called_once_with(
+            [mock_import_string.return_value, mock_import_string.return_value],
+            2020,
+            2021,
+            report=None,
+        )
+        self.assertEqual(return_value, mock_resolve_providers_range.return_value)
+
+    @mock.patch("calingen.models.profile.import_string")
+    @mock.patch("calingen.models.profile.iter_providers")
+    @mock.patch(
+        "calingen.models.profile.Profile.event_provider", new_callable=mock.PropertyMock
+    )
+    def test_iter_entries(
+        self, mock_event_provider, mock_iter_providers, mock_import_string
+    ):
+        """Every provider is a separate source of the merged entries."""
+        # Arrange (set up test environment)
+        profile = Profile()
+        mock_event_provider.return_value = {"active": ["foo.bar", "foo.baz"]}
+        mock_iter_providers.return_value = [
+            iter(
+                [
+                    CalendarEntry("a", "bar", datetime.date(2021, 1, 1), ("foo",)),
+                    CalendarEntry("c", "bar", datetime.date(2021, 1, 3), ("foo",)),
+                ]
+            ),
+            iter(
+                [
+                    CalendarEntry("b", "bar", datetime.date(2021, 1, 2), ("baz",)),
+                    CalendarEntry("c", "bar", datetime.date(2021, 1, 3), ("baz",)),
+                ]
+            ),
+        ]
+        report = mock.MagicMock()
+
+        # Act (actually perform what has to be done)
+        return_value = list(profile.iter_entries(2021, report=report))
+
+        # Assert (verify the results)
+        mock_iter_providers.assert_called_once_with(
+            [mock_import_string.return_value, mock_import_string.return_value],
+            2021,
+            report=report,
+        )
+        self.assertEqual([x.title for x in return_value], ["a", "b", "c"])
+        self.assertEqual(return_value[2].source, ("foo",))
+
+    @mock.patch("calingen.models.profile.import_string")
+    @mock.patch("calingen.models.profile.resolve_providers_async")
+    @mock.patch(
+        "calingen.models.profile.Profile.event_provider", new_callable=mock.PropertyMock
+    )
+    async def test_resolve_async(
+        self, mock_event_provider, mock_resolve_providers_async, mock_import_string
+    ):
+        """Resolving CalendarEntryList concurrently."""
+        # Arrange (set up test environment)
+        test_active_provider = "foo.bar.buhu"
+        profile = Profile()
+        mock_event_provider.return_value = {"active": [test_active_provider]}
+        resolved = CalendarEntryList()
+
+        async def _resolve_providers_async(providers, year, report):
+            return resolved
+
+        mock_resolve_providers_async.side_effect = _resolve_providers_async
+
+        # Act (actually perform what has to be done)
+        return_value = await profile.resolve_async(year=2020)
+
+        # Assert (verify the results)
+        mock_import_string.assert_called_once_with(test_active_provider)
+        mock_resolve_providers_async.assert_called_once_with(
+            [mock_import_string.return_value], 2020, report=None
+        )
+        self.assertIs(return_value, resolved)
 
     @mock.patch("calingen.models.profile.import_string")
     @mock.patch("calingen.models.profile.datetime")
-    @mock.patch("calingen.models.profile.CalendarEntryList")
+    @mock.patch("calingen.models.profile.resolve_providers")
     @mock.patch(
         "calingen.models.profile.Profile.event_provider", new_callable=mock.PropertyMock
     )
     def test_resolve_applies_current_year_in_CalendarEntry(
-        self, mock_event_provider, mock_cel, mock_datetime, mock_import_string
+        self,
+        mock_event_provider,
+        mock_resolve_providers,
+        mock_datetime,
+        mock_import_string,
     ):
         """Resolving CalendarEntryList with current year if not specified."""
         # Arrange (set up test environment)
@@ -168,7 +296,8 @@ class ProfileTest(CalingenTestCase):
         return_value = profile.resolve()
 
         # Assert (verify the results)
-        mock_cel.assert_called_once()
         mock_import_string.assert_called_once_with(test_active_provider)
-        mock_cel.return_value.merge.assert_called_once()
-        self.assertIsInstance(return_value, mock.MagicMock)
+        mock_resolve_providers.assert_called_once_with(
+            [mock_import_string.return_value], 2020, report=None
+        )
+        self.assertEqual(return_value, mock_resolve_providers.return_value)
@@ -0,0 +1,363 @@
+# SPDX-License-Identifier: MIT
+
+"""Provide tests for calingen.models.resolved_provider_year."""
+
+# Python imports
+import os
+import subprocess
+import sys
+from datetime import date, datetime
+from unittest import mock, skip  # noqa: F401
+
+# Django imports
+from django.test import override_settings, tag  # noqa: F401
+from django.utils.translation import get_language
+
+# external imports
+from dateutil.rrule import YEARLY, rrule
+
+# app imports
+from calingen.interfaces.data_exchange import CalendarEntry, CalendarEntryList
+from calingen.interfaces.plugin_api import EventProvider, fully_qualified_classname
+from calingen.interfaces.recurrence import RecurrenceEvaluator, register_evaluator
+from calingen.models.profile import Profile
+from calingen.models.resolved_provider_year import (
+    ResolvedProviderYear,
+    provider_fingerprint,
+)
+
+# local imports
+from ..util.testcases import CalingenORMTestCase, CalingenTestCase
+
+
+class EventProviderTestImplementation_materialized(EventProvider):
+    title = "materialized"
+    entries = [("foo", "bar", rrule(freq=YEARLY, dtstart=datetime(1990, 1, 1)))]
+
+
+class EventProviderTestImplementation_not_cacheable(EventProvider):
+    title = "not cacheable"
+    cacheable = False
+    entries = [("baz", "bar", rrule(freq=YEARLY, dtstart=datetime(1990, 3, 1)))]
+
+
+class EventProviderTestImplementation_custom_materialized(EventProvider):
+    title = "custom"
+
+    @classmethod
+    def resolve(cls, year):
+        result = CalendarEntryList()
+        result.add(CalendarEntry("custom", "bar", date(year, 3, 1), ("foo",)))
+        return result
+
+
+class EventProviderTestImplementation_set_literal(EventProvider):
+    title = "set literal"
+
+    @classmethod
+    def resolve(cls, year):
+        result = CalendarEntryList()
+        for title in sorted({"a", "b", "c", "d"}):
+            result.add(CalendarEntry(title, "bar", date(year, 3, 1), ("foo",)))
+        return result
+
+
+@tag("models", "ResolvedProviderYear")
+class ProviderFingerprintTest(CalingenTestCase):
+    def test_fingerprint_depends_on_definition(self):
+        # Arrange (set up test environment)
+        class EventProviderTestImplementation_fingerprint(EventProvider):
+            title = "do-not-care"
+            entries = [("foo", "bar", rrule(freq=YEARLY, dtstart=datetime(1990, 1, 1)))]
+
+        fingerprint = provider_fingerprint(EventProviderTestImplementation_fingerprint)
+
+        # Act (actually perform what has to be done)
+        EventProviderTestImplementation_fingerprint.entries = [
+            ("foo", "bar", rrule(freq=YEARLY, dtstart=datetime(1990, 1, 2)))
+        ]
+
+        # Assert (verify the results)
+        self.assertNotEqual(
+            fingerprint,
+            provider_fingerprint(EventProviderTestImplementation_fingerprint),
+        )
+
+    def test_fingerprint_depends_on_evaluators(self):
+        # Arrange (set up test environment)
+        rule = rrule(freq=YEARLY, dtstart=datetime(1990, 1, 1))
+
+        class EventProviderTestImplementation_fingerprint_evaluator(EventProvider):
+            title = "do-not-care"
+            entries = [("foo", "bar", rule)]
+
+        provider = EventProviderTestImplementation_fingerprint_evaluator
+        fingerprint = provider_fingerprint(provider)
+        evaluator = RecurrenceEvaluator(rule)
+        evaluator.version = "table"
+
+        # Act (actually perform what has to be done)
+        register_evaluator(rule, evaluator)
+
+        # Assert (verify the results)
+        self.assertNotEqual(provider_fingerprint(provider), fingerprint)
+
+    def test_fingerprint_is_stable(self):
+        # Arrange (set up test environment)
+        fingerprint = provider_fingerprint(EventProviderTestImplementation_materialized)
+
+        # Act (actually perform what has to be done)
+        with override_settings(LANGUAGE_CODE="de"):
+            return_value = provider_fingerprint(
+                EventProviderTestImplementation_materialized
+            )
+
+        # Assert (verify the results)
+        self.assertEqual(return_value, fingerprint)
+        self.assertEqual(len(return_value), 40)
+
+    def test_fingerprint_does_not_depend_on_hash_seed(self):
+        # Arrange (set up test environment)
+        script = (
+            "import django; django.setup(); "
+            "from calingen.models.resolved_provider_year import provider_fingerprint; "
+            "from tests.models.test_resolved_provider_year import "
+            "EventProviderTestImplementation_set_literal as provider; "
+            "print(provider_fingerprint(provider))"
+        )
+
+        # Act (actually perform what has to be done)
+        fingerprints = {
+            subprocess.run(
+                [sys.executable, "-c", script],
+                env=dict(
+                    os.environ,
+                    PYTHONHASHSEED=seed,
+                    PYTHONPATH=os.pathsep.join(sys.path),
+                ),
+                stdout=subprocess.PIPE,
+                check=True,
+                universal_newlines=True,
+            ).stdout.strip()
+            for seed in ("1", "2")
+        }
+
+        # Assert (verify the results)
+        self.assertEqual(
+            fingerprints,
+            {provider_fingerprint(EventProviderTestImplementation_set_literal)},
+        )
+
+    def test_fingerprint_depends_on_resolve_version(self):
+        # Arrange (set up test environment)
+        class EventProviderTestImplementation_fingerprint_version(
+            EventProviderTestImplementation_custom_materialized
+        ):
+            pass
+
+        provider = EventProviderTestImplementation_fingerprint_version
+        fingerprint = provider_fingerprint(provider)
+
+        # Act (actually perform what has to be done)
+        provider.resolve_version = 2
+        provider.entries = []
+
+        # Assert (verify the results)
+        self.assertNotEqual(provider_fingerprint(provider), fingerprint)
+
+
+@tag("models", "ResolvedProviderYear")
+class ResolvedProviderYearManagerTest(CalingenORMTestCase):
+    providers = [
+        EventProviderTestImplementation_materialized,
+        EventProviderTestImplementation_not_cacheable,
+    ]
+
+    def test_materialize_and_load(self):
+        # Arrange (set up test environment)
+        manager = ResolvedProviderYear.calingen_manager
+
+        # Act (actually perform what has to be done)
+        count = manager.materialize(self.providers, 2021, 2022, "en")
+        with self.assertNumQueries(1):
+            result, remaining = manager.load(self.providers, 2022, language="en")
+
+        # Assert (verify the results)
+        self.assertEqual(count, 2)
+        self.assertEqual(
+            [(x.title, x.timestamp) for x in result], [("foo", datetime(2022, 1, 1))]
+        )
+        self.assertEqual(remaining, [EventProviderTestImplementation_not_cacheable])
+
+    def test_load_range(self):
+        # Arrange (set up test environment)
+        manager = ResolvedProviderYear.calingen_manager
+        manager.materialize(self.providers, 2021, 2022, "en")
+
+        # Act (actually perform what has to be done)
+        with self.assertNumQueries(1):
+            result, remaining = manager.load_range(
+                self.providers, 2021, 2022, language="en"
+            )
+        incomplete, incomplete_remaining = manager.load_range(
+            self.providers, 2021, 2023, language="en"
+        )
+
+        # Assert (verify the results)
+        self.assertEqual(list(result), [2021, 2022])
+        self.assertEqual([x.timestamp for x in result[2021]], [datetime(2021, 1, 1)])
+        self.assertEqual(remaining, [EventProviderTestImplementation_not_cacheable])
+        # providers are only loaded, if all years are materialized
+        self.assertEqual(len(incomplete[2021]), 0)
+        self.assertEqual(incomplete_remaining, self.providers)
+
+    def test_materialize_replaces_rows(self):
+        # Arrange (set up test environment)
+        manager = ResolvedProviderYear.calingen_manager
+        manager.materialize(self.providers, 2021, 2022, "en")
+
+        # Act (actually perform what has to be done)
+        manager.materialize(self.providers, 2022, 2023, "en")
+
+        # Assert (verify the results)
+        self.assertEqual(
+            sorted(ResolvedProviderYear.objects.values_list("year", flat=True)),
+            [2021, 2022, 2023],
+        )
+
+    def test_outdated_rows_are_ignored_and_pruned(self):
+        # Arrange (set up test environment)
+        manager = ResolvedProviderYear.calingen_manager
+        manager.materialize(self.providers, 2022, 2022, "en")
+        ResolvedProviderYear.objects.create(
+            provider="foo.bar", year=2022, language="en", fingerprint="x", entries=b""
+        )
+        ResolvedProviderYear.objects.update(fingerprint="outdated")
+
+        # Act (actually perform what has to be done)
+        result, remaining = manager.load(self.providers, 2022, language="en")
+        deleted = manager.prune(self.providers)
+
+        # Assert (verify the results)
+        self.assertEqual(len(result), 0)
+        self.assertEqual(remaining, self.providers)
+        self.assertEqual(deleted, 2)
+        self.assertFalse(ResolvedProviderYear.objects.exists())
+
+    @override_settings(CALINGEN_EVENT_PROVIDER_MATERIALIZATION=True)
+    @mock.patch("calingen.models.profile.resolve_providers")
+    @mock.patch(
+        "calingen.models.profile.Profile.event_provider", new_callable=mock.PropertyMock
+    )
+    def test_profile_uses_materialized_results(
+        self, mock_event_provider, mock_resolve_providers
+    ):
+        # Arrange (set up test environment)
+        ResolvedProviderYear.calingen_manager.materialize(
+            self.providers, 2022, 2022, get_language()
+        )
+        mock_event_provider.return_value = {
+            "active": [fully_qualified_classname(x) for x in self.providers]
+        }
+        mock_resolve_providers.return_value = CalendarEntryList()
+
+        # Act (actually perform what has to be done)
+        result = Profile().resolve(year=2022)
+
+        # Assert (verify the results)
+        mock_resolve_providers.assert_called_once_with(
+            [EventProviderTestImplementation_not_cacheable], 2022, report=None
+        )
+        self.assertEqual([x.title for x in result], ["foo"])
+
+    @override_settings(CALINGEN_EVENT_PROVIDER_MATERIALIZATION=True)
+    @mock.patch("calingen.models.profile.iter_providers")
+    @mock.patch(
+        "calingen.models.profile.Profile.event_provider", new_callable=mock.PropertyMock
+    )
+    def test_profile_iterates_materialized_results(
+        self, mock_event_provider, mock_iter_providers
+    ):
+        # Arrange (set up test environment)
+        ResolvedProviderYear.calingen_manager.materialize(
+            self.providers, 2022, 2022, get_language()
+        )
+        mock_event_provider.return_value = {
+            "active": [fully_qualified_classname(x) for x in self.providers]
+        }
+        mock_iter_providers.return_value = [iter([])]
+
+        # Act (actually perform what has to be done)
+        result = list(Profile().iter_entries(year=2022))
+
+        # Assert (verify the results)
+        mock_iter_providers.assert_called_once_with(
+            [EventProviderTestImplementation_not_cacheable], 2022, report=None
+        )
+        self.assertEqual([x.title for x in result], ["foo"])
+
+    @override_settings(CALINGEN_EVENT_PROVIDER_MATERIALIZATION=True)
+    @mock.patch("calingen.models.profile.resolve_providers_range")
+    @mock.patch(
+        "calingen.models.profile.Profile.event_provider", new_callable=mock.PropertyMock
+    )
+    def test_profile_uses_materialized_ranges(
+        self, mock_event_provider, mock_resolve_providers_range
+    ):
+        # Arrange (set up test environment)
+        ResolvedProviderYear.calingen_manager.materialize(
+            self.providers, 2021, 2022, get_language()
+        )
+        mock_event_provider.return_value = {
+            "active": [fully_qualified_classname(x) for x in self.providers]
+        }
+        mock_resolve_providers_range.return_value = {
+            2021: CalendarEntryList(),
+            2022: CalendarEntryList(),
+        }
+
+        # Act (actually perform what has to be done)
+        result = Profile().resolve_range(2021, 2022)
+
+        # Assert (verify the results)
+        mock_resolve_providers_range.assert_called_once_with(
+            [EventProviderTestImplementation_not_cacheable], 2021, 2022, report=None
+        )
+        self.assertEqual([x.title for x in result[2021]], ["foo"])
+        self.assertEqual([x.title for x in result[2022]], ["foo"])
+
+    @override_settings(CALINGEN_EVENT_PROVIDER_MATERIALIZATION=True)
+    @mock.patch("calingen.models.profile.resolve_providers_window")
+    @mock.patch(
+        "calingen.models.profile.Profile.event_provider", new_callable=mock.PropertyMock
+    )
+    def test_profile_uses_materialized_windows(
+        self, mock_event_provider, mock_resolve_providers_window
+    ):
+        # Arrange (set up test environment)
+        providers = [
+            EventProviderTestImplementation_custom_materialized,
+            EventProviderTestImplementation_materialized,
+        ]
+        ResolvedProviderYear.calingen_manager.materialize(
+            providers, 2021, 2022, get_language()
+        )
+        mock_event_provider.return_value = {
+            "active": [fully_qualified_classname(x) for x in providers]
+        }
+        mock_resolve_providers_window.return_value = CalendarEntryList()
+        start, end = date(2021, 9, 1), date(2022, 8, 31)
+
+        # Act (actually perform what has to be done)
+        result = Profile().resolve_window(start, end)
+
+        # Assert (verify the results)
+        # providers with the default resolve() provide all occurences inside
+        # the window, so they are resolved anyway
+        mock_resolve_providers_window.assert_called_once_with(
+            [EventProviderTestImplementation_materialized], start, end, report=None
+        )
+        self.assertEqual(
+            [(x.title, x.timestamp) for x in result],
+            [("custom", datetime(2022, 3, 1))],
+        )
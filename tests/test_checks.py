@@ -11,7 +11,11 @@ from django.test import override_settings, tag  # noqa: F401
 # app imports
 from calingen.checks import (
     check_config_value_compiler,
+    check_config_value_event_provider_cache_size,
+    check_config_value_event_provider_materialization,
     check_config_value_event_provider_notification,
+    check_config_value_event_provider_resolution,
+    check_config_value_instrumentation,
     check_session_enabled,
 )
 
@@ -192,3 +196,129 @@ class CalingenChecksTest(CalingenTestCase):
 
         # Assert (verify the results)
         self.assertEqual(return_value, [])
+
+    @tag("config", "event_provider")
+    def test_e005_setting_is_valid(self):
+        # Arrange (set up test environment)
+
+        # Act (actually perform what has to be done)
+        return_value = check_config_value_event_provider_cache_size(None)
+
+        # Assert (verify the results)
+        self.assertEqual(return_value, [])
+
+    @tag("config", "event_provider")
+    def test_e005_setting_is_invalid(self):
+        # Arrange (set up test environment)
+        invalid_values = (-1, "128", None, True)
+
+        for value in invalid_values:
+            with self.subTest(value=value):
+                with override_settings(CALINGEN_EVENT_PROVIDER_CACHE_SIZE=value):
+                    # Act (actually perform what has to be done)
+                    return_value = check_config_value_event_provider_cache_size(None)
+
+                # Assert (verify the results)
+                self.assertEqual(len(return_value), 1)
+                self.assertEqual(return_value[0].id, "calingen.e005")
+
+    @tag("config", "event_provider")
+    def test_e006_e007_e008_settings_are_valid(self):
+        # Arrange (set up test environment)
+        valid_values = ((4, 5, 10), (0, None, None), (1, 0.5, 2.5))
+
+        for workers, timeout, budget in valid_values:
+            with self.subTest(workers=workers, timeout=timeout, budget=budget):
+                with override_settings(
+                    CALINGEN_EVENT_PROVIDER_WORKERS=workers,
+                    CALINGEN_EVENT_PROVIDER_TIMEOUT=timeout,
+                    CALINGEN_EVENT_PROVIDER_BUDGET=budget,
+                ):
+                    # Act (actually perform what has to be done)
+                    return_value = check_config_value_event_provider_resolution(None)
+
+                # Assert (verify the results)
+                self.assertEqual(return_value, [])
+
+    @tag("config", "event_provider")
+    def test_e006_setting_is_invalid(self):
+        # Arrange (set up test environment)
+        invalid_values = (-1, "4", None, True, 2.0)
+
+        for value in invalid_values:
+            with self.subTest(value=value):
+                with override_settings(CALINGEN_EVENT_PROVIDER_WORKERS=value):
+                    # Act (actually perform what has to be done)
+                    return_value = check_config_value_event_provider_resolution(None)
+
+                # Assert (verify the results)
+                self.assertEqual([x.id for x in return_value], ["calingen.e006"])
+
+    @tag("config", "event_provider")
+    def test_e007_e008_settings_are_invalid(self):
+        # Arrange (set up test environment)
+        invalid_values = (0, -1, "5", True)
+
+        for value in invalid_values:
+            with self.subTest(value=value):
+                with override_settings(
+                    CALINGEN_EVENT_PROVIDER_TIMEOUT=value,
+                    CALINGEN_EVENT_PROVIDER_BUDGET=value,
+                ):
+                    # Act (actually perform what has to be done)
+                    return_value = check_config_value_event_provider_resolution(None)
+
+                # Assert (verify the results)
+                self.assertEqual(
+                    [x.id for x in return_value], ["calingen.e007", "calingen.e008"]
+                )
+
+    @tag("config", "event_provider")
+    def test_e009_setting_is_valid(self):
+        # Arrange (set up test environment)
+
+        # Act (actually perform what has to be done)
+        return_value = check_config_value_event_provider_materialization(None)
+
+        # Assert (verify the results)
+        self.assertEqual(return_value, [])
+
+    @tag("config", "event_provider")
+    def test_e009_setting_is_invalid(self):
+        # Arrange (set up test environment)
+        invalid_values = (None, "True", 1)
+
+        for value in invalid_values:
+            with self.subTest(value=value):
+                with override_settings(CALINGEN_EVENT_PROVIDER_MATERIALIZATION=value):
+                    # Act (actually perform what has to be done)
+                    return_value = check_config_value_event_provider_materialization(
+                        None
+                    )
+
+                # Assert (verify the results)
+                self.assertEqual([x.id for x in return_value], ["calingen.e009"])
+
+    @tag("config", "instrumentation")
+    def test_e010_setting_is_valid(self):
+        # Arrange (set up test environment)
+
+        # Act (actually perform what has to be done)
+        return_value = check_config_value_instrumentation(None)
+
+        # Assert (verify the results)
+        self.assertEqual(return_value, [])
+
+    @tag("config", "instrumentation")
+    def test_e010_setting_is_invalid(self):
+        # Arrange (set up test environment)
+        invalid_values = (None, "True", 1)
+
+        for value in invalid_values:
+            with self.subTest(value=value):
+                with override_settings(CALINGEN_INSTRUMENTATION=value):
+                    # Act (actually perform what has to be done)
+                    return_value = check_config_value_instrumentation(None)
+
+                # Assert (verify the results)
+                self.assertEqual([x.id for x in return_value], ["calingen.e010"])
@@ -0,0 +1,195 @@
+# SPDX-License-Identifier: MIT
+
+"""Provide tests for calingen.instrumentation."""
+
+# Python imports
+from datetime import datetime
+from unittest import mock, skip  # noqa: F401
+
+# Django imports
+from django.test import override_settings, tag  # noqa: F401
+
+# external imports
+from dateutil.rrule import YEARLY, rrule
+
+# app imports
+from calingen.instrumentation import (
+    PluginStats,
+    StatsRegistry,
+    instrumented_call,
+    record_call,
+    stats_registry,
+)
+from calingen.interfaces.plugin_api import (
+    EventProvider,
+    clear_resolve_cache,
+    fully_qualified_classname,
+    resolve_providers,
+)
+from calingen.models.event import Event
+from calingen.signals import plugin_call_finished
+
+# local imports
+from .util.testcases import CalingenTestCase
+
+
+class EventProviderTestImplementation_instrumented(EventProvider):
+    title = "instrumented"
+    entries = [
+        ("foo", "bar", rrule(freq=YEARLY, dtstart=datetime(1990, 1, 1))),
+        ("baz", "bar", rrule(freq=YEARLY, dtstart=datetime(1990, 2, 1))),
+    ]
+
+
+@tag("instrumentation")
+class StatsRegistryTest(CalingenTestCase):
+    def test_record_aggregates_calls(self):
+        # Arrange (set up test environment)
+        registry = StatsRegistry()
+
+        # Act (actually perform what has to be done)
+        registry.record(PluginStats, "resolve", 0.5, entries=2, cache_hit=False)
+        registry.record(PluginStats, "resolve", 1.5, entries=2, cache_hit=True)
+        registry.record(PluginStats, "resolve", 1.0, entries=2, cache_hit=True)
+        registry.record(PluginStats, "render", 3.0)
+        result = registry.snapshot()
+
+        # Assert (verify the results)
+        name = fully_qualified_classname(PluginStats)
+        self.assertEqual(list(result), [(name, "resolve"), (name, "render")])
+        stats = result[(name, "resolve")]
+        self.assertEqual(stats.calls, 3)
+        self.assertEqual(stats.total_time, 3.0)
+        self.assertEqual(stats.mean_time, 1.0)
+        self.assertEqual(stats.max_time, 1.5)
+        self.assertEqual(stats.entries, 6)
+        self.assertAlmostEqual(stats.hit_rate, 2 / 3)
+        self.assertIsNone(result[(name, "render")].hit_rate)
+
+    def test_snapshot_is_a_copy(self):
+        # Arrange (set up test environment)
+        registry = StatsRegistry()
+        registry.record(PluginStats, "resolve", 0.5)
+        result = registry.snapshot()
+
+        # Act (actually perform what has to be done)
+        registry.record(PluginStats, "resolve", 0.5)
+        registry.reset()
+
+        # Assert (verify the results)
+        self.assertEqual(list(result.values())[0].calls, 1)
+        self.assertEqual(registry.snapshot(), {})
+
+
+@tag("instrumentation")
+class RecordCallTest(CalingenTestCase):
+    def setUp(self):
+        stats_registry.reset()
+        clear_resolve_cache()
+
+    def tearDown(self):
+        stats_registry.reset()
+
+    def _stats(self, plugin, operation="resolve"):
+        return stats_registry.snapshot().get(
+            (fully_qualified_classname(plugin), operation)
+        )
+
+    def test_record_call_sends_signal(self):
+        # Arrange (set up test environment)
+        receiver = mock.MagicMock()
+        plugin_call_finished.connect(receiver)
+        self.addCleanup(plugin_call_finished.disconnect, receiver)
+
+        # Act (actually perform what has to be done)
+        record_call(PluginStats, "render", 0.25, entries=3)
+
+        # Assert (verify the results)
+        receiver.assert_called_once_with(
+            signal=plugin_call_finished,
+            sender=PluginStats,
+            operation="render",
+            duration=0.25,
+            entries=3,
+            cache_hit=None,
+        )
+        self.assertEqual(self._stats(PluginStats, "render").calls, 1)
+
+    def test_instrumented_call_disabled(self):
+        # Arrange (set up test environment)
+        func = mock.MagicMock(return_value="source")
+
+        # Act (actually perform what has to be done)
+        result = instrumented_call(PluginStats, "render", func, "context")
+
+        # Assert (verify the results)
+        self.assertEqual(result, "source")
+        func.assert_called_once_with("context")
+        self.assertIsNone(self._stats(PluginStats, "render"))
+
+    @override_settings(CALINGEN_INSTRUMENTATION=True)
+    def test_instrumented_call_enabled(self):
+        # Arrange (set up test environment)
+        func = mock.MagicMock(return_value=[1, 2])
+
+        # Act (actually perform what has to be done)
+        instrumented_call(PluginStats, "render", func, "context")
+
+        # Assert (verify the results)
+        stats = self._stats(PluginStats, "render")
+        self.assertEqual(stats.calls, 1)
+        self.assertEqual(stats.entries, 2)
+
+    @override_settings(CALINGEN_INSTRUMENTATION=True)
+    def test_resolve_cached_records_hits(self):
+        # Arrange (set up test environment)
+        provider = EventProviderTestImplementation_instrumented
+
+        # Act (actually perform what has to be done)
+        provider.resolve_cached(2022)
+        provider.resolve_cached(2022)
+
+        # Assert (verify the results)
+        stats = self._stats(provider)
+        self.assertEqual(stats.calls, 2)
+        self.assertEqual(stats.entries, 4)
+        self.assertEqual((stats.cache_hits, stats.cache_misses), (1, 1))
+
+    @override_settings(CALINGEN_INSTRUMENTATION=True)
+    def test_resolve_providers_records_hits(self):
+        # Arrange (set up test environment)
+        providers = [EventProviderTestImplementation_instrumented]
+
+        # Act (actually perform what has to be done)
+        resolve_providers(providers, 2022)
+        resolve_providers(providers, 2022)
+
+        # Assert (verify the results)
+        stats = self._stats(providers[0])
+        self.assertEqual(stats.calls, 2)
+        self.assertEqual(stats.entries, 2)
+        self.assertEqual((stats.cache_hits, stats.cache_misses), (1, 1))
+
+    @override_settings(CALINGEN_INSTRUMENTATION=True)
+    def test_event_resolve(self):
+        # Arrange (set up test environment)
+        event = Event(title="foo", start=datetime(2021, 3, 1))
+
+        # Act (actually perform what has to be done)
+        event.resolve(2022)
+
+        # Assert (verify the results)
+        stats = self._stats(Event)
+        self.assertEqual(stats.calls, 1)
+        self.assertEqual(stats.entries, 1)
+
+    def test_disabled_by_default(self):
+        # Arrange (set up test environment)
+        provider = EventProviderTestImplementation_instrumented
+
+        # Act (actually perform what has to be done)
+        provider.resolve_cached(2022)
+        resolve_providers([provider], 2022)
+
+        # Assert (verify the results)
+        self.assertEqual(stats_registry.snapshot(), {})
@@ -72,7 +72,7 @@ class CalingenTeXLayoutCompilationTestCase(CalingenORMTestCase):
         all_entries.merge(internal_events)
         all_entries.merge(plugin_events)
 
-        return all_entries.sorted()
+        return all_entries
 
     def write_tex_to_tmp(self, rendered_tex, tex_filename):
         """Create a TeX source file for compilation."""
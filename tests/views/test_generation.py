@@ -195,11 +195,13 @@ class CompilerViewTest(CalingenORMTestCase):
         test_request = mock.MagicMock()
         test_request.session.pop.return_value = "foo"
         mock_kwargs = mock.MagicMock()
+        test_layout = mock.MagicMock()
+        test_layout.required_years.return_value = ("foo", "foo")
         cbv = CompilerView()
         cbv.request = test_request
 
         # Act
-        return_value = cbv._prepare_context()  # noqa: F841
+        return_value = cbv._prepare_context(test_layout)  # noqa: F841
 
         # Assert
         # test_form.save_configuration.assert_called_once()
@@ -208,6 +210,25 @@ class CompilerViewTest(CalingenORMTestCase):
             target_year="foo", layout_configuration="foo", **mock_kwargs
         )
 
+    @mock.patch("calingen.views.generation.CompilerView.get_context_data")
+    def test_prepare_context_with_several_years(self, mock_get_context_data):
+        # Arrange
+        test_request = mock.MagicMock()
+        test_request.session.pop.side_effect = [2022, None]
+        test_layout = mock.MagicMock()
+        test_layout.required_years.return_value = (2021, 2023)
+        cbv = CompilerView()
+        cbv.request = test_request
+
+        # Act
+        return_value = cbv._prepare_context(test_layout)  # noqa: F841
+
+        # Assert
+        test_layout.required_years.assert_called_once_with(2022)
+        mock_get_context_data.assert_called_once_with(
+            target_year=2022, layout_configuration=None, target_years=(2021, 2023)
+        )
+
     @override_settings(
         CALINGEN_COMPILER={"default": "default.compiler", "test-type": "foo.bar"}
     )
@@ -3,6 +3,7 @@
 """Provide tests for calingen.views.mixins."""
 
 # Python imports
+import datetime
 from unittest import mock, skip  # noqa: F401
 
 # Django imports
@@ -13,6 +14,7 @@ from django.views.generic import View
 from django.views.generic.base import ContextMixin
 
 # app imports
+from calingen.interfaces.data_exchange import CalendarEntry
 from calingen.views.mixins import (
     AllCalendarEntriesMixin,
     ProfileIDMixin,
@@ -54,6 +56,18 @@ class AllCalendarEntriesMixinAppliedView(
     pass
 
 
+class StreamingCalendarEntriesMixinAppliedView(AllCalendarEntriesMixinAppliedView):
+    stream_entries = True
+
+
+class StreamingCalendarEntriesMixinRenderedView(
+    StreamingCalendarEntriesMixinAppliedView
+):
+    def get(self, request, *args, **kwargs):
+        context = self.get_context_data(**kwargs)
+        return HttpResponse(" ".join(entry.title for entry in context["entries"]))
+
+
 @tag("views", "mixins", "RestrictToUserMixin")
 class RestrictToUserMixinTest(CalingenTestCase):
 
@@ -142,3 +156,225 @@ class AllCalendarEntriesMixinTest(CalingenTestCase):
         self.assertEqual(response.status_code, 200)
         self.assertTrue(mock_profile_manager.get_profile.called)
         self.assertTrue(mock_event_manager.get_calendar_entry_list.called)
+
+    @mock.patch("calingen.views.mixins.CalendarEntryStream")
+    @mock.patch("calingen.views.mixins.Event")
+    @mock.patch("calingen.views.mixins.Profile")
+    def test_mixin_streams_entries(self, mock_profile, mock_event, mock_stream):
+        # Arrange (set up test environment)
+        mock_profile_manager = mock.PropertyMock()
+        mock_profile.calingen_manager = mock_profile_manager
+        mock_event_manager = mock.PropertyMock()
+        mock_event.calingen_manager = mock_event_manager
+        test_target_year = 2021
+        cbv = StreamingCalendarEntriesMixinAppliedView
+        request = self.factory.get("/rand")
+        request.user = "foo"
+        view = cbv.as_view()
+
+        # Act (actually perform what has to be done)
+        response = view(request, target_year=test_target_year)
+
+        # Assert (verify the results)
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(mock_stream.called)
+        self.assertFalse(mock_event_manager.get_calendar_entry_list.called)
+        # the user's events and the providers are only retrieved while
+        # iterating the stream
+        self.assertFalse(mock_event_manager.iter_calendar_entries.called)
+        self.assertFalse(mock_profile_manager.get_profile.return_value.resolve.called)
+        self.assertFalse(
+            mock_profile_manager.get_profile.return_value.iter_entries.called
+        )
+
+    @mock.patch("calingen.views.mixins.Event")
+    @mock.patch("calingen.views.mixins.Profile")
+    def test_mixin_streams_provider_entries(self, mock_profile, mock_event):
+        # Arrange (set up test environment)
+        mock_profile_manager = mock.PropertyMock()
+        mock_profile.calingen_manager = mock_profile_manager
+        mock_event_manager = mock.PropertyMock()
+        mock_event.calingen_manager = mock_event_manager
+        mock_event_manager.iter_calendar_entries.return_value = iter(
+            [CalendarEntry("b", "foo", datetime.date(2021, 1, 2), ("foo",))]
+        )
+        mock_profile_manager.get_profile.return_value.iter_entries.return_value = iter(
+            [
+                CalendarEntry("a", "foo", datetime.date(2021, 1, 1), ("foo",)),
+                CalendarEntry("c", "foo", datetime.date(2021, 1, 3), ("foo",)),
+            ]
+        )
+        cbv = StreamingCalendarEntriesMixinRenderedView
+        request = self.factory.get("/rand")
+        request.user = "foo"
+        view = cbv.as_view()
+
+        # Act (actually perform what has to be done)
+        response = view(request, target_year=2021)
+
+        # Assert (verify the results)
+        self.assertEqual(response.content, b"a b c")
+        mock_profile_manager.get_profile.return_value.iter_entries.assert_called_once_with(
+            2021, report=mock.ANY
+        )
+
+    @mock.patch("calingen.views.mixins.Event")
+    @mock.patch("calingen.views.mixins.Profile")
+    def test_mixin_resolves_window(self, mock_profile, mock_event):
+        # Arrange (set up test environment)
+        mock_profile_manager = mock.PropertyMock()
+        mock_profile.calingen_manager = mock_profile_manager
+        mock_event_manager = mock.PropertyMock()
+        mock_event.calingen_manager = mock_event_manager
+        test_target_window = (datetime.date(2021, 9, 1), datetime.date(2022, 8, 31))
+        cbv = AllCalendarEntriesMixinAppliedView
+        request = self.factory.get("/rand")
+        request.user = "foo"
+        view = cbv.as_view()
+
+        # Act (actually perform what has to be done)
+        response = view(request, target_window=test_target_window)
+
+        # Assert (verify the results)
+        self.assertEqual(response.status_code, 200)
+        self.assertFalse(mock_event_manager.get_calendar_entry_list.called)
+        mock_event_manager.get_calendar_entry_list_window.assert_called_once_with(
+            user="foo", start=test_target_window[0], end=test_target_window[1]
+        )
+        mock_profile_manager.get_profile.return_value.resolve_window.assert_called_once_with(
+            *test_target_window, report=mock.ANY
+        )
+
+    @mock.patch("calingen.views.mixins.Event")
+    @mock.patch("calingen.views.mixins.Profile")
+    def test_mixin_resolves_several_years(self, mock_profile, mock_event):
+        # Arrange (set up test environment)
+        mock_profile_manager = mock.PropertyMock()
+        mock_profile.calingen_manager = mock_profile_manager
+        mock_event_manager = mock.PropertyMock()
+        mock_event.calingen_manager = mock_event_manager
+        mock_event_manager.get_calendar_entry_list_window.return_value = []
+        mock_profile_manager.get_profile.return_value.resolve_range.return_value = {}
+        cbv = AllCalendarEntriesMixinAppliedView
+        request = self.factory.get("/rand")
+        request.user = "foo"
+        view = cbv.as_view()
+
+        # Act (actually perform what has to be done)
+        response = view(request, target_year=2022, target_years=(2021, 2023))
+
+        # Assert (verify the results)
+        self.assertEqual(response.status_code, 200)
+        self.assertFalse(mock_event_manager.get_calendar_entry_list.called)
+        mock_event_manager.get_calendar_entry_list_window.assert_called_once_with(
+            user="foo",
+            start=datetime.date(2021, 1, 1),
+            end=datetime.date(2023, 12, 31),
+        )
+        mock_profile_manager.get_profile.return_value.resolve_range.assert_called_once_with(
+            2021, 2023, report=mock.ANY
+        )
+
+    @override_settings(CALINGEN_MISSING_EVENT_PROVIDER_NOTIFICATION="messages")
+    @mock.patch("calingen.views.mixins.messages")
+    @mock.patch("calingen.views.mixins.Event")
+    @mock.patch("calingen.views.mixins.Profile")
+    def test_mixin_notifies_about_timed_out_providers(
+        self, mock_profile, mock_event, mock_messages
+    ):
+        # Arrange (set up test environment)
+        mock_profile_manager = mock.PropertyMock()
+        mock_profile.calingen_manager = mock_profile_manager
+        mock_event_manager = mock.PropertyMock()
+        mock_event.calingen_manager = mock_event_manager
+
+        def _resolve(year, report):
+            report.timed_out.append(AllCalendarEntriesMixinAppliedView)
+            return []
+
+        mock_profile_manager.get_profile.return_value.resolve.side_effect = _resolve
+        cbv = AllCalendarEntriesMixinAppliedView
+        request = self.factory.get("/rand")
+        request.user = "foo"
+        view = cbv.as_view()
+
+        # Act (actually perform what has to be done)
+        response = view(request, target_year=2021)
+
+        # Assert (verify the results)
+        self.assertEqual(response.status_code, 200)
+        mock_messages.warning.assert_called_once()
+        self.assertIn(
+            "AllCalendarEntriesMixinAppliedView", mock_messages.warning.call_args[0][1]
+        )
+
+    @override_settings(CALINGEN_MISSING_EVENT_PROVIDER_NOTIFICATION="messages")
+    @mock.patch("calingen.views.mixins.messages")
+    @mock.patch("calingen.views.mixins.Event")
+    @mock.patch("calingen.views.mixins.Profile")
+    def test_mixin_notifies_about_failed_providers(
+        self, mock_profile, mock_event, mock_messages
+    ):
+        # Arrange (set up test environment)
+        mock_profile_manager = mock.PropertyMock()
+        mock_profile.calingen_manager = mock_profile_manager
+        mock_event_manager = mock.PropertyMock()
+        mock_event.calingen_manager = mock_event_manager
+
+        def _resolve(year, report):
+            report.failed.append(AllCalendarEntriesMixinAppliedView)
+            return []
+
+        mock_profile_manager.get_profile.return_value.resolve.side_effect = _resolve
+        cbv = AllCalendarEntriesMixinAppliedView
+        request = self.factory.get("/rand")
+        request.user = "foo"
+        view = cbv.as_view()
+
+        # Act (actually perform what has to be done)
+        response = view(request, target_year=2021)
+
+        # Assert (verify the results)
+        self.assertEqual(response.status_code, 200)
+        mock_messages.warning.assert_called_once()
+        self.assertIn(
+            "AllCalendarEntriesMixinAppliedView", mock_messages.warning.call_args[0][1]
+        )
+
+    @override_settings(CALINGEN_MISSING_EVENT_PROVIDER_NOTIFICATION="messages")
+    @mock.patch("calingen.views.mixins.messages")
+    @mock.patch("calingen.views.mixins.Event")
+    @mock.patch("calingen.views.mixins.Profile")
+    def test_streaming_mixin_notifies_about_timed_out_providers(
+        self, mock_profile, mock_event, mock_messages
+    ):
+        # Arrange (set up test environment)
+        mock_profile_manager = mock.PropertyMock()
+        mock_profile.calingen_manager = mock_profile_manager
+        mock_event_manager = mock.PropertyMock()
+        mock_event.calingen_manager = mock_event_manager
+
+        mock_event_manager.iter_calendar_entries.return_value = iter([])
+
+        def _iter_entries(year, report):
+            report.timed_out.append(AllCalendarEntriesMixinAppliedView)
+            return iter([])
+
+        mock_profile_manager.get_profile.return_value.iter_entries.side_effect = (
+            _iter_entries
+        )
+        cbv = StreamingCalendarEntriesMixinRenderedView
+        request = self.factory.get("/rand")
+        request.user = "foo"
+        view = cbv.as_view()
+
+        # Act (actually perform what has to be done)
+        response = view(request, target_year=2021)
+
+        # Assert (verify the results)
+        self.assertEqual(response.status_code, 200)
+        # the user is notified, once the stream was iterated
+        mock_messages.warning.assert_called_once()
+        self.assertIn(
+            "AllCalendarEntriesMixinAppliedView", mock_messages.warning.call_args[0][1]
+        )